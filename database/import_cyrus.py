@@ -2,9 +2,11 @@
 """
 Script d'import de la structure CYRUS dans Supabase
 Parse le fichier StructureCYRUS.txt et importe la hiérarchie
+Par défaut, seules les différences sont appliquées en une transaction (scripts/cyrus_sync.py) ;
+--wipe vide la table et réimporte tout.
 """
 
-import re
+import argparse
 import sys
 from pathlib import Path
 from supabase import create_client, Client
@@ -14,6 +16,17 @@ from dotenv import load_dotenv
 # Charger les variables d'environnement
 load_dotenv()
 
+# Modules partagés des scripts d'import (backend postgres)
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from batch_uploader import RETRYABLE_STATUSES, ConcurrentUploader, DeadLetterFile, UploadError
+from cyrus_parser import DEFAULT_SOURCE, parse_cyrus
+
+# Classes SQLSTATE des erreurs de données (22: valeur invalide, 23: contrainte violée)
+DATA_ERROR_CLASSES = ('22', '23')
+# Classes SQLSTATE passagères (08: connexion, 40: conflit de transaction, 53: ressources, 57: délai dépassé)
+TRANSIENT_ERROR_CLASSES = ('08', '40', '53', '57')
+
 def create_supabase_client() -> Client:
     """Créer le client Supabase"""
     url = os.getenv("SUPABASE_URL")
@@ -25,93 +38,46 @@ def create_supabase_client() -> Client:
     return create_client(url, key)
 
 def parse_cyrus_structure(file_path: str):
-    """Parser le fichier StructureCYRUS.txt"""
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    lines = content.split('\n')
-    
-    # Structure hiérarchique
-    current_secteur = None
-    current_rayon = None  
-    current_famille = None
-    
-    items = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Détecter le niveau en fonction du pattern
-        # Secteur: 3 chiffres + nom (ex: "201 GEANT CASINO")
-        secteur_match = re.match(r'^(\d{3})\s+(.+)$', line)
-        if secteur_match:
-            current_secteur = secteur_match.group(1)
-            secteur_name = secteur_match.group(2)
-            current_rayon = None
-            current_famille = None
-            
-            items.append({
-                'level': 1,
-                'code': current_secteur,
-                'name': secteur_name,
-                'parent_code': None,
-                'full_path': f"{current_secteur} {secteur_name}"
-            })
-            continue
-            
-        # Rayon: 2 chiffres + nom (ex: "01 MARCHE")
-        rayon_match = re.match(r'^(\d{2})\s+(.+)$', line)
-        if rayon_match and current_secteur:
-            current_rayon = rayon_match.group(1)
-            rayon_name = rayon_match.group(2)
-            current_famille = None
-            
-            items.append({
-                'level': 2,
-                'code': current_rayon,
-                'name': rayon_name,
-                'parent_code': current_secteur,
-                'full_path': f"{current_secteur} > {current_rayon} {rayon_name}"
-            })
-            continue
-            
-        # Famille: 3 chiffres + nom (ex: "010 BOUCHERIE")
-        famille_match = re.match(r'^(\d{3})\s+(.+)$', line)
-        if famille_match and current_rayon and len(famille_match.group(1)) == 3:
-            current_famille = famille_match.group(1)
-            famille_name = famille_match.group(2)
-            
-            items.append({
-                'level': 3,
-                'code': current_famille,
-                'name': famille_name,
-                'parent_code': current_rayon,
-                'full_path': f"{current_secteur} > {current_rayon} > {current_famille} {famille_name}"
-            })
-            continue
-            
-        # Sous-famille: 3 chiffres + nom (ex: "101 STAND TRADITIONNEL")
-        sous_famille_match = re.match(r'^(\d{3})\s+(.+)$', line)
-        if sous_famille_match and current_famille:
-            sous_famille_code = sous_famille_match.group(1)
-            sous_famille_name = sous_famille_match.group(2)
-            
-            items.append({
-                'level': 4,
-                'code': sous_famille_code,
-                'name': sous_famille_name,
-                'parent_code': current_famille,
-                'full_path': f"{current_secteur} > {current_rayon} > {current_famille} > {sous_famille_code} {sous_famille_name}"
-            })
-            continue
-    
-    return items
+    """Parser le fichier StructureCYRUS.txt (parser canonique scripts/cyrus_parser.py)"""
+    return list(parse_cyrus(file_path).rows())
+
+def make_cyrus_sender(supabase: Client):
+    """
+    Insertion d'un lot via le client Supabase, erreurs traduites pour ConcurrentUploader.
+    Seules les erreurs de transport et les erreurs passagères sont relancées ; une erreur
+    d'authentification, de droits ou de schéma remonte telle quelle et arrête l'import.
+    """
+    import httpx
+    from postgrest.exceptions import APIError
 
-def import_to_supabase(items, supabase: Client):
-    """Importer les données dans Supabase"""
+    def send(batch):
+        try:
+            # Upsert sur la clé naturelle : un lot relancé ne duplique pas les nœuds
+            supabase.table('cyrus_structure').upsert(batch, on_conflict='full_path').execute()
+        except APIError as e:
+            code = str(e.code or '')
+            if len(code) == 3 and code.isdigit():
+                # Réponse non JSON (passerelle, proxy) : le code est le statut HTTP
+                if int(code) in RETRYABLE_STATUSES:
+                    raise UploadError(f"HTTP {code}: {e.details}", status=int(code))
+                raise
+            if code[:2] in DATA_ERROR_CLASSES:
+                # Ligne refusée par Postgres : relancer le même lot ne sert à rien, il sera coupé en deux
+                raise UploadError(f"{code}: {e.message}", status=400)
+            if code[:2] in TRANSIENT_ERROR_CLASSES:
+                raise UploadError(f"{code}: {e.message}")
+            raise
+        except (httpx.TransportError, OSError) as e:
+            raise UploadError(f"Erreur réseau: {e}")
+
+    return send
+
+def import_to_supabase(items, supabase: Client, dead_letter_path: str = 'cyrus_import.rejected.jsonl'):
+    """
+    Importer les données dans Supabase par batches de 100.
+    Un batch refusé est coupé en deux récursivement : les éléments invalides sont isolés
+    en quelques requêtes (au lieu de 100 insertions une par une) et écrits dans `dead_letter_path`.
+    """
     
     print(f"Import de {len(items)} éléments CYRUS...")
     
@@ -122,34 +88,47 @@ def import_to_supabase(items, supabase: Client):
     except Exception as e:
         print(f"Erreur lors du vidage: {e}")
     
-    # Importer par batches de 100
+    # Importer par batches de 100, un à la fois (le client Supabase n'est pas partagé entre threads)
     batch_size = 100
-    success_count = 0
+    dead_letter = DeadLetterFile(dead_letter_path)
+    uploader = ConcurrentUploader(make_cyrus_sender(supabase), max_in_flight=1, batch_size=batch_size,
+                                  min_batch_size=batch_size, max_batch_size=batch_size, verbose=False,
+                                  dead_letter=dead_letter)
     
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
-        
-        try:
-            result = supabase.table('cyrus_structure').insert(batch).execute()
-            success_count += len(batch)
-            print(f"Batch {i//batch_size + 1}: {len(batch)} éléments importés")
-        except Exception as e:
-            print(f"Erreur batch {i//batch_size + 1}: {e}")
-            # Essayer un par un en cas d'erreur
-            for item in batch:
-                try:
-                    supabase.table('cyrus_structure').insert(item).execute()
-                    success_count += 1
-                except Exception as e2:
-                    print(f"Erreur item {item['code']}: {e2}")
+    def on_success(start, end):
+        print(f"Éléments {start + 1}-{end}: {end - start} importés")
     
-    print(f"Import terminé: {success_count}/{len(items)} éléments importés")
+    success_count, errors = uploader.upload(
+        (items[i:i + batch_size] for i in range(0, len(items), batch_size)), on_success=on_success)
+    dead_letter.close()
+    
+    for error in errors:
+        print(f"Erreur {error}")
+    print(f"Import terminé: {success_count}/{len(items)} éléments importés "
+          f"({uploader.requests} requêtes, {uploader.bisections} découpes)")
+    if dead_letter.count:
+        print(f"{dead_letter.count} éléments rejetés écrits dans {dead_letter.path}")
+
+def parse_args():
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Import de la structure CYRUS dans Supabase")
+    parser.add_argument('--backend', choices=['rest', 'postgres'], default='rest',
+                        help="rest: API Supabase ; postgres: connexion directe en une transaction")
+    parser.add_argument('--wipe', action='store_true',
+                        help="Vider la table puis tout réimporter (rest: table vide pendant l'import ; "
+                             "postgres: DELETE + COPY) au lieu de la synchronisation différentielle")
+    parser.add_argument('--dsn', default=None,
+                        help="URL Postgres du backend postgres (défaut: SUPABASE_DB_URL ou DATABASE_URL)")
+    parser.add_argument('--dead-letter', default='cyrus_import.rejected.jsonl',
+                        help="Fichier JSONL des éléments refusés par la base (backend rest)")
+    return parser.parse_args()
 
 def main():
     """Fonction principale"""
+    args = parse_args()
     try:
         # Chemin vers le fichier CYRUS
-        cyrus_file = Path(__file__).parent.parent.parent / "StructureCYRUS.txt"
+        cyrus_file = DEFAULT_SOURCE
         
         if not cyrus_file.exists():
             print(f"Fichier non trouvé: {cyrus_file}")
@@ -166,11 +145,27 @@ def main():
             print(f"  {i+1}. Level {item['level']}: {item['code']} - {item['name']}")
             print(f"     Parent: {item['parent_code']}, Path: {item['full_path']}")
         
+        if not args.wipe:
+            # Synchronisation différentielle : la table n'est jamais vide
+            from cyrus_sync import print_diff, sync_postgres, sync_rest
+            if args.backend == 'postgres':
+                diff = sync_postgres(items, args.dsn)
+            else:
+                diff = sync_rest(create_supabase_client(), items)
+            print("\nSynchronisation de cyrus_structure:")
+            print_diff(diff)
+            return
+        
+        if args.backend == 'postgres':
+            from pg_copy_loader import load_cyrus_items
+            load_cyrus_items(items, args.dsn)
+            return
+        
         # Créer le client Supabase
         supabase = create_supabase_client()
         
-        # Importer dans Supabase
-        import_to_supabase(items, supabase)
+        # Importer dans Supabase (--wipe : vidage puis insertion complète)
+        import_to_supabase(items, supabase, args.dead_letter)
         
     except Exception as e:
         print(f"Erreur: {e}")
@@ -24,7 +24,7 @@ CREATE INDEX IF NOT EXISTS idx_articles_secteur ON articles(secteur);
 -- Table de la structure CYRUS (hiérarchie de classification)
 CREATE TABLE IF NOT EXISTS cyrus_structure (
   id BIGSERIAL PRIMARY KEY,
-  level INTEGER NOT NULL, -- 1=Secteur, 2=Rayon, 3=Famille, 4=Sous-famille
+  level INTEGER NOT NULL, -- 0=Magasin, 1=Secteur, 2=Rayon, 3=Famille, 4=Sous-famille
   code TEXT NOT NULL,
   name TEXT NOT NULL,
   parent_code TEXT,
@@ -36,6 +36,9 @@ CREATE TABLE IF NOT EXISTS cyrus_structure (
 CREATE INDEX IF NOT EXISTS idx_cyrus_code ON cyrus_structure(code);
 CREATE INDEX IF NOT EXISTS idx_cyrus_level ON cyrus_structure(level);
 CREATE INDEX IF NOT EXISTS idx_cyrus_parent ON cyrus_structure(parent_code);
+-- Clé naturelle (chemin des codes et noms) : les imports relancés font un upsert au lieu de dupliquer.
+-- Sur une table contenant déjà des doublons, lancer d'abord scripts/cyrus_sync.py qui les supprime.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cyrus_full_path ON cyrus_structure(full_path);
 
 -- Table des corrections de libellés
 CREATE TABLE IF NOT EXISTS label_corrections (
@@ -128,6 +131,46 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Synchronisation différentielle de cyrus_structure (scripts/cyrus_sync.py)
+-- Applique en une transaction les suppressions, mises à jour et insertions calculées
+-- côté client ; échoue si la table a changé depuis la lecture ayant servi au diff.
+CREATE OR REPLACE FUNCTION apply_cyrus_structure_diff(inserts JSONB, updates JSONB, deletes BIGINT[])
+RETURNS JSONB AS $$
+DECLARE
+    deleted_count INTEGER;
+    updated_count INTEGER;
+    inserted_count INTEGER;
+BEGIN
+    LOCK TABLE cyrus_structure IN SHARE ROW EXCLUSIVE MODE;
+
+    DELETE FROM cyrus_structure WHERE id = ANY(deletes);
+    GET DIAGNOSTICS deleted_count = ROW_COUNT;
+    IF deleted_count <> COALESCE(cardinality(deletes), 0) THEN
+        RAISE EXCEPTION 'cyrus_structure a changé pendant la synchronisation (% suppressions sur %)',
+            deleted_count, cardinality(deletes);
+    END IF;
+
+    UPDATE cyrus_structure AS c
+    SET level = u.level, code = u.code, name = u.name, parent_code = u.parent_code, full_path = u.full_path
+    FROM jsonb_to_recordset(COALESCE(updates, '[]'::jsonb))
+        AS u(id BIGINT, level INTEGER, code TEXT, name TEXT, parent_code TEXT, full_path TEXT)
+    WHERE c.id = u.id;
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    IF updated_count <> jsonb_array_length(COALESCE(updates, '[]'::jsonb)) THEN
+        RAISE EXCEPTION 'cyrus_structure a changé pendant la synchronisation (% mises à jour sur %)',
+            updated_count, jsonb_array_length(updates);
+    END IF;
+
+    INSERT INTO cyrus_structure (level, code, name, parent_code, full_path)
+    SELECT i.level, i.code, i.name, i.parent_code, i.full_path
+    FROM jsonb_to_recordset(COALESCE(inserts, '[]'::jsonb))
+        AS i(level INTEGER, code TEXT, name TEXT, parent_code TEXT, full_path TEXT);
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+
+    RETURN jsonb_build_object('inserts', inserted_count, 'updates', updated_count, 'deletes', deleted_count);
+END;
+$$ language 'plpgsql';
+
 -- Triggers pour mise à jour automatique
 CREATE TRIGGER update_articles_updated_at BEFORE UPDATE ON articles FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_nomenclature_updated_at BEFORE UPDATE ON nomenclature_codes FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
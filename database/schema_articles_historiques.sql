@@ -34,6 +34,12 @@ CREATE INDEX IF NOT EXISTS idx_articles_import_batch ON articles_historiques(imp
 -- Index composite pour matching rapide
 CREATE INDEX IF NOT EXISTS idx_articles_search ON articles_historiques(ean, libelle, secteur);
 
+-- Clé naturelle (EAN + NARTAR) pour les imports idempotents (upsert on_conflict=ean,nartar).
+-- Si la table contient déjà des doublons issus d'imports relancés, les supprimer avant :
+-- DELETE FROM articles_historiques a USING articles_historiques b
+--     WHERE a.ean = b.ean AND a.nartar = b.nartar AND a.id < b.id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_natural_key ON articles_historiques(ean, nartar);
+
 -- Statistiques pour le matching IA
 CREATE TABLE IF NOT EXISTS articles_matching_stats (
     id BIGSERIAL PRIMARY KEY,
@@ -44,6 +50,33 @@ CREATE TABLE IF NOT EXISTS articles_matching_stats (
     last_updated TIMESTAMP DEFAULT NOW()
 );
 
+-- Recalcul des statistiques en une seule agrégation côté serveur
+-- (appelé après chaque import : supabase.rpc('refresh_articles_matching_stats'))
+CREATE OR REPLACE FUNCTION refresh_articles_matching_stats()
+RETURNS SETOF articles_matching_stats AS $$
+    INSERT INTO articles_matching_stats (
+        id, total_articles, unique_libelles, unique_eans, classification_coverage, last_updated
+    )
+    SELECT
+        1,
+        COUNT(*),
+        COUNT(DISTINCT libelle),
+        COUNT(DISTINCT ean),
+        -- Couverture : articles avec secteur, rayon et famille renseignés
+        COALESCE(ROUND(100.0 * COUNT(*) FILTER (
+            WHERE secteur IS NOT NULL AND rayon IS NOT NULL AND famille IS NOT NULL
+        ) / NULLIF(COUNT(*), 0), 2), 0),
+        NOW()
+    FROM articles_historiques
+    ON CONFLICT (id) DO UPDATE SET
+        total_articles = EXCLUDED.total_articles,
+        unique_libelles = EXCLUDED.unique_libelles,
+        unique_eans = EXCLUDED.unique_eans,
+        classification_coverage = EXCLUDED.classification_coverage,
+        last_updated = EXCLUDED.last_updated
+    RETURNING *;
+$$ LANGUAGE sql;
+
 -- Fonction de mise à jour automatique des timestamps
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -116,4 +149,5 @@ COMMENT ON COLUMN articles_historiques.libelle IS 'Libellé produit - utilisé p
 COMMENT ON COLUMN articles_historiques.ean IS 'Code-barres EAN13 du produit';
 COMMENT ON COLUMN articles_historiques.import_batch IS 'Batch d''import pour traçabilité';
 COMMENT ON INDEX idx_articles_libelle_gin IS 'Index GIN pour recherche full-text en français';
-COMMENT ON FUNCTION search_similar_articles IS 'Recherche d''articles similaires par libellé avec score de similarité';
\ No newline at end of file
+COMMENT ON FUNCTION search_similar_articles IS 'Recherche d''articles similaires par libellé avec score de similarité';
+COMMENT ON FUNCTION refresh_articles_matching_stats IS 'Recalcule articles_matching_stats (ligne id = 1) en une agrégation';
\ No newline at end of file
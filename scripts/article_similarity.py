@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Recherche de similarité locale sur les libellés de articles_historiques
+Équivalent en mémoire de la fonction SQL search_similar_articles (pg_trgm) :
+- trigrammes calculés comme pg_trgm (mots alphanumériques en minuscules,
+  complétés par deux espaces devant et un derrière)
+- score = similarity() de pg_trgm : trigrammes communs / trigrammes distincts des deux libellés
+- index inversé trigramme -> articles en tableaux numpy (postings CSR triés par article)
+- une requête compte les trigrammes communs de tous les articles dans un tableau
+  d'octets : ses listes y sont ajoutées une à une, et les trigrammes très fréquents,
+  gardés en lignes denses 0/1, y sont additionnés d'un bloc (plus rapide que de
+  disperser leurs longues listes) ; seuls les articles pouvant atteindre le seuil
+  sont ensuite notés
+
+L'index est construit depuis un export de la table et sauvegardé en .npz pour être
+rechargé sans appel réseau.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+DEFAULT_INDEX_PATH = Path(__file__).parent / "articles_historiques.trgm.npz"
+
+# Seuil par défaut de l'opérateur % (pg_trgm.similarity_threshold)
+DEFAULT_THRESHOLD = 0.3
+
+# Colonnes renvoyées par search_similar_articles
+ARTICLE_COLUMNS = ['id', 'ean', 'libelle', 'secteur', 'rayon', 'famille', 'sous_famille']
+
+# Trigrammes présents dans plus d'un article sur 32 : comptés en lignes denses
+# (un octet par article et par trigramme, ~16 Mo pour le catalogue d'essai de 97 000 articles)
+DENSE_FRACTION = 32
+
+# Pagination de l'export REST (limite par défaut de PostgREST)
+FETCH_PAGE_SIZE = 1000
+
+def iter_words(text: str) -> Iterator[str]:
+    """Mots au sens de pg_trgm : suites de caractères alphanumériques, en minuscules"""
+    word: List[str] = []
+    for char in text.lower():
+        if char.isalnum():
+            word.append(char)
+        elif word:
+            yield ''.join(word)
+            word = []
+    if word:
+        yield ''.join(word)
+
+def trigrams(text: str) -> Set[str]:
+    """Ensemble des trigrammes d'un texte, identique à show_trgm() de pg_trgm"""
+    result = set()
+    for word in iter_words(text):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+def trigram_similarity(a: str, b: str) -> float:
+    """similarity(a, b) de pg_trgm (référence pure Python)"""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    shared = len(ta & tb)
+    return shared / (len(ta) + len(tb) - shared)
+
+class TrigramIndex:
+    """
+    Index inversé des libellés : les articles sont numérotés dans l'ordre de l'export.
+    postings[offsets[t]:offsets[t + 1]] liste, par numéro croissant, les articles
+    contenant le trigramme t ; sizes[d] est le nombre de trigrammes distincts de l'article d.
+    Les trigrammes les plus fréquents ont en plus une ligne dense dense[dense_rows[t]]
+    (1 si l'article d contient t), construite au chargement.
+    """
+
+    def __init__(self, vocabulary: Sequence[str], offsets: np.ndarray, postings: np.ndarray,
+                 sizes: np.ndarray, records: Sequence[Dict]):
+        self.vocabulary = list(vocabulary)
+        self.trigram_ids = {trigram: i for i, trigram in enumerate(self.vocabulary)}
+        self.offsets = offsets
+        self.postings = postings
+        self.sizes = sizes
+        self.records = records
+
+        lengths = np.diff(offsets)
+        frequent = np.flatnonzero(lengths > len(sizes) // DENSE_FRACTION)
+        self.dense_rows = {int(t): row for row, t in enumerate(frequent)}
+        self.dense = np.zeros((len(frequent), len(sizes)), dtype=np.uint8)
+        for row, t in enumerate(frequent):
+            self.dense[row, postings[offsets[t]:offsets[t + 1]]] = 1
+
+    @classmethod
+    def build(cls, records: Iterable[Dict], label_field: str = 'libelle') -> "TrigramIndex":
+        """Construire l'index depuis des lignes d'articles (dicts contenant au moins le libellé)"""
+        records = [record for record in records if record.get(label_field)]
+        trigram_ids: Dict[str, int] = {}
+        pair_trigrams = array('i')
+        pair_docs = array('i')
+        sizes = array('i')
+
+        for doc, record in enumerate(records):
+            doc_trigrams = trigrams(record[label_field])
+            sizes.append(len(doc_trigrams))
+            for trigram in doc_trigrams:
+                pair_trigrams.append(trigram_ids.setdefault(trigram, len(trigram_ids)))
+                pair_docs.append(doc)
+
+        pair_trigrams = np.frombuffer(pair_trigrams, dtype=np.int32)
+        # Tri stable par trigramme : chaque liste reste triée par numéro d'article
+        order = np.argsort(pair_trigrams, kind='stable')
+        postings = np.frombuffer(pair_docs, dtype=np.int32)[order]
+        offsets = np.zeros(len(trigram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_trigrams, minlength=len(trigram_ids)), out=offsets[1:])
+
+        vocabulary = sorted(trigram_ids, key=trigram_ids.get)
+        return cls(vocabulary, offsets, postings, np.frombuffer(sizes, dtype=np.int32), records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # --- Recherche ---
+
+    def search(self, text: str, k: int = 10,
+               threshold: float = DEFAULT_THRESHOLD) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Numéros et scores des k articles les plus similaires (score >= threshold),
+        par score décroissant puis article le plus récent (comme ORDER BY ... created_at DESC).
+        """
+        query = trigrams(text)
+        size = len(query)
+        known = [self.trigram_ids[t] for t in query if t in self.trigram_ids]
+        # score >= threshold impose au moins ceil(threshold * |requête|) trigrammes communs
+        min_shared = max(1, math.ceil(threshold * size - 1e-9))
+        if len(known) < min_shared:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        # Compteurs sur un octet (moins de 256 trigrammes communs possibles) : un
+        # tableau de 100 Ko réutilisé par l'allocateur, là où np.bincount en alloue 8 fois plus
+        counts = np.zeros(len(self.sizes), dtype=np.uint8 if len(known) < 256 else np.uint16)
+        for t in known:
+            row = self.dense_rows.get(t)
+            if row is None:
+                # Une liste ne contient chaque article qu'une fois : += sans doublon
+                counts[self.postings[self.offsets[t]:self.offsets[t + 1]]] += 1
+            else:
+                np.add(counts, self.dense[row], out=counts)
+        candidates = np.flatnonzero(counts >= min_shared)
+        shared = counts[candidates]
+
+        scores = shared.astype(np.float32) / (size + self.sizes[candidates] - shared).astype(np.float32)
+        keep = scores >= threshold
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            # Ex aequo au k-ième score : tous gardés pour départager par ancienneté
+            top = np.flatnonzero(scores >= scores[top].min())
+            candidates, scores = candidates[top], scores[top]
+        order = np.lexsort((-candidates, -scores))[:k]
+        return candidates[order], scores[order]
+
+    def query(self, text: str, k: int = 10, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+        """Résultats au format de search_similar_articles (ligne + similarity_score)"""
+        docs, scores = self.search(text, k, threshold)
+        return [dict(self.records[doc], similarity_score=float(score)) for doc, score in zip(docs, scores)]
+
+    def query_many(self, texts: Iterable[str], k: int = 10,
+                   threshold: float = DEFAULT_THRESHOLD) -> List[List[Dict]]:
+        """Recherche par lot : les libellés identiques (après découpe en mots) ne sont cherchés qu'une fois"""
+        cache: Dict[Tuple[str, ...], List[Dict]] = {}
+        results = []
+        for text in texts:
+            key = tuple(iter_words(text))
+            if key not in cache:
+                cache[key] = self.query(text, k, threshold)
+            results.append(cache[key])
+        return results
+
+    # --- Sauvegarde ---
+
+    def save(self, path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, offsets=self.offsets, postings=self.postings, sizes=self.sizes,
+                     vocabulary=np.array(self.vocabulary, dtype=str),
+                     records=np.frombuffer(json.dumps(self.records, ensure_ascii=False,
+                                                      default=str).encode('utf-8'), dtype=np.uint8))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> "TrigramIndex":
+        with np.load(path) as data:
+            records = json.loads(data['records'].tobytes().decode('utf-8'))
+            return cls(data['vocabulary'].tolist(), data['offsets'], data['postings'], data['sizes'], records)
+
+def fetch_articles_rest(supabase, columns: Sequence[str] = ARTICLE_COLUMNS) -> List[Dict]:
+    """Exporter les articles classés de articles_historiques par pages (ordre d'import)"""
+    rows: List[Dict] = []
+    while True:
+        page = (supabase.table('articles_historiques').select(','.join(columns))
+                .not_.is_('secteur', 'null').order('created_at').order('id')
+                .range(len(rows), len(rows) + FETCH_PAGE_SIZE - 1).execute().data)
+        rows.extend(page)
+        if len(page) < FETCH_PAGE_SIZE:
+            return rows
+
+def load_similarity_index(path: Union[str, Path] = DEFAULT_INDEX_PATH) -> Optional[TrigramIndex]:
+    """Index sauvegardé, ou None s'il n'a pas encore été exporté"""
+    if not Path(path).exists():
+        return None
+    return TrigramIndex.load(path)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Index de similarité local des articles historiques")
+    parser.add_argument('--export', action='store_true', help="Exporter articles_historiques et construire l'index")
+    parser.add_argument('--index', default=str(DEFAULT_INDEX_PATH), help="Fichier .npz de l'index")
+    parser.add_argument('--query', action='append', default=[], help="Libellé à rechercher (répétable)")
+    parser.add_argument('--limit', type=int, default=10, help="Nombre de résultats par libellé")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="Score minimal (seuil de %%)")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Comparer à la similarité de référence sur un catalogue synthétique")
+    return parser.parse_args()
+
+def synthetic_catalogue(size: int, seed: int = 7) -> List[Dict]:
+    """Catalogue d'essai : noms de sous-familles CYRUS combinés à des marques et contenances"""
+    import random
+    from cyrus_index import load_cyrus_index
+
+    rng = random.Random(seed)
+    tree = load_cyrus_index().tree
+    names = [tree.names[i] for i in range(len(tree)) if tree.levels[i] == 4]
+    brands = ['DANONE', 'NESTLE', 'LU', 'PANZANI', 'PRESIDENT', 'CASINO', 'BONDUELLE', 'HARIBO', 'EVIAN', 'LESIEUR']
+    sizes = ['25CL', '33CL', '1L', '1.5L', '125G', '250G', '500G', '1KG', 'X6', 'X12']
+    return [{'id': i + 1, 'ean': f"{3000000000000 + i}", 'libelle': f"{rng.choice(brands)} {rng.choice(names)} "
+             f"{rng.choice(sizes)}", 'secteur': None, 'rayon': None, 'famille': None, 'sous_famille': None}
+            for i in range(size)]
+
+def run_self_test() -> bool:
+    import random
+
+    records = synthetic_catalogue(97_000)
+    started = time.perf_counter()
+    index = TrigramIndex.build(records)
+    print(f"🏗️  Index de {len(index):,} libellés construit en {time.perf_counter() - started:.2f}s "
+          f"({len(index.vocabulary):,} trigrammes, {len(index.postings):,} entrées)")
+
+    # Compatibilité pg_trgm sur des cas connus (show_trgm / similarity)
+    known_ok = (sorted(trigrams('Cat')) == ['  c', ' ca', 'at ', 'cat']
+                and abs(trigram_similarity('word', 'two words') - 4 / 11) < 1e-9
+                and trigrams('éclair-45') == trigrams('ÉCLAIR 45'))
+
+    rng = random.Random(3)
+    queries = [rng.choice(records)['libelle'][:rng.randint(6, 30)] + rng.choice(['', ' BIO', ' PROMO'])
+               for _ in range(200)]
+    # Référence exhaustive : similarity() recalculée contre tous les libellés
+    record_trigrams = [trigrams(r['libelle']) for r in records]
+    exact = True
+    for text in queries[:20]:
+        query = trigrams(text)
+        expected = sorted(((len(query & t) / len(query | t), d) for d, t in enumerate(record_trigrams)),
+                          key=lambda pair: (-pair[0], -pair[1]))
+        expected = [(d, s) for s, d in expected if s >= DEFAULT_THRESHOLD][:10]
+        docs, scores = index.search(text)
+        exact &= ([d for d, _ in expected] == docs.tolist()
+                  and all(abs(s - float(g)) < 1e-6 for (_, s), g in zip(expected, scores)))
+
+    # Meilleur de 3 passages : le premier paie aussi la mise en cache des lignes denses
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        results = index.query_many(queries)
+        timings.append(time.perf_counter() - started)
+    per_query_ms = min(timings) * 1000 / len(queries)
+    print(f"🔍 Trigrammes identiques à pg_trgm: {'✅' if known_ok else '❌'}")
+    print(f"🔍 Top-10 identique au calcul exhaustif: {'✅' if exact else '❌'}")
+    # Indicatif seulement : une mesure de temps ne fait pas échouer l'auto-test
+    print(f"⚡ {per_query_ms:.3f} ms par requête ({len(results)} requêtes, "
+          f"{sum(map(len, results)):,} résultats, objectif < 1 ms "
+          f"{'atteint' if per_query_ms < 1 else 'non atteint'})")
+    return known_ok and exact
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    if args.export:
+        from import_historical_data import get_supabase
+
+        started = time.perf_counter()
+        records = fetch_articles_rest(get_supabase())
+        print(f"📥 {len(records):,} articles exportés en {time.perf_counter() - started:.1f}s")
+        index = TrigramIndex.build(records)
+        index.save(args.index)
+        print(f"💾 Index ({len(index.vocabulary):,} trigrammes) sauvegardé dans: {args.index}")
+    else:
+        index = load_similarity_index(args.index)
+        if index is None:
+            print(f"❌ Index absent: {args.index} (lancer avec --export)")
+            return False
+
+    for text, matches in zip(args.query, index.query_many(args.query, args.limit, args.threshold)):
+        print(f"\n🔎 {text}")
+        for match in matches:
+            print(f"   {match['similarity_score']:.3f}  {match['libelle']}  "
+                  f"[{match.get('secteur')} > {match.get('rayon')} > {match.get('famille')}]")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Uploader concurrent pour les imports PostgREST / Supabase
+- Plusieurs lots en vol en parallèle (nombre borné)
+- Taille de lot adaptative selon la latence et les erreurs
+- Limitation de débit par seau à jetons (remplace le time.sleep fixe)
+- Relance avec backoff exponentiel sur 429 / 5xx / erreurs réseau
+- Lot refusé pour cause de données : découpe par dichotomie jusqu'aux lignes fautives,
+  écrites dans un fichier de rejets (JSONL)
+"""
+
+import http.client
+import json
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+
+# Statuts HTTP pour lesquels une nouvelle tentative a du sens
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+class UploadError(Exception):
+    """Échec d'envoi d'un lot (status=None pour une erreur réseau)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        return self.status is None or self.status in RETRYABLE_STATUSES
+
+class PostgrestSender:
+    """
+    Envoi d'un lot JSON vers une table PostgREST (API REST de Supabase ou stub local).
+    Chaque thread garde sa propre connexion keep-alive.
+    """
+
+    def __init__(self, base_url: str, api_key: str, table: str, on_conflict: Optional[str] = None,
+                 timeout: float = 60.0):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+
+        self.table_path = f"{parts.path.rstrip('/')}/rest/v1/{table}"
+        self.path = self.table_path
+        self.conflict_keys = [key.strip() for key in on_conflict.split(',')] if on_conflict else []
+        prefer = ['return=minimal']
+        if on_conflict:
+            # Upsert : les lignes existantes sur la clé naturelle sont mises à jour
+            self.path += '?' + urlencode({'on_conflict': on_conflict})
+            prefer.append('resolution=merge-duplicates')
+
+        self.headers = {
+            'Content-Type': 'application/json',
+            'apikey': api_key,
+            'Authorization': f'Bearer {api_key}',
+            'Prefer': ','.join(prefer),
+        }
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = cls(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _reset(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> bytes:
+        """Requête brute sur la connexion du thread. Lève UploadError si le statut n'est pas 2xx"""
+        conn = self._connection()
+        try:
+            conn.request(method, path, body=body, headers={**self.headers, **(headers or {})})
+            response = conn.getresponse()
+            payload = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self._reset()
+            raise UploadError(f"Erreur réseau: {e}")
+
+        if response.status >= 300:
+            retry_after = response.getheader('Retry-After')
+            raise UploadError(
+                f"HTTP {response.status}: {payload[:200].decode('utf-8', 'replace')}",
+                status=response.status,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        return payload
+
+    def __call__(self, records: List[dict]) -> int:
+        """Envoyer un lot ; retourne le nombre de lignes écrites (doublons de clé du lot retirés)"""
+        if self.conflict_keys:
+            # Postgres refuse un upsert qui touche deux fois la même clé dans une requête :
+            # on ne garde que la dernière occurrence de chaque clé naturelle du lot
+            unique = {tuple(record[key] for key in self.conflict_keys): record for record in records}
+            records = list(unique.values())
+        self.request('POST', self.path, json.dumps(records).encode('utf-8'))
+        return len(records)
+
+    def delete_matching(self, keys: List[dict]):
+        """
+        Supprimer les lignes dont les colonnes correspondent exactement à l'une des clés,
+        en une seule requête : DELETE ...?or=(and(col.eq."v",...),...)
+        """
+        def quote(value) -> str:
+            return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+        clauses = ['and(' + ','.join(f"{col}.eq.{quote(val)}" for col, val in key.items()) + ')' for key in keys]
+        query = urlencode({'or': '(' + ','.join(clauses) + ')'})
+        self.request('DELETE', f"{self.table_path}?{query}", headers={'Prefer': 'return=minimal'})
+
+class DeadLetterFile:
+    """
+    Lignes refusées définitivement, une par ligne JSON : {"position", "error", "row"}.
+    Le fichier n'est créé qu'au premier rejet ; les écritures sont sûres entre threads.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.count = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def write(self, position: int, row: dict, error: str):
+        line = json.dumps({'position': position, 'error': error, 'row': row}, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class TokenBucket:
+    """Limiteur de débit : `rate` requêtes par seconde, rafales jusqu'à `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+class ConcurrentUploader:
+    """
+    Envoie un flux de lignes en lots concurrents.
+    Chaque lot est identifié par sa position [start, end) dans le flux d'entrée,
+    ce qui permet de savoir exactement quelles lignes ont été validées.
+    Un lot refusé pour une erreur non relançable (400, 409, 422...) est coupé en deux
+    récursivement : k lignes invalides sur n sont isolées en O(k log n) requêtes au lieu
+    de n envois ligne à ligne, et chacune est écrite dans `dead_letter` si fourni.
+    """
+
+    def __init__(self, send: Callable[[List[dict]], Optional[int]], max_in_flight: int = 4,
+                 batch_size: int = 1000, min_batch_size: int = 100, max_batch_size: int = 5000,
+                 rate: Optional[float] = None, max_retries: int = 5, backoff_base: float = 0.5,
+                 max_backoff: float = 30.0, target_latency: float = 2.0, verbose: bool = True,
+                 bisect: bool = True, dead_letter: Optional[DeadLetterFile] = None):
+        self.send = send
+        self.max_in_flight = max_in_flight
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.target_latency = target_latency
+        self.verbose = verbose
+        self.bisect = bisect
+        self.dead_letter = dead_letter
+        self.bucket = TokenBucket(rate) if rate else None
+
+        self._batch_size = max(min_batch_size, min(batch_size, max_batch_size))
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.bisections = 0
+        # Lignes validées mais non écrites (doublons de clé naturelle dans un même lot)
+        self.duplicates = 0
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    # --- Taille de lot adaptative (augmentation douce, réduction franche) ---
+
+    def _on_latency(self, latency: float):
+        with self._lock:
+            if latency < self.target_latency:
+                self._batch_size = min(self.max_batch_size, int(self._batch_size * 1.25))
+            else:
+                self._batch_size = max(self.min_batch_size, int(self._batch_size * 0.75))
+
+    def _shrink(self):
+        with self._lock:
+            self._batch_size = max(self.min_batch_size, self._batch_size // 2)
+
+    # --- Envoi d'un lot avec relances ---
+
+    def _send_with_retry(self, start: int, batch: List[dict]) -> List[Tuple[int, int, Optional[str], int]]:
+        """
+        Envoyer un lot ; retourne des tranches (start, count, erreur ou None, lignes écrites).
+        `send` peut retourner le nombre de lignes réellement écrites (None : tout le lot).
+        """
+        attempt = 0
+        while True:
+            if self.bucket:
+                self.bucket.acquire()
+            began = time.perf_counter()
+            with self._lock:
+                self.requests += 1
+            try:
+                written = self.send(batch)
+                self._on_latency(time.perf_counter() - began)
+                written = len(batch) if written is None else written
+                if written < len(batch):
+                    with self._lock:
+                        self.duplicates += len(batch) - written
+                return [(start, len(batch), None, written)]
+            except UploadError as e:
+                # Lot trop gros pour le serveur : on le coupe en deux au lieu de relancer tel quel
+                if e.status == 413 and len(batch) > 1:
+                    self._shrink()
+                    half = len(batch) // 2
+                    return (self._send_with_retry(start, batch[:half]) +
+                            self._send_with_retry(start + half, batch[half:]))
+
+                if not e.retryable:
+                    return self._reject(start, batch, e)
+                if attempt >= self.max_retries:
+                    return [(start, len(batch), str(e), 0)]
+
+                if e.status is None or e.status >= 500:
+                    self._shrink()
+
+                delay = e.retry_after
+                if delay is None:
+                    delay = min(self.max_backoff, self.backoff_base * (2 ** attempt)) * (0.5 + random.random())
+                attempt += 1
+                with self._lock:
+                    self.retries += 1
+                time.sleep(delay)
+
+    def _reject(self, start: int, batch: List[dict],
+                error: UploadError) -> List[Tuple[int, int, Optional[str], int]]:
+        """Lot refusé par le serveur : dichotomie jusqu'aux lignes fautives, puis rejet"""
+        if self.bisect and len(batch) > 1:
+            with self._lock:
+                self.bisections += 1
+            half = len(batch) // 2
+            return (self._send_with_retry(start, batch[:half]) +
+                    self._send_with_retry(start + half, batch[half:]))
+
+        if self.dead_letter:
+            for position, row in enumerate(batch, start):
+                self.dead_letter.write(position, row, str(error))
+        return [(start, len(batch), str(error), 0)]
+
+    # --- Flux complet ---
+
+    def upload(self, chunks: Iterable[List[dict]],
+               on_success: Optional[Callable[[int, int], None]] = None) -> Tuple[int, List[str]]:
+        """
+        Envoyer tous les lots du flux `chunks` ; les positions sont comptées
+        à partir de 0 dans l'ordre du flux. Retourne (nb lignes importées, erreurs).
+        """
+        def positioned():
+            offset = 0
+            for records in chunks:
+                yield offset, records
+                offset += len(records)
+
+        return self.upload_ranges(positioned(), on_success)
+
+    def upload_ranges(self, chunks: Iterable[Tuple[int, List[dict]]],
+                      on_success: Optional[Callable[[int, int], None]] = None) -> Tuple[int, List[str]]:
+        """
+        Envoyer un flux de morceaux (position de départ, lignes). Les morceaux sont redécoupés
+        à la taille de lot courante ; au plus max_in_flight lots sont en cours à la fois.
+        on_success(start, end) est appelé (dans le thread appelant) pour chaque tranche validée.
+        Retourne (nb lignes écrites, erreurs) ; les doublons écartés sont comptés dans self.duplicates.
+        """
+        success_count = 0
+        errors: List[str] = []
+        in_flight = set()
+
+        def collect(done):
+            nonlocal success_count
+            for future in done:
+                for start, count, error, written in future.result():
+                    if error:
+                        errors.append(f"Lignes {start}-{start + count - 1}: {error}")
+                        if self.verbose:
+                            print(f"   ❌ Lignes {start}-{start + count - 1}: {error[:100]}")
+                        continue
+                    success_count += written
+                    if on_success:
+                        on_success(start, start + count)
+                    if self.verbose:
+                        dropped = f", {count - written} doublons ignorés" if written < count else ""
+                        print(f"   ✅ {written} articles importés ({success_count:,} au total{dropped}, "
+                              f"lot courant: {self._batch_size})")
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            for offset, records in chunks:
+                i = 0
+                while i < len(records):
+                    batch = records[i:i + self._batch_size]
+                    if len(in_flight) >= self.max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    in_flight.add(pool.submit(self._send_with_retry, offset + i, batch))
+                    i += len(batch)
+
+            done, _ = wait(in_flight)
+            collect(done)
+
+        return success_count, errors
+
+# --- Test autonome contre un stub PostgREST local ---
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    received: Dict[int, int] = {}
+    received_lock = threading.Lock()
+
+    class FlakyPostgrestStub(BaseHTTPRequestHandler):
+        """Stub minimal : accepte les POST JSON, renvoie parfois 429 / 503 / 413, et 400 pour un lot invalide"""
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            rows = json.loads(body)
+            roll = random.random()
+            if len(rows) > 1500:
+                status = 413
+            elif any(row['libelle'] is None for row in rows):
+                status = 400
+            elif roll < 0.1:
+                status = 429
+            elif roll < 0.2:
+                status = 503
+            else:
+                status = 201
+                with received_lock:
+                    for row in rows:
+                        received[row['id']] = received.get(row['id'], 0) + 1
+            self.send_response(status)
+            if status == 429:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyPostgrestStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    total = 20000
+    invalid_ids = {123, 124, 9001, 19999}
+    rows = [{'id': i, 'libelle': None if i in invalid_ids else f'ARTICLE {i}'} for i in range(total)]
+    chunks = (rows[i:i + 3000] for i in range(0, total, 3000))
+
+    sender = PostgrestSender(f"http://127.0.0.1:{server.server_port}", 'cle-test', 'articles_historiques')
+    dead_letter = DeadLetterFile(Path(tempfile.mkdtemp()) / 'rejets.jsonl')
+    uploader = ConcurrentUploader(sender, max_in_flight=4, batch_size=500, max_batch_size=2000,
+                                  rate=200, backoff_base=0.01, max_retries=20, verbose=False,
+                                  dead_letter=dead_letter)
+
+    print("🧪 Test de l'uploader concurrent contre un stub PostgREST local")
+    started = time.perf_counter()
+    committed = []
+    success_count, errors = uploader.upload(chunks, on_success=lambda s, e: committed.append((s, e)))
+    elapsed = time.perf_counter() - started
+    dead_letter.close()
+
+    valid_ids = [i for i in range(total) if i not in invalid_ids]
+    exactly_once = sorted(received) == valid_ids and set(received.values()) == {1}
+
+    # Upsert avec doublons de clé dans un lot : seule la dernière occurrence est écrite et comptée
+    received.clear()
+    upsert_rows = [{'id': i, 'libelle': f'ARTICLE {i}'} for i in range(1000)]
+    for i in (10, 20, 30):
+        upsert_rows.insert(i + 1, {'id': i, 'libelle': f'ARTICLE {i} CORRIGE'})
+    upserter = ConcurrentUploader(PostgrestSender(f"http://127.0.0.1:{server.server_port}", 'cle-test',
+                                                  'articles_historiques', on_conflict='id'),
+                                  batch_size=1000, min_batch_size=1000, max_batch_size=1000,
+                                  backoff_base=0.01, max_retries=20, verbose=False)
+    upserted, _ = upserter.upload([upsert_rows])
+    server.shutdown()
+    dedup_ok = upserted == 1000 and upserter.duplicates == 3 and len(received) == 1000
+    covered = sum(end - start for start, end in committed) == len(valid_ids)
+    with open(dead_letter.path, encoding='utf-8') as f:
+        rejected = sorted(json.loads(line)['position'] for line in f)
+
+    print(f"   {success_count:,}/{total:,} lignes en {elapsed:.2f}s, {uploader.requests} requêtes, "
+          f"{uploader.retries} relances, {uploader.bisections} découpes, {len(errors)} erreurs")
+    print(f"   Chaque ligne reçue exactement une fois: {'✅' if exactly_once else '❌'}")
+    print(f"   Tranches validées couvrant tout le flux valide: {'✅' if covered else '❌'}")
+    print(f"   Lignes invalides isolées dans {dead_letter.path.name}: "
+          f"{'✅' if rejected == sorted(invalid_ids) else '❌'}")
+    print(f"   Doublons de clé d'un lot: {upserted} lignes écrites, {upserter.duplicates} ignorées "
+          f"{'✅' if dedup_ok else '❌'}")
+    ok = (exactly_once and covered and rejected == sorted(invalid_ids) and success_count == len(valid_ids)
+          and dedup_ok)
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Classification en cascade, des étapes les moins chères aux plus chères
+1. exact   : EAN ou libellé corrigé (règles V2) déjà classés dans l'historique
+2. history : vote des articles historiques les plus similaires (trigrammes)
+3. knn     : vote kNN TF-IDF calibré
+4. llm     : OpenRouter en deux étapes (famille puis sous-famille), réseau
+
+Chaque étape ne reçoit que les articles que les précédentes n'ont pas tranchés :
+une réponse est acceptée si sa confiance atteint le seuil de l'étape, sinon
+l'article passe à l'étape suivante. Si aucune étape n'atteint son seuil, la
+meilleure réponse obtenue est gardée, marquée non résolue.
+Taux d'acceptation et latence sont relevés par étape.
+"""
+
+import argparse
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cyrus_index import CyrusIndex
+from cyrus_parser import SOUS_FAMILLE
+
+# (EAN, libellé brut) d'un article à classer
+Item = Tuple[Optional[str], str]
+# (nœud CYRUS sous-famille, confiance entre 0 et 1)
+Answer = Tuple[int, float]
+
+DEFAULT_THRESHOLDS = {
+    'exact': 0.9,
+    'history': 0.9,
+    'knn': 0.9,
+    'llm': 0.0,
+}
+
+# Articles historiques tirés pour calibrer la confiance de l'étape history
+HISTORY_CALIBRATION_SAMPLE = 2000
+
+# Occurrences historiques d'un EAN ou d'un libellé à partir desquelles une reprise exacte
+# garde sa pleine confiance ; en dessous, la confiance est réduite d'autant
+EXACT_MIN_SUPPORT = 2
+
+CODE_FIELDS = ['secteur_code', 'rayon_code', 'famille_code', 'sous_famille_code']
+NAME_FIELDS = ['secteur', 'rayon', 'famille', 'sous_famille']
+
+def record_node(index: CyrusIndex, record: Dict) -> Optional[int]:
+    """Sous-famille CYRUS d'un article historique : par ses codes, à défaut par ses noms"""
+    codes = [record.get(field) for field in CODE_FIELDS]
+    if all(codes):
+        try:
+            return index.lookup(*(int(code) for code in codes))
+        except (TypeError, ValueError):
+            return None
+    for node in index.find_name(record.get('sous_famille') or '', SOUS_FAMILLE):
+        classification = index.classification(node)
+        if all(classification[field] == record.get(field) for field in NAME_FIELDS[:3]):
+            return node
+    return None
+
+# --- Étapes ---
+
+class CascadeStage(ABC):
+    """Étape : classify(items) renvoie pour chaque article une réponse (nœud, confiance) ou None"""
+
+    name = ''
+    network = False
+
+    def __init__(self, index: CyrusIndex):
+        self.index = index
+
+    @abstractmethod
+    def classify(self, items: Sequence[Item]) -> List[Optional[Answer]]:
+        ...
+
+class ExactStage(CascadeStage):
+    """
+    Reprise de l'historique ; confiance = accord des occurrences x min(1, support / min_support) :
+    une clé vue une seule fois ne passe pas le seuil mais reste une réponse de repli
+    """
+
+    name = 'exact'
+
+    def __init__(self, index: CyrusIndex, exact, min_support: int = EXACT_MIN_SUPPORT):
+        super().__init__(index)
+        self.exact = exact
+        self.min_support = min_support
+
+    def classify(self, items: Sequence[Item]) -> List[Optional[Answer]]:
+        answers = []
+        for match in self.exact.lookup_many(items):
+            node = self.index.lookup(*match.codes) if match is not None else None
+            if node is None:
+                answers.append(None)
+                continue
+            answers.append((node, match.agreement * min(1.0, match.support / self.min_support)))
+        return answers
+
+class HistoryStage(CascadeStage):
+    """
+    Vote des voisins trigrammes pondéré par similarité² ; score brut = part du vote x
+    meilleure similarité, converti en probabilité d'avoir raison par régression isotone
+    (apprise en leave-one-out sur un échantillon de l'historique, comme pour le kNN,
+    les doublons exacts du libellé étant retirés avec lui)
+    """
+
+    name = 'history'
+
+    def __init__(self, index: CyrusIndex, similarity, k: int = 10, calibrate: bool = True):
+        super().__init__(index)
+        self.similarity = similarity
+        self.k = k
+        self.calibration = self._fit_calibration() if calibrate else None
+
+    def _vote(self, records: Sequence[Dict]) -> Optional[Tuple[int, float]]:
+        """(nœud, score brut) du vote des voisins, None si aucun n'est rattaché à CYRUS"""
+        votes: Dict[int, float] = {}
+        best: Dict[int, float] = {}
+        for record in records:
+            node = record_node(self.index, record)
+            if node is not None:
+                score = record['similarity_score']
+                votes[node] = votes.get(node, 0.0) + score ** 2
+                best[node] = max(best.get(node, 0.0), score)
+        if not votes:
+            return None
+        node = max(votes, key=votes.get)
+        return node, votes[node] / sum(votes.values()) * best[node]
+
+    def _confidence(self, score: float) -> float:
+        if self.calibration is None:
+            return score
+        ends, values = self.calibration
+        return float(np.interp(score, ends, values))
+
+    def _fit_calibration(self, sample: int = HISTORY_CALIBRATION_SAMPLE, seed: int = 0):
+        """
+        Score brut -> probabilité d'avoir raison. Chaque article tiré est retiré de ses voisins avec
+        tous ceux de même libellé corrigé : l'étape ne reçoit que des libellés que l'étape exact
+        n'a pas reconnus, un doublon parmi les voisins gonflerait la confiance.
+        """
+        from knn_classifier import isotonic_fit
+        from label_processor import DEFAULT_PROCESSOR
+
+        records = self.similarity.records
+        corrected = [DEFAULT_PROCESSOR.correct(record['libelle']) for record in records]
+        duplicates = Counter(corrected)
+        rng = np.random.default_rng(seed)
+        rows = rng.choice(len(records), size=min(sample, len(records)), replace=False)
+        scores: List[float] = []
+        outcomes: List[bool] = []
+        for row in rows.tolist():
+            expected = record_node(self.index, records[row])
+            if expected is None:
+                continue
+            label = corrected[row]
+            docs, similarities = self.similarity.search(records[row]['libelle'], self.k + duplicates[label])
+            vote = self._vote([dict(records[doc], similarity_score=float(score))
+                               for doc, score in zip(docs.tolist(), similarities)
+                               if corrected[doc] != label][:self.k])
+            scores.append(vote[1] if vote is not None else 0.0)
+            outcomes.append(vote is not None and vote[0] == expected)
+        if not scores:
+            return None
+        return isotonic_fit(np.array(scores), np.array(outcomes))
+
+    def classify(self, items: Sequence[Item]) -> List[Optional[Answer]]:
+        answers = []
+        for records in self.similarity.query_many([label for _, label in items], k=self.k):
+            vote = self._vote(records)
+            answers.append((vote[0], self._confidence(vote[1])) if vote is not None else None)
+        return answers
+
+class KnnStage(CascadeStage):
+    name = 'knn'
+
+    def __init__(self, index: CyrusIndex, knn):
+        super().__init__(index)
+        self.knn = knn
+
+    def classify(self, items: Sequence[Item]) -> List[Optional[Answer]]:
+        answers = []
+        for prediction in self.knn.predict([label for _, label in items]):
+            node = self.index.lookup(*prediction.codes) if prediction is not None else None
+            answers.append((node, prediction.confidence) if node is not None else None)
+        return answers
+
+class LlmStage(CascadeStage):
+    """
+    Classifieur LLM : `classify(labels)` au format de HierarchicalClassifier / BatchClassifier
+    (dicts avec les codes CYRUS et une confiance sur 100)
+    """
+
+    name = 'llm'
+    network = True
+
+    def __init__(self, index: CyrusIndex, classify: Callable[[List[str]], List[Optional[dict]]]):
+        super().__init__(index)
+        self.classify_labels = classify
+
+    def classify(self, items: Sequence[Item]) -> List[Optional[Answer]]:
+        answers = []
+        for result in self.classify_labels([label for _, label in items]):
+            node = record_node(self.index, result) if result else None
+            answers.append((node, result['confidence'] / 100) if node is not None else None)
+        return answers
+
+# --- Cascade ---
+
+@dataclass
+class StageStats:
+    seen: int = 0
+    answered: int = 0
+    accepted: int = 0
+    seconds: float = 0.0
+
+class CascadeClassifier:
+    def __init__(self, index: CyrusIndex, stages: Sequence[CascadeStage],
+                 thresholds: Optional[Dict[str, float]] = None):
+        self.index = index
+        self.stages = list(stages)
+        self.thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self.stage_stats = {stage.name: StageStats() for stage in self.stages}
+        self.total = 0
+
+    def classify(self, items: Sequence[Item]) -> List[Optional[dict]]:
+        """
+        Classification de chaque (EAN, libellé) : noms et codes CYRUS, `confidence`,
+        `stage` qui a répondu et `resolved` (seuil de l'étape atteint) ; None si aucune réponse
+        """
+        items = [(ean, label or '') for ean, label in items]
+        unique = list(dict.fromkeys(items))
+        self.total += len(unique)
+        best: Dict[Item, Tuple[int, float, str]] = {}
+        resolved = set()
+        pending = unique
+
+        for stage in self.stages:
+            if not pending:
+                break
+            stats = self.stage_stats[stage.name]
+            threshold = self.thresholds.get(stage.name, 0.0)
+            started = time.perf_counter()
+            answers = stage.classify(pending)
+            stats.seconds += time.perf_counter() - started
+            stats.seen += len(pending)
+
+            escalate = []
+            for item, answer in zip(pending, answers):
+                if answer is not None:
+                    stats.answered += 1
+                    node, confidence = answer
+                    if item not in best or confidence > best[item][1]:
+                        best[item] = (node, confidence, stage.name)
+                    if confidence >= threshold:
+                        stats.accepted += 1
+                        best[item] = (node, confidence, stage.name)
+                        resolved.add(item)
+                        continue
+                escalate.append(item)
+            pending = escalate
+
+        results: Dict[Item, Optional[dict]] = {}
+        for item in unique:
+            if item not in best:
+                results[item] = None
+                continue
+            node, confidence, stage = best[item]
+            results[item] = {**self.index.classification(node), 'confidence': round(confidence, 4),
+                             'stage': stage, 'resolved': item in resolved}
+        return [results[item] for item in items]
+
+    def stats(self) -> dict:
+        """Par étape : articles reçus, acceptés, taux d'acceptation et latence par article"""
+        stages = {}
+        offline = 0
+        for stage in self.stages:
+            stats = self.stage_stats[stage.name]
+            stages[stage.name] = {
+                'seen': stats.seen,
+                'answered': stats.answered,
+                'accepted': stats.accepted,
+                'hit_rate': stats.accepted / stats.seen if stats.seen else 0.0,
+                'share_of_total': stats.accepted / self.total if self.total else 0.0,
+                'us_per_item': stats.seconds / stats.seen * 1e6 if stats.seen else 0.0,
+            }
+            if not stage.network:
+                offline += stats.accepted
+        network_calls = sum(self.stage_stats[stage.name].seen for stage in self.stages if stage.network)
+        return {'total': self.total, 'resolved_offline': offline / self.total if self.total else 0.0,
+                'sent_to_network': network_calls, 'stages': stages}
+
+def print_stats(stats: dict, file=None):
+    print(f"📊 {stats['total']:,} articles, {stats['resolved_offline']:.1%} résolus sans réseau, "
+          f"{stats['sent_to_network']:,} envoyés au LLM", file=file)
+    for name, line in stats['stages'].items():
+        print(f"   {name:<8} reçus {line['seen']:>7,}  acceptés {line['accepted']:>7,} "
+              f"({line['hit_rate']:.1%})  {line['us_per_item']:>10,.1f} µs/article", file=file)
+
+def build_cascade(index: CyrusIndex, thresholds: Optional[Dict[str, float]] = None,
+                  use_llm: bool = True, workers: int = 4) -> Tuple[CascadeClassifier, Callable[[], None]]:
+    """
+    Cascade à partir des index sauvegardés (étapes absentes ignorées) ; retourne aussi
+    la fonction de fermeture des ressources (client OpenRouter, cache). Les messages
+    vont sur la sortie d'erreur : la sortie standard peut porter les résultats JSONL.
+    """
+    from article_similarity import load_similarity_index
+    from exact_match import load_exact_match_index
+    from knn_classifier import load_knn_classifier
+
+    stages: List[CascadeStage] = []
+    exact = load_exact_match_index()
+    if exact is not None:
+        stages.append(ExactStage(index, exact))
+    else:
+        print("⚠️  Étape exact ignorée : index absent ou périmé (exact_match.py --export)", file=sys.stderr)
+    similarity = load_similarity_index()
+    if similarity is not None:
+        stages.append(HistoryStage(index, similarity))
+    else:
+        print("⚠️  Étape history ignorée : index absent (article_similarity.py --export)", file=sys.stderr)
+    try:
+        knn = load_knn_classifier()
+        if knn is None:
+            print("⚠️  Étape knn ignorée : modèle absent (knn_classifier.py --export)", file=sys.stderr)
+    except RuntimeError as e:
+        print(f"⚠️  Étape knn ignorée : {e}", file=sys.stderr)
+        knn = None
+    if knn is not None:
+        stages.append(KnnStage(index, knn))
+
+    closers: List[Callable[[], None]] = []
+    if use_llm:
+        from dotenv import load_dotenv
+        from llm_batch_classifier import get_openrouter_key
+
+        load_dotenv()
+        api_key = get_openrouter_key()
+        if api_key:
+            from hierarchical_classifier import CandidateGenerator, HierarchicalClassifier
+            from llm_cache import LlmResponseCache
+            from openrouter_async import SyncOpenRouterClient
+
+            client = SyncOpenRouterClient(api_key, max_concurrency=workers)
+            cache = LlmResponseCache()
+            classifier = HierarchicalClassifier(client.complete, index, CandidateGenerator(index, knn, similarity),
+                                                workers=workers, cache=cache)
+            stages.append(LlmStage(index, classifier.classify))
+            closers += [client.close, cache.close]
+        else:
+            print("⚠️  Étape llm ignorée : clé OpenRouter manquante", file=sys.stderr)
+
+    def close():
+        for closer in closers:
+            closer()
+    return CascadeClassifier(index, stages, thresholds), close
+
+# --- Auto-test ---
+
+def run_self_test() -> bool:
+    import random
+    from article_similarity import TrigramIndex
+    from cyrus_index import load_cyrus_index
+    from exact_match import ExactMatchIndex
+    from knn_classifier import KnnClassifier, synthetic_training_set
+
+    rng = random.Random(3)
+    index = load_cyrus_index()
+    labels, codes = synthetic_training_set(45_000)
+    split = 40_000
+    # Un article revient une à trois fois dans l'historique (même EAN, même libellé, mêmes codes)
+    history = [(f"{3000000000000 + i}", label, key) for i, (label, key) in enumerate(zip(labels[:split], codes[:split]))
+               for _ in range(rng.randint(1, 3))]
+
+    started = time.perf_counter()
+    exact = ExactMatchIndex.build(history)
+    similarity = TrigramIndex.build({'id': i, 'libelle': label, **dict(zip(CODE_FIELDS, key))}
+                                    for i, (_, label, key) in enumerate(history))
+    knn = KnnClassifier.fit(labels[:split], codes[:split])
+    print(f"🏗️  Index exact, trigrammes et kNN construits en {time.perf_counter() - started:.1f}s")
+
+    # Flux entrant : 35 % d'EAN déjà vus, 15 % de libellés repris avec un nouvel EAN, 50 % de nouveautés
+    incoming: List[Item] = []
+    expected: List[int] = []
+    for i in range(4_000):
+        roll = rng.random()
+        if roll < 0.35:
+            ean, label, key = rng.choice(history)
+        elif roll < 0.5:
+            _, label, key = rng.choice(history)
+            ean = f"{4000000000000 + i}"
+        else:
+            j = rng.randrange(split, len(labels))
+            ean, label, key = f"{5000000000000 + i}", labels[j], codes[j]
+        incoming.append((ean, label))
+        expected.append(index.lookup(*key))
+
+    expected_by_label = {label: node for (_, label), node in zip(incoming, expected)}
+    llm_calls = []
+
+    def fake_llm(batch: List[str]) -> List[Optional[dict]]:
+        """LLM simulé : réponse juste, 50 ms par libellé de latence réseau"""
+        llm_calls.extend(batch)
+        time.sleep(0.05 * len(batch) / 8)
+        return [{**index.classification(expected_by_label[label]), 'confidence': 90.0} for label in batch]
+
+    cascade = CascadeClassifier(index, [ExactStage(index, exact), HistoryStage(index, similarity),
+                                        KnnStage(index, knn), LlmStage(index, fake_llm)])
+    started = time.perf_counter()
+    results = cascade.classify(incoming)
+    elapsed = time.perf_counter() - started
+    stats = cascade.stats()
+    print_stats(stats)
+
+    # Comparaison par noms : quelques chemins CYRUS existent en double sous des codes différents
+    def same(result, node):
+        return result is not None and all(result[field] == index.classification(node)[field] for field in NAME_FIELDS)
+    accuracy = {}
+    for name in DEFAULT_THRESHOLDS:
+        pairs = [(r, n) for r, n in zip(results, expected) if r is not None and r['stage'] == name]
+        if pairs:
+            accuracy[name] = sum(same(r, n) for r, n in pairs) / len(pairs)
+    overall = sum(same(r, n) for r, n in zip(results, expected)) / len(results)
+    print(f"🎯 Précision par étape: " + ', '.join(f"{name} {value:.1%}" for name, value in accuracy.items())
+          + f" ; globale {overall:.1%} en {elapsed:.2f}s")
+
+    # Un EAN vu une seule fois répond, mais sous le seuil de l'étape exact
+    seen = Counter(ean for ean, _, _ in history)
+    single = next(item for item in history if seen[item[0]] == 1)
+    answer = ExactStage(index, exact).classify([(single[0], None)])[0]
+    single_ok = answer is not None and answer[1] < DEFAULT_THRESHOLDS['exact']
+    print(f"🔍 Support 1 non accepté par l'étape exact: {'✅' if single_ok else '❌'}")
+
+    # Confiance calibrée : une étape acceptée au seuil 0.9 doit être juste au moins 9 fois sur 10
+    ok = (stats['resolved_offline'] >= 0.5 and len(llm_calls) == stats['sent_to_network'] < len(set(incoming)) / 2
+          and all(value >= 0.9 for value in accuracy.values()) and overall >= 0.95
+          and all(r is not None for r in results) and single_ok)
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+def parse_threshold(value: str) -> Tuple[str, float]:
+    name, _, threshold = value.partition('=')
+    if name not in DEFAULT_THRESHOLDS or not threshold:
+        raise argparse.ArgumentTypeError(f"attendu étape=seuil avec étape parmi {', '.join(DEFAULT_THRESHOLDS)}")
+    return name, float(threshold)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Classification en cascade : exact → historique → kNN → LLM")
+    parser.add_argument('--input', default=None,
+                        help="Fichier texte, une ligne par article : « EAN;libellé » ou libellé seul")
+    parser.add_argument('--label', action='append', default=[], help="Libellé à classer (répétable)")
+    parser.add_argument('--threshold', action='append', type=parse_threshold, default=[],
+                        help="Seuil d'acceptation d'une étape, ex. knn=0.95 (répétable)")
+    parser.add_argument('--no-llm', action='store_true', help="Sans appel réseau : étapes locales seulement")
+    parser.add_argument('--workers', type=int, default=4, help="Requêtes LLM en parallèle")
+    parser.add_argument('--output', default=None, help="Fichier JSONL des résultats (défaut: sortie standard)")
+    parser.add_argument('--self-test', action='store_true', help="Tester sur un catalogue synthétique")
+    return parser.parse_args()
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    from cyrus_index import load_cyrus_index
+
+    items: List[Item] = [(None, label) for label in args.label]
+    if args.input:
+        with open(args.input, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    ean, separator, label = line.partition(';')
+                    items.append((ean, label) if separator else (None, line))
+
+    cascade, close = build_cascade(load_cyrus_index(), dict(args.threshold), not args.no_llm, args.workers)
+    if not cascade.stages:
+        print("❌ Aucune étape disponible", file=sys.stderr)
+        return False
+    print(f"🔗 Cascade: {' → '.join(stage.name for stage in cascade.stages)} ({len(items):,} articles)",
+          file=sys.stderr)
+    try:
+        results = cascade.classify(items)
+    finally:
+        close()
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for (ean, label), result in zip(items, results):
+            output.write(json.dumps({'ean': ean, 'label': label, 'result': result}, ensure_ascii=False) + '\n')
+    finally:
+        if args.output:
+            output.close()
+    print_stats(cascade.stats(), file=sys.stderr)
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -15,7 +15,7 @@ def check_configuration():
     # Vérifier les fichiers essentiels
     essential_files = [
         "database/schema.sql",
-        "scripts/cyrus_insert_v3.sql",
+        "scripts/cyrus_insert_v4.sql",
         "scripts/test_supabase.py",
         ".env",
         "src/lib/supabase.ts",
@@ -34,7 +34,7 @@ def check_configuration():
     print("\n📊 Statistiques des données:")
     
     # Vérifier la taille du script CYRUS
-    cyrus_file = "scripts/cyrus_insert_v3.sql"
+    cyrus_file = "scripts/cyrus_insert_v4.sql"
     if os.path.exists(cyrus_file):
         size = os.path.getsize(cyrus_file)
         print(f"   - Structure CYRUS: {size:,} bytes (~2294 éléments)")
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """
 Script de nettoyage et réimport propre des données CYRUS
-Vide la table et réimporte de façon optimisée
+Par défaut, synchronisation différentielle (scripts/cyrus_sync.py) : la table n'est jamais vide.
+Avec --wipe, vide la table et réimporte tout (la structure est absente pendant l'import).
 """
 
+import argparse
 import os
-import re
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
-def clean_and_reimport():
-    """Nettoyer et réimporter proprement les données CYRUS"""
+from cyrus_index import load_cyrus_index
+from cyrus_parser import EXPECTED_NODE_COUNT, LEVEL_NAMES
+from cyrus_sync import print_diff, sync_rest
+from import_cyrus_api import count_cyrus_rows, iter_cyrus_rows, upload_cyrus_rows
+
+def clean_and_reimport(wipe: bool = False):
+    """Nettoyer et réimporter proprement les données CYRUS (diff par défaut, vidage complet si wipe)"""
     
     load_dotenv()
     
@@ -23,114 +29,62 @@ def clean_and_reimport():
     try:
         supabase = create_client(url, service_key)
         
-        # 1. Vider la table cyrus_structure
-        print("🗑️  Suppression des données existantes...")
-        supabase.table('cyrus_structure').delete().neq('id', 0).execute()
-        print("✅ Table cyrus_structure vidée")
-        
-        # 2. Lire et parser le fichier SQL plus proprement
-        sql_file = "scripts/cyrus_insert_v3.sql"
-        print(f"📁 Lecture optimisée de {sql_file}...")
-        
-        with open(sql_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # 1. Structure parsée (instantané de scripts/cyrus_parser.py), sans relire le SQL généré
+        index = load_cyrus_index()
+        print(f"📊 {len(index)} enregistrements dans la structure parsée")
         
-        # 3. Parser plus précisément les données
-        records = []
-        
-        # Extraire tous les INSERT INTO cyrus_structure
-        insert_blocks = re.findall(r'INSERT INTO cyrus_structure \([^)]+\) VALUES\s*(.*?)(?=;)', content, re.DOTALL)
-        
-        for block in insert_blocks:
-            # Extraire chaque ligne de VALUES (x,y,z,...)
-            value_matches = re.findall(r'\(([^)]+)\)', block)
+        if wipe:
+            # 2. Vider la table cyrus_structure (elle reste vide jusqu'à la fin de l'import)
+            print("🗑️  Suppression des données existantes (--wipe)...")
+            supabase.table('cyrus_structure').delete().neq('id', 0).execute()
+            print("✅ Table cyrus_structure vidée")
             
-            for values_str in value_matches:
-                # Split et clean chaque valeur
-                values = []
-                for val in values_str.split(','):
-                    val = val.strip()
-                    if val.startswith("'") and val.endswith("'"):
-                        val = val[1:-1]  # Retirer les quotes
-                    elif val == 'NULL':
-                        val = None
-                    elif val.isdigit():
-                        val = int(val)
-                    values.append(val)
-                
-                # Créer l'objet record avec les colonnes dans l'ordre
-                if len(values) >= 6:  # level, code, name, parent_code, full_path, created_at
-                    record = {
-                        'level': values[0],
-                        'code': values[1],
-                        'name': values[2],
-                        'parent_code': values[3],
-                        'full_path': values[4],
-                        'created_at': values[5] if values[5] else None
-                    }
-                    records.append(record)
-        
-        # 4. Supprimer les doublons basés sur code+level
-        seen = set()
-        unique_records = []
-        for record in records:
-            key = f"{record['level']}-{record['code']}"
-            if key not in seen:
-                seen.add(key)
-                unique_records.append(record)
-        
-        print(f"📊 {len(unique_records)} enregistrements uniques à importer")
-        
-        # 5. Import par batch plus petit pour éviter les erreurs
-        batch_size = 50
-        total_inserted = 0
-        
-        for i in range(0, len(unique_records), batch_size):
-            batch = unique_records[i:i+batch_size]
+            # 3. Import par gros lots concurrents (relances automatiques sur erreur transitoire)
+            total_inserted, errors = upload_cyrus_rows(url, service_key, iter_cyrus_rows(index))
+            for error in errors:
+                print(f"❌ {error[:150]}")
             
-            try:
-                result = supabase.table('cyrus_structure').insert(batch).execute()
-                if result.data:
-                    total_inserted += len(result.data)
-                    print(f"✅ Batch {i//batch_size + 1}: {len(result.data)} éléments")
-                else:
-                    total_inserted += len(batch)
-                    print(f"✅ Batch {i//batch_size + 1}: {len(batch)} éléments (traité)")
-                    
-            except Exception as e:
-                print(f"❌ Erreur batch {i//batch_size + 1}: {e}")
-                continue
-        
-        print(f"\n🎉 Import propre terminé !")
-        print(f"✅ {total_inserted} éléments importés")
+            print(f"\n🎉 Import propre terminé !")
+            print(f"✅ {total_inserted} éléments importés")
+        else:
+            # 2-3. Diff appliqué en une transaction (RPC apply_cyrus_structure_diff)
+            print("🔄 Synchronisation différentielle...")
+            diff = sync_rest(supabase, list(index.tree.rows()))
+            print_diff(diff)
+            print("✅ cyrus_structure déjà à jour" if diff.empty else "✅ Appliqué en une transaction")
         
-        # 6. Vérification finale détaillée
+        # 4. Vérification finale détaillée
         print("\n🔍 Vérification finale...")
         
-        for level in range(1, 5):
-            level_data = supabase.table('cyrus_structure').select('id').eq('level', level).execute()
-            count = len(level_data.data) if level_data.data else 0
-            level_names = {1: 'Secteurs', 2: 'Rayons', 3: 'Familles', 4: 'Sous-familles'}
-            print(f"   {level_names[level]} (niveau {level}): {count}")
+        expected = index.tree.stats()
+        for level, level_name in enumerate(LEVEL_NAMES):
+            level_data = supabase.table('cyrus_structure').select('id', count='exact').eq('level', level).limit(1).execute()
+            count = level_data.count or 0
+            print(f"   {level_name.capitalize()} (niveau {level}): {count} / {expected[level_name]}")
         
         # Total
-        total_data = supabase.table('cyrus_structure').select('id').execute()
-        total_count = len(total_data.data) if total_data.data else 0
+        total_count = count_cyrus_rows(supabase)
         print(f"\n📊 Total final: {total_count} éléments")
         
-        if total_count >= 2290:
+        if total_count == EXPECTED_NODE_COUNT:
             print("🎉 Structure CYRUS complète et optimisée !")
             return True
         else:
-            print("⚠️  Import partiel ou incomplet")
+            print(f"⚠️  Import partiel ou incomplet ({EXPECTED_NODE_COUNT} attendus)")
             return False
         
     except Exception as e:
         print(f"❌ Erreur: {e}")
         return False
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Réimport de la structure CYRUS dans Supabase")
+    parser.add_argument('--wipe', action='store_true',
+                        help="Vider la table puis tout réimporter au lieu de la synchronisation différentielle")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    success = clean_and_reimport()
+    success = clean_and_reimport(parse_args().wipe)
     
     if success:
         print("\n🚀 Configuration Supabase PARFAITE !")
@@ -138,4 +92,4 @@ if __name__ == "__main__":
         print("   bun dev")
     else:
         print("\n💡 Alternative: Interface web Supabase")
-        print("   Copier/coller scripts/cyrus_insert_v3.sql")
\ No newline at end of file
+        print("   Copier/coller scripts/cyrus_insert_v4.sql")
\ No newline at end of file
@@ -32,7 +32,7 @@ def create_cyrus_data():
         supabase = create_client(url, service_key)
         
         # Lire le fichier SQL v3
-        sql_file = "scripts/cyrus_insert_v3.sql"
+        sql_file = "scripts/cyrus_insert_v4.sql"
         if not os.path.exists(sql_file):
             print(f"❌ Fichier {sql_file} introuvable")
             return False
@@ -94,7 +94,7 @@ def create_cyrus_data():
         print(f"❌ Erreur lors de l'import: {e}")
         print("\n💡 Solutions alternatives:")
         print("1. Utiliser l'interface web Supabase SQL Editor")
-        print("2. Copier/coller scripts/cyrus_insert_v3.sql")
+        print("2. Copier/coller scripts/cyrus_insert_v4.sql")
         print("3. Relancer ce script")
         return False
 
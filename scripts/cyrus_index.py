@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Index en mémoire de la taxonomie CYRUS
+Construit une fois à partir de la table de nœuds du parser (cyrus_parser.CyrusTree)
+et partagé par l'import historique et les classifieurs :
+- clé complète (secteur, rayon, famille, sous_famille) -> nœud, sans ambiguïté
+  (le code 101 existe sous chaque famille)
+- adjacence parent / enfants en tableaux
+- index inversé nom -> nœuds et recherche par préfixe de nom
+- jointure vectorisée des codes d'un DataFrame d'articles vers les noms
+"""
+
+import json
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from cyrus_parser import DEFAULT_JSON_OUTPUT, FAMILLE, MAGASIN, RAYON, SECTEUR, SOUS_FAMILLE, CyrusTree
+
+# Colonnes de codes des articles historiques, du secteur à la sous-famille
+CODE_COLUMNS = ['SECTEUR', 'RAYON', 'FAMILLE', 'SOUS FAMILLE']
+NAME_COLUMNS = ['secteur_nom', 'rayon_nom', 'famille_nom', 'sous_famille_nom']
+FALLBACK_PREFIXES = ['SECTEUR_', 'RAYON_', 'FAMILLE_', 'SF_']
+
+# Chaque code tient sur 3 chiffres : une clé complète est packée dans un entier
+_CODE_BASE = 1000
+_LEVEL_BASE = _CODE_BASE ** 4
+
+def pack_key(codes: Sequence[int]) -> int:
+    """
+    Packer une clé (secteur, rayon, ...) en entier ; le niveau en préfixe évite les collisions.
+    Lève ValueError pour plus de 4 codes ou un code hors de [0, 1000) (il déborderait sur le champ voisin).
+    """
+    if len(codes) > 4:
+        raise ValueError(f"Clé CYRUS trop longue ({len(codes)} codes): {tuple(codes)}")
+    packed = 0
+    for code in codes:
+        if not 0 <= code < _CODE_BASE:
+            raise ValueError(f"Code CYRUS hors limites [0, {_CODE_BASE}): {code} dans {tuple(codes)}")
+        packed = packed * _CODE_BASE + code
+    packed *= _CODE_BASE ** (4 - len(codes))
+    return len(codes) * _LEVEL_BASE + packed
+
+def normalize_name(name: str) -> str:
+    return ' '.join(name.upper().split())
+
+def unpack_key(packed: int) -> Tuple[int, ...]:
+    """Inverse de pack_key"""
+    depth, packed = divmod(packed, _LEVEL_BASE)
+    codes = []
+    for position in range(4):
+        packed, code = divmod(packed, _CODE_BASE)
+        codes.append(code)
+    return tuple(reversed(codes))[:depth]
+
+class CyrusIndex:
+    """
+    Taxonomie CYRUS indexée (nœuds numérotés dans l'ordre du fichier).
+    Les tableaux (clés packées, adjacence) sont calculés depuis l'arbre ou repris
+    tels quels d'un instantané binaire ; les dictionnaires sont construits au premier usage.
+    """
+
+    def __init__(self, tree: CyrusTree, packed_keys=None, child_offsets=None, child_ids=None):
+        self.tree = tree
+        self.packed_keys = packed_keys if packed_keys is not None else self._compute_keys(tree)
+        if child_offsets is None:
+            child_offsets, child_ids = self._compute_children(tree)
+        self.child_offsets = child_offsets
+        self.child_ids = child_ids
+
+        self._by_key: Optional[Dict[int, int]] = None
+        self._by_name: Optional[Dict[str, List[int]]] = None
+        self._sorted_names: Optional[List[str]] = None
+        self._pandas_index = None
+
+    @staticmethod
+    def _compute_keys(tree: CyrusTree) -> array:
+        """Clé complète packée de chaque nœud (le magasin a la clé vide)"""
+        keys: List[Tuple[int, ...]] = []
+        packed_keys = array('q')
+        for index in range(len(tree)):
+            if tree.levels[index] == MAGASIN:
+                key: Tuple[int, ...] = ()
+            else:
+                key = keys[tree.parents[index]] + (int(tree.codes[index]),)
+            keys.append(key)
+            packed_keys.append(pack_key(key))
+        return packed_keys
+
+    @staticmethod
+    def _compute_children(tree: CyrusTree):
+        """Adjacence parent -> enfants au format CSR (enfants dans l'ordre du fichier)"""
+        size = len(tree)
+        counts = [0] * (size + 1)
+        for parent in tree.parents:
+            if parent >= 0:
+                counts[parent + 1] += 1
+        child_offsets = array('i', [0] * (size + 1))
+        for index in range(size):
+            child_offsets[index + 1] = child_offsets[index] + counts[index + 1]
+        child_ids = array('i', [0] * child_offsets[size])
+        cursor = list(child_offsets[:size])
+        for index, parent in enumerate(tree.parents):
+            if parent >= 0:
+                child_ids[cursor[parent]] = index
+                cursor[parent] += 1
+        return child_offsets, child_ids
+
+    @property
+    def by_key(self) -> Dict[int, int]:
+        """Clé packée -> premier nœud portant cette clé"""
+        if self._by_key is None:
+            self._by_key = {}
+            for index, packed in enumerate(self.packed_keys):
+                self._by_key.setdefault(packed, index)
+        return self._by_key
+
+    @property
+    def by_name(self) -> Dict[str, List[int]]:
+        """Index inversé nom normalisé -> nœuds"""
+        if self._by_name is None:
+            self._by_name = {}
+            for index, name in enumerate(self.tree.names):
+                self._by_name.setdefault(normalize_name(name), []).append(index)
+        return self._by_name
+
+    def key(self, index: int) -> Tuple[int, ...]:
+        """Clé complète (secteur, rayon, famille, sous_famille) d'un nœud"""
+        return unpack_key(self.packed_keys[index])
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path] = DEFAULT_JSON_OUTPUT) -> "CyrusIndex":
+        """Charger la sortie JSON du parser (cyrus_structure_v4.json, avec parent_index)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            items = json.load(f)['items']
+        tree = CyrusTree()
+        for item in items:
+            tree.append(item['level'], item['code'], item['name'], item['parent_index'], item['line_number'])
+        return cls(tree)
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    # --- Navigation ---
+
+    def parent(self, index: int) -> int:
+        return self.tree.parents[index]
+
+    def children(self, index: int) -> List[int]:
+        return list(self.child_ids[self.child_offsets[index]:self.child_offsets[index + 1]])
+
+    def lookup(self, *codes: int) -> Optional[int]:
+        """Nœud d'une clé (secteur[, rayon[, famille[, sous_famille]]]), None si inconnue"""
+        codes = tuple(int(code) for code in codes)
+        if len(codes) > 4 or any(code < 0 or code >= _CODE_BASE for code in codes):
+            return None
+        return self.by_key.get(pack_key(codes))
+
+    def classification(self, index: int) -> Dict[str, Optional[str]]:
+        """Noms et codes secteur / rayon / famille / sous-famille d'un nœud et de ses ancêtres"""
+        result: Dict[str, Optional[str]] = {}
+        chain = {self.tree.levels[i]: i for i in self.tree.ancestors(index)}
+        for level, field in ((SECTEUR, 'secteur'), (RAYON, 'rayon'),
+                             (FAMILLE, 'famille'), (SOUS_FAMILLE, 'sous_famille')):
+            node = chain.get(level)
+            result[field] = self.tree.names[node] if node is not None else None
+            result[f"{field}_code"] = self.tree.codes[node] if node is not None else None
+        return result
+
+    # --- Recherche par nom ---
+
+    def find_name(self, name: str, level: Optional[int] = None) -> List[int]:
+        """Nœuds portant exactement ce nom (insensible à la casse et aux espaces)"""
+        nodes = self.by_name.get(normalize_name(name), [])
+        return [i for i in nodes if level is None or self.tree.levels[i] == level]
+
+    def search_prefix(self, prefix: str, level: Optional[int] = None, limit: int = 20) -> List[int]:
+        """Nœuds dont le nom commence par `prefix`, par ordre alphabétique du nom"""
+        prefix = normalize_name(prefix)
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self.by_name)
+        results: List[int] = []
+        position = bisect_left(self._sorted_names, prefix)
+        while position < len(self._sorted_names) and len(results) < limit:
+            name = self._sorted_names[position]
+            if not name.startswith(prefix):
+                break
+            for index in self.by_name[name]:
+                if level is None or self.tree.levels[index] == level:
+                    results.append(index)
+            position += 1
+        return results[:limit]
+
+    # --- Jointure vectorisée avec un lot d'articles ---
+
+    def _node_index(self):
+        """Index pandas des clés packées (une entrée par clé distincte) et nœuds correspondants"""
+        import pandas as pd
+        if self._pandas_index is None:
+            nodes = sorted(self.by_key.values())
+            self._pandas_index = pd.Index([self.packed_keys[i] for i in nodes], dtype='int64'), nodes, \
+                list(self.tree.names)
+        return self._pandas_index
+
+    def map_frame(self, df):
+        """
+        Ajouter secteur_nom / rayon_nom / famille_nom / sous_famille_nom à un lot d'articles.
+        Chaque niveau est résolu par sa clé complète (codes de tous les niveaux supérieurs)
+        avec une seule recherche de hachage vectorisée ; les codes inconnus gardent
+        le libellé de repli 'SECTEUR_<code>', 'RAYON_<code>', ...
+        """
+        import numpy as np
+
+        keys, nodes, tree_names = self._node_index()
+        names = np.array(tree_names + [None], dtype=object)
+        node_ids = np.array(nodes + [len(tree_names)])
+
+        codes = [df[column].to_numpy(dtype='int64') for column in CODE_COLUMNS]
+        packed = np.zeros(len(df), dtype='int64')
+        # Un code hors de [0, 1000) ne peut appartenir à aucune clé (et fausserait le packing)
+        valid = np.ones(len(df), dtype=bool)
+        for depth, (code_column, name_column, fallback) in enumerate(
+                zip(CODE_COLUMNS, NAME_COLUMNS, FALLBACK_PREFIXES), 1):
+            level_codes = codes[depth - 1]
+            valid &= (level_codes >= 0) & (level_codes < _CODE_BASE)
+            packed = packed * _CODE_BASE + np.where(valid, level_codes, 0)
+            level_keys = depth * _LEVEL_BASE + packed * _CODE_BASE ** (4 - depth)
+            positions = np.where(valid, keys.get_indexer(level_keys), -1)
+            resolved = names[node_ids[positions]]
+            missing = positions < 0
+            if missing.any():
+                resolved[missing] = [fallback + str(code) for code in level_codes[missing].tolist()]
+            df[name_column] = resolved
+        return df
+
+def load_cyrus_index(path: Optional[Union[str, Path]] = None) -> CyrusIndex:
+    """
+    Index CYRUS partagé par les outils : instantané binaire (régénéré s'il est périmé),
+    sinon sortie JSON du parser, sinon index vide.
+    """
+    from cyrus_snapshot import DEFAULT_SNAPSHOT, StaleSnapshotError, load_snapshot_index
+
+    if path is not None and Path(path).suffix == '.json':
+        return CyrusIndex.from_json(path)
+    try:
+        return load_snapshot_index(path or DEFAULT_SNAPSHOT)
+    except StaleSnapshotError:
+        pass
+    if DEFAULT_JSON_OUTPUT.exists():
+        return CyrusIndex.from_json(DEFAULT_JSON_OUTPUT)
+    return CyrusIndex(CyrusTree())
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import pandas as pd
+
+    started = time.perf_counter()
+    index = load_cyrus_index()
+    print(f"✅ Index CYRUS: {len(index)} nœuds en {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    # Le code 101 existe sous plusieurs familles : la clé complète lève l'ambiguïté
+    boeuf = index.lookup(1, 10, 101, 101)
+    ok = boeuf is not None and index.tree.names[boeuf] == 'BOEUF LOCAL'
+    ok &= index.tree.names[index.lookup(1, 17, 171, 101)] != 'BOEUF LOCAL'
+    ok &= index.lookup(9, 99) is None
+    ok &= [index.tree.codes[i] for i in index.children(index.lookup(1))][:3] == ['010', '011', '012']
+    ok &= index.parent(boeuf) == index.lookup(1, 10, 101)
+    ok &= all(index.tree.levels[i] == RAYON for i in index.find_name('boucherie', level=RAYON))
+    ok &= all(index.tree.names[i].startswith('YAOURT') for i in index.search_prefix('yaour'))
+    ok &= index.classification(boeuf)['rayon'] == 'BOUCHERIE'
+    # Un code hors [0, 1000) déborderait sur le champ voisin : (1, 1010) == (2, 10) sans contrôle
+    try:
+        pack_key((1, 1010))
+        ok = False
+    except ValueError:
+        pass
+    print(f"🔍 Clés complètes, adjacence et recherche par nom: {'✅' if ok else '❌'}")
+
+    # Jointure vectorisée == résolution nœud par nœud
+    leaves = [i for i in range(len(index)) if index.tree.levels[i] == SOUS_FAMILLE]
+    rows = [index.key(i) for i in leaves] * 50 + [(1, 10, 101, 999), (9, 99, 999, 999), (1, 10, 5000, 101)]
+    df = pd.DataFrame(rows, columns=CODE_COLUMNS)
+    started = time.perf_counter()
+    index.map_frame(df)
+    elapsed = time.perf_counter() - started
+    expected = [index.classification(i)['sous_famille'] for i in leaves] * 50 + ['SF_999', 'SF_999', 'SF_101']
+    joined_ok = df['sous_famille_nom'].tolist() == expected
+    joined_ok &= df['famille_nom'].iloc[-3] == 'STAND TRADITIONNEL' and df['secteur_nom'].iloc[-2] == 'SECTEUR_9'
+    joined_ok &= df['rayon_nom'].iloc[-1] == 'BOUCHERIE' and df['famille_nom'].iloc[-1] == 'FAMILLE_5000'
+    print(f"⚡ {len(df):,} articles mappés en {elapsed * 1000:.1f} ms: {'✅' if joined_ok else '❌'}")
+    sys.exit(0 if ok and joined_ok else 1)
@@ -0,0 +1,2299 @@
+-- Script d'insertion de la structure CYRUS v4
+-- Généré automatiquement par scripts/cyrus_parser.py à partir de StructureCYRUS.txt
+
+DELETE FROM cyrus_structure;
+
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (0, '201', 'GEANT CASINO', NULL, '201 GEANT CASINO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '01', 'MARCHE', '201', '201 GEANT CASINO > 01 MARCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '010', 'BOUCHERIE', '01', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '101', 'STAND TRADITIONNEL', '010', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BOEUF LOCAL', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 101 BOEUF LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'BOEUF IMPORT', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 102 BOEUF IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'VEAU LOCAL', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 103 VEAU LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'VEAU IMPORT', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 104 VEAU IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'AGNEAU LOCAL', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 105 AGNEAU LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'AGNEAU IMPORT', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 106 AGNEAU IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'VOLAILLES', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 107 VOLAILLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'PORC', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 108 PORC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'PREPARATIONS', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 109 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '110', 'ABATS', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 110 ABATS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '111', 'AUTRES VIANDES', '101', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 111 AUTRES VIANDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '102', 'LIBRE SERVICE', '010', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'BOEUF LOCAL', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 201 BOEUF LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'BOEUF IMPORT', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 202 BOEUF IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'VEAU LOCAL', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 203 VEAU LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'VEAU IMPORT', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 204 VEAU IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'AGNEAU LOCAL', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 205 AGNEAU LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'AGNEAU IMPORT', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 206 AGNEAU IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'VOLAILLES', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 207 VOLAILLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'PORC', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 208 PORC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'PREPARATIONS', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 209 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'ABATS', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 210 ABATS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'AUTRES VIANDES', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 211 AUTRES VIANDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '212', 'SAUCISSE', '102', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 102 LIBRE SERVICE > 212 SAUCISSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '103', 'EMBALLAGES BOUCHERIES', '010', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 103 EMBALLAGES BOUCHERIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'EMBALLAGES', '103', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 103 EMBALLAGES BOUCHERIES > 301 EMBALLAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'FICELLE A ROTIR', '103', '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 103 EMBALLAGES BOUCHERIES > 302 FICELLE A ROTIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '011', 'FRUITS ET LEGUMES', '01', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '111', 'FRUITS', '011', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 111 FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'FRUITS LOCAUX', '111', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 111 FRUITS > 101 FRUITS LOCAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'FRUITS IMPORTS', '111', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 111 FRUITS > 102 FRUITS IMPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '112', 'LEGUMES', '011', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 112 LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'LEGUMES LOCAUX', '112', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 112 LEGUMES > 201 LEGUMES LOCAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'LEGUMES IMPORTS', '112', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 112 LEGUMES > 202 LEGUMES IMPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '113', 'VRAC EPICE/FRUIT SEC', '011', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 113 VRAC EPICE/FRUIT SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'EPICES VRAC', '113', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 113 VRAC EPICE/FRUIT SEC > 301 EPICES VRAC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'FRUITS SECS VRAC', '113', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 113 VRAC EPICE/FRUIT SEC > 302 FRUITS SECS VRAC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '114', 'FLEURS ET PLANTES', '011', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 114 FLEURS ET PLANTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'FLEURS LOCALES', '114', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 114 FLEURS ET PLANTES > 401 FLEURS LOCALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'FLEURS IMPORTS', '114', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 114 FLEURS ET PLANTES > 402 FLEURS IMPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'PLANTES LOCALES', '114', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 114 FLEURS ET PLANTES > 403 PLANTES LOCALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'PLANTES IMPORTS', '114', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 114 FLEURS ET PLANTES > 404 PLANTES IMPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'FLEURS/PLANTE CONSENTMENT', '114', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 114 FLEURS ET PLANTES > 405 FLEURS/PLANTE CONSENTMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '115', 'LS FRUITS', '011', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 115 LS FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'LS PREPARATION', '115', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 115 LS FRUITS > 501 LS PREPARATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '116', 'EMBALLAGES FRUITS LEGUMES', '011', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 116 EMBALLAGES FRUITS LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'EMBALLAGES', '116', '201 GEANT CASINO > 01 MARCHE > 011 FRUITS ET LEGUMES > 116 EMBALLAGES FRUITS LEGUMES > 601 EMBALLAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '012', 'BOULANGERIE + PATISSERIE', '01', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '121', 'BOULANGERIE', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 121 BOULANGERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BOULANGERIE', '121', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 121 BOULANGERIE > 101 BOULANGERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '122', 'VIENNOISERIE', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 122 VIENNOISERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'VIENNOISERIE', '122', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 122 VIENNOISERIE > 201 VIENNOISERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '123', 'PATISSERIE', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 123 PATISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'PATISSERIE', '123', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 123 PATISSERIE > 301 PATISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '124', 'CHOCOLATS', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 124 CHOCOLATS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CHOCOLATS', '124', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 124 CHOCOLATS > 401 CHOCOLATS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '125', 'PREPARATIONS', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 125 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'PREPARATIONS', '125', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 125 PREPARATIONS > 501 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '126', 'PATISSERIE SECHE', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 126 PATISSERIE SECHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'PATISSERIE SECHE', '126', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 126 PATISSERIE SECHE > 601 PATISSERIE SECHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '127', 'PATISSERIES DIVERS', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 127 PATISSERIES DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'PATISSERIES DIVERS', '127', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 127 PATISSERIES DIVERS > 701 PATISSERIES DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '128', 'EMBALLAGES PATISSERIES', '012', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 128 EMBALLAGES PATISSERIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'EMBALLAGES', '128', '201 GEANT CASINO > 01 MARCHE > 012 BOULANGERIE + PATISSERIE > 128 EMBALLAGES PATISSERIES > 801 EMBALLAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '013', 'POIND CHAUD + ROTISSERIE', '01', '201 GEANT CASINO > 01 MARCHE > 013 POIND CHAUD + ROTISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '131', 'ROTISSOIRE', '013', '201 GEANT CASINO > 01 MARCHE > 013 POIND CHAUD + ROTISSERIE > 131 ROTISSOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '132', 'PREPARATIONS FROIDES', '013', '201 GEANT CASINO > 01 MARCHE > 013 POIND CHAUD + ROTISSERIE > 132 PREPARATIONS FROIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '133', 'PREPARATIONS CHAUDES', '013', '201 GEANT CASINO > 01 MARCHE > 013 POIND CHAUD + ROTISSERIE > 133 PREPARATIONS CHAUDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '134', 'PREPARATIONS FOURNISSEURS', '013', '201 GEANT CASINO > 01 MARCHE > 013 POIND CHAUD + ROTISSERIE > 134 PREPARATIONS FOURNISSEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '135', 'EMBALL POINT CHAUD+ROTISS', '013', '201 GEANT CASINO > 01 MARCHE > 013 POIND CHAUD + ROTISSERIE > 135 EMBALL POINT CHAUD+ROTISS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '014', 'CHARCUTERIE COUPE', '01', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '141', 'CHARCUTERIE COUPE', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 141 CHARCUTERIE COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CHARCUTERIE COUPE', '141', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 141 CHARCUTERIE COUPE > 101 CHARCUTERIE COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'HALAL IMPORT', '141', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 141 CHARCUTERIE COUPE > 102 HALAL IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '142', 'VOLAILLE', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 142 VOLAILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'VOLAILLE', '142', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 142 VOLAILLE > 201 VOLAILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '143', 'BOEUF', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 143 BOEUF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'BOEUF', '143', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 143 BOEUF > 301 BOEUF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '144', 'OLIVES ET CONDIMENTS', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 144 OLIVES ET CONDIMENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'OLIVES ET CONDIMENTS', '144', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 144 OLIVES ET CONDIMENTS > 401 OLIVES ET CONDIMENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '145', 'LS CHARCUTERIE COUPE', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 145 LS CHARCUTERIE COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'LS CHARCUTERIE COUPE', '145', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 145 LS CHARCUTERIE COUPE > 501 LS CHARCUTERIE COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'LS OLIVE', '145', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 145 LS CHARCUTERIE COUPE > 502 LS OLIVE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'LS PREPARATIONS', '145', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 145 LS CHARCUTERIE COUPE > 601 LS PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '146', 'PORC', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 146 PORC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'PORC', '146', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 146 PORC > 601 PORC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '147', 'VEAU', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 147 VEAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'VEAU', '147', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 147 VEAU > 701 VEAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '148', 'EMBALLAGES CHARCUT COUPE', '014', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 148 EMBALLAGES CHARCUT COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'EMBALLAGES', '148', '201 GEANT CASINO > 01 MARCHE > 014 CHARCUTERIE COUPE > 148 EMBALLAGES CHARCUT COUPE > 801 EMBALLAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '015', 'FROMAGE a LA COUPE', '01', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '151', 'ORIGINE FRANCE', '015', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 151 ORIGINE FRANCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'ORIGINE FRANCE', '151', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 151 ORIGINE FRANCE > 101 ORIGINE FRANCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '152', 'LS FRAICHE DECOUPE', '015', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 152 LS FRAICHE DECOUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'LS FRAICHE DECOUPE', '152', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 152 LS FRAICHE DECOUPE > 201 LS FRAICHE DECOUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '153', 'ORIGINE LOCALE', '015', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 153 ORIGINE LOCALE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'ORIGINE LOCALE', '153', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 153 ORIGINE LOCALE > 301 ORIGINE LOCALE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '154', 'PREPARATIONS', '015', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 154 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'PREPARATIONS', '154', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 154 PREPARATIONS > 401 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '155', 'EMBALLAGES FROMAGE COUPE', '015', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 155 EMBALLAGES FROMAGE COUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'EMBALLAGES', '155', '201 GEANT CASINO > 01 MARCHE > 015 FROMAGE a LA COUPE > 155 EMBALLAGES FROMAGE COUPE > 501 EMBALLAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '016', 'MAREE', '01', '201 GEANT CASINO > 01 MARCHE > 016 MAREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '161', 'POISSONS', '016', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 161 POISSONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'LOCAL', '161', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 161 POISSONS > 101 LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'IMPORT', '161', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 161 POISSONS > 102 IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '162', 'COQUILLAGES ET CRUSTACES', '016', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 162 COQUILLAGES ET CRUSTACES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'LOCAL', '162', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 162 COQUILLAGES ET CRUSTACES > 201 LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'IMPORT', '162', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 162 COQUILLAGES ET CRUSTACES > 202 IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '163', 'LS MAREE', '016', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 163 LS MAREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'LOCAL', '163', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 163 LS MAREE > 301 LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'LS PREPARATIONS', '163', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 163 LS MAREE > 302 LS PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '164', 'SURGELES', '016', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 164 SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'IMPORT', '164', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 164 SURGELES > 401 IMPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '165', 'EMBALLAGES MAREE', '016', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 165 EMBALLAGES MAREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'EMBALLAGES', '165', '201 GEANT CASINO > 01 MARCHE > 016 MAREE > 165 EMBALLAGES MAREE > 501 EMBALLAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '017', 'TRAITEUR', '01', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '171', 'STAND TRADITIONNEL', '017', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 171 STAND TRADITIONNEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CONDIMENTS ET OLIVES', '171', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 171 STAND TRADITIONNEL > 101 CONDIMENTS ET OLIVES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '172', 'LIBRE SERVICE', '017', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 201 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 202 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 203 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 204 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 205 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 206 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'A REUTILISER', '172', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 172 LIBRE SERVICE > 207 A REUTILISER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '173', 'PREPARATIONS', '017', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 173 PREPARATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'PREPARATIONS FROIDES', '173', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 173 PREPARATIONS > 301 PREPARATIONS FROIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'PREPARATIONS CHAUDES', '173', '201 GEANT CASINO > 01 MARCHE > 017 TRAITEUR > 173 PREPARATIONS > 302 PREPARATIONS CHAUDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '02', 'FRAIS INDUSTRIEL', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '020', 'PRODUITS FRAIS LACTES', '02', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '201', 'PRODUIT FR.LAITIER LS BIO', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'LAITCONSOMMATION BIO', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 101 LAITCONSOMMATION BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'FROMAGE BIOLOGIQUE', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 102 FROMAGE BIOLOGIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'PAIN DE MIE ET PAINS BIO', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 103 PAIN DE MIE ET PAINS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'BEURRE & MARGARINES BIO', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 104 BEURRE & MARGARINES BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'OEUFS BIOLOGIQUES', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 105 OEUFS BIOLOGIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'DESSERTS ULTRA FRAIS BIO', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 106 DESSERTS ULTRA FRAIS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'LAIT FRAIS BIOLOGIQUE', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 107 LAIT FRAIS BIOLOGIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'CREME FRAICHE BIOLOGIQUE', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 108 CREME FRAICHE BIOLOGIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'YAOURTS BIOLOGIQUES', '201', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 201 PRODUIT FR.LAITIER LS BIO > 109 YAOURTS BIOLOGIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '202', 'LAIT DE CONSOMMATION', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'LAIT 1/2 ECREME', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 201 LAIT 1/2 ECREME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'LAIT ECREME', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 202 LAIT ECREME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'LAIT ENTIER', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 203 LAIT ENTIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'LAIT DE CHEVRE', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 204 LAIT DE CHEVRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'LAIT DE SOJA', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 205 LAIT DE SOJA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'LAIT AROMATISE/PETIT DEJ.', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 206 LAIT AROMATISE/PETIT DEJ.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'LAIT ENFANT', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 207 LAIT ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'LAIT FRAIS', '202', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 202 LAIT DE CONSOMMATION > 208 LAIT FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '203', 'OEUFS', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 203 OEUFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'OEUFS FRAIS', '203', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 203 OEUFS > 301 OEUFS FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'OEUFS DE CAILLE', '203', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 203 OEUFS > 302 OEUFS DE CAILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '204', 'DESSERTS ULTRA-FRAIS', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'LIEGEOIS', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 401 LIEGEOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'GELIFIES', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 402 GELIFIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SPECIALITES', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 403 SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'ENTREMETS', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 404 ENTREMETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'DESSERTS ALLEGES', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 405 DESSERTS ALLEGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'CREMES DESSERTS', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 406 CREMES DESSERTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'MOUSSES', '204', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 204 DESSERTS ULTRA-FRAIS > 407 MOUSSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '205', 'CREMES ET SAUCES FRAICHES', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 205 CREMES ET SAUCES FRAICHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'CREME FRAICHE LEGERE', '205', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 205 CREMES ET SAUCES FRAICHES > 501 CREME FRAICHE LEGERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'CREME FRAICHE ENTIERE', '205', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 205 CREMES ET SAUCES FRAICHES > 502 CREME FRAICHE ENTIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '206', 'YAOURTS', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'YAOURTS ALLEGES', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 601 YAOURTS ALLEGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'YAOURTS AUX FRUITS', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 602 YAOURTS AUX FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'YAOURTS A BOIRE', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 603 YAOURTS A BOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'YAOURTS SPECIALITES', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 604 YAOURTS SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'SOJA', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 605 SOJA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'YAOURTS ET DESSERTS BEBE', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 606 YAOURTS ET DESSERTS BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'YAOURTS NATURE', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 607 YAOURTS NATURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'YAOURTS POTS VERRE', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 608 YAOURTS POTS VERRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'YAOURTS AROMATISES', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 609 YAOURTS AROMATISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '610', 'YAOURTS BIFIDUS', '206', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 206 YAOURTS > 610 YAOURTS BIFIDUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '207', 'FROMAGE ULTRA FRAIS', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 207 FROMAGE ULTRA FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'FROMAGES FRAIS BLANC', '207', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 207 FROMAGE ULTRA FRAIS > 701 FROMAGES FRAIS BLANC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'FROMAGE FRAIS CAMPAGNE', '207', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 207 FROMAGE ULTRA FRAIS > 702 FROMAGE FRAIS CAMPAGNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'FAISSELLES ET SPECIALITES', '207', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 207 FROMAGE ULTRA FRAIS > 703 FAISSELLES ET SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'FROMAGE PETITS SUISSES', '207', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 207 FROMAGE ULTRA FRAIS > 704 FROMAGE PETITS SUISSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '208', 'FROMAGE LIBRE SERVICE', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'PATE MOLLE CROUTE FLEURIE', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 801 PATE MOLLE CROUTE FLEURIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'PATES PRESSEES CUITES', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 802 PATES PRESSEES CUITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'PATES PRESSEES NON CUITES', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 803 PATES PRESSEES NON CUITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'PATE MOLLE A CROUTE LAVEE', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 804 PATE MOLLE A CROUTE LAVEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'PATES PERSILLEES', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 805 PATES PERSILLEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'PIK & MIX', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 806 PIK & MIX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'FROMAGE ENFANT & GRIGNOTA', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 807 FROMAGE ENFANT & GRIGNOTA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'FROMAGE FONDU', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 808 FROMAGE FONDU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '809', 'CHEVRES ET BREBIS', '208', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 208 FROMAGE LIBRE SERVICE > 809 CHEVRES ET BREBIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '209', 'BEURRES', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 209 BEURRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'MINI BEURRIERS', '209', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 209 BEURRES > 901 MINI BEURRIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'BEURRE DOUX', '209', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 209 BEURRES > 902 BEURRE DOUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'BEURRES 1/2 SEL/GROS SEL', '209', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 209 BEURRES > 903 BEURRES 1/2 SEL/GROS SEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '211', 'CREME LONGUE CONSERVATION', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 211 CREME LONGUE CONSERVATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CREMES SPECIALITES', '211', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 211 CREME LONGUE CONSERVATION > 101 CREMES SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CREME UHT LEGERE', '211', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 211 CREME LONGUE CONSERVATION > 102 CREME UHT LEGERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CREME UHT ENTIERE', '211', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 211 CREME LONGUE CONSERVATION > 103 CREME UHT ENTIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'CREME SOUS PRESSION', '211', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 211 CREME LONGUE CONSERVATION > 104 CREME SOUS PRESSION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '212', 'MARGARINES ET MGV', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 212 MARGARINES ET MGV');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'MARGARINES STANDARDS', '212', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 212 MARGARINES ET MGV > 201 MARGARINES STANDARDS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'MARGARINES ALLEGEES', '212', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 212 MARGARINES ET MGV > 202 MARGARINES ALLEGEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'MARGARINE ANTI-CHOLETEROL', '212', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 212 MARGARINES ET MGV > 203 MARGARINE ANTI-CHOLETEROL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'GRAISSES A FRIRE', '212', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 212 MARGARINES ET MGV > 204 GRAISSES A FRIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '213', 'COMPOTES FRAICHES', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 213 COMPOTES FRAICHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'COMPOTES FRAICHES', '213', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 213 COMPOTES FRAICHES > 301 COMPOTES FRAICHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'COMPOTES FRAICHES ALLEGEE', '213', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 213 COMPOTES FRAICHES > 302 COMPOTES FRAICHES ALLEGEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '214', 'PAIN DE MIE ET PAINS', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 214 PAIN DE MIE ET PAINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'PAIN DE MIE ET PAINS', '214', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 214 PAIN DE MIE ET PAINS > 401 PAIN DE MIE ET PAINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '215', 'VIENNOISERIE INDUSTRIELLE', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 215 VIENNOISERIE INDUSTRIELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'VIENNOISERIE INDUSTRIELLE', '215', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 215 VIENNOISERIE INDUSTRIELLE > 501 VIENNOISERIE INDUSTRIELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '216', 'JUS DE FRUITS FRAIS', '020', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 216 JUS DE FRUITS FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'JUS DE FRUITS FRAIS', '216', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 020 PRODUITS FRAIS LACTES > 216 JUS DE FRUITS FRAIS > 601 JUS DE FRUITS FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '021', 'CHARCUTERIE-TRAITEUR', '02', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '211', 'SAUCISSERIE', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 211 SAUCISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SAUCISSERIE', '211', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 211 SAUCISSERIE > 101 SAUCISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '212', 'SAUCISSERIE HALAL', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 212 SAUCISSERIE HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'SAUCISSERIE HALAL', '212', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 212 SAUCISSERIE HALAL > 201 SAUCISSERIE HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '213', 'PLAT CUISINE/ETHNIQUE LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 213 PLAT CUISINE/ETHNIQUE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'PLATS CUISINE/ETHNIQUE LS', '213', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 213 PLAT CUISINE/ETHNIQUE LS > 301 PLATS CUISINE/ETHNIQUE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '214', 'PLATS CUISINES HALAL LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 214 PLATS CUISINES HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'PLATS CUISINES HALAL LS', '214', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 214 PLATS CUISINES HALAL LS > 401 PLATS CUISINES HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '215', 'SAUCISSONS SECS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 215 SAUCISSONS SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'SAUCISSONS SECS', '215', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 215 SAUCISSONS SECS > 501 SAUCISSONS SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '216', 'SALAISON MARITIME', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 216 SALAISON MARITIME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'SAUMON/TRUITE FUMEE', '216', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 216 SALAISON MARITIME > 601 SAUMON/TRUITE FUMEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'TRATINABLE DE LA MER', '216', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 216 SALAISON MARITIME > 602 TRATINABLE DE LA MER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'BLINIS', '216', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 216 SALAISON MARITIME > 603 BLINIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'AUTRE SAL.MARITIME', '216', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 216 SALAISON MARITIME > 604 AUTRE SAL.MARITIME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '217', 'CHARCUTERIE CUITE LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 217 CHARCUTERIE CUITE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'CHARCUTERIE CUITE LS', '217', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 217 CHARCUTERIE CUITE LS > 701 CHARCUTERIE CUITE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '218', 'CHARCUTERIE CUIT HALAL LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 218 CHARCUTERIE CUIT HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CHARCUTERIE CUIT HALAL LS', '218', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 218 CHARCUTERIE CUIT HALAL LS > 801 CHARCUTERIE CUIT HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '219', 'AIDE CULINAIRE CHARC. LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 219 AIDE CULINAIRE CHARC. LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'AIDE CULINAIRE CHARCUT.LS', '219', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 219 AIDE CULINAIRE CHARC. LS > 901 AIDE CULINAIRE CHARCUT.LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '221', 'SALAISON/CHARC.TRANCHE LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 221 SALAISON/CHARC.TRANCHE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SALAISON/CHARCUT.TR. LS', '221', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 221 SALAISON/CHARC.TRANCHE LS > 101 SALAISON/CHARCUT.TR. LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '222', 'CHARC. TRANCHEE HALAL LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 222 CHARC. TRANCHEE HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'CHARCUTERIE TR. HALAL LS', '222', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 222 CHARC. TRANCHEE HALAL LS > 201 CHARCUTERIE TR. HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '223', 'PATE/RILLETE/FOIE GRAS LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 223 PATE/RILLETE/FOIE GRAS LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'PATE/RILLETE/FOIE GRAS LS', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 223 PATE/RILLETE/FOIE GRAS LS > 301 PATE/RILLETE/FOIE GRAS LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '224', 'TARTES SALEES LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 224 TARTES SALEES LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'TARTES SALEES LS', '224', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 224 TARTES SALEES LS > 401 TARTES SALEES LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '225', 'PATE FRAICHE/QUENELLE LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 225 PATE FRAICHE/QUENELLE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'PATE FRAICHE/QUENELLE LS', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 225 PATE FRAICHE/QUENELLE LS > 501 PATE FRAICHE/QUENELLE LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '226', 'SALADES FRAICHES LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 226 SALADES FRAICHES LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'SALADES FRAICHES LS', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 226 SALADES FRAICHES LS > 601 SALADES FRAICHES LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '227', 'SALADE FRAICHES HALAL LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 227 SALADE FRAICHES HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'SALADE FRAICHES HALAL LS', '227', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 227 SALADE FRAICHES HALAL LS > 701 SALADE FRAICHES HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '228', 'SNACKING FRAIS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 228 SNACKING FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'SNACKING FRAIS', '228', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 228 SNACKING FRAIS > 801 SNACKING FRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '229', 'SNACKING FRAIS HALAL LS', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 229 SNACKING FRAIS HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'SNACKING FRAIS HALAL LS', '229', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 229 SNACKING FRAIS HALAL LS > 901 SNACKING FRAIS HALAL LS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '231', 'PATES MENAGERES', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 231 PATES MENAGERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'PATES MENAGERES', '231', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 231 PATES MENAGERES > 101 PATES MENAGERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '232', 'CHARCUTERIE DE VOLAILLE', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 232 CHARCUTERIE DE VOLAILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'CHARCUTERIE DE VOLAILLE', '232', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 232 CHARCUTERIE DE VOLAILLE > 201 CHARCUTERIE DE VOLAILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '233', 'CHARC. VOLAILLE HALAL', '021', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 233 CHARC. VOLAILLE HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CHARCUTERIE VOLAILE HALAL', '233', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 021 CHARCUTERIE-TRAITEUR > 233 CHARC. VOLAILLE HALAL > 301 CHARCUTERIE VOLAILE HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '022', 'SURGELES', '02', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '221', 'PIZZAS SURGELEES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 221 PIZZAS SURGELEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'PIZZAS ET CALZONE', '221', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 221 PIZZAS SURGELEES > 101 PIZZAS ET CALZONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '222', 'PIZZAS SURGELEES HALAL', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 222 PIZZAS SURGELEES HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PIZZAS SURGELEES HALAL', '222', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 222 PIZZAS SURGELEES HALAL > 201 PIZZAS SURGELEES HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '223', 'BIO SURGELE', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 301 BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'CRUSTACE MOLL. BIO SURGEL', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 302 CRUSTACE MOLL. BIO SURGEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'ENTREES BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 303 ENTREES BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'GLACES BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 304 GLACES BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'LEGUMES BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 305 LEGUMES BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'PIZZAS BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 306 PIZZAS BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'PLATS CUISINE BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 307 PLATS CUISINE BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '308', 'POMME-TERRE BIO SURGELE', '223', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 223 BIO SURGELE > 308 POMME-TERRE BIO SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '224', 'POISSONS SURGELES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 224 POISSONS SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'POISSONS SURGELES', '224', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 224 POISSONS SURGELES > 401 POISSONS SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'FILETS ET MORCEAUX', '224', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 224 POISSONS SURGELES > 402 FILETS ET MORCEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'POISSONS PANES', '224', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 224 POISSONS SURGELES > 403 POISSONS PANES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '225', 'GLACES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'BATONNETS', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 501 BATONNETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'BACS', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 502 BACS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'CONES', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 503 CONES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'GLACES ARTISANALS', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 504 GLACES ARTISANALS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'GLACONS A RAFRAICHIR', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 505 GLACONS A RAFRAICHIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'POTS INDIVIDUELS', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 506 POTS INDIVIDUELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'SPECIALITES A PARTAGER', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 507 SPECIALITES A PARTAGER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '508', 'SPECIALITES INDIVIDUELLES', '225', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 225 GLACES > 508 SPECIALITES INDIVIDUELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '226', 'ENTREES SURGELEES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'ENTREES SURGELEES', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 601 ENTREES SURGELEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'APERITFS', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 602 APERITFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'AUTRES', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 603 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'COQUILLES', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 604 COQUILLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'ENTREES SURGELEES HALAL', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 605 ENTREES SURGELEES HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'ESCARGOTS', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 606 ESCARGOTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'ETHNIQUES', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 607 ETHNIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'QUICHES/TARTE/TOURTES', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 608 QUICHES/TARTE/TOURTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'SNACKS', '226', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 226 ENTREES SURGELEES > 609 SNACKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '227', 'ENTREES SURGELEES HALAL', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 227 ENTREES SURGELEES HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'ENTREES SURGELEES HALAL', '227', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 227 ENTREES SURGELEES HALAL > 701 ENTREES SURGELEES HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '228', 'POMMES DE TERRE SURGELEES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 228 POMMES DE TERRE SURGELEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'POMMES DE TERRE SURGELEES', '228', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 228 POMMES DE TERRE SURGELEES > 801 POMMES DE TERRE SURGELEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'AUTRES', '228', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 228 POMMES DE TERRE SURGELEES > 802 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'FRITES', '228', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 228 POMMES DE TERRE SURGELEES > 803 FRITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'POELEE POMMES DE TERRE', '228', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 228 POMMES DE TERRE SURGELEES > 804 POELEE POMMES DE TERRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '229', 'CRUSTACE MOLUSQUE SURGELE', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 229 CRUSTACE MOLUSQUE SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'CRUSTACE MOLLUSQUE SURGEL', '229', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 229 CRUSTACE MOLUSQUE SURGELE > 901 CRUSTACE MOLLUSQUE SURGEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'CREVETTES SURGELES', '229', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 229 CRUSTACE MOLUSQUE SURGELE > 902 CREVETTES SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '231', 'LEGUMES SURGELES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 231 LEGUMES SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'LEGUMES CUISINES, POELEES', '231', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 231 LEGUMES SURGELES > 101 LEGUMES CUISINES, POELEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '232', 'VIANDE/VOLAILLE SURGELEE', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 232 VIANDE/VOLAILLE SURGELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'VIANDE/VOLAILLE SURGELEE', '232', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 232 VIANDE/VOLAILLE SURGELEE > 201 VIANDE/VOLAILLE SURGELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'CANARD SURGELES', '232', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 232 VIANDE/VOLAILLE SURGELEE > 202 CANARD SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '233', 'V.VOLAILLE SURGELEE HALAL', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 233 V.VOLAILLE SURGELEE HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'V.VOLAILLE SURGEL. HALAL', '233', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 233 V.VOLAILLE SURGELEE HALAL > 301 V.VOLAILLE SURGEL. HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '234', 'PATISSERIE SURGELEE', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 234 PATISSERIE SURGELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'PATISSERIE SURGELEE', '234', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 234 PATISSERIE SURGELEE > 401 PATISSERIE SURGELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '235', 'PLATS CUISINES SURGELES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 235 PLATS CUISINES SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'PLATS CUISINES SURGELES', '235', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 235 PLATS CUISINES SURGELES > 501 PLATS CUISINES SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '236', 'PLAT CUISINE SURGEL HALAL', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 236 PLAT CUISINE SURGEL HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'PLAT CUISINE SURGEL HALAL', '236', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 236 PLAT CUISINE SURGEL HALAL > 601 PLAT CUISINE SURGEL HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '237', 'OEUF SURGELES', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 237 OEUF SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'OEUF SURGELES', '237', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 237 OEUF SURGELES > 701 OEUF SURGELES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '238', 'MATIERE GRASSE SURGELEE', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 238 MATIERE GRASSE SURGELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'MATIERE GRASSE SURGELEE', '238', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 238 MATIERE GRASSE SURGELEE > 801 MATIERE GRASSE SURGELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '239', 'FRUITS SURGELE', '022', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 239 FRUITS SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'FRUITS SURGELE', '239', '201 GEANT CASINO > 02 FRAIS INDUSTRIEL > 022 SURGELES > 239 FRUITS SURGELE > 901 FRUITS SURGELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '03', 'EPICERIE', '201', '201 GEANT CASINO > 03 EPICERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '030', 'EPICERIE SUCREE', '03', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '301', 'PRODUITS SALES APERITIFS', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 301 PRODUITS SALES APERITIFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BISCUITS APERITIFS', '301', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 301 PRODUITS SALES APERITIFS > 101 BISCUITS APERITIFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'GRAINES', '301', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 301 PRODUITS SALES APERITIFS > 102 GRAINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'POP CORN', '301', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 301 PRODUITS SALES APERITIFS > 103 POP CORN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'AUTRES', '301', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 301 PRODUITS SALES APERITIFS > 104 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '302', 'CHIPS', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 302 CHIPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'CHIPS NATURE', '302', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 302 CHIPS > 201 CHIPS NATURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'CHIPS AROMATISEES', '302', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 302 CHIPS > 202 CHIPS AROMATISEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'AUTRES', '302', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 302 CHIPS > 203 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'TUILES', '302', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 302 CHIPS > 204 TUILES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '303', 'BISCUITS SUCRES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'SEC', '303', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES > 301 SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'PETITS DEJEUNERS', '303', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES > 302 PETITS DEJEUNERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'FRUITES', '303', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES > 303 FRUITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'COOKIES', '303', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES > 304 COOKIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'CHOCOLATES', '303', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES > 305 CHOCOLATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'GOUTERS', '303', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 303 BISCUITS SUCRES > 306 GOUTERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '304', 'PATISSERIE ELABOREE', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 304 PATISSERIE ELABOREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CAKES', '304', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 304 PATISSERIE ELABOREE > 401 CAKES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'SPECIALITES ETRANGERES', '304', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 304 PATISSERIE ELABOREE > 402 SPECIALITES ETRANGERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'PAINS D''EPICES', '304', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 304 PATISSERIE ELABOREE > 403 PAINS D''EPICES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'PAINS DE MIE ET PAINS', '304', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 304 PATISSERIE ELABOREE > 405 PAINS DE MIE ET PAINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '305', 'PATISSERIE TRADITIONNELLE', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 305 PATISSERIE TRADITIONNELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'BARRES PATISSIERES + 4/4', '305', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 305 PATISSERIE TRADITIONNELLE > 501 BARRES PATISSIERES + 4/4');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'GAUFRES TRADITIONNELLES', '305', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 305 PATISSERIE TRADITIONNELLE > 502 GAUFRES TRADITIONNELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'SPECIALITES', '305', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 305 PATISSERIE TRADITIONNELLE > 503 SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'MADELEINES', '305', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 305 PATISSERIE TRADITIONNELLE > 504 MADELEINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'CREPES TRADITIONNELLES', '305', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 305 PATISSERIE TRADITIONNELLE > 505 CREPES TRADITIONNELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '306', 'BISCOTTES & ASSIMILES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 306 BISCOTTES & ASSIMILES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'BISCOTTES', '306', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 306 BISCOTTES & ASSIMILES > 601 BISCOTTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'PAINS GRILLES SUEDOIS', '306', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 306 BISCOTTES & ASSIMILES > 602 PAINS GRILLES SUEDOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'ASSIMILES', '306', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 306 BISCOTTES & ASSIMILES > 603 ASSIMILES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'EXTRUDES', '306', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 306 BISCOTTES & ASSIMILES > 604 EXTRUDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '307', 'CEREALE BARRE CEREALIERE', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 307 CEREALE BARRE CEREALIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'CEREALES ADULTES', '307', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 307 CEREALE BARRE CEREALIERE > 701 CEREALES ADULTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'CEREALES ENFANTS', '307', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 307 CEREALE BARRE CEREALIERE > 702 CEREALES ENFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'BARRES CEREALIERES', '307', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 307 CEREALE BARRE CEREALIERE > 703 BARRES CEREALIERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '308', 'TARTINABLE', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CONFITURES', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 801 CONFITURES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'CREMES DE MARRONS', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 802 CREMES DE MARRONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'MIELS', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 803 MIELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'PATES A TARTINER', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 804 PATES A TARTINER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'SIROP D''ERABLE', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 805 SIROP D''ERABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'GELEES - MARMELADES', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 806 GELEES - MARMELADES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'DESSERTS DE FRUITS', '308', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 308 TARTINABLE > 807 DESSERTS DE FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '309', 'COMPOTES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 309 COMPOTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'BOCAUX-BRICK-BOITE FER', '309', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 309 COMPOTES > 901 BOCAUX-BRICK-BOITE FER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'COUPELLES', '309', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 309 COMPOTES > 902 COUPELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'GOURDES INDIVIDUELLES', '309', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 309 COMPOTES > 903 GOURDES INDIVIDUELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '311', 'CAFES . CHICOREES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CAFES GRAINS', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 101 CAFES GRAINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CAFES MOULUS', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 102 CAFES MOULUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CAFE + ADJONCTION', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 103 CAFE + ADJONCTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'SOLUBLES PURS', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 104 SOLUBLES PURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'DOSETTES / CAPSULES', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 105 DOSETTES / CAPSULES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'CHICOREE', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 106 CHICOREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'CAPPUCCINO', '311', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 311 CAFES . CHICOREES > 107 CAPPUCCINO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '312', 'PETITS DEJEUNER CACAO', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'POUDRES INSTANTANEES', '312', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO > 201 POUDRES INSTANTANEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'INSTANTANES GRANULES', '312', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO > 202 INSTANTANES GRANULES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'CACAO PUR', '312', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO > 203 CACAO PUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'MALTES', '312', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO > 204 MALTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'DOSETTES', '312', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO > 205 DOSETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'AUTRES', '312', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 312 PETITS DEJEUNER CACAO > 206 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '313', 'THE - INFUSIONS', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 313 THE - INFUSIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'THE', '313', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 313 THE - INFUSIONS > 301 THE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'INFUSION ET TISANES', '313', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 313 THE - INFUSIONS > 302 INFUSION ET TISANES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'DOSETTES/CAPSULES', '313', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 313 THE - INFUSIONS > 303 DOSETTES/CAPSULES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'AUTRES', '313', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 313 THE - INFUSIONS > 304 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '314', 'DESSERT AIDE PATISSIERE', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 314 DESSERT AIDE PATISSIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'DESSERTS A PREPARER', '314', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 314 DESSERT AIDE PATISSIERE > 401 DESSERTS A PREPARER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'DESSERT PRETS A CONSOMMER', '314', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 314 DESSERT AIDE PATISSIERE > 402 DESSERT PRETS A CONSOMMER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'LEVURES ET SUCRES', '314', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 314 DESSERT AIDE PATISSIERE > 403 LEVURES ET SUCRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'AIDES A LA PATISSERIE', '314', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 314 DESSERT AIDE PATISSIERE > 404 AIDES A LA PATISSERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '315', 'SUCRES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 315 SUCRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'CLASSIQUE', '315', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 315 SUCRES > 501 CLASSIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'SPECIALITES', '315', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 315 SUCRES > 502 SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'ALLEGES', '315', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 315 SUCRES > 503 ALLEGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'EDULCORANTS', '315', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 315 SUCRES > 504 EDULCORANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'SIROP D''AGAVE', '315', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 315 SUCRES > 505 SIROP D''AGAVE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '316', 'FRUITS AU SIROP', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'MACEDOINES', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 601 MACEDOINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'ABRICOTS', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 602 ABRICOTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'PECHES', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 603 PECHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'ANANAS', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 604 ANANAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'AUTRES', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 605 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'INDIVIDUELS', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 606 INDIVIDUELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'COCKTAILS', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 607 COCKTAILS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'LYCHEES', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 608 LYCHEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'MANGUE', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 609 MANGUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '610', 'POIRES', '316', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 316 FRUITS AU SIROP > 610 POIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '317', 'FRUITS SEC', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 317 FRUITS SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'FRUITS SEC', '317', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 317 FRUITS SEC > 701 FRUITS SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '318', 'CHOCOLATS EN TABLETTES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'PATISSIER', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 801 PATISSIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'TABLETTE LAIT/BLC MENAGE', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 802 TABLETTE LAIT/BLC MENAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'TABLETTE PATISSIER', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 803 TABLETTE PATISSIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'TABLETTE LAIT/BLC DEGUSTA', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 804 TABLETTE LAIT/BLC DEGUSTA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'TABLETTE NOIR MENAGE', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 805 TABLETTE NOIR MENAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'TABLETTE NOIR DEGUSTATION', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 806 TABLETTE NOIR DEGUSTATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'PRODUITS BIOLOGIQUES', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 807 PRODUITS BIOLOGIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'AUTRES', '318', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 318 CHOCOLATS EN TABLETTES > 808 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '319', 'CONFISERIE DE CHOCOLAT', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'BARRES BISCUITEES', '319', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT > 901 BARRES BISCUITEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'LUDIQUES ENFANTS', '319', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT > 902 LUDIQUES ENFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'ROCHERS CHOCO/ACCOMP.CAFE', '319', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT > 903 ROCHERS CHOCO/ACCOMP.CAFE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'BOITAGES PERMANENTS', '319', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT > 904 BOITAGES PERMANENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'PRODUITS BIOLOGIQUES', '319', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT > 905 PRODUITS BIOLOGIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'BARRES FONDANTES', '319', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 319 CONFISERIE DE CHOCOLAT > 906 BARRES FONDANTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '321', 'CHOCOLATS SAISONNIERS', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 321 CHOCOLATS SAISONNIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CHOCOLATS DE NOEL', '321', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 321 CHOCOLATS SAISONNIERS > 101 CHOCOLATS DE NOEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CHOCOLATS DE PAQUE', '321', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 321 CHOCOLATS SAISONNIERS > 102 CHOCOLATS DE PAQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'AUTRE SAISONNIER', '321', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 321 CHOCOLATS SAISONNIERS > 103 AUTRE SAISONNIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '322', 'CONFISERIE DE SUCRE', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'BONBONS FAMILIAUX', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 201 BONBONS FAMILIAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'CONFISERIE SPECIALISEE', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 202 CONFISERIE SPECIALISEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'BONBONS ENFANTS', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 203 BONBONS ENFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'CHEWING-GUM/BUBBLE-GUM', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 204 CHEWING-GUM/BUBBLE-GUM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'CONF DE SUCRE BIOLOGIQUE', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 205 CONF DE SUCRE BIOLOGIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'CONFISERIE REGION/PREM.', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 206 CONFISERIE REGION/PREM.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'CONFISERIE SAISONNIERE', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 207 CONFISERIE SAISONNIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'BONBON AVEC JOUET', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 208 BONBON AVEC JOUET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'PETITE CONFISERIE POCHE', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 209 PETITE CONFISERIE POCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'SANTE FORME', '322', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 322 CONFISERIE DE SUCRE > 210 SANTE FORME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '323', 'FARINES', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 323 FARINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'FARINES BLANCHES', '323', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 323 FARINES > 301 FARINES BLANCHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'FARINES COMPLETES', '323', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 323 FARINES > 302 FARINES COMPLETES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'AUTRES FARINES', '323', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 323 FARINES > 303 AUTRES FARINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '324', 'LAITS INDUSTRIELS', '030', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 324 LAITS INDUSTRIELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CONCENTRE SUCRE', '324', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 324 LAITS INDUSTRIELS > 401 CONCENTRE SUCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'CONCENTRE NON SUCRE', '324', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 324 LAITS INDUSTRIELS > 402 CONCENTRE NON SUCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'POUDRE', '324', '201 GEANT CASINO > 03 EPICERIE > 030 EPICERIE SUCREE > 324 LAITS INDUSTRIELS > 403 POUDRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '031', 'EPICERIE SALEE', '03', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '311', 'ALIMENTATÂ° INFANTILE IFF', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CEREALES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 101 CEREALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'BISCUITS', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 102 BISCUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'BOISSONS', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 103 BOISSONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'POTS LEGUMES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 104 POTS LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'COUPELLES SALEES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 105 COUPELLES SALEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'ASSIETTES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 106 ASSIETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'PRODUITS JUNIOR', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 107 PRODUITS JUNIOR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'POT DESSERTS-GOUTERS', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 108 POT DESSERTS-GOUTERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'COUPELLES SUCREES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 109 COUPELLES SUCREES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '110', 'POTS FRUITS', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 110 POTS FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '111', 'LAITS POUDRES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 111 LAITS POUDRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '112', 'LAITS LIQUIDES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 112 LAITS LIQUIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '113', 'LAITS DE CROISSANCE', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 113 LAITS DE CROISSANCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '114', 'PETITS DEJEUNERS', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 114 PETITS DEJEUNERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '115', 'POTAGES', '311', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 311 ALIMENTATÂ° INFANTILE IFF > 115 POTAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '312', 'POMMES DE TERRE', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 312 POMMES DE TERRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'FLOCONS NATURE', '312', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 312 POMMES DE TERRE > 201 FLOCONS NATURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'PUREE', '312', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 312 POMMES DE TERRE > 202 PUREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '313', 'PATES ALIMENTAIRES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 313 PATES ALIMENTAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'PATES QS QUOTIDIENNES', '313', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 313 PATES ALIMENTAIRES > 301 PATES QS QUOTIDIENNES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'PATES AUX OEUFS', '313', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 313 PATES ALIMENTAIRES > 302 PATES AUX OEUFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'PATES QS FESTIVES', '313', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 313 PATES ALIMENTAIRES > 303 PATES QS FESTIVES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '314', 'LEGUMES SECS-RIZ-CEREALES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 314 LEGUMES SECS-RIZ-CEREALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'LEGUMES SECS', '314', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 314 LEGUMES SECS-RIZ-CEREALES > 401 LEGUMES SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'RIZ', '314', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 314 LEGUMES SECS-RIZ-CEREALES > 402 RIZ');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'AUTRES CEREALES', '314', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 314 LEGUMES SECS-RIZ-CEREALES > 403 AUTRES CEREALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'SEMOULES', '314', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 314 LEGUMES SECS-RIZ-CEREALES > 404 SEMOULES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'GRAINES A COUSCOUS', '314', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 314 LEGUMES SECS-RIZ-CEREALES > 405 GRAINES A COUSCOUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '315', 'POTAGES & CROUTONS', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 315 POTAGES & CROUTONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'CROUTONS', '315', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 315 POTAGES & CROUTONS > 501 CROUTONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'POTAGES', '315', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 315 POTAGES & CROUTONS > 502 POTAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'POTAGE DESHYDRATE SACHET', '315', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 315 POTAGES & CROUTONS > 503 POTAGE DESHYDRATE SACHET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '316', 'CONDIMENTS & SAUCES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'LEGUMES CONDIMENTAIRES', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 601 LEGUMES CONDIMENTAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'KETCHUP', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 602 KETCHUP');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'SAUCES FROIDES', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 603 SAUCES FROIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'DIVERS', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 604 DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'CORNICHONS', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 605 CORNICHONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'OLIVES', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 606 OLIVES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'MOUTARDES', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 607 MOUTARDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'MAYONNAISES', '316', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 316 CONDIMENTS & SAUCES > 608 MAYONNAISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '317', 'SAUCES CHAUDES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 317 SAUCES CHAUDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'PULPE/PUREE/COULIS/CONC.', '317', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 317 SAUCES CHAUDES > 701 PULPE/PUREE/COULIS/CONC.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'SAUCES BASE TOMATES', '317', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 317 SAUCES CHAUDES > 702 SAUCES BASE TOMATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'SAUCES HORS TOMATES', '317', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 317 SAUCES CHAUDES > 703 SAUCES HORS TOMATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '318', 'EPICES POIVRES SELS', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 318 EPICES POIVRES SELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'EPICES HERBES ET AROMATES', '318', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 318 EPICES POIVRES SELS > 801 EPICES HERBES ET AROMATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'SELS', '318', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 318 EPICES POIVRES SELS > 802 SELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'POIVRE', '318', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 318 EPICES POIVRES SELS > 803 POIVRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'ACCOMPAGNEMENT SALADE', '318', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 318 EPICES POIVRES SELS > 804 ACCOMPAGNEMENT SALADE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '319', 'AIDES CULINAIRES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 319 AIDES CULINAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'LIANTS ET CHAPELURES', '319', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 319 AIDES CULINAIRES > 901 LIANTS ET CHAPELURES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'BOUILLONS ET ASS.CHAUDS', '319', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 319 AIDES CULINAIRES > 902 BOUILLONS ET ASS.CHAUDS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'ASSAISONNEMENTS FROIDS', '319', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 319 AIDES CULINAIRES > 903 ASSAISONNEMENTS FROIDS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'DIVERS', '319', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 319 AIDES CULINAIRES > 904 DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '321', 'HUILES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'HUILES SANTE', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 101 HUILES SANTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PRODUITS BIOLOGIQUES', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 102 PRODUITS BIOLOGIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'ARACHIDE', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 103 ARACHIDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'TOURNESOL', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 104 TOURNESOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'OLIVE ET POMASSE', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 105 OLIVE ET POMASSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'SPECIALITES', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 106 SPECIALITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'MELANGES', '321', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 321 HUILES > 107 MELANGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '322', 'VINAIGRES ET VINAIGRETTES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 322 VINAIGRES ET VINAIGRETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'VINAIGRES', '322', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 322 VINAIGRES ET VINAIGRETTES > 201 VINAIGRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'VINAIGRES GASTRONOMIQUES', '322', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 322 VINAIGRES ET VINAIGRETTES > 202 VINAIGRES GASTRONOMIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'SAUCE SALADE/VINAIGRETTE', '322', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 322 VINAIGRES ET VINAIGRETTES > 203 SAUCE SALADE/VINAIGRETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '323', 'CONSERVES DE LEGUMES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'MELANGES DE LEGUMES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 301 MELANGES DE LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'ASPERGES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 302 ASPERGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'CHAMPIGNONS DE PARIS', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 303 CHAMPIGNONS DE PARIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'CHAMPIGNONS SYLVESTRES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 304 CHAMPIGNONS SYLVESTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'LEGUMES DIVERS', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 305 LEGUMES DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'GERMES DE SOJA', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 306 GERMES DE SOJA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'LEGUMES SECS', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 307 LEGUMES SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '308', 'LEGUMES CUISINES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 308 LEGUMES CUISINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '309', 'MAIS', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 309 MAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '310', 'AUTRES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 310 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '311', 'PETITS POIS CUISINES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 311 PETITS POIS CUISINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '312', 'POIS ET CAROTTES', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 312 POIS ET CAROTTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '313', 'HARIC.VERTS BEURRE MT', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 313 HARIC.VERTS BEURRE MT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '314', 'FLAGEOLETS', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 314 FLAGEOLETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '315', 'TOMATE ENTIERE ET PELEE', '323', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 323 CONSERVES DE LEGUMES > 315 TOMATE ENTIERE ET PELEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '324', 'CONSERVES DE POISSONS', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'SARDINES', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 401 SARDINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'SALADES MARINIERES', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 402 SALADES MARINIERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'THONS', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 403 THONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'MAQUEREAUX', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 404 MAQUEREAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'TARTINABLES', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 405 TARTINABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'CRUSTACES ET MOLLUSQUES', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 406 CRUSTACES ET MOLLUSQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'AUTRES POISSONS', '324', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 324 CONSERVES DE POISSONS > 407 AUTRES POISSONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '325', 'CONSERVES DE VIANDES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'VIANDES EN CONSERVES', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 501 VIANDES EN CONSERVES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'FOIE GRAS ET DERIVES', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 502 FOIE GRAS ET DERIVES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'SALADES DE VIANDE', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 503 SALADES DE VIANDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'PATES', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 504 PATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'RILLETTES', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 505 RILLETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'CONFITS DE FOIE', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 506 CONFITS DE FOIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'SAUCISSE COCKTAIL/HOT DOG', '325', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 325 CONSERVES DE VIANDES > 507 SAUCISSE COCKTAIL/HOT DOG');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '326', 'PLATS CUISINES A PREPARER', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'LEGUMES SECS', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 601 LEGUMES SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'PATES ALIMENTAIRES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 602 PATES ALIMENTAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'RIZ', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 603 RIZ');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'BLE', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 604 BLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'CASSOULET', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 605 CASSOULET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'PLAT CUISINE BASE DE PATE', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 606 PLAT CUISINE BASE DE PATE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'PLATS A BASE DE LEGUMES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 607 PLATS A BASE DE LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'PLAT BARQUETTE INDIVIDUEL', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 608 PLAT BARQUETTE INDIVIDUEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'PLATS EXOTIQUES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 609 PLATS EXOTIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '610', 'PLATS DESHYDRATES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 610 PLATS DESHYDRATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '611', 'PLATS CUISINES DIVERS', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 611 PLATS CUISINES DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '612', 'ESCARGOTS', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 612 ESCARGOTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '613', 'CONFITS', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 613 CONFITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '614', 'GRAISSES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 614 GRAISSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '615', 'CHOUCROUTE GARNIE', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 615 CHOUCROUTE GARNIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '616', 'PRODUITS BIOLOGIQUES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 616 PRODUITS BIOLOGIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '617', 'PLAT CUISINE BASELENTILLE', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 617 PLAT CUISINE BASELENTILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '618', 'QUENELLES', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 618 QUENELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '619', 'PLATS PREPARER HALAL', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 619 PLATS PREPARER HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '620', 'AUTRES HALAL', '326', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 326 PLATS CUISINES A PREPARER > 620 AUTRES HALAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '327', 'PRODUITS BIO ET EQUITABLE', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'EPICERIE SUCREE BIO', '327', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE > 701 EPICERIE SUCREE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'EPICERIE SALEE BIO', '327', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE > 702 EPICERIE SALEE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'BOISSONS BIO', '327', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE > 703 BOISSONS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'PRODUITS A BASE DE SOJA', '327', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE > 704 PRODUITS A BASE DE SOJA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'COMMERCE EQUITABLE BIO', '327', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE > 705 COMMERCE EQUITABLE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'COMMERCE EQUITABLE NN BIO', '327', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 327 PRODUITS BIO ET EQUITABLE > 706 COMMERCE EQUITABLE NN BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '328', 'PRODUITS DIETETIQUES', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'DIETETIQUE QUOTIDIENNE', '328', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES > 801 DIETETIQUE QUOTIDIENNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'MALADIES / INTOLERANCES', '328', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES > 802 MALADIES / INTOLERANCES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'DIETETIQUE MINCEUR', '328', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES > 803 DIETETIQUE MINCEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'DIETETIQUE SPORTIVE', '328', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES > 804 DIETETIQUE SPORTIVE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'DIETETIQUE FONCTIONNELLE', '328', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES > 805 DIETETIQUE FONCTIONNELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'SOJA', '328', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 328 PRODUITS DIETETIQUES > 806 SOJA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '329', 'PRODUITS REGIONAUX', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 329 PRODUITS REGIONAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'EPICERIE SALEE', '329', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 329 PRODUITS REGIONAUX > 901 EPICERIE SALEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'EPICERIE SUCREE', '329', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 329 PRODUITS REGIONAUX > 902 EPICERIE SUCREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'AUTRES', '329', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 329 PRODUITS REGIONAUX > 903 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '331', 'EPICERIE DU MONDE', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 331 EPICERIE DU MONDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '332', 'CHAT HUMIDE', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 332 CHAT HUMIDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PORTION/BQT INDIVID. CHAT', '332', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 332 CHAT HUMIDE > 201 PORTION/BQT INDIVID. CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'BOITE CHAT', '332', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 332 CHAT HUMIDE > 202 BOITE CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'LAIT POUR CHAT', '332', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 332 CHAT HUMIDE > 203 LAIT POUR CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '333', 'CHIEN HUMIDE', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 333 CHIEN HUMIDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'PORTION/BQT INDIVID.CHIEN', '333', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 333 CHIEN HUMIDE > 301 PORTION/BQT INDIVID.CHIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BOITE CHIEN', '333', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 333 CHIEN HUMIDE > 302 BOITE CHIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '334', 'CHAT SEC', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 334 CHAT SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'SNACKING CHAT', '334', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 334 CHAT SEC > 401 SNACKING CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'CROQUETTES CHAT', '334', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 334 CHAT SEC > 402 CROQUETTES CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '335', 'CHIEN SEC', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 335 CHIEN SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'SNACKING CHIEN', '335', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 335 CHIEN SEC > 501 SNACKING CHIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'CROQUETTES CHIEN', '335', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 335 CHIEN SEC > 502 CROQUETTES CHIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'COMPLEMENTS', '335', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 335 CHIEN SEC > 503 COMPLEMENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '336', 'LITIERES CHATS', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 336 LITIERES CHATS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'NORMALE', '336', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 336 LITIERES CHATS > 601 NORMALE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'COMPACTE', '336', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 336 LITIERES CHATS > 602 COMPACTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'PARFUMEE', '336', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 336 LITIERES CHATS > 603 PARFUMEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'AUTRES', '336', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 336 LITIERES CHATS > 604 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '337', 'ANIMALERIE', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'ACCESSOIRES CHAT', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 701 ACCESSOIRES CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'ACCESSOIRES CHIEN', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 702 ACCESSOIRES CHIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'ACCESSOIRE AUTRE ANIMAUX', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 703 ACCESSOIRE AUTRE ANIMAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'SANTE ET TOILETTAGE CHAT', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 704 SANTE ET TOILETTAGE CHAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'SANTE ET TOILETTAGE CHIEN', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 705 SANTE ET TOILETTAGE CHIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'SANTE AUTRES ANIMAUX', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 706 SANTE AUTRES ANIMAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '707', 'ALIMENTS OISEAUX', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 707 ALIMENTS OISEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '708', 'ALIMENTS RONGEURS', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 708 ALIMENTS RONGEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '709', 'ALIMENTS AUTRES ANIMAUX', '337', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 337 ANIMALERIE > 709 ALIMENTS AUTRES ANIMAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '338', 'IFFO', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 338 IFFO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'STANDARDS', '338', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 338 IFFO > 801 STANDARDS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'SPECIAUX', '338', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 338 IFFO > 802 SPECIAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '339', 'GUM', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 339 GUM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'POUDRE', '339', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 339 GUM > 901 POUDRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'LIQUIDE', '339', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 339 GUM > 902 LIQUIDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '341', 'I.CEREALS', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 341 I.CEREALS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BLEDINE', '341', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 341 I.CEREALS > 101 BLEDINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PHOSPHATINE', '341', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 341 I.CEREALS > 102 PHOSPHATINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '342', 'FOOD', '031', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 342 FOOD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'BOISSONS', '342', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 342 FOOD > 201 BOISSONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'BISCUITS', '342', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 342 FOOD > 202 BISCUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'SUCRES', '342', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 342 FOOD > 203 SUCRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'SALES', '342', '201 GEANT CASINO > 03 EPICERIE > 031 EPICERIE SALEE > 342 FOOD > 204 SALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '04', 'LIQUIDES', '201', '201 GEANT CASINO > 04 LIQUIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '040', 'VINS/ALCOOLS', '04', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '401', 'ALCOOLS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 401 ALCOOLS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'FLASKS ET MIGNONETTES', '401', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 401 ALCOOLS > 101 FLASKS ET MIGNONETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'GINS', '401', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 401 ALCOOLS > 102 GINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'TEQUILAS', '401', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 401 ALCOOLS > 103 TEQUILAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'VODKAS', '401', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 401 ALCOOLS > 104 VODKAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'AUTRES ALCOOLS', '401', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 401 ALCOOLS > 105 AUTRES ALCOOLS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '402', 'RHUMS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 402 RHUMS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'RHUMS BLANCS', '402', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 402 RHUMS > 201 RHUMS BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'RHUMS BRUNS ET VIEUX', '402', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 402 RHUMS > 202 RHUMS BRUNS ET VIEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'RHUMS ARRANGES', '402', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 402 RHUMS > 203 RHUMS ARRANGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '403', 'WHISKIE SCOTCH ET BOURBON', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 403 WHISKIE SCOTCH ET BOURBON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'BLEND', '403', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 403 WHISKIE SCOTCH ET BOURBON > 301 BLEND');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BOURBONS', '403', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 403 WHISKIE SCOTCH ET BOURBON > 302 BOURBONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'SINGLE & PURE MALT', '403', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 403 WHISKIE SCOTCH ET BOURBON > 303 SINGLE & PURE MALT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'WHISKIES DU MONDE', '403', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 403 WHISKIE SCOTCH ET BOURBON > 304 WHISKIES DU MONDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '404', 'APERITIFS ET DIGESTIFS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'A BASE DE FRUITS', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 401 A BASE DE FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'A BASE DE PLANTES', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 402 A BASE DE PLANTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'ANISES', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 403 ANISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'COGNACS ET ARMAGNACS', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 404 COGNACS ET ARMAGNACS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'CREMES DE FRUITS', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 405 CREMES DE FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'PORTOS ET VINS CUITS', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 406 PORTOS ET VINS CUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'PREMIX PUNCHS & COCKTAILs', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 407 PREMIX PUNCHS & COCKTAILs');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '408', 'APERITIFS SANS ALCOOL', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 408 APERITIFS SANS ALCOOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '409', 'VINS DOUX NATURELS', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 409 VINS DOUX NATURELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '410', 'AUTRE APERITIF/DIGESTIF', '404', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 404 APERITIFS ET DIGESTIFS > 410 AUTRE APERITIF/DIGESTIF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '405', 'BIERES ET PANACHES', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'BIERES', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 501 BIERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'BIERES AROMATISEES', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 502 BIERES AROMATISEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'BIERES DU MONDE', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 503 BIERES DU MONDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'BIERES FUTS', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 504 BIERES FUTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'CAVE A BIERES', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 505 CAVE A BIERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'BIERES SANS ALCOOL', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 506 BIERES SANS ALCOOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'PANACHES', '405', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 405 BIERES ET PANACHES > 507 PANACHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '406', 'CIDRES', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 406 CIDRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'CIDRES BRUTS', '406', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 406 CIDRES > 601 CIDRES BRUTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'CIDRES DOUX', '406', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 406 CIDRES > 602 CIDRES DOUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'CIDRES ROSES', '406', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 406 CIDRES > 603 CIDRES ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'CIDRES AROMATISES', '406', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 406 CIDRES > 604 CIDRES AROMATISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '407', 'EFFERVESCENTS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'EFFERVESCENTS BRUTS', '407', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS > 701 EFFERVESCENTS BRUTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'EFFERVESCENTS DEMI SECS', '407', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS > 702 EFFERVESCENTS DEMI SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'EFFERVESCENTS ROSES', '407', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS > 703 EFFERVESCENTS ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'EFFERVESCENTS REGIONAUX', '407', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS > 704 EFFERVESCENTS REGIONAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'EFFERVESCENTS AROMATISES', '407', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS > 705 EFFERVESCENTS AROMATISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'EFFERVESCENTS DU MONDE', '407', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 407 EFFERVESCENTS > 706 EFFERVESCENTS DU MONDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '408', 'CHAMPAGNES', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 408 CHAMPAGNES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CHAMPAGNES BRUTS', '408', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 408 CHAMPAGNES > 801 CHAMPAGNES BRUTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'CHAMPAGNES DEMI SECS', '408', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 408 CHAMPAGNES > 802 CHAMPAGNES DEMI SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'CHAMPAGNES ROSES', '408', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 408 CHAMPAGNES > 803 CHAMPAGNES ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'BLC DE BLC ET BLC DE NOIR', '408', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 408 CHAMPAGNES > 804 BLC DE BLC ET BLC DE NOIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '409', 'VINS PRIMEURS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 409 VINS PRIMEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'BEAUJOLAIS NOUVEAU', '409', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 409 VINS PRIMEURS > 901 BEAUJOLAIS NOUVEAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'COTES DU RHONES PRIMEUR', '409', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 409 VINS PRIMEURS > 902 COTES DU RHONES PRIMEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'AUTRES PRIMEURS', '409', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 409 VINS PRIMEURS > 903 AUTRES PRIMEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '411', 'CUBIS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 411 CUBIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CUBIS ROUGES', '411', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 411 CUBIS > 101 CUBIS ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CUBIS BLANCS', '411', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 411 CUBIS > 102 CUBIS BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CUBIS ROSES', '411', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 411 CUBIS > 103 CUBIS ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '412', 'ALSACES', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 412 ALSACES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PINOTS', '412', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 412 ALSACES > 201 PINOTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'GEWURZTRAMINER', '412', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 412 ALSACES > 203 GEWURZTRAMINER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'SYLVANER', '412', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 412 ALSACES > 204 SYLVANER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'RIESLING', '412', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 412 ALSACES > 205 RIESLING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'VOSGES ET JURA', '412', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 412 ALSACES > 206 VOSGES ET JURA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '413', 'BEAUJOLAIS ET LYONNAIS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 413 BEAUJOLAIS ET LYONNAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'BEAUJOLAIS/LYONNAIS ROUGE', '413', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 413 BEAUJOLAIS ET LYONNAIS > 301 BEAUJOLAIS/LYONNAIS ROUGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BEAUJOLAIS/LYONNAIS BLANC', '413', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 413 BEAUJOLAIS ET LYONNAIS > 302 BEAUJOLAIS/LYONNAIS BLANC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'BEAUJOLAIS/LYONNAIS ROSE', '413', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 413 BEAUJOLAIS ET LYONNAIS > 303 BEAUJOLAIS/LYONNAIS ROSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '414', 'BORDEAUX', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 414 BORDEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'BORDEAUX ROUGES', '414', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 414 BORDEAUX > 401 BORDEAUX ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'BORDEAUX BLANCS DOUX', '414', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 414 BORDEAUX > 402 BORDEAUX BLANCS DOUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'BORDEAUX BLANCS SECS', '414', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 414 BORDEAUX > 403 BORDEAUX BLANCS SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BORDEAUX ROSES', '414', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 414 BORDEAUX > 404 BORDEAUX ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '415', 'BOURGOGNES', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 415 BOURGOGNES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'BOURGOGNES ROUGES', '415', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 415 BOURGOGNES > 501 BOURGOGNES ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'BOURGOGNES BLANCS', '415', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 415 BOURGOGNES > 502 BOURGOGNES BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'BOURGOGNES ROSES', '415', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 415 BOURGOGNES > 503 BOURGOGNES ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'BOURGOGNES ALIGOTES', '415', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 415 BOURGOGNES > 504 BOURGOGNES ALIGOTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '416', 'LANGUEDOC ROUSSILLON', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 416 LANGUEDOC ROUSSILLON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'LANGUEDOC ROUSSILLON RGE', '416', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 416 LANGUEDOC ROUSSILLON > 601 LANGUEDOC ROUSSILLON RGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'LANGUEDOC ROUSSILLON BLC', '416', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 416 LANGUEDOC ROUSSILLON > 602 LANGUEDOC ROUSSILLON BLC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'LANGUEDOC ROUSSILLON RS', '416', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 416 LANGUEDOC ROUSSILLON > 603 LANGUEDOC ROUSSILLON RS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '417', 'LOIRE ET CENTRE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 417 LOIRE ET CENTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'LOIRE ET CENTRE ROUGES', '417', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 417 LOIRE ET CENTRE > 701 LOIRE ET CENTRE ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'LOIRE ET CENTRE BLANCS', '417', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 417 LOIRE ET CENTRE > 702 LOIRE ET CENTRE BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'LOIRE ET CENTRE ROSES', '417', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 417 LOIRE ET CENTRE > 703 LOIRE ET CENTRE ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '418', 'PROVENCE ET CORSE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 418 PROVENCE ET CORSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'PROVENCE ET CORSE ROUGES', '418', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 418 PROVENCE ET CORSE > 801 PROVENCE ET CORSE ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'PROVENCE ET CORSE BLANCS', '418', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 418 PROVENCE ET CORSE > 802 PROVENCE ET CORSE BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'PROVENCE ET CORSE ROSES', '418', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 418 PROVENCE ET CORSE > 803 PROVENCE ET CORSE ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '419', 'SAVOIE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 419 SAVOIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'SAVOIE ROUGES', '419', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 419 SAVOIE > 901 SAVOIE ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'SAVOIE BLANCS', '419', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 419 SAVOIE > 902 SAVOIE BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'SAVOIE ROSES', '419', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 419 SAVOIE > 903 SAVOIE ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '421', 'SUD OUEST', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 421 SUD OUEST');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SUD OUEST ROUGES', '421', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 421 SUD OUEST > 101 SUD OUEST ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'SUD OUEST BLANCS DOUX', '421', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 421 SUD OUEST > 102 SUD OUEST BLANCS DOUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'SUD OUEST BLANCS SECS', '421', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 421 SUD OUEST > 103 SUD OUEST BLANCS SECS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'SUD OUEST ROSES', '421', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 421 SUD OUEST > 104 SUD OUEST ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '422', 'VALLEE DU RHONE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 422 VALLEE DU RHONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'VALLEE DU RHONE ROUGES', '422', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 422 VALLEE DU RHONE > 201 VALLEE DU RHONE ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'VALLEE DU RHONE BLANCS', '422', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 422 VALLEE DU RHONE > 202 VALLEE DU RHONE BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'VALLEE DU RHONE ROSES', '422', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 422 VALLEE DU RHONE > 203 VALLEE DU RHONE ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '423', 'VIN S/ALCOOL ET AROMATISE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 423 VIN S/ALCOOL ET AROMATISE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'VINS SANS ALCOOL', '423', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 423 VIN S/ALCOOL ET AROMATISE > 301 VINS SANS ALCOOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'VINS AROMATISES', '423', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 423 VIN S/ALCOOL ET AROMATISE > 302 VINS AROMATISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '424', 'VINS DE PAYS', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 424 VINS DE PAYS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'VINS DE PAYS ROUGES', '424', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 424 VINS DE PAYS > 401 VINS DE PAYS ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'VINS DE PAYS BLANCS', '424', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 424 VINS DE PAYS > 402 VINS DE PAYS BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'VINS DE PAYS ROSES', '424', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 424 VINS DE PAYS > 403 VINS DE PAYS ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '425', 'VINS DE TABLE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 425 VINS DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'VINS DE TABLE ROUGES', '425', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 425 VINS DE TABLE > 501 VINS DE TABLE ROUGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'VINS DE TABLE BLANCS', '425', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 425 VINS DE TABLE > 502 VINS DE TABLE BLANCS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'VINS DE TABLE ROSES', '425', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 425 VINS DE TABLE > 503 VINS DE TABLE ROSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '426', 'VINS DU MONDE', '040', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 426 VINS DU MONDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'AFRIQUE DU SUD', '426', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 426 VINS DU MONDE > 601 AFRIQUE DU SUD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'ETHIOPIE', '426', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 426 VINS DU MONDE > 602 ETHIOPIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'MAGHREB', '426', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 426 VINS DU MONDE > 603 MAGHREB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'EUROPE', '426', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 426 VINS DU MONDE > 604 EUROPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'AUTRES VINS DU MONDE', '426', '201 GEANT CASINO > 04 LIQUIDES > 040 VINS/ALCOOLS > 426 VINS DU MONDE > 605 AUTRES VINS DU MONDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '041', 'LIQUIDES', '04', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '411', 'LIMONADES SODAS EXTRAIT', '041', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'LIMONADES', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 101 LIMONADES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'BOISSON AUX FRUIT GAZEUSE', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 102 BOISSON AUX FRUIT GAZEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'BOISSON AUX FRUITS PLATES', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 103 BOISSON AUX FRUITS PLATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'BOISSONS ENERGETIQUES', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 104 BOISSONS ENERGETIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'BOISSONS A BASE DE THE', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 105 BOISSONS A BASE DE THE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'CLEAR LIMES', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 106 CLEAR LIMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'SODA AU EXTRAIT DE PLANTE', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 107 SODA AU EXTRAIT DE PLANTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'COLAS', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 108 COLAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'SODA AU EXTRAIT DE FRUIT', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 109 SODA AU EXTRAIT DE FRUIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '110', 'BOISSONS ENFANT', '411', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 411 LIMONADES SODAS EXTRAIT > 110 BOISSONS ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '412', 'JUS DE FRUITS', '041', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 412 JUS DE FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PUR JUS DE FRUITS', '412', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 412 JUS DE FRUITS > 201 PUR JUS DE FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'JUS DE FRUITS CONCENTRE', '412', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 412 JUS DE FRUITS > 202 JUS DE FRUITS CONCENTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'NECTAR DE FRUITS', '412', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 412 JUS DE FRUITS > 203 NECTAR DE FRUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'JUS LEGUMES', '412', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 412 JUS DE FRUITS > 204 JUS LEGUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '413', 'SIROPS ET CONCENTRES', '041', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'SIROPS BIDONS', '413', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES > 301 SIROPS BIDONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'SIROPS BOUTEILLE', '413', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES > 302 SIROPS BOUTEILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'CONCENTRES NON SUCRES', '413', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES > 303 CONCENTRES NON SUCRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'AUTRES', '413', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES > 304 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'SIROP COCKTAIL', '413', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES > 305 SIROP COCKTAIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'BIO', '413', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 413 SIROPS ET CONCENTRES > 306 BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '414', 'EAUX', '041', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'EAUX DE SOURCE PLATES', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 401 EAUX DE SOURCE PLATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'EAUX GAZEUSES AROMATISEES', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 402 EAUX GAZEUSES AROMATISEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'PRODUITS REGIONAUX', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 403 PRODUITS REGIONAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'EAUX MINERALES PLATES', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 404 EAUX MINERALES PLATES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'EAUX MINERALES GAZEUSES', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 405 EAUX MINERALES GAZEUSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'EAUX PLATES AROMATISEES', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 406 EAUX PLATES AROMATISEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'BOISSONS FONCTIONNELLES', '414', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 414 EAUX > 407 BOISSONS FONCTIONNELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '415', 'LIQUIDES BIO', '041', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'LIMONADE SODA EXTRAIT BIO', '415', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO > 501 LIMONADE SODA EXTRAIT BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'APERITIFS ET ALCOOL BIO', '415', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO > 502 APERITIFS ET ALCOOL BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'JUS DE FRUITS BIO', '415', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO > 503 JUS DE FRUITS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'SIROPS ET CONCENTRES BIO', '415', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO > 504 SIROPS ET CONCENTRES BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'CIDRES BIO', '415', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO > 505 CIDRES BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'CAVE A BIERES BIO', '415', '201 GEANT CASINO > 04 LIQUIDES > 041 LIQUIDES > 415 LIQUIDES BIO > 506 CAVE A BIERES BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '05', 'D.H.P.', '201', '201 GEANT CASINO > 05 D.H.P.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '050', 'PARFUMERIE', '05', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '501', 'RASAGE ET SOINS HOMME', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 501 RASAGE ET SOINS HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'OUTILS DE RASAGE', '501', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 501 RASAGE ET SOINS HOMME > 101 OUTILS DE RASAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'LAMES DE RASOIRS', '501', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 501 RASAGE ET SOINS HOMME > 102 LAMES DE RASOIRS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'PRODUITS AVANT RASAGE', '501', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 501 RASAGE ET SOINS HOMME > 103 PRODUITS AVANT RASAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'PRODUITS APRES RASAGES', '501', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 501 RASAGE ET SOINS HOMME > 104 PRODUITS APRES RASAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '502', 'DENTAIRE', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'DENTIFRICES', '502', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE > 201 DENTIFRICES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'SOINS DENTAIRES', '502', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE > 202 SOINS DENTAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'NETTOYANT APPAR. DENTAIRE', '502', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE > 203 NETTOYANT APPAR. DENTAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'BROSSES DENTS ENFANTS', '502', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE > 204 BROSSES DENTS ENFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'BROSSES DENTS ADULTES', '502', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE > 205 BROSSES DENTS ADULTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'ACCESSOIRES', '502', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 502 DENTAIRE > 206 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '503', 'ACCESSOIRES DE TOILETTE', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 503 ACCESSOIRES DE TOILETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'ACCESSOIRES CHEVEUX', '503', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 503 ACCESSOIRES DE TOILETTE > 301 ACCESSOIRES CHEVEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'ACCESSOIRES SALLE DE BAIN', '503', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 503 ACCESSOIRES DE TOILETTE > 302 ACCESSOIRES SALLE DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'ACCESSOIRES MAQUILLAGE', '503', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 503 ACCESSOIRES DE TOILETTE > 303 ACCESSOIRES MAQUILLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'ACCESOIRE MANUC./PEDICURE', '503', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 503 ACCESSOIRES DE TOILETTE > 304 ACCESOIRE MANUC./PEDICURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'ACCESSOIRES AUTRES', '503', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 503 ACCESSOIRES DE TOILETTE > 305 ACCESSOIRES AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '504', 'COLORATION', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 504 COLORATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'COLORATION LONGUE DUREE', '504', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 504 COLORATION > 401 COLORATION LONGUE DUREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'COLORATION TEMPORAIRE', '504', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 504 COLORATION > 402 COLORATION TEMPORAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'COLORATION TON SUR TON', '504', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 504 COLORATION > 403 COLORATION TON SUR TON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'DIVERS', '504', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 504 COLORATION > 404 DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'COLORATION HOMME', '504', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 504 COLORATION > 405 COLORATION HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '505', 'MAQUILLAGE', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 505 MAQUILLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'MAQUILLAGE DES YEUX', '505', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 505 MAQUILLAGE > 501 MAQUILLAGE DES YEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'MAQUILLAGE ONGLES', '505', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 505 MAQUILLAGE > 502 MAQUILLAGE ONGLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'MAQUILLAGE DES LEVRES', '505', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 505 MAQUILLAGE > 503 MAQUILLAGE DES LEVRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'MAQUILLAGE VISAGE', '505', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 505 MAQUILLAGE > 504 MAQUILLAGE VISAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '506', 'COTON', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 506 COTON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'COTON A DEMAQUILLER', '506', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 506 COTON > 601 COTON A DEMAQUILLER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'COTON PREDECOUPE', '506', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 506 COTON > 602 COTON PREDECOUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'COTONS TIGES', '506', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 506 COTON > 603 COTONS TIGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '507', 'HYGIENE CORPORELLE', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 507 HYGIENE CORPORELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'SAVONS DE TOILETTE', '507', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 507 HYGIENE CORPORELLE > 701 SAVONS DE TOILETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'BAINS', '507', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 507 HYGIENE CORPORELLE > 702 BAINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'DOUCHES', '507', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 507 HYGIENE CORPORELLE > 703 DOUCHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '508', 'SHAMPOOINGS/A.SHAMP/SOINS', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 508 SHAMPOOINGS/A.SHAMP/SOINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'SHAMPOOINGS', '508', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 508 SHAMPOOINGS/A.SHAMP/SOINS > 801 SHAMPOOINGS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'APRES SHAMPOOINGS ET SOIN', '508', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 508 SHAMPOOINGS/A.SHAMP/SOINS > 802 APRES SHAMPOOINGS ET SOIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'LOTIONS CAPILLAIRES', '508', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 508 SHAMPOOINGS/A.SHAMP/SOINS > 803 LOTIONS CAPILLAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '509', 'PARFUMERIE ALCOOLIQUE', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'EAU DE COLOGNE', '509', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE > 901 EAU DE COLOGNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'EAU DE TOILETTE MASCULINE', '509', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE > 902 EAU DE TOILETTE MASCULINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'EAU DE TOILETTE FEMININE', '509', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE > 903 EAU DE TOILETTE FEMININE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'EAU DE TOILETTE ENFANT', '509', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE > 904 EAU DE TOILETTE ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'AUTRE', '509', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE > 905 AUTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'PARFUM ARAB', '509', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 509 PARFUMERIE ALCOOLIQUE > 906 PARFUM ARAB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '511', 'COIFFANTS', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 511 COIFFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'FIXATEURS', '511', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 511 COIFFANTS > 101 FIXATEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'LAQUES', '511', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 511 COIFFANTS > 102 LAQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'PRODUIT PERMANENT-DIVERS', '511', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 511 COIFFANTS > 103 PRODUIT PERMANENT-DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '512', 'DEODORANTS', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 512 DEODORANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'DEODORANTS FEMMES', '512', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 512 DEODORANTS > 201 DEODORANTS FEMMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'DEODORANTS HOMMES', '512', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 512 DEODORANTS > 202 DEODORANTS HOMMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'DEODORANTS AUTRES', '512', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 512 DEODORANTS > 203 DEODORANTS AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '513', 'SOLAIRES', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 513 SOLAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'AUTOBRONZANTS', '513', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 513 SOLAIRES > 301 AUTOBRONZANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'PRODUITS SOLAIRES ENFANTS', '513', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 513 SOLAIRES > 302 PRODUITS SOLAIRES ENFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'PRODUITS SOLAIRES ADULTES', '513', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 513 SOLAIRES > 303 PRODUITS SOLAIRES ADULTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'APRES SOLEIL', '513', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 513 SOLAIRES > 304 APRES SOLEIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'AUTRES PRODUITS SOLAIRES', '513', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 513 SOLAIRES > 305 AUTRES PRODUITS SOLAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '514', 'PARFUMERIE BIO', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'COTON BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 401 COTON BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'HYGIENE CORPORELLE BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 402 HYGIENE CORPORELLE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'CAPILLAIRE BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 403 CAPILLAIRE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'PARFUMERIE ALCOOLIQUE BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 404 PARFUMERIE ALCOOLIQUE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'DEODORANTS BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 405 DEODORANTS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'PARAPHARMACIE BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 406 PARAPHARMACIE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'DENTAIRE BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 407 DENTAIRE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '409', 'SOINS VISAGE ET CORPS BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 409 SOINS VISAGE ET CORPS BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '410', 'DEPILATOIRES BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 410 DEPILATOIRES BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '411', 'ACCESOIRE DE TOILETTE BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 411 ACCESOIRE DE TOILETTE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '412', 'COLORATION BIO', '514', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 514 PARFUMERIE BIO > 412 COLORATION BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '515', 'PARAPHARMACIE', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 515 PARAPHARMACIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', '1ER SECOURS', '515', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 515 PARAPHARMACIE > 501 1ER SECOURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ACCESSOIRES', '515', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 515 PARAPHARMACIE > 502 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'DERMATOLOGIE', '515', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 515 PARAPHARMACIE > 503 DERMATOLOGIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'PODOLOGIE', '515', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 515 PARAPHARMACIE > 504 PODOLOGIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '516', 'SOINS VISAGE ET CORPS', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'HOMME TOILETTE DU VISAGE', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 601 HOMME TOILETTE DU VISAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'HOMME SOINS DU VISAGE', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 602 HOMME SOINS DU VISAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'HOMME SOINS DU CORPS', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 603 HOMME SOINS DU CORPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'ANTI-BACTERIENS', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 604 ANTI-BACTERIENS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'TOILETTE DU VISAGE', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 605 TOILETTE DU VISAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'SOINS DU VISAGE', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 606 SOINS DU VISAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'SOINS DU CORPS', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 607 SOINS DU CORPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'SOINS SPECIFIQUES', '516', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 516 SOINS VISAGE ET CORPS > 608 SOINS SPECIFIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '517', 'DEPILATOIRE/RASAGE FEMME', '050', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 517 DEPILATOIRE/RASAGE FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'CREME ET GEL', '517', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 517 DEPILATOIRE/RASAGE FEMME > 701 CREME ET GEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'MOUSSE', '517', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 517 DEPILATOIRE/RASAGE FEMME > 702 MOUSSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'CIRE CHAUDE', '517', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 517 DEPILATOIRE/RASAGE FEMME > 703 CIRE CHAUDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'CIRE FROIDE', '517', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 517 DEPILATOIRE/RASAGE FEMME > 704 CIRE FROIDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'AUTRES', '517', '201 GEANT CASINO > 05 D.H.P. > 050 PARFUMERIE > 517 DEPILATOIRE/RASAGE FEMME > 705 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '051', 'DROGUERIE HYGIENE', '05', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '511', 'SACS PROVISIONS', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 511 SACS PROVISIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SACS DE CAISSE', '511', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 511 SACS PROVISIONS > 101 SACS DE CAISSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'SACS ISOTHERMES', '511', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 511 SACS PROVISIONS > 102 SACS ISOTHERMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '512', 'VAISSELLE', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 512 VAISSELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PRODUITS LAVE VAISSELLE', '512', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 512 VAISSELLE > 201 PRODUITS LAVE VAISSELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'VAISSELLE MAINS', '512', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 512 VAISSELLE > 202 VAISSELLE MAINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '513', 'SPARTERIE BROSSERIE/MENAG', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'SPARTERIE TAPIS BROSSE', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 301 SPARTERIE TAPIS BROSSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BROSSERIE BALAIS', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 302 BROSSERIE BALAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'GANTS DE MENAGE', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 303 GANTS DE MENAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'EPONGES', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 304 EPONGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'CHIFFONS', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 305 CHIFFONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'ESSUIE TOUT', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 306 ESSUIE TOUT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'SERPILIERE', '513', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 513 SPARTERIE BROSSERIE/MENAG > 307 SERPILIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '514', 'HYGIENE BEBE', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 514 HYGIENE BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CHANGES BEBE', '514', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 514 HYGIENE BEBE > 401 CHANGES BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'CULOTTES', '514', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 514 HYGIENE BEBE > 402 CULOTTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'AUTRES CHANGES BEBE', '514', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 514 HYGIENE BEBE > 403 AUTRES CHANGES BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'ENURESIE', '514', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 514 HYGIENE BEBE > 404 ENURESIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'TOILETTE BEBE', '514', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 514 HYGIENE BEBE > 405 TOILETTE BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '515', 'PAPIERS', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 515 PAPIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'ESSUIE TOUT UNI', '515', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 515 PAPIERS > 501 ESSUIE TOUT UNI');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ESSUIE TOUT DECORE', '515', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 515 PAPIERS > 502 ESSUIE TOUT DECORE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'ROULEAUX', '515', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 515 PAPIERS > 503 ROULEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'PAQUETS', '515', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 515 PAPIERS > 504 PAQUETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'AUTRES', '515', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 515 PAPIERS > 505 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '516', 'MOUCHOIRS', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 516 MOUCHOIRS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'BOITE', '516', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 516 MOUCHOIRS > 601 BOITE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'ETUIS', '516', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 516 MOUCHOIRS > 602 ETUIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'NETTOYANTS OPTIQUES', '516', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 516 MOUCHOIRS > 603 NETTOYANTS OPTIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '517', 'ART. ABSORBANT/RECURANT', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 517 ART. ABSORBANT/RECURANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'ARTICLE ABSORBANT/ESUYAGE', '517', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 517 ART. ABSORBANT/RECURANT > 701 ARTICLE ABSORBANT/ESUYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'ARTICLES A RECURER', '517', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 517 ART. ABSORBANT/RECURANT > 702 ARTICLES A RECURER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '518', 'PRDT WC/DESODORIS./JAVEL', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'ENTRETIEN WC', '518', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL > 801 ENTRETIEN WC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'FOSSES SEPTIQUES', '518', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL > 802 FOSSES SEPTIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'DEBOUCHEURS', '518', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL > 803 DEBOUCHEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'CANALISATION', '518', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL > 804 CANALISATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'DESODORISANTS', '518', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL > 805 DESODORISANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'JAVEL', '518', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 518 PRDT WC/DESODORIS./JAVEL > 806 JAVEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '519', 'INSECTICIDES', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 519 INSECTICIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'ANTI-VOLANTS', '519', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 519 INSECTICIDES > 901 ANTI-VOLANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'ANTI-RAMPANTS', '519', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 519 INSECTICIDES > 902 ANTI-RAMPANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'ANTI-MITES', '519', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 519 INSECTICIDES > 903 ANTI-MITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'MULTI-USAGE', '519', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 519 INSECTICIDES > 904 MULTI-USAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'DIVERS', '519', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 519 INSECTICIDES > 905 DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '521', 'HYGIENE INTIME', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 521 HYGIENE INTIME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SERVIETTES', '521', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 521 HYGIENE INTIME > 101 SERVIETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PROTEGE-SLIPS', '521', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 521 HYGIENE INTIME > 102 PROTEGE-SLIPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'TAMPONS', '521', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 521 HYGIENE INTIME > 103 TAMPONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'INCONTINENCE', '521', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 521 HYGIENE INTIME > 104 INCONTINENCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'TOILETTE INTIME', '521', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 521 HYGIENE INTIME > 105 TOILETTE INTIME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '522', 'ARTICLES MENAGERS', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 522 ARTICLES MENAGERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'EMBALLAGES MENAGERS', '522', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 522 ARTICLES MENAGERS > 201 EMBALLAGES MENAGERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'SACS POUBELLES', '522', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 522 ARTICLES MENAGERS > 202 SACS POUBELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '523', 'ENTRETIEN DU LINGE', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 523 ENTRETIEN DU LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'LESSIVES LIQUIDES', '523', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 523 ENTRETIEN DU LINGE > 301 LESSIVES LIQUIDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'LESSIVES POUDRES', '523', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 523 ENTRETIEN DU LINGE > 302 LESSIVES POUDRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'DOSETTES', '523', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 523 ENTRETIEN DU LINGE > 303 DOSETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '524', 'PRODUITS D''ENTRETIEN', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CUIRS CHAUSSURES', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 401 CUIRS CHAUSSURES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'COMBUSTIBLES', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 402 COMBUSTIBLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'NETTOYANTS SPECIFIQUE SOL', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 403 NETTOYANTS SPECIFIQUE SOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'NETTOYANTS SPEC. MEUBLE', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 404 NETTOYANTS SPEC. MEUBLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'NETTOYANT-GLACES-VITRES', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 405 NETTOYANT-GLACES-VITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'NETTOY.MENAG.MULTI USAGES', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 406 NETTOY.MENAG.MULTI USAGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'NETTOYANT MENAGER SPEC.', '524', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 524 PRODUITS D''ENTRETIEN > 407 NETTOYANT MENAGER SPEC.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '525', 'ASSOUPLISSANTS', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'CLASSIQUES DILUES', '525', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS > 501 CLASSIQUES DILUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'DOSES TABLETTES', '525', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS > 502 DOSES TABLETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'CLASSIQUES BERLINGOT', '525', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS > 503 CLASSIQUES BERLINGOT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'ECO-RECHARGES', '525', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS > 504 ECO-RECHARGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'ULTRAS', '525', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS > 505 ULTRAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'VOILE SECHE-LINGE', '525', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 525 ASSOUPLISSANTS > 506 VOILE SECHE-LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '526', 'SOINS DU LINGE', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 526 SOINS DU LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'SOIN TEXTILE APRES LAVAGE', '526', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 526 SOINS DU LINGE > 601 SOIN TEXTILE APRES LAVAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'ANTICALCAIRE', '526', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 526 SOINS DU LINGE > 602 ANTICALCAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'SAVONS DE LAVAGE', '526', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 526 SOINS DU LINGE > 603 SAVONS DE LAVAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'SOIN TEXT.AV./PEND.LAVAGE', '526', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 526 SOINS DU LINGE > 604 SOIN TEXT.AV./PEND.LAVAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '527', 'DH BIO', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 527 DH BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'HYGIENE BEBE BIO', '527', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 527 DH BIO > 701 HYGIENE BEBE BIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '528', 'TABAC', '051', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 528 TABAC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CIGARETTES', '528', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 528 TABAC > 801 CIGARETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'AUTRES', '528', '201 GEANT CASINO > 05 D.H.P. > 051 DROGUERIE HYGIENE > 528 TABAC > 802 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '06', 'TEXTILE', '201', '201 GEANT CASINO > 06 TEXTILE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '060', 'FEMME', '06', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '601', 'VTEMENT DE NUIT FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 601 VTEMENT DE NUIT FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CHEMISE DE NUIT', '601', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 601 VTEMENT DE NUIT FEMME > 101 CHEMISE DE NUIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PYJAMA', '601', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 601 VTEMENT DE NUIT FEMME > 102 PYJAMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'NUISETTE', '601', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 601 VTEMENT DE NUIT FEMME > 103 NUISETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'ROBE DE CHAMBRE', '601', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 601 VTEMENT DE NUIT FEMME > 104 ROBE DE CHAMBRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '602', 'CONFECTION FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'DEBARDEUR', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 201 DEBARDEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', '2 POLO', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 202 2 POLO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'T-SHIRT', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 203 T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'SWEATER / PULLOVER', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 204 SWEATER / PULLOVER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'CARDIGAN / ENSEMBLE', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 205 CARDIGAN / ENSEMBLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'VESTE', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 206 VESTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'AUTRES', '602', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 602 CONFECTION FEMME > 207 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '603', 'CHEMISIER FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 603 CHEMISIER FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CHEMISE DE SOIREE', '603', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 603 CHEMISIER FEMME > 301 CHEMISE DE SOIREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'CHEMISIER', '603', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 603 CHEMISIER FEMME > 302 CHEMISIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '604', 'PANTALON FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'JEANS', '604', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME > 401 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'PANTALON DECONTRACTE', '604', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME > 402 PANTALON DECONTRACTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SALOPETTE', '604', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME > 403 SALOPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BERMUDA', '604', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME > 404 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'SHORT', '604', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME > 405 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'LEGGING', '604', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 604 PANTALON FEMME > 406 LEGGING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '605', 'ENSEMBLE FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 605 ENSEMBLE FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'ENSEMBLE PANTALON', '605', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 605 ENSEMBLE FEMME > 501 ENSEMBLE PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ENSEMBLE SHORT', '605', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 605 ENSEMBLE FEMME > 502 ENSEMBLE SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'ENSEMBLE JUPE', '605', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 605 ENSEMBLE FEMME > 503 ENSEMBLE JUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'ENSEMBLE ROBE', '605', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 605 ENSEMBLE FEMME > 504 ENSEMBLE ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '606', 'ROBE/JUPE FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 606 ROBE/JUPE FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'JUPE', '606', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 606 ROBE/JUPE FEMME > 601 JUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'ROBE', '606', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 606 ROBE/JUPE FEMME > 602 ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '607', 'VTEMENT SPORT/PLAGE FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 607 VTEMENT SPORT/PLAGE FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'VETEMENT DE SPORT', '607', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 607 VTEMENT SPORT/PLAGE FEMME > 701 VETEMENT DE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'VETEMENT DE PLAGE', '607', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 607 VTEMENT SPORT/PLAGE FEMME > 702 VETEMENT DE PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '608', 'VTEMENT LOCAL FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 608 VTEMENT LOCAL FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'JALABEYAH', '608', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 608 VTEMENT LOCAL FEMME > 801 JALABEYAH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'ABAYAH', '608', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 608 VTEMENT LOCAL FEMME > 802 ABAYAH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '609', 'SOUS-VETEMENT FEMME', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'MAILLOT DE CORPS', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 901 MAILLOT DE CORPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'T-SHIRT', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 902 T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'STRING', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 903 STRING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'SLIP', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 904 SLIP');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'CALECON', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 905 CALECON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'GAINE', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 906 GAINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '907', 'SOUTIEN-GORGE', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 907 SOUTIEN-GORGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '908', 'SOUS-VETEMENT LOCAL', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 908 SOUS-VETEMENT LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '909', 'CHAUSSETTE CLASSIC', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 909 CHAUSSETTE CLASSIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '910', 'CHAUSSETTE DECONTRACTE', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 910 CHAUSSETTE DECONTRACTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '911', 'CHAUSSETTE SPORT', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 911 CHAUSSETTE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '912', 'CUISSARDE', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 912 CUISSARDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '913', 'COLLANT', '609', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 609 SOUS-VETEMENT FEMME > 913 COLLANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '611', 'ACCESSOIRES', '060', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CEINTURE FEMME', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 101 CEINTURE FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'FOULARD&CHALES', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 102 FOULARD&CHALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'PARAPLUIE', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 103 PARAPLUIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'ARTICLES CUIR FEMME', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 104 ARTICLES CUIR FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'CHAPEAU FEMME', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 105 CHAPEAU FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'GANTS FEMME', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 106 GANTS FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'BIJOUTERIE FANTAISI FEMME', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 107 BIJOUTERIE FANTAISI FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'LUNETTES FEMME', '611', '201 GEANT CASINO > 06 TEXTILE > 060 FEMME > 611 ACCESSOIRES > 108 LUNETTES FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '061', 'HOMME', '06', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '611', 'VTEMENT NUIT HOMME', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 611 VTEMENT NUIT HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'PYJAMA', '611', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 611 VTEMENT NUIT HOMME > 101 PYJAMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'ROBE DE CHAMBRE', '611', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 611 VTEMENT NUIT HOMME > 102 ROBE DE CHAMBRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '612', 'CONFECTION HOMME', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'POLO', '612', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME > 201 POLO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'T-SHIRT', '612', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME > 202 T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'SWEATER', '612', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME > 203 SWEATER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'PULLOVER', '612', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME > 204 PULLOVER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'CARDIGAN', '612', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME > 205 CARDIGAN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'VESTE', '612', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 612 CONFECTION HOMME > 206 VESTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '613', 'CHEMISE HOMME', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 613 CHEMISE HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CHEMISE CLASSIQUE', '613', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 613 CHEMISE HOMME > 301 CHEMISE CLASSIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'CHEMISE DECONTRACTEE', '613', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 613 CHEMISE HOMME > 302 CHEMISE DECONTRACTEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '614', 'PANTALON HOMME', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 614 PANTALON HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'JEANS', '614', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 614 PANTALON HOMME > 401 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'PANTALON DECONTRACTE', '614', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 614 PANTALON HOMME > 402 PANTALON DECONTRACTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SALOPETTE', '614', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 614 PANTALON HOMME > 403 SALOPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BERMUDA', '614', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 614 PANTALON HOMME > 404 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'SHORT', '614', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 614 PANTALON HOMME > 405 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '615', 'VTEMENT SPORT/PLAGE HOMME', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 615 VTEMENT SPORT/PLAGE HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'VETEMENT DE SPORT', '615', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 615 VTEMENT SPORT/PLAGE HOMME > 501 VETEMENT DE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'VETEMENT DE PLAGE', '615', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 615 VTEMENT SPORT/PLAGE HOMME > 502 VETEMENT DE PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '616', 'VTEMENT LOCAL HOMME', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 616 VTEMENT LOCAL HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'WEZAR', '616', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 616 VTEMENT LOCAL HOMME > 601 WEZAR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'DISHDASH', '616', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 616 VTEMENT LOCAL HOMME > 602 DISHDASH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'KAFIE', '616', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 616 VTEMENT LOCAL HOMME > 603 KAFIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'GATRAH', '616', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 616 VTEMENT LOCAL HOMME > 604 GATRAH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'AGHAL', '616', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 616 VTEMENT LOCAL HOMME > 605 AGHAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '617', 'ACCESSOIRES HOMMES', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'CEINTURE HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 701 CEINTURE HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'PARAPLUIE HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 702 PARAPLUIE HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'CUIR HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 703 CUIR HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'CHAPEAU HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 704 CHAPEAU HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'GANTS HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 705 GANTS HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'BRETELLES', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 706 BRETELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '707', 'CRAVATE HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 707 CRAVATE HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '708', 'FOULARD HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 708 FOULARD HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '709', 'LUNETTES DE SOLEIL HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 709 LUNETTES DE SOLEIL HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '710', 'BIJOU HOMME', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 710 BIJOU HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '711', 'GOLDAS MAN', '617', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 617 ACCESSOIRES HOMMES > 711 GOLDAS MAN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '618', 'SOUS-VETEMENT HOMMES', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 618 SOUS-VETEMENT HOMMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'T-SHIRT', '618', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 618 SOUS-VETEMENT HOMMES > 801 T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'SLIP', '618', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 618 SOUS-VETEMENT HOMMES > 802 SLIP');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'BOXER SHORT', '618', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 618 SOUS-VETEMENT HOMMES > 803 BOXER SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'SOUS-VETEMENT LOCAL', '618', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 618 SOUS-VETEMENT HOMMES > 804 SOUS-VETEMENT LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '619', 'CHAUSSETTES HOMMES', '061', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 619 CHAUSSETTES HOMMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'CHAUSSETTES CLASSIQUE', '619', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 619 CHAUSSETTES HOMMES > 901 CHAUSSETTES CLASSIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'CHAUSSETTE DECONTRACTE', '619', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 619 CHAUSSETTES HOMMES > 902 CHAUSSETTE DECONTRACTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'CHAUSSETTE SPORT', '619', '201 GEANT CASINO > 06 TEXTILE > 061 HOMME > 619 CHAUSSETTES HOMMES > 903 CHAUSSETTE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '062', 'BEBE ENFANTS', '06', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '621', 'VTEMENT NUIT/INTER. 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 621 VTEMENT NUIT/INTER. 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'VETEMENT DE NUIT', '621', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 621 VTEMENT NUIT/INTER. 0-18M > 101 VETEMENT DE NUIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'VETMENT DE NUIT INTERIEUR', '621', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 621 VTEMENT NUIT/INTER. 0-18M > 102 VETMENT DE NUIT INTERIEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'SS VETMENT BEBE / LAYETTE', '621', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 621 VTEMENT NUIT/INTER. 0-18M > 103 SS VETMENT BEBE / LAYETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '622', 'CONFECTION GARCON 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 622 CONFECTION GARCON 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'POLO / T-SHIRT', '622', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 622 CONFECTION GARCON 0-18M > 201 POLO / T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'SWEATER', '622', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 622 CONFECTION GARCON 0-18M > 202 SWEATER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'CARDIGAN', '622', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 622 CONFECTION GARCON 0-18M > 203 CARDIGAN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '623', 'CHEMISE GARCON 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 623 CHEMISE GARCON 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CHEMISE UNIE', '623', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 623 CHEMISE GARCON 0-18M > 301 CHEMISE UNIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'CHEMISE IMPRIMEE', '623', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 623 CHEMISE GARCON 0-18M > 302 CHEMISE IMPRIMEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '624', 'PANTALON GARCON 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 624 PANTALON GARCON 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'JEANS', '624', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 624 PANTALON GARCON 0-18M > 401 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'PANTALON', '624', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 624 PANTALON GARCON 0-18M > 402 PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SALOPETTE', '624', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 624 PANTALON GARCON 0-18M > 403 SALOPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BERMUDA', '624', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 624 PANTALON GARCON 0-18M > 404 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'SHORT', '624', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 624 PANTALON GARCON 0-18M > 405 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '625', 'ENSEMBLE GARCON 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 625 ENSEMBLE GARCON 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'ENSEMBLE PANTALON', '625', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 625 ENSEMBLE GARCON 0-18M > 501 ENSEMBLE PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ENSEMBLE SALOPETTE', '625', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 625 ENSEMBLE GARCON 0-18M > 502 ENSEMBLE SALOPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'ENSEMBLE BERMUDA', '625', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 625 ENSEMBLE GARCON 0-18M > 503 ENSEMBLE BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'ENSEMBLE SHORT', '625', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 625 ENSEMBLE GARCON 0-18M > 504 ENSEMBLE SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '626', 'VTEMENT SPORT/PLAGE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 626 VTEMENT SPORT/PLAGE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'VETEMENT DE SPORT', '626', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 626 VTEMENT SPORT/PLAGE 0-18M > 601 VETEMENT DE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'VETEMENT DE PLAGE', '626', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 626 VTEMENT SPORT/PLAGE 0-18M > 602 VETEMENT DE PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '627', 'CONFECTION FILLE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 627 CONFECTION FILLE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'POLO / T-SHIRT', '627', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 627 CONFECTION FILLE 0-18M > 701 POLO / T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'SWEATER / PULLOVER', '627', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 627 CONFECTION FILLE 0-18M > 702 SWEATER / PULLOVER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'CARDIGAN / JACKET', '627', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 627 CONFECTION FILLE 0-18M > 703 CARDIGAN / JACKET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '628', 'CHEMISE/BLOUSE FILE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 628 CHEMISE/BLOUSE FILE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'SHIRT', '628', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 628 CHEMISE/BLOUSE FILE 0-18M > 801 SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'BLOUSE', '628', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 628 CHEMISE/BLOUSE FILE 0-18M > 802 BLOUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '629', 'PANTALON FILLE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'JEANS', '629', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M > 901 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'TROUSER', '629', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M > 902 TROUSER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'DUNGAREE', '629', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M > 903 DUNGAREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'BERMUDA', '629', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M > 904 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'SHORT', '629', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M > 905 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'LEGGING', '629', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 629 PANTALON FILLE 0-18M > 906 LEGGING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '631', 'ENSEMBLE FILLE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SET PANTALON', '631', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M > 101 SET PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'SET SALOPPETTE', '631', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M > 102 SET SALOPPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'SET BERMUDA', '631', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M > 103 SET BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'SET SHORT', '631', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M > 104 SET SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'SET JUPE', '631', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M > 105 SET JUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'SET ROBE', '631', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 631 ENSEMBLE FILLE 0-18M > 106 SET ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '632', 'ROBE/JUPE FILLE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 632 ROBE/JUPE FILLE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'JUPE', '632', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 632 ROBE/JUPE FILLE 0-18M > 201 JUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'ROBE', '632', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 632 ROBE/JUPE FILLE 0-18M > 202 ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '633', 'VTEMENT SPORT/PLAGE 0-18M', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 633 VTEMENT SPORT/PLAGE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'VETEMENT DE SPORT', '633', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 633 VTEMENT SPORT/PLAGE 0-18M > 301 VETEMENT DE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'VETEMENT PLAGE', '633', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 633 VTEMENT SPORT/PLAGE 0-18M > 302 VETEMENT PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '634', 'CHAUSSETTES BEBE', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 634 CHAUSSETTES BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CHAUSSETTE BB BOY 0-18M', '634', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 634 CHAUSSETTES BEBE > 401 CHAUSSETTE BB BOY 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'CHAUSSETTE BB FILLE 0-18M', '634', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 634 CHAUSSETTES BEBE > 402 CHAUSSETTE BB FILLE 0-18M');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '635', 'PYJAMA GARCON 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 635 PYJAMA GARCON 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'PYJAMA', '635', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 635 PYJAMA GARCON 2-5 > 501 PYJAMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ROBE DE CHAMBRE', '635', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 635 PYJAMA GARCON 2-5 > 502 ROBE DE CHAMBRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'POLO / T-SHIRT', '635', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 635 PYJAMA GARCON 2-5 > 503 POLO / T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'SWEATER / PULLOVER', '635', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 635 PYJAMA GARCON 2-5 > 504 SWEATER / PULLOVER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'CARDIGAN / VESTE', '635', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 635 PYJAMA GARCON 2-5 > 505 CARDIGAN / VESTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '636', 'CHEMISE GARCON 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 636 CHEMISE GARCON 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'CHEMISE UNIE', '636', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 636 CHEMISE GARCON 2-5 > 601 CHEMISE UNIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'CHEMISE IMPRIMEE', '636', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 636 CHEMISE GARCON 2-5 > 602 CHEMISE IMPRIMEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '637', 'PANTALON GARCON 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 637 PANTALON GARCON 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'JEANS', '637', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 637 PANTALON GARCON 2-5 > 701 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'PANTALON', '637', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 637 PANTALON GARCON 2-5 > 702 PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'SALOPPETTE', '637', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 637 PANTALON GARCON 2-5 > 703 SALOPPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'BERMUDA', '637', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 637 PANTALON GARCON 2-5 > 704 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'SHORT', '637', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 637 PANTALON GARCON 2-5 > 705 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '638', 'ENSEMBLE GARCON 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 638 ENSEMBLE GARCON 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'SET PANTALON', '638', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 638 ENSEMBLE GARCON 2-5 > 801 SET PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'SET SALOPPETTE', '638', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 638 ENSEMBLE GARCON 2-5 > 802 SET SALOPPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'SET BERMUDA', '638', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 638 ENSEMBLE GARCON 2-5 > 803 SET BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'SET SHORT', '638', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 638 ENSEMBLE GARCON 2-5 > 804 SET SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '639', 'VTEMENT SPORT/PLAGE BOY', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 639 VTEMENT SPORT/PLAGE BOY');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'VETEMENT DE SPORT', '639', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 639 VTEMENT SPORT/PLAGE BOY > 901 VETEMENT DE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'VETEMENT DE PLAGE', '639', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 639 VTEMENT SPORT/PLAGE BOY > 902 VETEMENT DE PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '641', 'GIRL NIGHTWEAR 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 641 GIRL NIGHTWEAR 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'NIGHT GOWN', '641', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 641 GIRL NIGHTWEAR 2-5 > 101 NIGHT GOWN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'NIGHT T-SHIRT', '641', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 641 GIRL NIGHTWEAR 2-5 > 102 NIGHT T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'PYJAMA', '641', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 641 GIRL NIGHTWEAR 2-5 > 103 PYJAMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '642', 'CONFECTION FILLE 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 642 CONFECTION FILLE 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'POLO / T-SHIRT', '642', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 642 CONFECTION FILLE 2-5 > 201 POLO / T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'SWEATER / PULLOVER', '642', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 642 CONFECTION FILLE 2-5 > 202 SWEATER / PULLOVER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'CARDIGAN / JACKET', '642', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 642 CONFECTION FILLE 2-5 > 203 CARDIGAN / JACKET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '643', 'CHEMISIER/BLOUSE FILE 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 643 CHEMISIER/BLOUSE FILE 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'SHIRT', '643', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 643 CHEMISIER/BLOUSE FILE 2-5 > 301 SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BLOUSE', '643', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 643 CHEMISIER/BLOUSE FILE 2-5 > 302 BLOUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '644', 'PANTALON FILLE 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'JEANS', '644', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5 > 401 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'PANTALON', '644', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5 > 402 PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SALOPPETTE', '644', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5 > 403 SALOPPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BERMUDA', '644', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5 > 404 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'SHORT', '644', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5 > 405 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'LEGGING', '644', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 644 PANTALON FILLE 2-5 > 406 LEGGING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '645', 'ENSEMBLE FILLE 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'SET PANTALON', '645', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5 > 501 SET PANTALON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'SET SALOPPETTE', '645', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5 > 502 SET SALOPPETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'SET BERMUDA', '645', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5 > 503 SET BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'SET SHORT', '645', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5 > 504 SET SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'SET JUPE', '645', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5 > 505 SET JUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'SET ROBE', '645', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 645 ENSEMBLE FILLE 2-5 > 506 SET ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '646', 'ROBE/JUPE FILLE 2-5', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 646 ROBE/JUPE FILLE 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'JUPE', '646', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 646 ROBE/JUPE FILLE 2-5 > 601 JUPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'ROBE', '646', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 646 ROBE/JUPE FILLE 2-5 > 602 ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '647', 'VTEMENT SPORT/PLAGE GIRL', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 647 VTEMENT SPORT/PLAGE GIRL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'VETEMENT DE SPORT', '647', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 647 VTEMENT SPORT/PLAGE GIRL > 701 VETEMENT DE SPORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '648', 'CHAUSSETTE BEBE FILLE', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 648 CHAUSSETTE BEBE FILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'KID BOY SOCKS 2-5', '648', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 648 CHAUSSETTE BEBE FILLE > 801 KID BOY SOCKS 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'KID GIRL SOCKS 2-5', '648', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 648 CHAUSSETTE BEBE FILLE > 802 KID GIRL SOCKS 2-5');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '649', 'PYJAMA GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 649 PYJAMA GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'PYJAMA', '649', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 649 PYJAMA GARCON 6-16 > 901 PYJAMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'DRESSING ROBE', '649', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 649 PYJAMA GARCON 6-16 > 902 DRESSING ROBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '651', 'CONFECTION GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 651 CONFECTION GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'POLO / T-SHIRT', '651', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 651 CONFECTION GARCON 6-16 > 101 POLO / T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'SWEATER / PULLOVER', '651', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 651 CONFECTION GARCON 6-16 > 102 SWEATER / PULLOVER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CARDIGAN / JACKET', '651', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 651 CONFECTION GARCON 6-16 > 103 CARDIGAN / JACKET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '652', 'CHEMISE GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 652 CHEMISE GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'SHIRT PLAIN', '652', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 652 CHEMISE GARCON 6-16 > 201 SHIRT PLAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'SHIRT PRINTED', '652', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 652 CHEMISE GARCON 6-16 > 202 SHIRT PRINTED');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '653', 'PANTALON GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'JEANS', '653', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16 > 301 JEANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'CASUAL TROUSER', '653', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16 > 302 CASUAL TROUSER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'FORMAL TROUSER', '653', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16 > 303 FORMAL TROUSER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'DUNGAREE', '653', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16 > 304 DUNGAREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'BERMUDA', '653', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16 > 305 BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'SHORT', '653', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 653 PANTALON GARCON 6-16 > 306 SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '654', 'ENSEMBLE GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 654 ENSEMBLE GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'SET TROUSER', '654', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 654 ENSEMBLE GARCON 6-16 > 401 SET TROUSER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'SET BERMUDA', '654', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 654 ENSEMBLE GARCON 6-16 > 402 SET BERMUDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SET SHORT', '654', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 654 ENSEMBLE GARCON 6-16 > 403 SET SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '655', 'VTEMENT SPORT/PLAGE BOY G', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 655 VTEMENT SPORT/PLAGE BOY G');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'SPORTWEAR', '655', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 655 VTEMENT SPORT/PLAGE BOY G > 501 SPORTWEAR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'BEACHWEAR', '655', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 655 VTEMENT SPORT/PLAGE BOY G > 502 BEACHWEAR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'WEZAR', '655', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 655 VTEMENT SPORT/PLAGE BOY G > 503 WEZAR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '656', 'VTEMENT LOCAL GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'DISHASH', '656', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16 > 601 DISHASH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'VEST', '656', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16 > 602 VEST');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'T-SHIRT', '656', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16 > 603 T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'BRIEF', '656', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16 > 604 BRIEF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'BOXER SHORT', '656', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16 > 605 BOXER SHORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'LOCAL UNDERWEAR', '656', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 656 VTEMENT LOCAL GARCON 6-16 > 606 LOCAL UNDERWEAR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '657', 'CHAUSSETTES GARCON 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 657 CHAUSSETTES GARCON 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'FORMAL SOCKS', '657', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 657 CHAUSSETTES GARCON 6-16 > 701 FORMAL SOCKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'CASUAL SOCKS', '657', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 657 CHAUSSETTES GARCON 6-16 > 702 CASUAL SOCKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'SPORT SOCKS', '657', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 657 CHAUSSETTES GARCON 6-16 > 703 SPORT SOCKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '658', 'PYJAMA FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 658 PYJAMA FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'NIGHT GOWN', '658', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 658 PYJAMA FILLE 6-16 > 801 NIGHT GOWN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'NIGHT T-SHIRT', '658', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 658 PYJAMA FILLE 6-16 > 802 NIGHT T-SHIRT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'PYJAMA', '658', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 658 PYJAMA FILLE 6-16 > 803 PYJAMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '659', 'CONFECTION FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 659 CONFECTION FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '661', 'CHEMISE/BLOUSE FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 661 CHEMISE/BLOUSE FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '662', 'PANTALON FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 662 PANTALON FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '663', 'ENSEMBLE FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 663 ENSEMBLE FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '664', 'ROBE/JUPE FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 664 ROBE/JUPE FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '665', 'VTEMENT SPORT/FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 665 VTEMENT SPORT/FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '666', 'VTEMENT LOCAL FILLE 6-16', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 666 VTEMENT LOCAL FILLE 6-16');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '667', 'CHAUSSETTES FILLES 6-17', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 667 CHAUSSETTES FILLES 6-17');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '668', 'ACCESSOIRES', '062', '201 GEANT CASINO > 06 TEXTILE > 062 BEBE ENFANTS > 668 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '063', 'PUERICULTURE', '06', '201 GEANT CASINO > 06 TEXTILE > 063 PUERICULTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '631', 'GROS PUERICULTURE ENFANT', '063', '201 GEANT CASINO > 06 TEXTILE > 063 PUERICULTURE > 631 GROS PUERICULTURE ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '632', 'PETIT PUERICULTURE ENFANT', '063', '201 GEANT CASINO > 06 TEXTILE > 063 PUERICULTURE > 632 PETIT PUERICULTURE ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '064', 'CHAUSSURES', '06', '201 GEANT CASINO > 06 TEXTILE > 064 CHAUSSURES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '641', 'CHAUSSURE ENFANT 0-2Y', '064', '201 GEANT CASINO > 06 TEXTILE > 064 CHAUSSURES > 641 CHAUSSURE ENFANT 0-2Y');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '642', 'CHAUSSURE FILLE 3-16Y', '064', '201 GEANT CASINO > 06 TEXTILE > 064 CHAUSSURES > 642 CHAUSSURE FILLE 3-16Y');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '643', 'CHAUSSURE GARCON 3-16Y', '064', '201 GEANT CASINO > 06 TEXTILE > 064 CHAUSSURES > 643 CHAUSSURE GARCON 3-16Y');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '644', 'CHAUSSURE FEMME', '064', '201 GEANT CASINO > 06 TEXTILE > 064 CHAUSSURES > 644 CHAUSSURE FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '645', 'CHAUSSURE HOMME', '064', '201 GEANT CASINO > 06 TEXTILE > 064 CHAUSSURES > 645 CHAUSSURE HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '065', 'LINGE DE MAISON', '06', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '651', 'MERCERIE/LACET/SEMELLE', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 651 MERCERIE/LACET/SEMELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'MERCERIE', '651', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 651 MERCERIE/LACET/SEMELLE > 101 MERCERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'LACET', '651', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 651 MERCERIE/LACET/SEMELLE > 102 LACET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'SEMELLE', '651', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 651 MERCERIE/LACET/SEMELLE > 103 SEMELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'KIT DE COUTURE', '651', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 651 MERCERIE/LACET/SEMELLE > 104 KIT DE COUTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '652', 'TISSUS AMEUBLEMENT', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'RIDEAUX UNIS', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 201 RIDEAUX UNIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'RIDEAUX FANTAISIES', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 202 RIDEAUX FANTAISIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'OCCULTANT', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 203 OCCULTANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'VOILAGE', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 204 VOILAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'RIDEAUX FILS', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 205 RIDEAUX FILS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'HOUSSE DE CANAPE', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 206 HOUSSE DE CANAPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'COUSSINS', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 207 COUSSINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'HOUSSE DE COUSSIN', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 208 HOUSSE DE COUSSIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'POUF - COUSSIN DE SOL', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 209 POUF - COUSSIN DE SOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'GALETTES', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 210 GALETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'BAS DE PORTE', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 211 BAS DE PORTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '212', 'CIEL DE LIT', '652', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 652 TISSUS AMEUBLEMENT > 212 CIEL DE LIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '653', 'COUVERT./COUETE/COUVRELIT', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 653 COUVERT./COUETE/COUVRELIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'COUVERTURE', '653', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 653 COUVERT./COUETE/COUVRELIT > 301 COUVERTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'COUETTE', '653', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 653 COUVERT./COUETE/COUVRELIT > 302 COUETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'COUVRE LIT', '653', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 653 COUVERT./COUETE/COUVRELIT > 303 COUVRE LIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'PLAID', '653', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 653 COUVERT./COUETE/COUVRELIT > 304 PLAID');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '654', 'LINGE DE LIT', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'COORDONNEES', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 401 COORDONNEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'HOUSSE DE COUETTE', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 402 HOUSSE DE COUETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'TAIE D''OREILLER', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 403 TAIE D''OREILLER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'DRAP PLAT', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 404 DRAP PLAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'DRAP HOUSSE', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 405 DRAP HOUSSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'PROTECTION MATELAS', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 406 PROTECTION MATELAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'MATELAS', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 407 MATELAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '408', 'MATTRES', '654', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 654 LINGE DE LIT > 408 MATTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '655', 'LINGE DE TOILETTE', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'SERVIETTE DE TOILETTE', '655', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE > 501 SERVIETTE DE TOILETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'DRAP DE BAIN', '655', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE > 502 DRAP DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'SERVIETTE INVITES', '655', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE > 503 SERVIETTE INVITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'GANTS/EPONGE', '655', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE > 504 GANTS/EPONGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'PEIGNOIR', '655', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE > 505 PEIGNOIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'TAPIS DE BAIN', '655', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 655 LINGE DE TOILETTE > 506 TAPIS DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '656', 'LINGE DE TABLE', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 656 LINGE DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'NAPPE', '656', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 656 LINGE DE TABLE > 601 NAPPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'SERVIETTE DE TABLE', '656', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 656 LINGE DE TABLE > 602 SERVIETTE DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'SET DE TABLE', '656', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 656 LINGE DE TABLE > 603 SET DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'TORCHON', '656', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 656 LINGE DE TABLE > 604 TORCHON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'GANT ET MANIQUE - TABLIER', '656', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 656 LINGE DE TABLE > 605 GANT ET MANIQUE - TABLIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '657', 'OREILLER', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 657 OREILLER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'FIBRE NATUREL', '657', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 657 OREILLER > 701 FIBRE NATUREL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'FIBRE SYNTHETIC', '657', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 657 OREILLER > 702 FIBRE SYNTHETIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'MEDICAL', '657', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 657 OREILLER > 703 MEDICAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'PLUME', '657', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 657 OREILLER > 704 PLUME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'POLOCHON', '657', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 657 OREILLER > 705 POLOCHON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '658', 'PLAGE ET ACCESSOIRES', '065', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 658 PLAGE ET ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'DRAP DE BAIN', '658', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 658 PLAGE ET ACCESSOIRES > 801 DRAP DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'TAPIS DE PLAGE', '658', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 658 PLAGE ET ACCESSOIRES > 802 TAPIS DE PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'TAPIS PICNIC', '658', '201 GEANT CASINO > 06 TEXTILE > 065 LINGE DE MAISON > 658 PLAGE ET ACCESSOIRES > 803 TAPIS PICNIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '066', 'BIJOUTERIE', '06', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '661', 'BAGUE', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BAGUE OR', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 101 BAGUE OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'BAGUE OR DIAMANT', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 102 BAGUE OR DIAMANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'BAGUE OR PIERRE PRECIEUSE', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 103 BAGUE OR PIERRE PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'BAGUE OR P.SEMI PRECIEUSE', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 104 BAGUE OR P.SEMI PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'BAGUE OR PERLE', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 105 BAGUE OR PERLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'BAGUE DE MARRIAGE', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 106 BAGUE DE MARRIAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'BAGUE ARGENT', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 107 BAGUE ARGENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'BAGUE FANTAISIE', '661', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 661 BAGUE > 108 BAGUE FANTAISIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '662', 'BOUCLE D''OREILLE', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'CREOLE OR', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 201 CREOLE OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'BOUCLE D''OREILLE OR', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 202 BOUCLE D''OREILLE OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'BOUCLE OREILLE OR DIAMOND', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 203 BOUCLE OREILLE OR DIAMOND');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'B.OREILLE OR P. PRECIEUSE', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 204 B.OREILLE OR P. PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'B.OREILLE OR S-P.PRECIEUS', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 205 B.OREILLE OR S-P.PRECIEUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'BOUCLE D''OREILLE PERLE', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 206 BOUCLE D''OREILLE PERLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'BOUCLE D''OREILLE ARGENT', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 207 BOUCLE D''OREILLE ARGENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'PIERCING OR', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 208 PIERCING OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'BOUCLE DOREILLE FANTAISIE', '662', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 662 BOUCLE D''OREILLE > 209 BOUCLE DOREILLE FANTAISIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '663', 'CHAINE ET COLLIER', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 663 CHAINE ET COLLIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CHAINE', '663', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 663 CHAINE ET COLLIER > 301 CHAINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'COLLIER', '663', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 663 CHAINE ET COLLIER > 302 COLLIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '664', 'BRACELET', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'BRACELET BEBE', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 401 BRACELET BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'BRACELET OR', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 402 BRACELET OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'BRACELET ARGENT', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 403 BRACELET ARGENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BRACELET DIAMANT', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 404 BRACELET DIAMANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'BRACELET PIERRE PRECIEUSE', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 405 BRACELET PIERRE PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'BRACELET S-P.PRECIEUSE', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 406 BRACELET S-P.PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'BRACELET PERLE', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 407 BRACELET PERLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '408', 'BRACELET FANTAISIE', '664', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 664 BRACELET > 408 BRACELET FANTAISIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '665', 'PENDANTIF ET MEDAILLON', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'PENDENTIF RELIGIEUX', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 501 PENDENTIF RELIGIEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'PENDENTIF OR', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 502 PENDENTIF OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'PENDANTIF ARGENT', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 503 PENDANTIF ARGENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'PENDATIF OR DIAMANT', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 504 PENDATIF OR DIAMANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'PENDANTIF OR/P.PRECIEUSE', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 505 PENDANTIF OR/P.PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'PENDANTIF OR P-S PRECIEUS', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 506 PENDANTIF OR P-S PRECIEUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'PENDANTIF OR PERLE', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 507 PENDANTIF OR PERLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '508', 'PIECES OR', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 508 PIECES OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '509', 'IDOLE OR', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 509 IDOLE OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '510', 'PENDENTIF/MEDAILLON FANT.', '665', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 665 PENDANTIF ET MEDAILLON > 510 PENDENTIF/MEDAILLON FANT.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '666', 'BROCHE', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'BROCHE OR', '666', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE > 601 BROCHE OR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'OR ET DIAMANT', '666', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE > 602 OR ET DIAMANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'OR AVEC PIERRE PRECIEUSE', '666', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE > 603 OR AVEC PIERRE PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'OR AVEC P. SEMI PRECIEUSE', '666', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE > 604 OR AVEC P. SEMI PRECIEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'OR AVEC PERLE', '666', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE > 605 OR AVEC PERLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'BROCHE ARGENT', '666', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 666 BROCHE > 606 BROCHE ARGENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '667', 'LUNETTES', '066', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'SOLEIL FEMME', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 701 SOLEIL FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'SOLEIL HOMME', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 702 SOLEIL HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'SOLEIL ENFANT', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 703 SOLEIL ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'SOLEIL BEBE', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 704 SOLEIL BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'LUNETTES DE LECTURE', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 705 LUNETTES DE LECTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'ETUIS', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 706 ETUIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '707', 'ENTRETIEN', '667', '201 GEANT CASINO > 06 TEXTILE > 066 BIJOUTERIE > 667 LUNETTES > 707 ENTRETIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '067', 'BOUTIQUE CADEAUX', '06', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '671', 'MONTRES', '067', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'ENFANT', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 101 ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'HOMME', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 102 HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'FEMME', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 103 FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'PROMO CLOCKS', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 104 PROMO CLOCKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'AUTRES', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 105 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'SPORTS', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 106 SPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'FASHION', '671', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 671 MONTRES > 107 FASHION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '672', 'CADEAUX', '067', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 672 CADEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'STYLO', '672', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 672 CADEAUX > 201 STYLO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'STYLO ENCRE', '672', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 672 CADEAUX > 202 STYLO ENCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'CRITERIUM', '672', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 672 CADEAUX > 203 CRITERIUM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'COFFRET', '672', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 672 CADEAUX > 204 COFFRET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '673', 'CLOCK', '067', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 673 CLOCK');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'HORLOGE', '673', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 673 CLOCK > 301 HORLOGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'PENDULE', '673', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 673 CLOCK > 302 PENDULE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'PROMO CLOCK', '673', '201 GEANT CASINO > 06 TEXTILE > 067 BOUTIQUE CADEAUX > 673 CLOCK > 303 PROMO CLOCK');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '07', 'BAZAR', '201', '201 GEANT CASINO > 07 BAZAR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '070', 'MENAGE', '07', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '701', 'VAISSELLE', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'AMUSE BOUCHE ET MINIATURE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 101 AMUSE BOUCHE ET MINIATURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PORCELAINE BLANCHE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 102 PORCELAINE BLANCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'PORCELAINE DECOREE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 103 PORCELAINE DECOREE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'FAIENCE ET COULEUR', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 104 FAIENCE ET COULEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'ARDOISE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 105 ARDOISE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'SERVICE DE TABLE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 106 SERVICE DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'PLATS DE SERVICE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 107 PLATS DE SERVICE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'AUTRES', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 108 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'MELAMINE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 109 MELAMINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '110', 'COUVERTS DE TABLE', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 110 COUVERTS DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '111', 'MENAGERES', '701', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 701 VAISSELLE > 111 MENAGERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '702', 'USTENSILES DE CUISINE', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'COUTELLERIE DE CUISINE', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 201 COUTELLERIE DE CUISINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'SET COUTEAUX', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 202 SET COUTEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'GADGETS', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 203 GADGETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'CISEAUX', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 204 CISEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'PLANCHE A DECOUPER', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 205 PLANCHE A DECOUPER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'CONDIMENTS', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 206 CONDIMENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'PREPARATION', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 207 PREPARATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'BALANCE ET MINUTEUR', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 208 BALANCE ET MINUTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'GADGET INDIEN', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 209 GADGET INDIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'ISOTHERME', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 210 ISOTHERME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'PLASTIC DE TABLE', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 211 PLASTIC DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '212', 'PLATEAUX', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 212 PLATEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '213', 'ARTICLE EVIERS', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 213 ARTICLE EVIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '214', 'AUTRES', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 214 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '215', 'ARTICLES BOIS', '702', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 702 USTENSILES DE CUISINE > 215 ARTICLES BOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '703', 'VERRERIE', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'ASSIETTES ET COUPES', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 301 ASSIETTES ET COUPES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'VERRES', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 302 VERRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'VERRE APERO', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 303 VERRE APERO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'CARAFES - BOUTEILLES', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 304 CARAFES - BOUTEILLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'SEAU A GLACE', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 305 SEAU A GLACE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'BONBONNIERES', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 306 BONBONNIERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'VERRE CRISTAL', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 307 VERRE CRISTAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '308', 'SERVICE VERRE/ACCESOIRE', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 308 SERVICE VERRE/ACCESOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '309', 'CADEAUX', '703', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 703 VERRERIE > 309 CADEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '704', 'CAFE/PETIT DEJEUNER', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'TASSES', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 401 TASSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'MUGS', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 402 MUGS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'BOLS', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 403 BOLS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'CAFETIERE/THEIERE', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 404 CAFETIERE/THEIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'SERVICE A CAFE/THE', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 405 SERVICE A CAFE/THE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'AUTRES', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 406 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'THERMOS/BTEILLE ISOTHERME', '704', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 704 CAFE/PETIT DEJEUNER > 407 THERMOS/BTEILLE ISOTHERME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '705', 'CUISSON', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'POELE', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 501 POELE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'FAITOUT', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 502 FAITOUT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'CASSEROLE', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 503 CASSEROLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'KADAI / WOKS', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 504 KADAI / WOKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'AUTOCUISEUR - COCOTTES', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 505 AUTOCUISEUR - COCOTTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'PLAT A FOUR', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 506 PLAT A FOUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'SILICONE', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 507 SILICONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '508', 'ARTICLES MICRO ONDES', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 508 ARTICLES MICRO ONDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '509', 'ACCESSOIRES - AUTRES', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 509 ACCESSOIRES - AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '511', 'SET DE CUISSON', '705', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 705 CUISSON > 511 SET DE CUISSON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '706', 'UTILITAIRE DE CUISINE', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 706 UTILITAIRE DE CUISINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'BOCAUX ET BOITES', '706', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 706 UTILITAIRE DE CUISINE > 601 BOCAUX ET BOITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'RANGEMENT', '706', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 706 UTILITAIRE DE CUISINE > 602 RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'EGOUTTOIRS-RANGE COUVERTS', '706', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 706 UTILITAIRE DE CUISINE > 603 EGOUTTOIRS-RANGE COUVERTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'SUPPORTS ET PATERES', '706', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 706 UTILITAIRE DE CUISINE > 604 SUPPORTS ET PATERES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'ASSIETTE PLASTIQUE', '706', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 706 UTILITAIRE DE CUISINE > 607 ASSIETTE PLASTIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '707', 'ENTRETIEN DU LINGE', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 707 ENTRETIEN DU LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'PANIERS A LINGE', '707', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 707 ENTRETIEN DU LINGE > 701 PANIERS A LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'ETENDOIR/PINCE', '707', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 707 ENTRETIEN DU LINGE > 702 ETENDOIR/PINCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'TABLE A REPASSER/HOUSSE', '707', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 707 ENTRETIEN DU LINGE > 703 TABLE A REPASSER/HOUSSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'CINTRE', '707', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 707 ENTRETIEN DU LINGE > 704 CINTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'MACHINE A COUDRE/ACCESOIR', '707', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 707 ENTRETIEN DU LINGE > 705 MACHINE A COUDRE/ACCESOIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '708', 'RANGEM. PLASTIC/CORBEILLE', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'RANGEMENT PLASTIC', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 801 RANGEMENT PLASTIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'RANGEMENT METALIC', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 802 RANGEMENT METALIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'POUBELLE CUISINE', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 803 POUBELLE CUISINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'POUBELLE SALLE DE BAIN', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 804 POUBELLE SALLE DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'BOITE DECO', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 805 BOITE DECO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'VANNERIE', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 806 VANNERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'AUTRES', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 807 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'PANIER/BASSINE', '708', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 708 RANGEM. PLASTIC/CORBEILLE > 808 PANIER/BASSINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '709', 'ARTICLES JETABLES', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'VAISSELLE JETABLE', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 901 VAISSELLE JETABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'VAISSELLE PLASTIQUE', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 902 VAISSELLE PLASTIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'AMUSE BOUCHE ET APERO', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 903 AMUSE BOUCHE ET APERO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'ACCESSOIRES CAOUTCHOUC', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 904 ACCESSOIRES CAOUTCHOUC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'ALUMINIUM FOOD SAVERS', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 905 ALUMINIUM FOOD SAVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'ARTICLE DE NOEL', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 906 ARTICLE DE NOEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '907', 'ARTICLE DE FETE', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 907 ARTICLE DE FETE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '908', 'PAILLE', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 908 PAILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '909', 'SERVIETTE JETABLE', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 909 SERVIETTE JETABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '910', 'AUTRES', '709', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 709 ARTICLES JETABLES > 910 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '711', 'BOUGIE ET SENTEUR', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 711 BOUGIE ET SENTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BOUGIES', '711', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 711 BOUGIE ET SENTEUR > 101 BOUGIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'POT POURRIS', '711', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 711 BOUGIE ET SENTEUR > 102 POT POURRIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'SENTEURS', '711', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 711 BOUGIE ET SENTEUR > 103 SENTEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '712', 'SOUVENIRS', '070', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 712 SOUVENIRS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'CADEAUX', '712', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 712 SOUVENIRS > 201 CADEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'FIGURINES', '712', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 712 SOUVENIRS > 202 FIGURINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'SHEESHA', '712', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 712 SOUVENIRS > 203 SHEESHA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'SHEESHA ACCESSORIES', '712', '201 GEANT CASINO > 07 BAZAR > 070 MENAGE > 712 SOUVENIRS > 204 SHEESHA ACCESSORIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '071', 'SPORTS', '07', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '711', 'SPORTS PLEIN AIR', '071', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'RAQUETTE TENNIS', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 101 RAQUETTE TENNIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'RAQUETTE SQUASH', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 102 RAQUETTE SQUASH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'RAQUETTES BADMINGTON', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 103 RAQUETTES BADMINGTON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'BALLONS ET ACCESSOIRES', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 104 BALLONS ET ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'TENNIS DE TABLE', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 105 TENNIS DE TABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'ROLLER', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 106 ROLLER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'SET ROLLER', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 107 SET ROLLER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'SKATE ACCESSOIRES', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 108 SKATE ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'AUTRES SPORTS', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 109 AUTRES SPORTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '110', 'FITNESS LEGER', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 110 FITNESS LEGER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '111', 'FITNESS', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 111 FITNESS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '112', 'FITNESS ACCESSOIRES', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 112 FITNESS ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '113', 'AUTRES FITNESS', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 113 AUTRES FITNESS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '114', 'FLECHETTES', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 114 FLECHETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '115', 'FOOTBALL', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 115 FOOTBALL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '116', 'BASKETBALL', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 116 BASKETBALL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '117', 'VOLLEYBALL', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 117 VOLLEYBALL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '118', 'ACCESSOIRES SPORT EQUIPE', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 118 ACCESSOIRES SPORT EQUIPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '119', 'AUTRES', '711', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 711 SPORTS PLEIN AIR > 119 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '712', 'SPORTS AQUATIQUES', '071', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'LUNETTE PISCINE/BONNET', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 201 LUNETTE PISCINE/BONNET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'MASK ET TUBA', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 202 MASK ET TUBA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'PALMES', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 203 PALMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'SET PLONGEE', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 204 SET PLONGEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'COMBINAISON PLONGEE', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 205 COMBINAISON PLONGEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'ACCESSOIRES PLONGEES', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 206 ACCESSOIRES PLONGEES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'PISCINE/ACCESSOIRES', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 207 PISCINE/ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'BODYBOARD/SURF', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 208 BODYBOARD/SURF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'PLANCHE A VOILE/KITE', '712', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 712 SPORTS AQUATIQUES > 209 PLANCHE A VOILE/KITE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '713', 'PECHE', '071', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 713 PECHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CANNES A PECHE', '713', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 713 PECHE > 301 CANNES A PECHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'MOULINETS', '713', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 713 PECHE > 302 MOULINETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'LIGNES/PLOMB', '713', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 713 PECHE > 303 LIGNES/PLOMB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'LEURRES/HAMECON', '713', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 713 PECHE > 304 LEURRES/HAMECON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'ACCESSOIRES PECHES', '713', '201 GEANT CASINO > 07 BAZAR > 071 SPORTS > 713 PECHE > 305 ACCESSOIRES PECHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '072', 'BRICOLAGE/AUTO', '07', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '721', 'ACCESSOIRE AUTO INTERIEUR', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'ANTENNES', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 101 ANTENNES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'HOUSSE DE SIEGE/COUSSIN', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 102 HOUSSE DE SIEGE/COUSSIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'TAPIS DE SOL', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 103 TAPIS DE SOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'PROTECTION VOLANT', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 104 PROTECTION VOLANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'DESODORISANTS', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 105 DESODORISANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'PARE SOLEIL', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 106 PARE SOLEIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'GADGETS', '721', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 721 ACCESSOIRE AUTO INTERIEUR > 107 GADGETS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '722', 'ACCESSOIRE AUTO EXTERIEUR', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'JERRICAN', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 201 JERRICAN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'GALERIE DE TOIT/COFFRE', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 202 GALERIE DE TOIT/COFFRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'MIRRORS', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 203 MIRRORS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'ESSUIE GLASSES', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 204 ESSUIE GLASSES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'PROTEGE ROUE', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 205 PROTEGE ROUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'HOUSSE DE VOITURE', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 206 HOUSSE DE VOITURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'DECORATION', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 207 DECORATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'PROTECTION', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 208 PROTECTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'ACCESSOIRES', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 209 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'SANGLE DE REMORQUAGE', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 210 SANGLE DE REMORQUAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'COMPRESSEUR/POMPES', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 211 COMPRESSEUR/POMPES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '212', 'CABLE DE DEMARRAGE', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 212 CABLE DE DEMARRAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '213', 'PNEUS', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 213 PNEUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '214', 'AUTRES', '722', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 722 ACCESSOIRE AUTO EXTERIEUR > 214 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '723', 'ACCESSOIRE ELECTR/MECANIK', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'LAMPE/TORCHE', '723', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK > 301 LAMPE/TORCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'ALARMS', '723', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK > 302 ALARMS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'OUTILS', '723', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK > 303 OUTILS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'FUSIBLES', '723', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK > 304 FUSIBLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'AUTRES', '723', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK > 305 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'AMPOULES', '723', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 723 ACCESSOIRE ELECTR/MECANIK > 306 AMPOULES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '724', 'LUBRIFIANTS/HUILE', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'MINERAL', '724', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE > 401 MINERAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'SEMI SYNTHETIC', '724', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE > 402 SEMI SYNTHETIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'SYNTHETIC', '724', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE > 403 SYNTHETIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'BT VITESSE/DIRECT.ASSISTE', '724', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE > 404 BT VITESSE/DIRECT.ASSISTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'BATEAUX', '724', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE > 405 BATEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'AUTRES', '724', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 724 LUBRIFIANTS/HUILE > 406 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '725', 'NETTOYAGE/ENTRETIEN', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'EPONGE/ACCESSOIRES', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 501 EPONGE/ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'SHAMPOING', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 502 SHAMPOING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'POLISH', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 503 POLISH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'PLASTIC/CUIR', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 504 PLASTIC/CUIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'NETTOYAGE ROUE/PNEU', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 505 NETTOYAGE ROUE/PNEU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'MOTEUR ADDITIF', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 506 MOTEUR ADDITIF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'LIQUIDE DE FREIN', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 507 LIQUIDE DE FREIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '508', 'LIQUIDE DE NETTOYAGE', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 508 LIQUIDE DE NETTOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '509', 'GONFLEUR', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 509 GONFLEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '510', 'STOP FUITE', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 510 STOP FUITE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '511', 'KIT NETOYAGE', '725', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 725 NETTOYAGE/ENTRETIEN > 511 KIT NETOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '726', 'OUTILLAGE', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'OUTILS', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 601 OUTILS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'KIT OUTILS', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 602 KIT OUTILS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'VISSERIE/CLOU', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 603 VISSERIE/CLOU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'CORDES/CADENAS', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 604 CORDES/CADENAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'BOITE A OUTILS/RANGEMENT', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 605 BOITE A OUTILS/RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'METRE', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 606 METRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'CARTOUCHE', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 607 CARTOUCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'FILTRE A EAU', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 608 FILTRE A EAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'PROTECTION', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 609 PROTECTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '610', 'AUTRES', '726', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 726 OUTILLAGE > 610 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '727', 'PRODUITS ELECTRIK', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'PRISE ELECTRIQUE', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 701 PRISE ELECTRIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'CABLE ELECTRIK/MULTIPRISE', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 702 CABLE ELECTRIK/MULTIPRISE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'PRISE TELEPHONE', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 703 PRISE TELEPHONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'AMPOULE', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 704 AMPOULE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'SPHERICAL BULBS', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 705 SPHERICAL BULBS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'FLAME BULBS', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 706 FLAME BULBS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '707', 'SPOT', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 707 SPOT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '708', 'NEON', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 708 NEON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '709', 'ENERGY SAVING', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 709 ENERGY SAVING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '710', 'FUNCTIONAL', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 710 FUNCTIONAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '711', 'INSECT KILLERS', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 711 INSECT KILLERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '712', 'LED LAMPE', '727', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 727 PRODUITS ELECTRIK > 712 LED LAMPE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '728', 'ISOLANTS', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 728 ISOLANTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'SCOTCH', '728', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 728 ISOLANTS > 801 SCOTCH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'COLLE', '728', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 728 ISOLANTS > 802 COLLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'MASTIC / SILICON', '728', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 728 ISOLANTS > 803 MASTIC / SILICON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'TEFLON', '728', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 728 ISOLANTS > 804 TEFLON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '729', 'OUTILLAGE ELECTRIK', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'MECHE', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 901 MECHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'SCIE', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 902 SCIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'PONCEUSE', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 903 PONCEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'OUTILS SANS FIL', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 904 OUTILS SANS FIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'EQUIPEMENT LOURD', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 905 EQUIPEMENT LOURD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'ACCESSOIRES', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 906 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '907', 'AUTRES', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 907 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '908', 'NETTOYEUR HTE PRES/ACCESS', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 908 NETTOYEUR HTE PRES/ACCESS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '909', 'SOUFFLEUR', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 909 SOUFFLEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '910', 'GENERATEUR', '729', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 729 OUTILLAGE ELECTRIK > 910 GENERATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '731', 'BATTERIES', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 731 BATTERIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'SALINES', '731', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 731 BATTERIES > 101 SALINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'ALKALINES', '731', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 731 BATTERIES > 102 ALKALINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'RECHARGEABLE', '731', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 731 BATTERIES > 103 RECHARGEABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'CHARGEURS', '731', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 731 BATTERIES > 104 CHARGEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'LAMPES TORCHE', '731', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 731 BATTERIES > 105 LAMPES TORCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '732', 'PEINTURE', '072', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 732 PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PEINTURE', '732', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 732 PEINTURE > 201 PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'ACCESSOIRES PEINTURES', '732', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 732 PEINTURE > 202 ACCESSOIRES PEINTURES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'ENDUITS', '732', '201 GEANT CASINO > 07 BAZAR > 072 BRICOLAGE/AUTO > 732 PEINTURE > 203 ENDUITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '073', 'CULTURE', '07', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '731', 'AUDIO', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 731 AUDIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'K7', '731', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 731 AUDIO > 101 K7');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'K7 PROMO', '731', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 731 AUDIO > 102 K7 PROMO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CD', '731', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 731 AUDIO > 103 CD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'CD PROMO', '731', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 731 AUDIO > 104 CD PROMO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'RANGEMENT CD/ACCESSOIRES', '731', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 731 AUDIO > 105 RANGEMENT CD/ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '732', 'VIDEO', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 732 VIDEO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'DVD', '732', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 732 VIDEO > 201 DVD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'DVD PROMO', '732', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 732 VIDEO > 202 DVD PROMO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'OTHERS', '732', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 732 VIDEO > 203 OTHERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'BLUE RAY DVD', '732', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 732 VIDEO > 204 BLUE RAY DVD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'BLUE RAY DVD PROMO', '732', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 732 VIDEO > 205 BLUE RAY DVD PROMO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '733', 'ROMAN', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 733 ROMAN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'ARABIC', '733', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 733 ROMAN > 301 ARABIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'JEUNE', '733', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 733 ROMAN > 302 JEUNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'FRENCH', '733', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 733 ROMAN > 303 FRENCH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '734', 'JOURNAUX', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'QUOTIDIEN ARABE', '734', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX > 402 QUOTIDIEN ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'QUOTIDIEN LOCAL', '734', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX > 403 QUOTIDIEN LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'HEBDO Francais', '734', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX > 404 HEBDO Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'HEBDO ARABIC', '734', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX > 405 HEBDO ARABIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'HEBDO LOCAL', '734', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX > 406 HEBDO LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'AUTRES', '734', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 734 JOURNAUX > 407 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '735', 'LIVRES', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 735 LIVRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'Francais', '735', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 735 LIVRES > 501 Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ARABE', '735', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 735 LIVRES > 502 ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'LOCAL', '735', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 735 LIVRES > 503 LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '736', 'LIVRES PRATIQUES', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 736 LIVRES PRATIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '737', 'JEUNESSE', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 737 JEUNESSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'HISTOIRE', '737', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 737 JEUNESSE > 701 HISTOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'ACTIVITES', '737', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 737 JEUNESSE > 702 ACTIVITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'COLORIAGE', '737', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 737 JEUNESSE > 703 COLORIAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'EDUCATION', '737', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 737 JEUNESSE > 704 EDUCATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'CULTURE GENERALE', '737', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 737 JEUNESSE > 705 CULTURE GENERALE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '738', 'MAGAZINES', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'HEBDO ANGLAIS', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 801 HEBDO ANGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'HEBDO Francais', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 802 HEBDO Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'HEBDO LOCAL', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 803 HEBDO LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'HEBDO AUTRES', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 804 HEBDO AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'MENSUEL ANGLAIS', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 805 MENSUEL ANGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'MENSUEL Francais', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 806 MENSUEL Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'MENSUEL LOCAL', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 807 MENSUEL LOCAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'AUTRES MENSUEL', '738', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 738 MAGAZINES > 808 AUTRES MENSUEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '739', 'DICTIONNAIRES', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'Francais ANGLAIS', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 901 Francais ANGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'ANGLAIS Francais', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 902 ANGLAIS Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'ANGLAIS ARABE', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 903 ANGLAIS ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'ARABE ANGLAIS', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 904 ARABE ANGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'AUTRES', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 905 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'ANGLAIS', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 906 ANGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '907', 'ARABE', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 907 ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '908', 'Francais', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 908 Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '909', 'ESPAGNOL', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 909 ESPAGNOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '910', 'ALLEMAND', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 910 ALLEMAND');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '911', 'RUSSE', '739', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 739 DICTIONNAIRES > 911 RUSSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '741', 'CARTES ET ACCESSOIRES', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CARTE SIMPLE', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 101 CARTE SIMPLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CELEBRATIONS', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 102 CELEBRATIONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'BOITES', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 103 BOITES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'EID CARDS', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 104 EID CARDS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'ARTICLES DE FETES', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 105 ARTICLES DE FETES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'ACCESSOIRES', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 106 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'PAPIERS CADEAUX', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 107 PAPIERS CADEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'AUTRES', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 108 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'CARTES POSTALES', '741', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 741 CARTES ET ACCESSOIRES > 109 CARTES POSTALES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '742', 'AUTRES', '073', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 742 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'OTHERS', '742', '201 GEANT CASINO > 07 BAZAR > 073 CULTURE > 742 AUTRES > 201 OTHERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '074', 'PAPETERIE', '07', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '741', 'ECRITURE', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'ENVELOPPES', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 101 ENVELOPPES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'BLOCK NOTE', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 102 BLOCK NOTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CRAYONS', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 103 CRAYONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'ENCRE', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 104 ENCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'SYLO BILLE', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 105 SYLO BILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'FEUTRE', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 106 FEUTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'CRAYON DE COULEUR FEUTRE', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 107 CRAYON DE COULEUR FEUTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'GOMME ET CORRECTEUR', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 108 GOMME ET CORRECTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '109', 'BACK TO SCHOOL', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 109 BACK TO SCHOOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '110', 'TAILLE CRAYON', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 110 TAILLE CRAYON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '111', 'MARKERS', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 111 MARKERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '112', 'COLORIAGE', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 112 COLORIAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '113', 'ROLLER', '741', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 741 ECRITURE > 113 ROLLER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '742', 'CARNETS/CAHIERS', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'ARABE', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 201 ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'ENGLAIS', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 202 ENGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'Francais', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 203 Francais');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'AGENDA SCOLAIRE', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 204 AGENDA SCOLAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'SPECIFIC', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 205 SPECIFIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'AUTRES', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 206 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'JOURNAL', '742', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 742 CARNETS/CAHIERS > 207 JOURNAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '743', 'FEUILLE PAPIER', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 743 FEUILLE PAPIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'FEUILLE SIMPLE', '743', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 743 FEUILLE PAPIER > 301 FEUILLE SIMPLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'FEUILLE DOUBLE', '743', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 743 FEUILLE PAPIER > 302 FEUILLE DOUBLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'PROMO FEUILLE SIMPLE', '743', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 743 FEUILLE PAPIER > 303 PROMO FEUILLE SIMPLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'PROMO FEUILLE DOUBLE', '743', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 743 FEUILLE PAPIER > 304 PROMO FEUILLE DOUBLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '744', 'FOURNITURES DE BUREAU', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'BLOCK NOTE PETIT FORMAT', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 401 BLOCK NOTE PETIT FORMAT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'BLOCK NOTE A INDEX', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 402 BLOCK NOTE A INDEX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'PAPIER PHOTOCOPIE', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 403 PAPIER PHOTOCOPIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'ROULEAU FAX', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 404 ROULEAU FAX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'AGENDA DE BUREAU', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 405 AGENDA DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'SPECIFIC', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 406 SPECIFIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'AUTRES', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 407 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '408', 'EQUIPEMENT DE BUREAU', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 408 EQUIPEMENT DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '409', 'LIVRES DE DESSIN', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 409 LIVRES DE DESSIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '410', 'FEUILLE DE DESSIN', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 410 FEUILLE DE DESSIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '411', 'ACCESSOIRES PEINTURE', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 411 ACCESSOIRES PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '412', 'CRAYON/CRAIE', '744', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 744 FOURNITURES DE BUREAU > 412 CRAYON/CRAIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '745', 'FOURNITURE SCOLAIRES', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'COLLE/ SCOTCH', '745', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES > 501 COLLE/ SCOTCH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ETIQUETTES/POST IT', '745', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES > 502 ETIQUETTES/POST IT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'MESUREMENT/COMPAS', '745', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES > 503 MESUREMENT/COMPAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'AUTRES MATERIEL SCOLAIRE', '745', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES > 504 AUTRES MATERIEL SCOLAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'PROMOTION', '745', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES > 505 PROMOTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'CISEAUX', '745', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 745 FOURNITURE SCOLAIRES > 506 CISEAUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '746', 'BUREAU/ACCESSOIRES', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'BOITES RANGEMENT BUREAU', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 601 BOITES RANGEMENT BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'CLASSEURS BUREAU', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 602 CLASSEURS BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'CLASSEURS SCOLAIRE', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 603 CLASSEURS SCOLAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'COUVRE CAHIER/INTERCALAIR', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 604 COUVRE CAHIER/INTERCALAIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'AUTRES ARTICLES DE BUREAU', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 605 AUTRES ARTICLES DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'RANGEMENT BUREAU', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 606 RANGEMENT BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'CALCULATRICE SCOLAIRE', '746', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 746 BUREAU/ACCESSOIRES > 607 CALCULATRICE SCOLAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '747', 'CARTABLE/SACS/RANGEMENT', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'TROUSSE', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 701 TROUSSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'BOITE A CRAYONS', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 702 BOITE A CRAYONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'BABY BAG', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 703 BABY BAG');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'SAC A DOS', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 704 SAC A DOS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'CARTABLES', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 705 CARTABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'VALISE A ROULETTES', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 706 VALISE A ROULETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '707', 'GAMELLE', '747', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 747 CARTABLE/SACS/RANGEMENT > 707 GAMELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '748', 'CADRES/ALBUMS/POSTERS', '074', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 748 CADRES/ALBUMS/POSTERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CADRES', '748', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 748 CADRES/ALBUMS/POSTERS > 801 CADRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'CADRES VERRES', '748', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 748 CADRES/ALBUMS/POSTERS > 802 CADRES VERRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'ALBUM PHOTO', '748', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 748 CADRES/ALBUMS/POSTERS > 803 ALBUM PHOTO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'POSTERS', '748', '201 GEANT CASINO > 07 BAZAR > 074 PAPETERIE > 748 CADRES/ALBUMS/POSTERS > 804 POSTERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '075', 'EQUIPEMENT DE LA MAISON', '07', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '751', 'LUMINAIRE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'LAMPE A POSER', '751', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE > 101 LAMPE A POSER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'LAMPE DE BUREAU', '751', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE > 102 LAMPE DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'LAMPE HALOGENE', '751', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE > 103 LAMPE HALOGENE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'LAMPADAIRE', '751', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE > 104 LAMPADAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'ABAT-JOUR', '751', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE > 105 ABAT-JOUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'GUIRLANDES ET LANTERNES', '751', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 751 LUMINAIRE > 106 GUIRLANDES ET LANTERNES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '752', 'VASE ET PHOTOPHORE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 752 VASE ET PHOTOPHORE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PHOTOPHORE ET LUMIGNONS', '752', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 752 VASE ET PHOTOPHORE > 201 PHOTOPHORE ET LUMIGNONS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'LANTERNE', '752', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 752 VASE ET PHOTOPHORE > 202 LANTERNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'BOUGEOIR ET CHANDELIER', '752', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 752 VASE ET PHOTOPHORE > 203 BOUGEOIR ET CHANDELIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'VASE ET CACHE POT', '752', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 752 VASE ET PHOTOPHORE > 204 VASE ET CACHE POT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '753', 'MEUBLE/RANGEMENT', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CHAISE / TABOURET', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 301 CHAISE / TABOURET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BUREAU', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 302 BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'TABLES', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 303 TABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'RANGEMENT', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 304 RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'AUTRES', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 305 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'PARAVENT', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 306 PARAVENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'EGLO', '753', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 753 MEUBLE/RANGEMENT > 307 EGLO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '754', 'DECORATION MURALE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 754 DECORATION MURALE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'MIRROIRS', '754', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 754 DECORATION MURALE > 401 MIRROIRS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'STICKERS', '754', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 754 DECORATION MURALE > 402 STICKERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'TOILE', '754', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 754 DECORATION MURALE > 403 TOILE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '755', 'OBJET DECO', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 755 OBJET DECO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'ACCESSOIRES DECO', '755', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 755 OBJET DECO > 501 ACCESSOIRES DECO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ACCESSOIRES FUMEURS', '755', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 755 OBJET DECO > 502 ACCESSOIRES FUMEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'PORTE-BIJOUX', '755', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 755 OBJET DECO > 503 PORTE-BIJOUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'PATERE / PLAQUE DE PORTE', '755', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 755 OBJET DECO > 504 PATERE / PLAQUE DE PORTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'DECORATION NOEL', '755', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 755 OBJET DECO > 505 DECORATION NOEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '756', 'SANITAIRE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'ACCESSOIRES DOUCHE', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 601 ACCESSOIRES DOUCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'RIDEAU DE DOUCHE', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 602 RIDEAU DE DOUCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'TAPIS DE BAIN', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 603 TAPIS DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'ACCESOIRE SALLE DE BAIN', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 604 ACCESOIRE SALLE DE BAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'ABATTANT WC', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 605 ABATTANT WC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'POUBELLE', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 606 POUBELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'PESE PERSONNE', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 607 PESE PERSONNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'ACCESSOIRE HYGIENE BEAUTE', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 608 ACCESSOIRE HYGIENE BEAUTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'ACCESSOIRES DE TOILETTE', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 609 ACCESSOIRES DE TOILETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '610', 'MOBILIER DE SDB', '756', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 756 SANITAIRE > 610 MOBILIER DE SDB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '757', 'TAPIS', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 757 TAPIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'TAPIS', '757', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 757 TAPIS > 701 TAPIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'TAPIS PERSE', '757', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 757 TAPIS > 702 TAPIS PERSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'TAPIS TURC', '757', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 757 TAPIS > 703 TAPIS TURC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'PAILLASSON', '757', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 757 TAPIS > 704 PAILLASSON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '758', 'PEINTURE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 758 PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'PEINTURE', '758', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 758 PEINTURE > 801 PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'ACCESSOIRES PEINTURE', '758', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 758 PEINTURE > 802 ACCESSOIRES PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'TRAITEMENT BOIS', '758', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 758 PEINTURE > 803 TRAITEMENT BOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'AUTOCOLLANT', '758', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 758 PEINTURE > 804 AUTOCOLLANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '759', 'ENDUIT/ TRINGLERIE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'TRINGLERIE FER FORGE', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 901 TRINGLERIE FER FORGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'TRINGLERIE BOIS', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 902 TRINGLERIE BOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'KIT', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 903 KIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'VITRAGE', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 904 VITRAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'EMBRASSE', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 905 EMBRASSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'AIMANT ET PINCE CROCO', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 906 AIMANT ET PINCE CROCO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '907', 'PINCE', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 907 PINCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '908', 'FONCTIONNEL ET PENDERIE', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 908 FONCTIONNEL ET PENDERIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '909', 'STORE', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 909 STORE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '910', 'ISOLATION', '759', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 759 ENDUIT/ TRINGLERIE > 910 ISOLATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '761', 'PENDULE/HORLOGE', '075', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 761 PENDULE/HORLOGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'HORLOGE', '761', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 761 PENDULE/HORLOGE > 101 HORLOGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PENDULE', '761', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 761 PENDULE/HORLOGE > 102 PENDULE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'REVEIL', '761', '201 GEANT CASINO > 07 BAZAR > 075 EQUIPEMENT DE LA MAISON > 761 PENDULE/HORLOGE > 103 REVEIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '076', 'JARDINAGE', '07', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '761', 'OUTILLAGE DE JARDIN', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 761 OUTILLAGE DE JARDIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'OUTILS MANUELS', '761', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 761 OUTILLAGE DE JARDIN > 101 OUTILS MANUELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'OUTILS MECANIQUES', '761', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 761 OUTILLAGE DE JARDIN > 102 OUTILS MECANIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'RANGEMENT', '761', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 761 OUTILLAGE DE JARDIN > 103 RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'ECHAFAUDAGE', '761', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 761 OUTILLAGE DE JARDIN > 104 ECHAFAUDAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'TONDEUSE', '761', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 761 OUTILLAGE DE JARDIN > 105 TONDEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '762', 'PLANTES ARTIFICIELLES', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 762 PLANTES ARTIFICIELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'FAGOTS', '762', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 762 PLANTES ARTIFICIELLES > 201 FAGOTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'TIGES', '762', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 762 PLANTES ARTIFICIELLES > 202 TIGES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'POTS/COMPOSITIONS FLEURS', '762', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 762 PLANTES ARTIFICIELLES > 203 POTS/COMPOSITIONS FLEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'PLANTES D''INTERIEUR', '762', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 762 PLANTES ARTIFICIELLES > 204 PLANTES D''INTERIEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'PLANTES D''EXTERIEUR', '762', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 762 PLANTES ARTIFICIELLES > 205 PLANTES D''EXTERIEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '763', 'GRAINES/BULBES/SEMANCE', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 763 GRAINES/BULBES/SEMANCE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'GRAINES', '763', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 763 GRAINES/BULBES/SEMANCE > 301 GRAINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BULBES', '763', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 763 GRAINES/BULBES/SEMANCE > 302 BULBES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'GAZON', '763', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 763 GRAINES/BULBES/SEMANCE > 303 GAZON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'AUTRES', '763', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 763 GRAINES/BULBES/SEMANCE > 304 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '764', 'DECORATION JARDIN', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 764 DECORATION JARDIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'POT FLEURS PLASTIC', '764', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 764 DECORATION JARDIN > 401 POT FLEURS PLASTIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'POTS', '764', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 764 DECORATION JARDIN > 402 POTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'CERAMICS', '764', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 764 DECORATION JARDIN > 403 CERAMICS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'PANIERS', '764', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 764 DECORATION JARDIN > 404 PANIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'ELEMENTS BOIS', '764', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 764 DECORATION JARDIN > 405 ELEMENTS BOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '765', 'ARROSAGE/PULVERISATION', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 765 ARROSAGE/PULVERISATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'TUYAU ARROSAGE', '765', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 765 ARROSAGE/PULVERISATION > 501 TUYAU ARROSAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ACCESSOIRES ARROSAGE', '765', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 765 ARROSAGE/PULVERISATION > 502 ACCESSOIRES ARROSAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'PULVERISATEUR /ARROSEURS', '765', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 765 ARROSAGE/PULVERISATION > 503 PULVERISATEUR /ARROSEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '766', 'GRILLAGE / PROTECTION', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 766 GRILLAGE / PROTECTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'TUTEURS', '766', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 766 GRILLAGE / PROTECTION > 601 TUTEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'TERREAU', '766', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 766 GRILLAGE / PROTECTION > 602 TERREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'GRILLAGE', '766', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 766 GRILLAGE / PROTECTION > 603 GRILLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '767', 'FERTILIZERS', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 767 FERTILIZERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'ENGRAIS', '767', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 767 FERTILIZERS > 701 ENGRAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'AUTRES', '767', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 767 FERTILIZERS > 702 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '768', 'INSECT.ELECTRIQ./PROTECT.', '076', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 768 INSECT.ELECTRIQ./PROTECT.');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'INSECTICIDES ELECTIQUES', '768', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 768 INSECT.ELECTRIQ./PROTECT. > 801 INSECTICIDES ELECTIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'MOUSTIQUAIRE', '768', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 768 INSECT.ELECTRIQ./PROTECT. > 802 MOUSTIQUAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'x', '768', '201 GEANT CASINO > 07 BAZAR > 076 JARDINAGE > 768 INSECT.ELECTRIQ./PROTECT. > 808 x');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '077', 'BAGGAGE/CAMPING', '07', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '771', 'BAGGAGE', '077', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BAGAGE CABINE DUR', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 101 BAGAGE CABINE DUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'BAGAGE CABINE SOFT', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 102 BAGAGE CABINE SOFT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'VANITY CASE/ATTACHE CASE', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 103 VANITY CASE/ATTACHE CASE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'VALISE SOUPLE', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 104 VALISE SOUPLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'VALISE DURE', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 105 VALISE DURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'SACS DE VOYAGE', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 106 SACS DE VOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'ACCESSOIRES', '771', '201 GEANT CASINO > 07 BAZAR > 077 BAGGAGE/CAMPING > 771 BAGGAGE > 107 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '078', 'CAMPING/MEUBLE EXTERNE', '07', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '781', 'MOBILIER DE JARDIN', '078', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'TABLE / CHAISE RESINE', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 101 TABLE / CHAISE RESINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'TABLE/CHAISE/A. MATERIEL', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 102 TABLE/CHAISE/A. MATERIEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'COUSSINS', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 103 COUSSINS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'PARASOLS', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 104 PARASOLS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'AUTRES', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 105 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'BALANCELLE', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 106 BALANCELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '107', 'HAMMACK', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 107 HAMMACK');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '108', 'BAIN DE SOLEIL', '781', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 781 MOBILIER DE JARDIN > 108 BAIN DE SOLEIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '782', 'CAMPING', '078', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'BARBECUE', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 201 BARBECUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'BARBECUE ACC / CHARBON', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 202 BARBECUE ACC / CHARBON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'CHAISE DE CAMPING', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 203 CHAISE DE CAMPING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'TENTES', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 204 TENTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'COUCHAGE', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 205 COUCHAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'GLACIERE', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 206 GLACIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'FLASKS / JUGS', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 207 FLASKS / JUGS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'CUISINE/ECLAIRAGE', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 208 CUISINE/ECLAIRAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'AUTRES', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 209 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'ACCESSOIRES CAMPING', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 210 ACCESSOIRES CAMPING');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'PRODUITS PICNIC', '782', '201 GEANT CASINO > 07 BAZAR > 078 CAMPING/MEUBLE EXTERNE > 782 CAMPING > 211 PRODUITS PICNIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '079', 'JOUETS/CYCLES', '07', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '791', 'JOUET BEBE', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'BOIS', '791', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE > 101 BOIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'PELUCHE', '791', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE > 102 PELUCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'EDUCATIF', '791', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE > 103 EDUCATIF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'EVEIL', '791', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE > 104 EVEIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'MOTRICITE', '791', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE > 105 MOTRICITE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'AUTRES', '791', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 791 JOUET BEBE > 106 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '792', 'JOUET FILLE', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'POUPON', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 201 POUPON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'POUSSETTES ET ACCESSOIRES', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 202 POUSSETTES ET ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'POUPEE', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 203 POUPEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'POUPEE MANNEQUIN', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 204 POUPEE MANNEQUIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'ACCESOIRE POUPEE MANEQUIN', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 205 ACCESOIRE POUPEE MANEQUIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'CUISINE', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 206 CUISINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'BEAUTE', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 207 BEAUTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'IMITATION', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 208 IMITATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'THEMATIQUES', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 209 THEMATIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'AUTRES', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 210 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'FIGURINES', '792', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 792 JOUET FILLE > 211 FIGURINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '793', 'JOUET GARCON', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'ARMES', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 301 ARMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'BRICOLAGE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 302 BRICOLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'ROBOT', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 303 ROBOT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'DRAGON DINOSAURE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 304 DRAGON DINOSAURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'INTERVENTION', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 305 INTERVENTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'VOITURE MINIATURE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 306 VOITURE MINIATURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'VOITURE TELECOMMANDEE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 307 VOITURE TELECOMMANDEE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '308', 'ROAD RACING DIE CAST', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 308 ROAD RACING DIE CAST');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '309', 'FIGURINES', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 309 FIGURINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '310', 'AUTRES', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 310 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '311', 'VOITURE TLCDE REGARGEABLE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 311 VOITURE TLCDE REGARGEABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '312', 'AVION / HELICOPTERE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 312 AVION / HELICOPTERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '313', 'ACCESSOIRES FIGURINES', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 313 ACCESSOIRES FIGURINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '314', 'VEHICULE A FRICTION', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 314 VEHICULE A FRICTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '315', 'BATEAU RADIO COMMANDE', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 315 BATEAU RADIO COMMANDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '316', 'EXTREME HOBBY', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 316 EXTREME HOBBY');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '317', 'THEMATIQUES', '793', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 793 JOUET GARCON > 317 THEMATIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '794', 'JOUET MIXTE', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'JEU DE SOCIETE', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 401 JEU DE SOCIETE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'PUZZLES', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 402 PUZZLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'PATE A MODELER', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 403 PATE A MODELER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'LOISIRS CREATIFS', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 404 LOISIRS CREATIFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'PELUCHE', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 405 PELUCHE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'CONSTRUCTION', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 406 CONSTRUCTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'LCD GAMES', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 407 LCD GAMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '408', 'TV GAMES', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 408 TV GAMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '409', 'EDUCATIONAL COMPUTERS', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 409 EDUCATIONAL COMPUTERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '410', 'MUSIC', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 410 MUSIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '411', 'HEAVY TOYS', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 411 HEAVY TOYS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '412', 'OTHERS', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 412 OTHERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '413', 'JEUX EDUCATIF', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 413 JEUX EDUCATIF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '414', 'MUSIC', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 414 MUSIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '415', 'HALLOWEEN', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 415 HALLOWEEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '416', 'YO-YO', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 416 YO-YO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '417', 'CHARACTER WATCHES', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 417 CHARACTER WATCHES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '418', 'COSTUMES', '794', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 794 JOUET MIXTE > 418 COSTUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '795', 'JEUX D ETE', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'PISCINE', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 501 PISCINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'ACCESSOIRES DE PISCINE', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 502 ACCESSOIRES DE PISCINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'ARTICLES GONFLABLES', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 503 ARTICLES GONFLABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'JEUX DE PLAGE', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 504 JEUX DE PLAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'MOBILER GONFLABLE', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 505 MOBILER GONFLABLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'PISTOLET A EAU', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 506 PISTOLET A EAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'JEU DE PLEIN AIR', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 507 JEU DE PLEIN AIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '508', 'BALLE BALLON', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 508 BALLE BALLON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '509', 'AUTRES', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 509 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '510', 'JEUX D''EAU', '795', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 795 JEUX D ETE > 510 JEUX D''EAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '796', 'FESTIF /CELEBRATION', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'GUIRLANDES', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 601 GUIRLANDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'DECORATION', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 602 DECORATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'DECORATION POUR VITRES', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 603 DECORATION POUR VITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'DECO ELECTRIQUE LUMINEUX', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 604 DECO ELECTRIQUE LUMINEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'ARBRE DE NOEL', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 605 ARBRE DE NOEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'ARTICLE DE FETE', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 606 ARTICLE DE FETE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'AUTRES', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 607 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'HALOWEEN', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 608 HALOWEEN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '609', 'VALENTINES', '796', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 796 FESTIF /CELEBRATION > 609 VALENTINES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '797', 'VELO/ENGINS MOTORISES', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'VELO ENFANT', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 701 VELO ENFANT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'VELO HOMME', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 702 VELO HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'VELO FEMME', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 703 VELO FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'ACCESSOIRES', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 704 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'TROTTEUR', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 705 TROTTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '706', 'SCOOTER TERRESTRE', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 706 SCOOTER TERRESTRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '707', 'SCOOTER MARINE', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 707 SCOOTER MARINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '708', 'QUAD', '797', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 797 VELO/ENGINS MOTORISES > 708 QUAD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '798', 'DESSIN ET PEINTURE', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 798 DESSIN ET PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CHASSIS', '798', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 798 DESSIN ET PEINTURE > 801 CHASSIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'PEINTURE', '798', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 798 DESSIN ET PEINTURE > 802 PEINTURE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'ACCESSOIRE', '798', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 798 DESSIN ET PEINTURE > 803 ACCESSOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '799', 'DO IT YOURSELF', '079', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 799 DO IT YOURSELF');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'TRICOT', '799', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 799 DO IT YOURSELF > 901 TRICOT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'DIVERS', '799', '201 GEANT CASINO > 07 BAZAR > 079 JOUETS/CYCLES > 799 DO IT YOURSELF > 902 DIVERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (1, '08', 'BAZAR LOURD', '201', '201 GEANT CASINO > 08 BAZAR LOURD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '080', 'PETIT ELECTROMENAGER', '08', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '801', 'PETIT DEJEUNER', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'CAFETIERE', '801', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER > 101 CAFETIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CAFETIERE EXPRESSO', '801', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER > 102 CAFETIERE EXPRESSO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'MOULIN A CAFE', '801', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER > 103 MOULIN A CAFE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'BOUILLOIRE', '801', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER > 104 BOUILLOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'GRILLE PAIN', '801', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER > 105 GRILLE PAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '106', 'TOASTER', '801', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 801 PETIT DEJEUNER > 106 TOASTER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '802', 'PREPARATION CULINAIRE', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'PRESSE AGRUMES', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 201 PRESSE AGRUMES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'ROBOT ALIMENTAIRE', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 202 ROBOT ALIMENTAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'CUISEUR VAPEUR', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 203 CUISEUR VAPEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'FRITEUSE', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 204 FRITEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'MACHINE A PAIN', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 205 MACHINE A PAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'MIXEUR FRUIT', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 206 MIXEUR FRUIT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'GRILL BARBECUE', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 207 GRILL BARBECUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'HACHOIR', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 208 HACHOIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'CUISEUR VAPEUR', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 209 CUISEUR VAPEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'MIXER', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 210 MIXER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'DOMINO GAS', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 211 DOMINO GAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '212', 'PLAQUE CHAUFFANTE', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 212 PLAQUE CHAUFFANTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '213', 'BRULEUR GAS', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 213 BRULEUR GAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '214', 'ACCESSOIRES ELECTRIQUES', '802', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 802 PREPARATION CULINAIRE > 214 ACCESSOIRES ELECTRIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '803', 'FOUR MICRO ONDES', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 803 FOUR MICRO ONDES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'MICRO ONDES 15/20L', '803', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 803 FOUR MICRO ONDES > 301 MICRO ONDES 15/20L');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'MICRO ONDES 25/30L', '803', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 803 FOUR MICRO ONDES > 302 MICRO ONDES 25/30L');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'MINI FOUR <20L', '803', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 803 FOUR MICRO ONDES > 303 MINI FOUR <20L');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'MINI FOUR>20L', '803', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 803 FOUR MICRO ONDES > 304 MINI FOUR>20L');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '804', 'ENTRETIEN DU LINGE', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 804 ENTRETIEN DU LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'FER DE VOYAGE', '804', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 804 ENTRETIEN DU LINGE > 401 FER DE VOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'FER SEC', '804', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 804 ENTRETIEN DU LINGE > 402 FER SEC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'FER VAPEUR', '804', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 804 ENTRETIEN DU LINGE > 403 FER VAPEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'CENTRALE VAPEUR', '804', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 804 ENTRETIEN DU LINGE > 404 CENTRALE VAPEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'MACHINE A COUDRE', '804', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 804 ENTRETIEN DU LINGE > 405 MACHINE A COUDRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '805', 'BEAUTE/SOINS DU CORPS', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'SECHE CHEVEUX/LISSEUR', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 501 SECHE CHEVEUX/LISSEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'SOINS DENTAIRE', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 502 SOINS DENTAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'MASSAGE', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 503 MASSAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'EPILATEUR', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 504 EPILATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'AUTRES', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 505 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'THERMOMETRE', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 506 THERMOMETRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'TENSIONMETRE', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 507 TENSIONMETRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '508', 'SOINS DU VISAGE', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 508 SOINS DU VISAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '509', 'SOINS DES ONGLES', '805', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 805 BEAUTE/SOINS DU CORPS > 509 SOINS DES ONGLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '806', 'RASOIRS', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 806 RASOIRS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'RASOIRS HOMME', '806', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 806 RASOIRS > 601 RASOIRS HOMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'EPILATION FEMME', '806', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 806 RASOIRS > 602 EPILATION FEMME');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'TONDEUSE', '806', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 806 RASOIRS > 603 TONDEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'EBARBEUSE', '806', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 806 RASOIRS > 604 EBARBEUSE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'EPILATEUR NEZ', '806', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 806 RASOIRS > 605 EPILATEUR NEZ');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '807', 'ENTRETIEN DU SOL', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 807 ENTRETIEN DU SOL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'ASPIRATEUR', '807', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 807 ENTRETIEN DU SOL > 701 ASPIRATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'ASPIRATEUR EAU/POUSSIERE', '807', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 807 ENTRETIEN DU SOL > 702 ASPIRATEUR EAU/POUSSIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'ASPIRATEUR CIREUR', '807', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 807 ENTRETIEN DU SOL > 703 ASPIRATEUR CIREUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'ASPIRATEUR A MAIN', '807', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 807 ENTRETIEN DU SOL > 704 ASPIRATEUR A MAIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '808', 'BIEN ETRE/COMFORT', '080', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'VENTILATEURS', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 801 VENTILATEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'REFROIDISSEURS D''AIR', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 802 REFROIDISSEURS D''AIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'ASSAINISSEMENT DE L''AIR', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 803 ASSAINISSEMENT DE L''AIR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'FILTRE A EAU', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 804 FILTRE A EAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'FONTAINE', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 805 FONTAINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'RADIATEUR A HUILE', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 806 RADIATEUR A HUILE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'RADIATEUR ELECTRIQUE', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 807 RADIATEUR ELECTRIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'DESHUMIDIFICATEUR', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 808 DESHUMIDIFICATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '809', 'AFTER SALES SERVICE', '808', '201 GEANT CASINO > 08 BAZAR LOURD > 080 PETIT ELECTROMENAGER > 808 BIEN ETRE/COMFORT > 809 AFTER SALES SERVICE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '081', 'GROS ELECTROMENAGER', '08', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '811', 'LAVE LINGE/ SECHE LINGE', '081', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 811 LAVE LINGE/ SECHE LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'TOP LOAD TWIN TUB', '811', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 811 LAVE LINGE/ SECHE LINGE > 101 TOP LOAD TWIN TUB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'MAL TOP AUTO', '811', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 811 LAVE LINGE/ SECHE LINGE > 102 MAL TOP AUTO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'MAL FRONTAL', '811', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 811 LAVE LINGE/ SECHE LINGE > 103 MAL FRONTAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'SECHE LINGE', '811', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 811 LAVE LINGE/ SECHE LINGE > 104 SECHE LINGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'MAL SECHANTE', '811', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 811 LAVE LINGE/ SECHE LINGE > 105 MAL SECHANTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '812', 'LAVE VAISSELLE', '081', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 812 LAVE VAISSELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'LAVE VAISSELLE', '812', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 812 LAVE VAISSELLE > 201 LAVE VAISSELLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '813', 'REFRIGERATEUR', '081', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'FRIGO UP TO 59 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 301 FRIGO UP TO 59 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'FRIGO 60 A 99 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 302 FRIGO 60 A 99 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'FRIGO 100 A 149 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 303 FRIGO 100 A 149 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'FRIGO 150 A 240 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 304 FRIGO 150 A 240 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'FRIGO 241 A 330LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 305 FRIGO 241 A 330LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'FRIGO 331 A 449 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 306 FRIGO 331 A 449 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'FRIGO 450 A 549 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 307 FRIGO 450 A 549 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '308', 'FRIGO 550 A 619 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 308 FRIGO 550 A 619 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '309', 'FRIGO 610 A 699 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 309 FRIGO 610 A 699 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '310', 'FRIGO 700 A 799 LITRES', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 310 FRIGO 700 A 799 LITRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '311', 'FRIGO 800 ET >', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 311 FRIGO 800 ET >');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '312', 'FRIGO 23 CU FT', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 312 FRIGO 23 CU FT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '313', 'FRIGO INTEGRE', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 313 FRIGO INTEGRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '314', 'CAVE A VIN', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 314 CAVE A VIN');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '315', 'FRIGO DOUBLE PORTE', '813', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 813 REFRIGERATEUR > 315 FRIGO DOUBLE PORTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '814', 'CONGELATEUR', '081', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 814 CONGELATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'CONGELATEUR BAHUT', '814', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 814 CONGELATEUR > 401 CONGELATEUR BAHUT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'CONGELATEUR ARMOIRE', '814', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 814 CONGELATEUR > 402 CONGELATEUR ARMOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '815', 'CUISINIERE', '081', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 815 CUISINIERE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'CUISINIERE GAS', '815', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 815 CUISINIERE > 501 CUISINIERE GAS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'CUISINIERE ELECTRIQUE', '815', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 815 CUISINIERE > 502 CUISINIERE ELECTRIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'CUISINIERE MIXTE', '815', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 815 CUISINIERE > 503 CUISINIERE MIXTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '816', 'AIR CONDITIONNE', '081', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 816 AIR CONDITIONNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'CLIM FENETRE 1.5 TON', '816', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 816 AIR CONDITIONNE > 601 CLIM FENETRE 1.5 TON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'CLIM FENETRE 2.0 TON', '816', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 816 AIR CONDITIONNE > 602 CLIM FENETRE 2.0 TON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'SPLIT AC', '816', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 816 AIR CONDITIONNE > 603 SPLIT AC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'PORTABLE A/C', '816', '201 GEANT CASINO > 08 BAZAR LOURD > 081 GROS ELECTROMENAGER > 816 AIR CONDITIONNE > 604 PORTABLE A/C');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '082', 'INFORMATIQUE', '08', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '821', 'LIVRE ORDINATEUR', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 821 LIVRE ORDINATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'LIVRE ARABE', '821', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 821 LIVRE ORDINATEUR > 101 LIVRE ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'LIVRE ANGLAIS', '821', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 821 LIVRE ORDINATEUR > 102 LIVRE ANGLAIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'LIVRE AVEC VIDEO', '821', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 821 LIVRE ORDINATEUR > 103 LIVRE AVEC VIDEO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '822', 'TELEPHONIE', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'TELEPHONE AVEC FIL', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 201 TELEPHONE AVEC FIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'TELEPHONE A-FIL/REPONDEUR', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 202 TELEPHONE A-FIL/REPONDEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'TELEPHONE SANS FIL', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 203 TELEPHONE SANS FIL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'TELEPHONE S-FIL/REPONDEUR', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 204 TELEPHONE S-FIL/REPONDEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'DECT TELEPHONES', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 205 DECT TELEPHONES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'REPONDEUR', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 206 REPONDEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'ACCESSOIRES TELEPHONE', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 207 ACCESSOIRES TELEPHONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'TELEPHONE MOBILE', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 208 TELEPHONE MOBILE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '209', 'MOBILE PHONE', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 209 MOBILE PHONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '210', 'SMART PHONE', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 210 SMART PHONE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '211', 'ACCESSOIRES MOBILE', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 211 ACCESSOIRES MOBILE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '212', 'MOBILE ACCES/NON-ORIGINAL', '822', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 822 TELEPHONIE > 212 MOBILE ACCES/NON-ORIGINAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '823', 'CONSOLES JEUX', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'SONY PLAYSTATION', '823', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX > 301 SONY PLAYSTATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'MICROSOFT', '823', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX > 302 MICROSOFT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'NINTENDO', '823', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX > 303 NINTENDO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'ACCESOIR SONY PLAYSTATION', '823', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX > 304 ACCESOIR SONY PLAYSTATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'ACCESSOIRES MICROSOFT', '823', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX > 305 ACCESSOIRES MICROSOFT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'ACCESSOIRES NINTENDO', '823', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 823 CONSOLES JEUX > 306 ACCESSOIRES NINTENDO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '824', 'INFORMATIQUE', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'ORDINATEUR DE BUREAU', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 401 ORDINATEUR DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'LAPTOPS', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 402 LAPTOPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'NET BOOKS', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 403 NET BOOKS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'PDA', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 404 PDA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'PDA ACCESSORIES', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 405 PDA ACCESSORIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '406', 'IMPRIMANTES', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 406 IMPRIMANTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '407', 'IMPRIMANTE MULTIFONCTION', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 407 IMPRIMANTE MULTIFONCTION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '408', 'ECRANS', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 408 ECRANS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '409', 'CLAVIERS', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 409 CLAVIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '410', 'SCANNERS', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 410 SCANNERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '411', 'ACCESSOIRES LAPTOP', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 411 ACCESSOIRES LAPTOP');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '412', 'IMPRIMANTE JET D''ENCRE', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 412 IMPRIMANTE JET D''ENCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '413', 'IMPRIMANTE LASER', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 413 IMPRIMANTE LASER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '414', 'TABLETTES', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 414 TABLETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '415', 'ACCESSOIRES TABLETTES', '824', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 824 INFORMATIQUE > 415 ACCESSOIRES TABLETTES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '825', 'CALCULATRICE', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'STANDARD', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 501 STANDARD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'SCIENTIFIC', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 502 SCIENTIFIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'FINANCIAL', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 503 FINANCIAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'AGENDA ELECTRONIC', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 504 AGENDA ELECTRONIC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'TRADUCTEUR', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 505 TRADUCTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'DICTIONNAIRE', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 506 DICTIONNAIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'ACCESSOIRES', '825', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 825 CALCULATRICE > 507 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '826', 'BUREAUTIQUE', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 826 BUREAUTIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'FAX MACHINE', '826', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 826 BUREAUTIQUE > 601 FAX MACHINE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'FAX ACCESSOIRES', '826', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 826 BUREAUTIQUE > 602 FAX ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'PHOTOCOPIEUR', '826', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 826 BUREAUTIQUE > 603 PHOTOCOPIEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'EQUIPEMENT DE BUREAU', '826', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 826 BUREAUTIQUE > 604 EQUIPEMENT DE BUREAU');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '827', 'JEUX VIDEO', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 827 JEUX VIDEO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '701', 'JEUX SONY PLAYSTATION', '827', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 827 JEUX VIDEO > 701 JEUX SONY PLAYSTATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '702', 'JEUX MICROSOFT', '827', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 827 JEUX VIDEO > 702 JEUX MICROSOFT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '703', 'JEUX NINTENDO', '827', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 827 JEUX VIDEO > 703 JEUX NINTENDO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '704', 'AUTRES JEUX', '827', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 827 JEUX VIDEO > 704 AUTRES JEUX');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '705', 'ACCESSOIRES CONSOLE', '827', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 827 JEUX VIDEO > 705 ACCESSOIRES CONSOLE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '828', 'ACESSOIRES INFORMATIQUES', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '801', 'CARTOUCHE D''ENCRE', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 801 CARTOUCHE D''ENCRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '802', 'TONER IMPRIMANTE', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 802 TONER IMPRIMANTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '803', 'JOYSTICK / PAD', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 803 JOYSTICK / PAD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '804', 'SOURIS / TAPIS', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 804 SOURIS / TAPIS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '805', 'CABLES ORDINATEUR', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 805 CABLES ORDINATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '806', 'BOITE DE RANGEMENT', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 806 BOITE DE RANGEMENT');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '807', 'MEUBLE ORDINATEUR', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 807 MEUBLE ORDINATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '808', 'CASQUES', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 808 CASQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '809', 'MICRO', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 809 MICRO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '810', 'CLAVIER', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 810 CLAVIER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '811', 'CAMERA WEB', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 811 CAMERA WEB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '812', 'HAUT PARLEUR', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 812 HAUT PARLEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '813', 'PAPIERS', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 813 PAPIERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '814', 'ROUTERS', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 814 ROUTERS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '815', 'USB', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 815 USB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '816', 'DISQUE DUR EXTERNE', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 816 DISQUE DUR EXTERNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '817', 'AUTRES', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 817 AUTRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '818', 'WRITABLE CD''S / DVD''S', '828', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 828 ACESSOIRES INFORMATIQUES > 818 WRITABLE CD''S / DVD''S');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '829', 'LOGICIEL', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '901', 'JEUX ORDINATEUR', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 901 JEUX ORDINATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '902', 'JEUX PEDAGOGIQUE', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 902 JEUX PEDAGOGIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '903', 'UTILITAIRES', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 903 UTILITAIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '904', 'BUSINESS', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 904 BUSINESS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '905', 'DESSINS GRAPHIQUES', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 905 DESSINS GRAPHIQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '906', 'ARABE', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 906 ARABE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '907', 'VIDEO', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 907 VIDEO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '908', 'AUTRES LOGICIELS', '829', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 829 LOGICIEL > 908 AUTRES LOGICIELS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '830', 'GPS', '082', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 830 GPS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'GPS UNITS', '830', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 830 GPS > 101 GPS UNITS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'GPS ACCESSORIES', '830', '201 GEANT CASINO > 08 BAZAR LOURD > 082 INFORMATIQUE > 830 GPS > 102 GPS ACCESSORIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '083', 'TELEVISION', '08', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '831', 'TELEVISION', '083', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 831 TELEVISION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'TV PLASMA', '831', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 831 TELEVISION > 101 TV PLASMA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'TV LCD', '831', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 831 TELEVISION > 102 TV LCD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'TV COMBO', '831', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 831 TELEVISION > 103 TV COMBO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'TV LED', '831', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 831 TELEVISION > 104 TV LED');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '105', 'PROJECTEUR', '831', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 831 TELEVISION > 105 PROJECTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '832', 'ACCESSOIRES', '083', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'CABLES', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 201 CABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'MEUBLE TV', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 202 MEUBLE TV');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'TELECOMMANDE', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 203 TELECOMMANDE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'ANTENNE', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 204 ANTENNE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'SACS', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 205 SACS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'BATTERIES', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 206 BATTERIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '207', 'ADAPTATEURS', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 207 ADAPTATEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '208', 'MISCELLANEOUS', '832', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 832 ACCESSOIRES > 208 MISCELLANEOUS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '833', 'CAMERA VIDEO', '083', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 833 CAMERA VIDEO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'CAMESCOPE VHS-C', '833', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 833 CAMERA VIDEO > 301 CAMESCOPE VHS-C');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'CAMESCOPE 8MM', '833', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 833 CAMERA VIDEO > 302 CAMESCOPE 8MM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'CAMESCOPE DIGITAL', '833', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 833 CAMERA VIDEO > 303 CAMESCOPE DIGITAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'PROJECTEUR', '833', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 833 CAMERA VIDEO > 304 PROJECTEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'HARD DISK RECORDER', '833', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 833 CAMERA VIDEO > 305 HARD DISK RECORDER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '834', 'LECTEUR VIDEO', '083', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 834 LECTEUR VIDEO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'LECTEUR DVD', '834', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 834 LECTEUR VIDEO > 401 LECTEUR DVD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'LECTEUR DVD ENREGISTREUR', '834', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 834 LECTEUR VIDEO > 402 LECTEUR DVD ENREGISTREUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '835', 'ANTENNE SATELLITE', '083', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'RECEPTEUR ANALOGIQUE', '835', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE > 501 RECEPTEUR ANALOGIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'RECEPTEUR DIGITAL', '835', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE > 502 RECEPTEUR DIGITAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'ANTENNE PARABOLIQUE', '835', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE > 503 ANTENNE PARABOLIQUE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'LNB', '835', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE > 504 LNB');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'KIT PACKAGE', '835', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE > 505 KIT PACKAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'RENT / PACKAGE', '835', '201 GEANT CASINO > 08 BAZAR LOURD > 083 TELEVISION > 835 ANTENNE SATELLITE > 506 RENT / PACKAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '084', 'HIFI & SON', '08', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '841', 'PETIT SON', '084', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 841 PETIT SON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'RADIO POCKET', '841', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 841 PETIT SON > 101 RADIO POCKET');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'ONDES COURTES RADIO', '841', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 841 PETIT SON > 102 ONDES COURTES RADIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '103', 'CLOCK RADIO', '841', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 841 PETIT SON > 103 CLOCK RADIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '104', 'RADIO CASSETTE', '841', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 841 PETIT SON > 104 RADIO CASSETTE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '842', 'AUTO RADIO', '084', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'AUTO RADIO K7', '842', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO > 201 AUTO RADIO K7');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'AUTO RADIO CD', '842', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO > 202 AUTO RADIO CD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'AMPLIFICATEUR', '842', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO > 203 AMPLIFICATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'CD CHANGER', '842', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO > 204 CD CHANGER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '205', 'KIT AUTO RADIO', '842', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO > 205 KIT AUTO RADIO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '206', 'HAUT PARLEURS', '842', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 842 AUTO RADIO > 206 HAUT PARLEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '843', 'MP3/MP4', '084', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 843 MP3/MP4');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'MP-3 /MP4/ IPOD', '843', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 843 MP3/MP4 > 301 MP-3 /MP4/ IPOD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'ACCESOIRE MP3/MP4/IPOD', '843', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 843 MP3/MP4 > 302 ACCESOIRE MP3/MP4/IPOD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'DOCK STATION', '843', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 843 MP3/MP4 > 303 DOCK STATION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '844', 'HIFI SYSTEMS', '084', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 844 HIFI SYSTEMS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '401', 'MICRO SYSTEM', '844', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 844 HIFI SYSTEMS > 401 MICRO SYSTEM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '402', 'MIDI SYSTEM', '844', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 844 HIFI SYSTEMS > 402 MIDI SYSTEM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '403', 'MINI SYSTEM', '844', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 844 HIFI SYSTEMS > 403 MINI SYSTEM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '404', 'VIDEO SYSTEM', '844', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 844 HIFI SYSTEMS > 404 VIDEO SYSTEM');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '405', 'HOME THEATER', '844', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 844 HIFI SYSTEMS > 405 HOME THEATER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '845', 'INDIVIDUAL COMPONENTS', '084', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '501', 'LECTEUR CD', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 501 LECTEUR CD');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '502', 'AMPLIFICATEUR', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 502 AMPLIFICATEUR');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '503', 'HAUT PARLEURS', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 503 HAUT PARLEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '504', 'EQUILIZER', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 504 EQUILIZER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '505', 'KARAOKE', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 505 KARAOKE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '506', 'TUNER', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 506 TUNER');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '507', 'TABLE DE MIXAGE', '845', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 845 INDIVIDUAL COMPONENTS > 507 TABLE DE MIXAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '846', 'ACCESSOIRES SON', '084', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '601', 'CABLES', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 601 CABLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '602', 'CASQUES', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 602 CASQUES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '603', 'MICRO', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 603 MICRO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '604', 'HAUT PARLEURS', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 604 HAUT PARLEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '605', 'NETTOYAGE', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 605 NETTOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '606', 'ACCESSOIRES NETTOYAGE', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 606 ACCESSOIRES NETTOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '607', 'ACCESSOIRES KARAOKE', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 607 ACCESSOIRES KARAOKE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '608', 'S.P STAND', '846', '201 GEANT CASINO > 08 BAZAR LOURD > 084 HIFI & SON > 846 ACCESSOIRES SON > 608 S.P STAND');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (2, '085', 'PHOTO', '08', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '851', 'CAMERA', '085', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 851 CAMERA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '101', 'DIGITAL CAMERA', '851', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 851 CAMERA > 101 DIGITAL CAMERA');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '102', 'CAMERA BOITIER DIGITAL', '851', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 851 CAMERA > 102 CAMERA BOITIER DIGITAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '852', 'APPAREIL DE VISION', '085', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 852 APPAREIL DE VISION');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '201', 'JUMELLES', '852', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 852 APPAREIL DE VISION > 201 JUMELLES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '202', 'PROJECTEURS', '852', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 852 APPAREIL DE VISION > 202 PROJECTEURS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '203', 'TELESCOPES', '852', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 852 APPAREIL DE VISION > 203 TELESCOPES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '204', 'OBJECTIFS', '852', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 852 APPAREIL DE VISION > 204 OBJECTIFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (3, '853', 'ACCESSOIRES PHOTO', '085', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '301', 'TREPIED', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 301 TREPIED');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '302', 'SAC', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 302 SAC');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '303', 'FLASH', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 303 FLASH');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '304', 'OBJECTIFS', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 304 OBJECTIFS');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '305', 'BATTERIES', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 305 BATTERIES');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '306', 'CARTE MEMOIRE', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 306 CARTE MEMOIRE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '307', 'CADRE PHOTO DIGITAL', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 307 CADRE PHOTO DIGITAL');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '308', 'KIT DE NETTOYAGE', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 308 KIT DE NETTOYAGE');
+INSERT INTO cyrus_structure (level, code, name, parent_code, full_path) VALUES (4, '309', 'FILTRE PHOTO', '853', '201 GEANT CASINO > 08 BAZAR LOURD > 085 PHOTO > 853 ACCESSOIRES PHOTO > 309 FILTRE PHOTO');
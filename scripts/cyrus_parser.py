@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Parser canonique de la structure CYRUS (StructureCYRUS.txt)
+Remplace parse_cyrus.py, parse_cyrus_fixed.py, parse_cyrus_v2.py et parse_cyrus_v3.py.
+
+Le niveau de chaque ligne se lit dans la structure du fichier, en une seule passe :
+- un en-tête de groupe est précédé d'une ligne ne contenant qu'une tabulation,
+  une feuille (sous-famille) n'est précédée que de la ligne à deux tabulations ;
+- parmi les en-têtes : le premier est le magasin (201), un code à 2 chiffres est un
+  secteur (01), un code à 3 chiffres qui prolonge le secteur est un rayon (010),
+  les autres sont des familles (101).
+
+Le résultat est une table de nœuds compacte (tableaux typés niveau / parent / ligne) ;
+les chemins complets ne sont construits qu'à la demande.
+"""
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from itertools import zip_longest
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_SOURCE = ROOT_DIR / "StructureCYRUS.txt"
+DEFAULT_JSON_OUTPUT = Path(__file__).parent / "cyrus_structure_v4.json"
+DEFAULT_SQL_OUTPUT = Path(__file__).parent / "cyrus_insert_v4.sql"
+GOLDEN_V3_JSON = Path(__file__).parent / "cyrus_structure_v3.json"
+
+# Niveaux de cyrus_structure.level
+MAGASIN, SECTEUR, RAYON, FAMILLE, SOUS_FAMILLE = range(5)
+LEVEL_NAMES = ['magasin', 'secteurs', 'rayons', 'familles', 'sous_familles']
+
+PATH_SEPARATOR = " > "
+
+# Nombre de nœuds attendus pour StructureCYRUS.txt (contrôle des imports)
+EXPECTED_NODE_COUNT = 2294
+
+# Colonnes de la table cyrus_structure
+TABLE_COLUMNS = ['level', 'code', 'name', 'parent_code', 'full_path']
+
+class CyrusTree:
+    """
+    Table de nœuds CYRUS dans l'ordre du fichier.
+    Le nœud i est décrit par levels[i], codes[i], names[i], parents[i] (-1 pour la racine)
+    et lines[i] (numéro de ligne dans le fichier source).
+    """
+
+    def __init__(self):
+        self.levels = array('b')
+        self.parents = array('i')
+        self.lines = array('i')
+        self.codes: List[str] = []
+        self.names: List[str] = []
+        # Lignes « code » sans libellé, ignorées (ex: "401" sous 734 JOURNAUX)
+        self.skipped_lines: List[int] = []
+
+    @classmethod
+    def from_arrays(cls, levels, parents, lines, codes, names, skipped_lines=()) -> "CyrusTree":
+        """Arbre adossé à des tableaux existants (ex: vues sur un instantané binaire), sans copie"""
+        tree = cls()
+        tree.levels, tree.parents, tree.lines = levels, parents, lines
+        tree.codes, tree.names = codes, names
+        tree.skipped_lines = list(skipped_lines)
+        return tree
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, level: int, code: str, name: str, parent: int, line_number: int) -> int:
+        self.levels.append(level)
+        self.codes.append(code)
+        self.names.append(name)
+        self.parents.append(parent)
+        self.lines.append(line_number)
+        return len(self.codes) - 1
+
+    def ancestors(self, index: int) -> List[int]:
+        """Indices des nœuds de la racine jusqu'à `index` inclus"""
+        chain = []
+        while index >= 0:
+            chain.append(index)
+            index = self.parents[index]
+        chain.reverse()
+        return chain
+
+    def label(self, index: int) -> str:
+        return f"{self.codes[index]} {self.names[index]}"
+
+    def full_path(self, index: int) -> str:
+        """Chemin complet « 201 GEANT CASINO > 01 MARCHE > ... » (construit à la demande)"""
+        return PATH_SEPARATOR.join(self.label(i) for i in self.ancestors(index))
+
+    def parent_code(self, index: int) -> Optional[str]:
+        parent = self.parents[index]
+        return self.codes[parent] if parent >= 0 else None
+
+    def item(self, index: int) -> Dict:
+        """Nœud au format des lignes de cyrus_structure (+ parent_index et line_number)"""
+        return {
+            'level': self.levels[index],
+            'code': self.codes[index],
+            'name': self.names[index],
+            'parent_code': self.parent_code(index),
+            'parent_index': self.parents[index],
+            'full_path': self.full_path(index),
+            'line_number': self.lines[index],
+        }
+
+    def items(self) -> Iterator[Dict]:
+        for index in range(len(self)):
+            yield self.item(index)
+
+    def rows(self) -> Iterator[Dict]:
+        """Nœuds réduits aux colonnes de cyrus_structure (payload d'import)"""
+        for index in range(len(self)):
+            item = self.item(index)
+            yield {column: item[column] for column in TABLE_COLUMNS}
+
+    def stats(self) -> Dict[str, int]:
+        counts = {name: 0 for name in LEVEL_NAMES}
+        for level in self.levels:
+            counts[LEVEL_NAMES[level]] += 1
+        counts['total'] = len(self)
+        return counts
+
+def iter_source_lines(source: Union[str, Path, Iterable[str]]) -> Iterator[str]:
+    """Lignes du fichier source (chemin) ou d'un itérable de lignes déjà lues"""
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from f
+    else:
+        yield from source
+
+def parse_cyrus(source: Union[str, Path, Iterable[str]] = DEFAULT_SOURCE) -> CyrusTree:
+    """Parser StructureCYRUS.txt en une passe et retourner la table de nœuds"""
+    tree = CyrusTree()
+    # Dernier nœud vu à chaque niveau : le parent d'un nœud de niveau L est last[L - 1]
+    last = [-1] * len(LEVEL_NAMES)
+    group_header = False
+
+    for line_number, raw in enumerate(iter_source_lines(source), 1):
+        line = raw.rstrip('\r\n')
+        text = line.strip()
+
+        if not text:
+            # Une ligne réduite à une tabulation annonce un en-tête de groupe
+            if line == '\t':
+                group_header = True
+            continue
+
+        code, _, name = text.partition(' ')
+        if not code.isdigit():
+            continue  # ligne de titre "Structure"
+        name = name.strip()
+        if not name:
+            tree.skipped_lines.append(line_number)
+            group_header = False
+            continue
+
+        if not group_header:
+            level = SOUS_FAMILLE
+        elif last[MAGASIN] < 0:
+            level = MAGASIN
+        elif len(code) == 2:
+            level = SECTEUR
+        elif last[SECTEUR] >= 0 and code.startswith(tree.codes[last[SECTEUR]]):
+            level = RAYON
+        else:
+            level = FAMILLE
+        group_header = False
+
+        parent = last[level - 1] if level > MAGASIN else -1
+        if level > MAGASIN and parent < 0:
+            raise ValueError(f"Ligne {line_number}: '{text}' ({LEVEL_NAMES[level]}) sans parent")
+
+        last[level] = tree.append(level, code, name, parent, line_number)
+        for deeper in range(level + 1, len(last)):
+            last[deeper] = -1
+
+    return tree
+
+def write_json(tree: CyrusTree, output_file: Union[str, Path] = DEFAULT_JSON_OUTPUT):
+    """Sauvegarder la structure parsée (format v4 : items avec parent_index)"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'metadata': {
+                'source_file': DEFAULT_SOURCE.name,
+                'total_items': len(tree),
+                'stats': tree.stats(),
+                'skipped_lines': tree.skipped_lines,
+                'version': 4
+            },
+            'items': list(tree.items())
+        }, f, indent=2, ensure_ascii=False)
+
+def _sql_literal(value) -> str:
+    if value is None:
+        return 'NULL'
+    if isinstance(value, int):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+def write_sql(tree: CyrusTree, output_file: Union[str, Path] = DEFAULT_SQL_OUTPUT):
+    """Script SQL équivalent, pour un import manuel depuis le SQL Editor de Supabase"""
+    columns = ', '.join(TABLE_COLUMNS)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("-- Script d'insertion de la structure CYRUS v4\n")
+        f.write("-- Généré automatiquement par scripts/cyrus_parser.py à partir de StructureCYRUS.txt\n\n")
+        f.write("DELETE FROM cyrus_structure;\n\n")
+        for row in tree.rows():
+            values = ', '.join(_sql_literal(row[column]) for column in TABLE_COLUMNS)
+            f.write(f"INSERT INTO cyrus_structure ({columns}) VALUES ({values});\n")
+
+def check_against_golden(tree: CyrusTree, golden_file: Union[str, Path] = GOLDEN_V3_JSON) -> bool:
+    """
+    Vérifier que le parser retrouve exactement les mêmes lignes (numéro, code, nom)
+    que cyrus_structure_v3.json, et les effectifs attendus par niveau.
+    """
+    with open(golden_file, 'r', encoding='utf-8') as f:
+        golden = json.load(f)['items']
+
+    expected = [(item['line_number'], item['code'], item['name']) for item in golden]
+    actual = list(zip(tree.lines, tree.codes, tree.names))
+    expected_stats = {'magasin': 1, 'secteurs': 8, 'rayons': 41, 'familles': 410,
+                      'sous_familles': 1834, 'total': EXPECTED_NODE_COUNT}
+
+    ok = True
+    if actual != expected:
+        mismatch, (got, want) = next((i, pair) for i, pair in enumerate(zip_longest(actual, expected))
+                                     if pair[0] != pair[1])
+        print(f"❌ Séquence différente de {Path(golden_file).name} à l'élément {mismatch}: {got} != {want}")
+        ok = False
+    if tree.stats() != expected_stats:
+        print(f"❌ Effectifs {tree.stats()} != {expected_stats}")
+        ok = False
+    if tree.skipped_lines != [3685]:
+        print(f"❌ Lignes ignorées inattendues: {tree.skipped_lines}")
+        ok = False
+
+    # Cohérence de l'arbre : chaque parent est du niveau immédiatement supérieur
+    for index in range(len(tree)):
+        parent = tree.parents[index]
+        if tree.levels[index] > MAGASIN and tree.levels[parent] != tree.levels[index] - 1:
+            print(f"❌ Parent incohérent pour {tree.label(index)} (ligne {tree.lines[index]})")
+            ok = False
+            break
+    return ok
+
+def run_self_test() -> bool:
+    """Contrôle de référence sur StructureCYRUS.txt, sans rien écrire"""
+    started = time.perf_counter()
+    tree = parse_cyrus(DEFAULT_SOURCE)
+    elapsed = time.perf_counter() - started
+    ok = check_against_golden(tree)
+    print(f"🔍 {len(tree)} éléments en {elapsed * 1000:.1f} ms, contrôle de référence "
+          f"({GOLDEN_V3_JSON.name}): {'✅' if ok else '❌'}")
+    return ok
+
+def generate(source: Path = DEFAULT_SOURCE) -> bool:
+    """Parser `source` et écrire le JSON v4, le script SQL et (fichier par défaut) l'instantané binaire"""
+    print(f"📖 Parsing du fichier: {source}")
+
+    started = time.perf_counter()
+    tree = parse_cyrus(source)
+    elapsed = time.perf_counter() - started
+
+    stats = tree.stats()
+    print(f"✅ {stats['total']} éléments en {elapsed * 1000:.1f} ms")
+    for name in LEVEL_NAMES:
+        print(f"   - {name}: {stats[name]}")
+    if tree.skipped_lines:
+        print(f"⚠️  Lignes sans libellé ignorées: {tree.skipped_lines}")
+
+    if source == DEFAULT_SOURCE and not check_against_golden(tree):
+        print(f"❌ Contrôle de référence ({GOLDEN_V3_JSON.name}) en échec : rien n'est écrit")
+        return False
+
+    write_json(tree)
+    print(f"💾 Données sauvegardées dans: {DEFAULT_JSON_OUTPUT}")
+    write_sql(tree)
+    print(f"💾 Script SQL généré dans: {DEFAULT_SQL_OUTPUT}")
+
+    if source == DEFAULT_SOURCE:
+        from cyrus_index import CyrusIndex
+        from cyrus_snapshot import DEFAULT_SNAPSHOT, write_snapshot
+        write_snapshot(CyrusIndex(tree), DEFAULT_SNAPSHOT, source)
+        print(f"💾 Instantané binaire: {DEFAULT_SNAPSHOT}")
+    return True
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Parser canonique de StructureCYRUS.txt")
+    parser.add_argument('source', nargs='?', type=Path, default=DEFAULT_SOURCE, help="Fichier CYRUS à parser")
+    parser.add_argument('--generate', action='store_true',
+                        help="Écrire cyrus_structure_v4.json, cyrus_insert_v4.sql et l'instantané binaire")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Comparer le parsing à cyrus_structure_v3.json (aucun fichier écrit)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.self_test:
+        sys.exit(0 if run_self_test() else 1)
+    if not args.generate:
+        print("Utiliser --generate pour écrire les fichiers dérivés, --self-test pour le contrôle de référence")
+        sys.exit(0)
+    sys.exit(0 if generate(args.source) else 1)
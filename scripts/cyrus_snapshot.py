@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Instantané binaire de la taxonomie CYRUS
+Fichier unique, versionné, lu par mmap sans copie :
+
+    en-tête   magic 'CYRS', version, nombre de nœuds, tailles des sections,
+              SHA-256 du fichier source et SHA-256 du contenu
+    sections  levels int8[n] | parents int32[n] | lines int32[n] | packed_keys int64[n]
+              | child_offsets int32[n+1] | child_ids int32[c] | code_offsets uint32[n+1]
+              | name_offsets uint32[n+1] | skipped_lines int32[k] | pool UTF-8 (codes puis noms)
+
+Chaque section est alignée sur 8 octets. Les tableaux sont des memoryview sur le
+fichier mappé ; les chaînes ne sont décodées qu'à l'accès. L'empreinte du source
+permet de détecter un instantané périmé et de le régénérer.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional, Union
+
+from cyrus_parser import DEFAULT_SOURCE, CyrusTree, parse_cyrus
+
+DEFAULT_SNAPSHOT = Path(__file__).parent / "cyrus_structure.snapshot"
+
+MAGIC = b'CYRS'
+FORMAT_VERSION = 1
+# magic, version, réservé, n nœuds, n enfants, n lignes ignorées, taille du pool, sha source, sha contenu
+HEADER = struct.Struct('<4sHHIIII32s32s')
+ALIGNMENT = 8
+
+class StaleSnapshotError(Exception):
+    """Instantané absent, illisible ou construit depuis une autre version du source"""
+
+def source_digest(path: Union[str, Path] = DEFAULT_SOURCE) -> bytes:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+class StringPool(Sequence):
+    """Chaînes stockées bout à bout dans un buffer UTF-8, décodées à la demande"""
+
+    def __init__(self, buffer: memoryview, offsets: memoryview):
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return str(self._buffer[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % ALIGNMENT)
+
+def write_snapshot(index, path: Union[str, Path] = DEFAULT_SNAPSHOT,
+                   source: Union[str, Path] = DEFAULT_SOURCE):
+    """Écrire l'instantané d'un CyrusIndex (écriture atomique par renommage)"""
+    from array import array
+
+    tree = index.tree
+    size = len(tree)
+
+    pool = bytearray()
+    offsets = {}
+    for field, strings in (('codes', tree.codes), ('names', tree.names)):
+        field_offsets = array('I', [len(pool)])
+        for text in strings:
+            pool += text.encode('utf-8')
+            field_offsets.append(len(pool))
+        offsets[field] = field_offsets
+
+    sections = [
+        array('b', tree.levels), array('i', tree.parents), array('i', tree.lines),
+        array('q', index.packed_keys), array('i', index.child_offsets), array('i', index.child_ids),
+        offsets['codes'], offsets['names'], array('i', tree.skipped_lines),
+    ]
+    if sys.byteorder != 'little':
+        for section in sections:
+            section.byteswap()
+
+    body = bytearray()
+    for section in sections:
+        raw = section.tobytes()
+        body += raw + _padding(len(raw))
+    body += pool
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, size, len(index.child_ids), len(tree.skipped_lines),
+                         len(pool), source_digest(source), hashlib.sha256(body).digest())
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+
+class CyrusSnapshot:
+    """Instantané mappé en mémoire ; reste ouvert tant que l'index qui l'utilise vit"""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_SNAPSHOT, source: Optional[Union[str, Path]] = DEFAULT_SOURCE,
+                 verify: bool = True):
+        try:
+            with open(path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise StaleSnapshotError(f"Instantané illisible {path}: {e}")
+
+        view = memoryview(self._mmap)
+        if len(view) < HEADER.size:
+            raise StaleSnapshotError(f"Instantané tronqué: {path}")
+        (magic, version, _, size, n_children, n_skipped, pool_size,
+         self.source_sha256, self.content_sha256) = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise StaleSnapshotError(f"Format d'instantané inconnu ({magic!r}, v{version})")
+
+        body = view[HEADER.size:]
+        if verify and hashlib.sha256(body).digest() != self.content_sha256:
+            raise StaleSnapshotError(f"Instantané corrompu: {path}")
+        if source is not None and Path(source).exists() and source_digest(source) != self.source_sha256:
+            raise StaleSnapshotError(f"Instantané périmé: {Path(source).name} a changé")
+
+        cursor = 0
+
+        def take(fmt: str, count: int) -> memoryview:
+            nonlocal cursor
+            length = count * struct.calcsize(fmt)
+            section = body[cursor:cursor + length].cast(fmt)
+            cursor += length + (-length % ALIGNMENT)
+            return section
+
+        self.levels = take('b', size)
+        self.parents = take('i', size)
+        self.lines = take('i', size)
+        self.packed_keys = take('q', size)
+        self.child_offsets = take('i', size + 1)
+        self.child_ids = take('i', n_children)
+        code_offsets = take('I', size + 1)
+        name_offsets = take('I', size + 1)
+        self.skipped_lines = take('i', n_skipped).tolist()
+        pool = body[cursor:cursor + pool_size]
+        self.codes = StringPool(pool, code_offsets)
+        self.names = StringPool(pool, name_offsets)
+
+    def tree(self) -> CyrusTree:
+        return CyrusTree.from_arrays(self.levels, self.parents, self.lines,
+                                     self.codes, self.names, self.skipped_lines)
+
+def load_snapshot_index(path: Union[str, Path] = DEFAULT_SNAPSHOT, source: Union[str, Path] = DEFAULT_SOURCE,
+                        rebuild: bool = True):
+    """
+    CyrusIndex adossé à l'instantané binaire. S'il est absent ou périmé et que le
+    source est disponible, le source est reparsé et l'instantané réécrit (rebuild=True).
+    """
+    from cyrus_index import CyrusIndex
+
+    try:
+        snapshot = CyrusSnapshot(path, source)
+    except StaleSnapshotError as e:
+        if not rebuild or not Path(source).exists():
+            raise
+        print(f"🔄 {e} : régénération de {Path(path).name}")
+        index = CyrusIndex(parse_cyrus(source))
+        try:
+            write_snapshot(index, path, source)
+        except OSError as write_error:
+            print(f"⚠️  Instantané non écrit: {write_error}")
+        return index
+
+    index = CyrusIndex(snapshot.tree(), snapshot.packed_keys, snapshot.child_offsets, snapshot.child_ids)
+    index.snapshot = snapshot
+    return index
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from cyrus_index import CyrusIndex
+
+    reference = CyrusIndex(parse_cyrus(DEFAULT_SOURCE))
+    with tempfile.TemporaryDirectory() as tmp:
+        snap_path = Path(tmp) / "cyrus.snapshot"
+        write_snapshot(reference, snap_path)
+        print(f"💾 Instantané: {snap_path.stat().st_size / 1024:.0f} Ko")
+
+        started = time.perf_counter()
+        index = load_snapshot_index(snap_path, rebuild=False)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        node = index.lookup(1, 10, 101, 101)
+        first_lookup_ms = (time.perf_counter() - started) * 1000
+
+        same = (list(index.tree.codes) == reference.tree.codes
+                and list(index.tree.names) == reference.tree.names
+                and list(index.tree.levels) == list(reference.tree.levels)
+                and list(index.tree.parents) == list(reference.tree.parents)
+                and list(index.packed_keys) == list(reference.packed_keys)
+                and list(index.child_ids) == list(reference.child_ids)
+                and index.tree.skipped_lines == reference.tree.skipped_lines
+                and index.tree.full_path(node) == reference.tree.full_path(node))
+        print(f"⚡ Chargement {load_ms:.2f} ms, première recherche {first_lookup_ms:.2f} ms")
+        print(f"🔍 Contenu identique au parsing du source: {'✅' if same else '❌'}")
+
+        # Un source modifié rend l'instantané périmé
+        modified = Path(tmp) / "StructureCYRUS.txt"
+        modified.write_bytes(DEFAULT_SOURCE.read_bytes() + b"\n")
+        try:
+            CyrusSnapshot(snap_path, modified)
+            stale_ok = False
+        except StaleSnapshotError:
+            stale_ok = True
+        print(f"🔍 Détection d'instantané périmé: {'✅' if stale_ok else '❌'}")
+        index = None
+
+    sys.exit(0 if same and stale_ok else 1)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Synchronisation différentielle de cyrus_structure
+Compare la structure parsée (StructureCYRUS.txt) au contenu de la table par clé
+naturelle (chemin des codes depuis le magasin) et n'applique que les insertions,
+mises à jour et suppressions nécessaires, en une seule transaction :
+- backend rest : fonction SQL apply_cyrus_structure_diff (database/schema.sql)
+- backend postgres : connexion directe, table verrouillée pendant le diff
+La table n'est jamais vide pendant une mise à jour de la taxonomie.
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from cyrus_parser import PATH_SEPARATOR, TABLE_COLUMNS
+
+# Pagination de la lecture de la table (limite par défaut de PostgREST)
+FETCH_PAGE_SIZE = 1000
+
+NaturalKey = Tuple[str, ...]
+
+def natural_key(row: Dict) -> NaturalKey:
+    """Chemin des codes d'une ligne, lu dans full_path ('201 X > 01 Y' -> ('201', '01'))"""
+    return tuple(segment.split(' ', 1)[0] for segment in row['full_path'].split(PATH_SEPARATOR))
+
+@dataclass
+class CyrusDiff:
+    """Changements à appliquer à cyrus_structure (les mises à jour et suppressions portent l'id)"""
+    inserts: List[Dict] = field(default_factory=list)
+    updates: List[Dict] = field(default_factory=list)
+    deletes: List[int] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.inserts or self.updates or self.deletes)
+
+    def summary(self) -> Dict[str, int]:
+        return {'inserts': len(self.inserts), 'updates': len(self.updates),
+                'deletes': len(self.deletes), 'unchanged': self.unchanged}
+
+def diff_cyrus(current: Iterable[Dict], target: Iterable[Dict]) -> CyrusDiff:
+    """
+    Différence entre les lignes en base (avec id) et les lignes cibles du parser.
+    Une clé présente plusieurs fois en base (imports relancés) est ramenée à une seule ligne.
+    """
+    diff = CyrusDiff()
+    existing: Dict[NaturalKey, Dict] = {}
+    for row in sorted(current, key=lambda r: r['id']):
+        key = natural_key(row)
+        if key in existing:
+            diff.deletes.append(row['id'])
+        else:
+            existing[key] = row
+
+    for row in target:
+        key = natural_key(row)
+        previous = existing.pop(key, None)
+        if previous is None:
+            diff.inserts.append({column: row[column] for column in TABLE_COLUMNS})
+        elif any(previous[column] != row[column] for column in TABLE_COLUMNS):
+            update = {column: row[column] for column in TABLE_COLUMNS}
+            update['id'] = previous['id']
+            diff.updates.append(update)
+        else:
+            diff.unchanged += 1
+
+    diff.deletes.extend(row['id'] for row in existing.values())
+    return diff
+
+# --- Backend REST (Supabase) ---
+
+def fetch_current_rest(supabase) -> List[Dict]:
+    """Lire toute la table cyrus_structure par pages"""
+    columns = ','.join(['id'] + TABLE_COLUMNS)
+    rows: List[Dict] = []
+    while True:
+        page = (supabase.table('cyrus_structure').select(columns).order('id')
+                .range(len(rows), len(rows) + FETCH_PAGE_SIZE - 1).execute().data)
+        rows.extend(page)
+        if len(page) < FETCH_PAGE_SIZE:
+            return rows
+
+def apply_diff_rest(supabase, diff: CyrusDiff) -> Dict[str, int]:
+    """Appliquer le diff en une transaction côté serveur (RPC apply_cyrus_structure_diff)"""
+    result = supabase.rpc('apply_cyrus_structure_diff', {
+        'inserts': diff.inserts,
+        'updates': diff.updates,
+        'deletes': diff.deletes,
+    }).execute()
+    return result.data
+
+def sync_rest(supabase, target: List[Dict], dry_run: bool = False) -> CyrusDiff:
+    """Lire la table, calculer le diff et l'appliquer (s'il y a lieu) via la RPC"""
+    diff = diff_cyrus(fetch_current_rest(supabase), target)
+    if not dry_run and not diff.empty:
+        apply_diff_rest(supabase, diff)
+    return diff
+
+# --- Backend postgres (connexion directe) ---
+
+def sync_postgres(target: List[Dict], dsn: Optional[str] = None, dry_run: bool = False) -> CyrusDiff:
+    """Verrouiller la table, calculer le diff et l'appliquer dans la même transaction"""
+    from pg_copy_loader import PostgresCopyLoader, get_database_url
+
+    dsn = get_database_url(dsn)
+    if not dsn:
+        raise RuntimeError("SUPABASE_DB_URL (ou DATABASE_URL) doit être défini pour le backend postgres")
+
+    loader = PostgresCopyLoader(dsn)
+    try:
+        with loader.conn.transaction():
+            with loader.conn.cursor() as cur:
+                # Les lecteurs continuent de lire l'ancienne version ; les écritures concurrentes attendent
+                cur.execute("LOCK TABLE cyrus_structure IN SHARE ROW EXCLUSIVE MODE")
+                cur.execute(f"SELECT id, {', '.join(TABLE_COLUMNS)} FROM cyrus_structure")
+                columns = [column.name for column in cur.description]
+                current = [dict(zip(columns, row)) for row in cur.fetchall()]
+                diff = diff_cyrus(current, target)
+                if dry_run or diff.empty:
+                    return diff
+
+                if diff.deletes:
+                    cur.execute("DELETE FROM cyrus_structure WHERE id = ANY(%s)", (diff.deletes,))
+                if diff.updates:
+                    assignments = ', '.join(f"{column} = %({column})s" for column in TABLE_COLUMNS)
+                    cur.executemany(f"UPDATE cyrus_structure SET {assignments} WHERE id = %(id)s", diff.updates)
+            if diff.inserts:
+                loader.copy_rows('cyrus_structure', TABLE_COLUMNS,
+                                 ([row[column] for column in TABLE_COLUMNS] for row in diff.inserts))
+        return diff
+    finally:
+        loader.close()
+
+def print_diff(diff: CyrusDiff):
+    summary = diff.summary()
+    print(f"   ➕ {summary['inserts']} insertions")
+    print(f"   ✏️  {summary['updates']} mises à jour")
+    print(f"   ➖ {summary['deletes']} suppressions")
+    print(f"   = {summary['unchanged']} inchangés")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Synchronisation différentielle de cyrus_structure")
+    parser.add_argument('--backend', choices=['rest', 'postgres'], default='rest',
+                        help="rest: RPC apply_cyrus_structure_diff ; postgres: transaction directe")
+    parser.add_argument('--dsn', default=None,
+                        help="URL Postgres du backend postgres (défaut: SUPABASE_DB_URL ou DATABASE_URL)")
+    parser.add_argument('--dry-run', action='store_true', help="Afficher le diff sans rien modifier")
+    parser.add_argument('--self-test', action='store_true', help="Vérifier le calcul du diff hors connexion")
+    return parser.parse_args()
+
+def run_self_test() -> bool:
+    """Diff sur une copie divergente de la structure parsée, appliqué en mémoire"""
+    from cyrus_parser import parse_cyrus
+
+    target = list(parse_cyrus().rows())
+    current = [dict(row, id=i + 1) for i, row in enumerate(target)]
+    # Base divergente : un renommage, un élément disparu, un doublon d'import, un élément obsolète
+    current[5] = dict(current[5], name='ANCIEN NOM')
+    del current[10]
+    current.append(dict(current[20], id=10_000))
+    current.append({'id': 10_001, 'level': 4, 'code': '999', 'name': 'OBSOLETE', 'parent_code': '101',
+                    'full_path': '201 GEANT CASINO > 01 MARCHE > 010 BOUCHERIE > 101 STAND TRADITIONNEL > 999 OBSOLETE'})
+
+    diff = diff_cyrus(current, target)
+    expected = {'inserts': 1, 'updates': 1, 'deletes': 2, 'unchanged': len(target) - 2}
+
+    # Appliquer le diff à la copie en mémoire doit redonner exactement la cible
+    table = {row['id']: row for row in current}
+    for row_id in diff.deletes:
+        del table[row_id]
+    for update in diff.updates:
+        table[update['id']] = dict(update)
+    for position, row in enumerate(diff.inserts):
+        table[20_000 + position] = dict(row, id=20_000 + position)
+    synced = sorted(json.dumps({c: row[c] for c in TABLE_COLUMNS}, sort_keys=True) for row in table.values())
+    reference = sorted(json.dumps(row, sort_keys=True) for row in target)
+
+    ok = diff.summary() == expected and synced == reference and diff_cyrus(
+        [dict(row, id=i) for i, row in enumerate(target)], target).empty
+    print(f"🔍 Diff {diff.summary()}: {'✅' if ok else '❌'}")
+    return ok
+
+def main() -> bool:
+    from cyrus_index import load_cyrus_index
+
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+    load_dotenv()
+
+    print("🔄 SYNCHRONISATION CYRUS")
+    print("=" * 40)
+
+    target = list(load_cyrus_index().tree.rows())
+    print(f"📊 {len(target)} éléments dans la structure parsée")
+
+    try:
+        if args.backend == 'postgres':
+            diff = sync_postgres(target, args.dsn, args.dry_run)
+            print_diff(diff)
+        else:
+            from supabase import create_client
+
+            url = os.getenv("SUPABASE_URL")
+            service_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+            if not url or not service_key:
+                print("❌ SUPABASE_URL et SUPABASE_SERVICE_ROLE_KEY doivent être définis")
+                return False
+            supabase = create_client(url, service_key)
+
+            diff = sync_rest(supabase, target, args.dry_run)
+            print_diff(diff)
+            if not args.dry_run and not diff.empty:
+                print("✅ Appliqué en une transaction")
+    except Exception as e:
+        print(f"❌ Erreur de synchronisation: {e}")
+        return False
+
+    if diff.empty:
+        print("✅ cyrus_structure déjà à jour")
+    elif args.dry_run:
+        print("ℹ️  Mode --dry-run : aucune modification appliquée")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
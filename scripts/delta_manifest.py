@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Manifeste local pour les imports incrémentaux (delta)
+Base SQLite : clé naturelle -> empreinte de la ligne telle qu'elle est en base.
+À chaque import, seules les lignes nouvelles ou modifiées sont envoyées,
+et les clés disparues du fichier source sont supprimées.
+"""
+
+import sqlite3
+from typing import Dict, Iterator, List, Tuple
+
+# SQLite limite le nombre de paramètres par requête
+SQLITE_IN_CHUNK = 500
+
+# Séparateur des colonnes de la clé naturelle dans le manifeste
+KEY_SEPARATOR = '\x1f'
+
+class DeltaManifest:
+    """
+    Compare un flux de (clé, empreinte) à l'instantané du dernier import.
+    Les changements sont d'abord « mis en attente » avec une position ; l'instantané
+    n'est mis à jour que pour les positions effectivement validées en base.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                key TEXT PRIMARY KEY,
+                hash TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        # Tables de travail de l'import en cours (non persistées)
+        self.db.execute("CREATE TEMP TABLE seen (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        self.db.execute("CREATE TEMP TABLE staged (pos INTEGER PRIMARY KEY, key TEXT NOT NULL, hash TEXT)")
+
+        self._next_pos = 0
+        self.inserts = 0
+        self.updates = 0
+        self.unchanged = 0
+        self.deletes = 0
+
+    def _lookup(self, keys: List[str]) -> Dict[str, str]:
+        found = {}
+        for i in range(0, len(keys), SQLITE_IN_CHUNK):
+            chunk = keys[i:i + SQLITE_IN_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self.db.execute(
+                f"SELECT key, hash FROM articles WHERE key IN ({placeholders})", chunk
+            ))
+        return found
+
+    def diff(self, keys: List[str], hashes: List[str]) -> List[bool]:
+        """
+        Marquer les clés comme présentes dans le fichier et retourner, pour chaque ligne,
+        True si elle est nouvelle ou modifiée depuis le dernier import.
+        """
+        known = self._lookup(keys)
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO seen (key) VALUES (?)", ((k,) for k in keys))
+
+        changed = []
+        for key, row_hash in zip(keys, hashes):
+            previous = known.get(key)
+            if previous is None:
+                self.inserts += 1
+                changed.append(True)
+            elif previous != row_hash:
+                self.updates += 1
+                changed.append(True)
+            else:
+                self.unchanged += 1
+                changed.append(False)
+        return changed
+
+    def stage(self, keys: List[str], hashes: List) -> int:
+        """Mettre en attente des changements (hash None = suppression). Retourne la position de départ"""
+        start = self._next_pos
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO staged (pos, key, hash) VALUES (?, ?, ?)",
+                ((start + i, key, row_hash) for i, (key, row_hash) in enumerate(zip(keys, hashes)))
+            )
+        self._next_pos += len(keys)
+        return start
+
+    def commit_range(self, start: int, end: int):
+        """Reporter dans l'instantané les changements des positions [start, end) validées en base"""
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO articles (key, hash) "
+                "SELECT key, hash FROM staged WHERE pos >= ? AND pos < ? AND hash IS NOT NULL ORDER BY pos",
+                (start, end)
+            )
+            self.db.execute(
+                "DELETE FROM articles WHERE key IN "
+                "(SELECT key FROM staged WHERE pos >= ? AND pos < ? AND hash IS NULL)",
+                (start, end)
+            )
+
+    def stage_deletions(self, chunk_size: int = 100) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Mettre en attente la suppression des clés de l'instantané absentes du fichier lu.
+        À n'appeler qu'après avoir lu le fichier source en entier.
+        """
+        missing = [row[0] for row in self.db.execute(
+            "SELECT key FROM articles WHERE key NOT IN (SELECT key FROM seen)"
+        )]
+        self.deletes = len(missing)
+        for i in range(0, len(missing), chunk_size):
+            keys = missing[i:i + chunk_size]
+            yield self.stage(keys, [None] * len(keys)), keys
+
+    def summary(self) -> dict:
+        return {
+            'inserts': self.inserts,
+            'updates': self.updates,
+            'unchanged': self.unchanged,
+            'deletes': self.deletes,
+        }
+
+    def close(self):
+        self.db.close()
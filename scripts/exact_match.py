@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Étape de correspondance exacte avant toute recherche floue ou appel IA
+Deux tables de hachage construites depuis l'historique classé :
+- EAN normalisé -> codes CYRUS (secteur, rayon, famille, sous_famille)
+- libellé corrigé (moteur V2, équivalent de process_single_label(...)['corrected']) -> codes
+Un article déjà vu est classé immédiatement ; une entrée dont les occurrences
+historiques ne s'accordent pas (MIN_AGREEMENT) n'est pas utilisée et l'article
+passe à l'étape suivante.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from cyrus_index import pack_key, unpack_key
+from label_cache import CachedLabelProcessor
+from label_processor import rules_version_hash
+
+DEFAULT_INDEX_PATH = Path(__file__).parent / "exact_match_index.npz"
+
+# Part minimale des occurrences historiques d'une clé qui doivent porter les mêmes codes
+MIN_AGREEMENT = 0.9
+
+# Un libellé corrigé trop court ("LAIT") désigne plusieurs produits : pas de raccourci
+MIN_LABEL_LENGTH = 6
+
+def normalize_ean(value) -> Optional[str]:
+    """EAN sous forme canonique (chiffres, zéros de tête retirés puis complété à 13), None si invalide"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if text.endswith('.0'):
+        text = text[:-2]
+    if not text.isdigit() or len(text) > 14:
+        return None
+    text = text.lstrip('0')
+    if not text:
+        return None
+    return text.zfill(13)
+
+@dataclass
+class ExactMatch:
+    """Classification reprise telle quelle de l'historique"""
+    codes: Tuple[int, ...]   # (secteur, rayon, famille, sous_famille)
+    source: str              # 'ean' ou 'libelle'
+    support: int             # occurrences historiques portant ces codes
+    agreement: float         # part des occurrences de la clé portant ces codes
+
+class ExactMatchIndex:
+    """
+    Tables EAN -> entrée et libellé corrigé -> entrée. Une entrée est
+    (clé packée gagnante, occurrences de cette clé, occurrences totales).
+    """
+
+    def __init__(self, by_ean: Dict[str, Tuple[int, int, int]], by_label: Dict[str, Tuple[int, int, int]],
+                 rules_hash: str, processor: Optional[CachedLabelProcessor] = None):
+        self.by_ean = by_ean
+        self.by_label = by_label
+        self.rules_hash = rules_hash
+        self.processor = processor or CachedLabelProcessor()
+        self.ean_hits = 0
+        self.label_hits = 0
+        self.ambiguous = 0
+        self.misses = 0
+
+    @staticmethod
+    def _entries(counters: Dict[str, Counter]) -> Dict[str, Tuple[int, int, int]]:
+        entries = {}
+        for key, counter in counters.items():
+            packed, count = counter.most_common(1)[0]
+            entries[key] = (packed, count, sum(counter.values()))
+        return entries
+
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[Optional[str], Optional[str], Sequence[int]]],
+              processor: Optional[CachedLabelProcessor] = None) -> "ExactMatchIndex":
+        """Construire les tables depuis des lignes (EAN, libellé brut, codes) de l'historique"""
+        processor = processor or CachedLabelProcessor()
+        eans: Dict[str, Counter] = defaultdict(Counter)
+        labels: Dict[str, Counter] = defaultdict(Counter)
+        rows = list(rows)
+        corrected = processor.correct_many([label for _, label, _ in rows])
+        for (ean, _, codes), label in zip(rows, corrected):
+            packed = pack_key(tuple(int(code) for code in codes))
+            ean = normalize_ean(ean)
+            if ean:
+                eans[ean][packed] += 1
+            if len(label) >= MIN_LABEL_LENGTH:
+                labels[label][packed] += 1
+        return cls(cls._entries(eans), cls._entries(labels), rules_version_hash(), processor)
+
+    # --- Recherche ---
+
+    def _match(self, entry: Optional[Tuple[int, int, int]], source: str) -> Optional[ExactMatch]:
+        if entry is None:
+            return None
+        packed, count, total = entry
+        if count < MIN_AGREEMENT * total:
+            self.ambiguous += 1
+            return None
+        return ExactMatch(unpack_key(packed), source, count, count / total)
+
+    def lookup_many(self, items: Iterable[Tuple[Optional[str], Optional[str]]]) -> List[Optional[ExactMatch]]:
+        """
+        Correspondance de chaque (EAN, libellé brut) : l'EAN d'abord, puis le libellé corrigé.
+        None si l'article est inconnu ou ambigu (à confier à l'étape suivante).
+        """
+        items = list(items)
+        corrected = self.processor.correct_many([label for _, label in items])
+        results: List[Optional[ExactMatch]] = []
+        for (ean, _), label in zip(items, corrected):
+            match = self._match(self.by_ean.get(normalize_ean(ean) or ''), 'ean')
+            if match is not None:
+                self.ean_hits += 1
+            else:
+                match = self._match(self.by_label.get(label), 'libelle')
+                if match is not None:
+                    self.label_hits += 1
+                else:
+                    self.misses += 1
+            results.append(match)
+        return results
+
+    def lookup(self, ean: Optional[str] = None, label: Optional[str] = None) -> Optional[ExactMatch]:
+        return self.lookup_many([(ean, label)])[0]
+
+    def stats(self) -> dict:
+        """Compteurs de correspondances depuis la création de l'index"""
+        lookups = self.ean_hits + self.label_hits + self.misses
+        return {
+            'ean_hits': self.ean_hits,
+            'label_hits': self.label_hits,
+            'misses': self.misses,
+            'ambiguous': self.ambiguous,
+            'hit_rate': (self.ean_hits + self.label_hits) / lookups if lookups else 0.0,
+            'eans': len(self.by_ean),
+            'labels': len(self.by_label),
+        }
+
+    # --- Sauvegarde ---
+
+    def save(self, path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        def columns(table: Dict[str, Tuple[int, int, int]]):
+            return (np.array(list(table), dtype=str),
+                    np.array(list(table.values()), dtype=np.int64).reshape(-1, 3))
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        eans, ean_entries = columns(self.by_ean)
+        labels, label_entries = columns(self.by_label)
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, eans=eans, ean_entries=ean_entries, labels=labels, label_entries=label_entries,
+                     rules_hash=np.array(self.rules_hash))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> "ExactMatchIndex":
+        with np.load(path) as data:
+            by_ean = dict(zip(data['eans'].tolist(), map(tuple, data['ean_entries'].tolist())))
+            by_label = dict(zip(data['labels'].tolist(), map(tuple, data['label_entries'].tolist())))
+            return cls(by_ean, by_label, str(data['rules_hash']))
+
+def load_exact_match_index(path: Union[str, Path] = DEFAULT_INDEX_PATH) -> Optional[ExactMatchIndex]:
+    """
+    Index sauvegardé, ou None s'il est absent ou construit avec d'autres règles de
+    correction (les libellés corrigés ne seraient plus comparables)
+    """
+    if not Path(path).exists():
+        return None
+    index = ExactMatchIndex.load(path)
+    if index.rules_hash != rules_version_hash():
+        print(f"⚠️  {Path(path).name} construit avec d'autres règles de correction : à reconstruire",
+              file=sys.stderr)
+        return None
+    return index
+
+# --- Données d'historique ---
+
+def history_rows_from_supabase() -> List[Tuple[str, str, Tuple[int, ...]]]:
+    """(EAN, libellé, codes) des articles classés exportés de articles_historiques"""
+    from article_similarity import fetch_articles_rest
+    from import_historical_data import get_supabase
+    from knn_classifier import CODE_FIELDS
+
+    rows = fetch_articles_rest(get_supabase(), ['ean', 'libelle'] + CODE_FIELDS)
+    return [(row['ean'], row['libelle'], tuple(row[column] for column in CODE_FIELDS))
+            for row in rows if all(row.get(column) for column in CODE_FIELDS)]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Correspondance exacte EAN / libellé corrigé sur l'historique")
+    parser.add_argument('--train-file', default=None, help="Construire depuis le catalogue historique (.xlsx ou .csv)")
+    parser.add_argument('--export', action='store_true', help="Construire depuis articles_historiques (API REST)")
+    parser.add_argument('--index', default=str(DEFAULT_INDEX_PATH), help="Fichier .npz de l'index")
+    parser.add_argument('--ean', action='append', default=[], help="EAN à rechercher (répétable)")
+    parser.add_argument('--label', action='append', default=[], help="Libellé à rechercher (répétable)")
+    parser.add_argument('--self-test', action='store_true', help="Vérifier l'index sur un historique synthétique")
+    return parser.parse_args()
+
+def run_self_test() -> bool:
+    import random
+    from knn_classifier import synthetic_training_set
+
+    rng = random.Random(5)
+    labels, codes = synthetic_training_set(50_000)
+    history = [(f"{3000000000000 + i}", label, key) for i, (label, key) in enumerate(zip(labels, codes))]
+    # Un EAN historique classé de deux façons différentes : ambigu, donc ignoré
+    history.append((history[0][0], history[0][1], (9, 99, 999, 999)))
+
+    started = time.perf_counter()
+    index = ExactMatchIndex.build(history)
+    print(f"🏗️  Index construit en {time.perf_counter() - started:.2f}s "
+          f"({len(index.by_ean):,} EAN, {len(index.by_label):,} libellés corrigés)")
+
+    # Flux entrant : 40 % d'EAN déjà vus, 20 % de libellés déjà vus avec un nouvel EAN, 40 % de nouveautés
+    incoming, expected = [], []
+    for i in range(20_000):
+        ean, label, key = rng.choice(history[1:-1])
+        roll = rng.random()
+        if roll < 0.4:
+            incoming.append((ean, label.lower()))
+            expected.append(('ean', tuple(key)))
+        elif roll < 0.6:
+            incoming.append((f"0{4000000000000 + i}", f"  {label}  "))
+            expected.append(('libelle', tuple(key)))
+        else:
+            incoming.append((None, f"NOUVEAUTE {i} {label[:3]}"))
+            expected.append((None, None))
+
+    started = time.perf_counter()
+    matches = index.lookup_many(incoming)
+    elapsed = time.perf_counter() - started
+
+    # Attendu pour un libellé repris, recalculé sans l'index : les codes majoritaires de son
+    # libellé corrigé si leur accord atteint MIN_AGREEMENT, aucune correspondance sinon
+    from label_processor import DEFAULT_PROCESSOR
+    by_label: Dict[str, Counter] = defaultdict(Counter)
+    for _, label, key in history:
+        by_label[DEFAULT_PROCESSOR.correct(label)][tuple(key)] += 1
+
+    def expected_label_hit(label: str) -> Optional[Tuple[int, ...]]:
+        counter = by_label[DEFAULT_PROCESSOR.correct(label)]
+        key, count = counter.most_common(1)[0]
+        if len(DEFAULT_PROCESSOR.correct(label)) < MIN_LABEL_LENGTH or count < MIN_AGREEMENT * sum(counter.values()):
+            return None
+        return key
+
+    ok = all(
+        (match is None) if source is None else
+        (match is not None and match.source == 'ean' and match.codes == key) if source == 'ean' else
+        ((match is None) if expected_label_hit(label) is None else
+         (match is not None and match.source == 'libelle' and match.codes == expected_label_hit(label)))
+        for match, (_, label), (source, key) in zip(matches, incoming, expected))
+    label_hits = sum(source == 'libelle' and expected_label_hit(label) is not None
+                     for (_, label), (source, _) in zip(incoming, expected))
+    ok = ok and label_hits > 0
+    ok = ok and index.lookup(history[0][0]) is None
+
+    stats = index.stats()
+    print(f"⚡ {len(incoming) / elapsed:,.0f} articles/s")
+    print(f"🎯 Taux de correspondance {stats['hit_rate']:.1%} "
+          f"(EAN {stats['ean_hits']:,}, libellé {stats['label_hits']:,}, ambigus {stats['ambiguous']:,})")
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    if args.train_file or args.export:
+        from import_historical_data import iter_classified_articles
+
+        started = time.perf_counter()
+        rows = (list(iter_classified_articles(args.train_file)) if args.train_file
+                else history_rows_from_supabase())
+        index = ExactMatchIndex.build(rows)
+        index.save(args.index)
+        print(f"💾 {len(rows):,} articles indexés en {time.perf_counter() - started:.1f}s "
+              f"({len(index.by_ean):,} EAN, {len(index.by_label):,} libellés) : {args.index}")
+    else:
+        index = load_exact_match_index(args.index)
+        if index is None:
+            print(f"❌ Index absent ou périmé: {args.index} (construire avec --train-file ou --export)")
+            return False
+
+    queries = [(ean, None) for ean in args.ean] + [(None, label) for label in args.label]
+    for (ean, label), match in zip(queries, index.lookup_many(queries)):
+        if match is None:
+            print(f"❓ {ean or label}: inconnu")
+        else:
+            print(f"✅ {ean or label}: {match.codes} via {match.source} "
+                  f"({match.support} occurrences, accord {match.agreement:.0%})")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Classification CYRUS en deux étapes courtes au lieu d'un prompt avec toute la structure
+1. famille : le modèle choisit parmi une courte liste de familles candidates
+   (« secteur > rayon > famille »), élaguée localement :
+   - familles des plus proches voisins historiques (kNN TF-IDF, index trigrammes)
+   - familles dont le nom, ou celui d'une de leurs sous-familles, ressemble au libellé
+2. sous-famille : seules les sous-familles de la famille retenue sont envoyées
+
+Si aucune candidate ne convient (réponse 0), le modèle choisit d'abord le rayon
+parmi les 41 rayons, puis la famille dans ce rayon. Un prompt fait ainsi quelques
+centaines de tokens, contre ~14 000 avec la structure complète (2294 nœuds).
+"""
+
+import argparse
+import http.client
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from article_similarity import TrigramIndex
+from cyrus_index import CyrusIndex, unpack_key
+from cyrus_parser import FAMILLE, RAYON, SECTEUR, SOUS_FAMILLE
+from llm_batch_classifier import (
+    PRIMARY_MODEL, SYSTEM_PROMPT, ChatCompletionError, answering_model, build_batch_messages, extract_result_objects,
+    taxonomy_context,
+)
+from llm_cache import LlmResponseCache, prompt_hash
+
+MAX_CANDIDATES = 8
+# Similarité trigrammes minimale entre le libellé et un nom CYRUS
+NAME_THRESHOLD = 0.2
+# Approximation du nombre de tokens d'un texte français (caractères / token)
+CHARS_PER_TOKEN = 4
+
+# Échecs d'une requête ou de la lecture de sa réponse (JSON invalide, connexion coupée,
+# délai dépassé) : seul le libellé concerné reste non classé, le lot continue
+REQUEST_ERRORS = (ChatCompletionError, OSError, http.client.HTTPException, ValueError)
+
+_CHOICE_RE = re.compile(r'"choix"\s*:\s*"?(\d+)')
+
+def estimate_tokens(messages: Sequence[Dict[str, str]]) -> int:
+    return sum(len(message['content']) for message in messages) // CHARS_PER_TOKEN
+
+def is_choice(item: dict) -> bool:
+    """Objet réponse d'une étape ({"choix": n, ...}) : le flux est coupé dès qu'il est complet"""
+    return 'choix' in item
+
+def parse_choice(content: str, options: int) -> Optional[Tuple[int, float, str]]:
+    """(choix, confiance, raisonnement) d'une réponse {"choix": n, ...} ; None si illisible ou hors liste"""
+    objects = [item for item in extract_result_objects(content) if 'choix' in item]
+    if objects:
+        item = objects[0]
+        try:
+            choice = int(item['choix'])
+        except (TypeError, ValueError):
+            return None
+        try:
+            confidence = min(100.0, max(0.0, float(item.get('confidence', 50))))
+        except (TypeError, ValueError):
+            confidence = 50.0
+        reasoning = item.get('reasoning') if isinstance(item.get('reasoning'), str) else ''
+    else:
+        match = _CHOICE_RE.search(content or '')
+        if match is None:
+            return None
+        choice, confidence, reasoning = int(match.group(1)), 50.0, ''
+    return (choice, confidence, reasoning) if 0 <= choice <= options else None
+
+class CandidateGenerator:
+    """Familles CYRUS candidates d'un libellé, par score décroissant"""
+
+    def __init__(self, index: CyrusIndex, knn=None, similarity: Optional[TrigramIndex] = None,
+                 correct_labels: bool = True):
+        self.index = index
+        self.knn = knn
+        self.similarity = similarity
+        self.correct_labels = correct_labels
+        tree = index.tree
+        # Index trigrammes des noms de familles et sous-familles (un « article » par nœud)
+        self.names = TrigramIndex.build({'libelle': tree.names[i], 'node': i} for i in range(len(tree))
+                                        if tree.levels[i] in (FAMILLE, SOUS_FAMILLE))
+
+    def _famille(self, node: Optional[int]) -> Optional[int]:
+        if node is None:
+            return None
+        while node >= 0 and self.index.tree.levels[node] > FAMILLE:
+            node = self.index.parent(node)
+        return node if node >= 0 and self.index.tree.levels[node] == FAMILLE else None
+
+    def _famille_of_record(self, record: Dict) -> Optional[int]:
+        """Famille d'un article historique : par ses codes, à défaut par ses noms"""
+        codes = [record.get(f"{field}_code") for field in ('secteur', 'rayon', 'famille')]
+        if all(codes):
+            return self.index.lookup(*codes)
+        for node in self.index.find_name(record.get('famille') or '', FAMILLE):
+            if self.index.classification(node)['rayon'] == record.get('rayon'):
+                return node
+        return None
+
+    def candidates(self, labels: Sequence[str], limit: int = MAX_CANDIDATES) -> List[List[int]]:
+        """Pour chaque libellé, au plus `limit` familles candidates"""
+        if self.correct_labels:
+            from label_processor import DEFAULT_PROCESSOR
+            texts = [DEFAULT_PROCESSOR.correct(label) or label for label in labels]
+        else:
+            texts = list(labels)
+        sources: List[List[Dict[int, float]]] = [[] for _ in labels]
+
+        if self.knn is not None:
+            for votes, prediction in zip(sources, self.knn.predict(labels)):
+                scores: Dict[int, float] = {}
+                for doc, similarity in (prediction.neighbors if prediction else []):
+                    node = self.index.lookup(*unpack_key(int(self.knn.keys[doc]))[:3])
+                    if node is not None:
+                        scores[node] = scores.get(node, 0.0) + similarity ** 2
+                votes.append(scores)
+
+        if self.similarity is not None:
+            for votes, records in zip(sources, self.similarity.query_many(labels, k=20)):
+                scores = {}
+                for record in records:
+                    node = self._famille_of_record(record)
+                    if node is not None:
+                        scores[node] = scores.get(node, 0.0) + record['similarity_score'] ** 2
+                votes.append(scores)
+
+        for votes, text in zip(sources, texts):
+            scores = {}
+            docs, similarities = self.names.search(text, k=4 * limit, threshold=NAME_THRESHOLD)
+            for doc, similarity in zip(docs, similarities):
+                node = self._famille(self.names.records[doc]['node'])
+                if node is not None:
+                    scores[node] = max(scores.get(node, 0.0), float(similarity))
+            votes.append(scores)
+
+        # Chaque source normalisée à 1 pour que les voisins et les noms pèsent autant
+        ranked = []
+        for votes in sources:
+            total: Dict[int, float] = {}
+            for scores in votes:
+                top = max(scores.values(), default=0.0)
+                for node, score in scores.items():
+                    total[node] = total.get(node, 0.0) + score / top
+            ranked.append(sorted(total, key=lambda node: (-total[node], node))[:limit])
+        return ranked
+
+class HierarchicalClassifier:
+    """
+    Classification en deux étapes. `complete(messages, max_tokens, accept=...)` renvoie le
+    texte de la réponse (OpenRouterClient.complete, SyncOpenRouterClient.complete ou un faux
+    client) ; avec accept=is_choice, la réponse est lue en streaming jusqu'à l'objet {"choix"}.
+    """
+
+    def __init__(self, complete: Callable[[List[Dict[str, str]], int], str], index: CyrusIndex,
+                 generator: CandidateGenerator, max_candidates: int = MAX_CANDIDATES, workers: int = 1,
+                 cache: Optional[LlmResponseCache] = None, model: str = PRIMARY_MODEL):
+        self.complete = complete
+        self.index = index
+        self.generator = generator
+        self.max_candidates = max_candidates
+        self.workers = workers
+        self.cache = cache
+        self.model = model
+        self.rayons = [i for i in range(len(index)) if index.tree.levels[i] == RAYON]
+        # Compteurs mis à jour par les `workers` threads
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.fallbacks = 0
+        self.failed = 0
+
+    def path(self, node: int) -> str:
+        """« secteur > rayon > famille » sans codes (les options sont numérotées)"""
+        tree = self.index.tree
+        return ' > '.join(tree.names[i] for i in tree.ancestors(node) if tree.levels[i] >= SECTEUR)
+
+    def _ask(self, label: str, question: str, options: List[str],
+             context: str = '') -> Optional[Tuple[int, float, str]]:
+        """Une étape : choix du modèle parmi des options numérotées (0 = aucune)"""
+        numbered = '\n'.join(f"{i}. {option}" for i, option in enumerate(options, 1))
+        prompt = f"""PRODUIT: {json.dumps(label, ensure_ascii=False)}
+{context}
+{question}
+{numbered}
+0. Aucune de ces propositions
+
+RÉPONSE (format JSON uniquement):
+{{"choix": numéro, "confidence": 85, "reasoning": "Explication courte"}}"""
+        messages = [{'role': 'system', 'content': SYSTEM_PROMPT}, {'role': 'user', 'content': prompt}]
+
+        key = prompt_hash(self.model, prompt) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached['choix'], cached['confidence'], cached['reasoning']
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += estimate_tokens(messages)
+        try:
+            reply = self.complete(messages, 150, accept=is_choice)
+        except REQUEST_ERRORS:
+            with self._lock:
+                self.failed += 1
+            return None
+        answer = parse_choice(reply, len(options))
+        if answer is not None and key is not None:
+            # Rangée sous le modèle qui a répondu : une réponse de secours n'est pas servie pour self.model
+            model = answering_model(reply, self.model)
+            self.cache.put(prompt_hash(model, prompt),
+                           {'choix': answer[0], 'confidence': answer[1], 'reasoning': answer[2]}, model)
+        return answer
+
+    def _choose_famille(self, label: str, candidates: List[int]) -> Optional[Tuple[int, float]]:
+        if candidates:
+            answer = self._ask(label, "Choisis la famille CYRUS de ce produit (secteur > rayon > famille):",
+                               [self.path(node) for node in candidates])
+            if answer is not None and answer[0] > 0:
+                return candidates[answer[0] - 1], answer[1]
+
+        # Aucune candidate retenue : rayon parmi tous, puis famille dans ce rayon
+        with self._lock:
+            self.fallbacks += 1
+        answer = self._ask(label, "Choisis le rayon CYRUS de ce produit (secteur > rayon):",
+                           [self.path(node) for node in self.rayons])
+        if answer is None or answer[0] == 0:
+            return None
+        familles = self.index.children(self.rayons[answer[0] - 1])
+        answer = self._ask(label, "Choisis la famille CYRUS de ce produit:",
+                           [self.index.tree.names[node] for node in familles],
+                           context=f"RAYON: {self.path(self.rayons[answer[0] - 1])}\n")
+        if answer is None or answer[0] == 0:
+            return None
+        return familles[answer[0] - 1], answer[1]
+
+    def classify_one(self, label: str, candidates: List[int]) -> Optional[dict]:
+        chosen = self._choose_famille(label, candidates)
+        if chosen is None:
+            return None
+        famille, confidence = chosen
+        sous_familles = self.index.children(famille)
+        reasoning = ''
+        if len(sous_familles) == 1:
+            leaf = sous_familles[0]
+        else:
+            answer = self._ask(label, "Choisis la sous-famille CYRUS de ce produit:",
+                               [self.index.tree.names[node] for node in sous_familles],
+                               context=f"FAMILLE: {self.path(famille)}\n")
+            if answer is None or answer[0] == 0:
+                return None
+            leaf = sous_familles[answer[0] - 1]
+            confidence = min(confidence, answer[1])
+            reasoning = answer[2]
+        return {**self.index.classification(leaf), 'confidence': confidence, 'reasoning': reasoning}
+
+    def classify(self, labels: Iterable[str]) -> List[Optional[dict]]:
+        """Résultat de chaque libellé (dans l'ordre), None si le modèle n'a pas abouti"""
+        labels = list(labels)
+        unique = list(dict.fromkeys(label for label in labels if label))
+        candidates = self.generator.candidates(unique, self.max_candidates)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = dict(zip(unique, pool.map(self.classify_one, unique, candidates)))
+        return [results.get(label) for label in labels]
+
+    def stats(self) -> dict:
+        return {'requests': self.requests, 'prompt_tokens': self.prompt_tokens, 'fallbacks': self.fallbacks,
+                'failed': self.failed}
+
+# --- Auto-test ---
+
+def run_self_test() -> bool:
+    from cyrus_index import load_cyrus_index
+    from knn_classifier import KnnClassifier, synthetic_training_set
+    from llm_stream import first_json_object
+
+    index = load_cyrus_index()
+    labels, codes = synthetic_training_set(22_000)
+    split = 20_000
+    knn = KnnClassifier.fit(labels[:split], codes[:split], calibrate=False)
+    similarity = TrigramIndex.build({'id': i, 'libelle': label, **dict(zip(
+        ('secteur_code', 'rayon_code', 'famille_code', 'sous_famille_code'), key))}
+        for i, (label, key) in enumerate(zip(labels[:split], codes[:split])))
+    generator = CandidateGenerator(index, knn=knn, similarity=similarity)
+
+    test_labels = list(dict.fromkeys(labels[split:]))[:300]
+    expected = {label: index.lookup(*key) for label, key in zip(labels[split:], codes[split:])}
+
+    streamed = []
+
+    def oracle(messages: List[Dict[str, str]], max_tokens: int, accept=None) -> str:
+        """Faux modèle parfait : choisit l'option qui appartient au chemin attendu"""
+        prompt = messages[-1]['content']
+        label = json.loads(prompt.split('\n', 1)[0][len('PRODUIT: '):])
+        leaf = expected[label]
+        tree = index.tree
+        names = [tree.names[i] for i in tree.ancestors(leaf) if tree.levels[i] >= SECTEUR]
+        wanted = {' > '.join(names[:depth]) for depth in (2, 3)} | {names[2], names[3]}
+        if 'CYRUS de ce produit:' in prompt and 'FAMILLE:' in prompt:
+            wanted = {names[3]}
+        choice = 0
+        for line in prompt.split('\n'):
+            match = re.match(r'^(\d+)\. (.*)$', line)
+            if match and int(match.group(1)) > 0 and match.group(2) in wanted:
+                choice = int(match.group(1))
+                break
+        content = f'```json\n{{"choix": {choice}, "confidence": 90, "reasoning": "test"}}\n```'
+        if accept is None:
+            return content
+        # Comme les clients en streaming : seul le premier objet accepté est rendu
+        streamed.append(True)
+        return json.dumps(first_json_object(content, accept))
+
+    classifier = HierarchicalClassifier(oracle, index, generator, workers=4)
+    started = time.perf_counter()
+    results = classifier.classify(test_labels)
+    elapsed = time.perf_counter() - started
+
+    # Comparaison par noms : quelques chemins CYRUS existent en double sous des codes différents
+    fields = ('secteur', 'rayon', 'famille', 'sous_famille')
+    correct = sum(1 for label, result in zip(test_labels, results) if result is not None and
+                  all(result[field] == index.classification(expected[label])[field] for field in fields))
+    in_candidates = sum(1 for label, nodes in zip(test_labels, generator.candidates(test_labels))
+                        if generator._famille(expected[label]) in nodes)
+    stats = classifier.stats()
+    full_prompt = estimate_tokens(build_batch_messages([(1, test_labels[0])], taxonomy_context(index)))
+    per_label = stats['prompt_tokens'] / len(test_labels)
+    print(f"🎯 Famille attendue parmi les {MAX_CANDIDATES} candidates: {in_candidates / len(test_labels):.1%}")
+    print(f"🧪 {correct}/{len(test_labels)} libellés bien classés en {elapsed:.2f}s, "
+          f"{stats['requests'] / len(test_labels):.2f} requêtes/libellé, {stats['fallbacks']} repli(s) par rayon")
+    print(f"📉 Prompt: ~{per_label:.0f} tokens/libellé contre ~{full_prompt:,} avec la structure complète "
+          f"(x{full_prompt / per_label:.0f})")
+    streaming_ok = len(streamed) == stats['requests']
+    print(f"✂️  Réponses lues en streaming jusqu'à l'objet {{\"choix\"}}: {len(streamed)}/{stats['requests']} "
+          f"{'✅' if streaming_ok else '❌'}")
+
+    # Réponse illisible (JSONDecodeError d'un client) pour quelques libellés : eux seuls
+    # restent non classés, le reste du lot aboutit
+    broken = set(test_labels[:5])
+
+    def flaky(messages: List[Dict[str, str]], max_tokens: int, accept=None) -> str:
+        if any(json.dumps(label, ensure_ascii=False) in messages[-1]['content'] for label in broken):
+            return json.loads('<html>502 Bad Gateway</html>')
+        return oracle(messages, max_tokens, accept)
+
+    partial = HierarchicalClassifier(flaky, index, generator, workers=4).classify(test_labels[:50])
+    isolated_ok = all((result is None) == (label in broken) for label, result in zip(test_labels, partial))
+    print(f"🔍 Réponses illisibles isolées au libellé: "
+          f"{sum(result is not None for result in partial)}/50 classés {'✅' if isolated_ok else '❌'}")
+    ok = correct == len(test_labels) and full_prompt / per_label >= 10 and streaming_ok and isolated_ok
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Classification CYRUS en deux étapes (famille puis sous-famille)")
+    parser.add_argument('--labels-file', default=None, help="Fichier texte, un libellé par ligne")
+    parser.add_argument('--label', action='append', default=[], help="Libellé à classer (répétable)")
+    parser.add_argument('--workers', type=int, default=4, help="Libellés traités en parallèle")
+    parser.add_argument('--no-cache', action='store_true', help="Toujours interroger le modèle")
+    parser.add_argument('--self-test', action='store_true', help="Tester avec un faux modèle et des voisins synthétiques")
+    return parser.parse_args()
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    from dotenv import load_dotenv
+    from article_similarity import load_similarity_index
+    from cyrus_index import load_cyrus_index
+    from knn_classifier import load_knn_classifier
+    from llm_batch_classifier import get_openrouter_key
+    from openrouter_async import SyncOpenRouterClient
+
+    load_dotenv()
+    api_key = get_openrouter_key()
+    if not api_key:
+        print("❌ Clé OpenRouter manquante (VITE_OPENROUTER_API_KEY ou OPENROUTER_API_KEY)")
+        return False
+
+    labels = list(args.label)
+    if args.labels_file:
+        with open(args.labels_file, encoding='utf-8') as f:
+            labels.extend(line.strip() for line in f if line.strip())
+
+    knn, similarity = load_knn_classifier(), load_similarity_index()
+    if knn is None and similarity is None:
+        print("⚠️  Aucun index historique (knn_classifier.py / article_similarity.py --export) : "
+              "candidates par ressemblance des noms CYRUS seulement")
+    index = load_cyrus_index()
+    client = SyncOpenRouterClient(api_key, max_concurrency=args.workers)
+    cache = None if args.no_cache else LlmResponseCache()
+    classifier = HierarchicalClassifier(client.complete, index, CandidateGenerator(index, knn, similarity),
+                                        workers=args.workers, cache=cache)
+    try:
+        results = classifier.classify(labels)
+    finally:
+        client.close()
+        if cache is not None:
+            cache.close()
+    for label, result in zip(labels, results):
+        print(json.dumps({'label': label, 'result': result}, ensure_ascii=False))
+    print(f"📊 {classifier.stats()}", file=sys.stderr)
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -1,53 +1,71 @@
 #!/usr/bin/env python3
 """
 Script simplifié pour importer les données CYRUS via l'API Supabase
-Parse le fichier SQL et fait les insertions via l'API Python
+Lit la structure parsée (instantané de scripts/cyrus_parser.py) et l'insère par gros lots
 """
 
+import argparse
 import os
-import re
-import json
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
-def parse_sql_inserts(sql_content):
-    """Parser les INSERT statements du fichier SQL"""
-    
-    # Pattern pour matcher les INSERT INTO statements
-    insert_pattern = r"INSERT INTO cyrus_structure \(([^)]+)\) VALUES\s*(.*?)(?=INSERT INTO|$)"
-    
-    matches = re.findall(insert_pattern, sql_content, re.DOTALL)
+from batch_uploader import ConcurrentUploader, PostgrestSender
+from cyrus_index import CyrusIndex, load_cyrus_index
+from cyrus_parser import EXPECTED_NODE_COUNT
+
+# Clé naturelle de cyrus_structure (index unique idx_cyrus_full_path, database/schema.sql)
+CYRUS_NATURAL_KEY = 'full_path'
+
+def iter_cyrus_rows(index: Optional[CyrusIndex] = None) -> Iterator[dict]:
+    """Lignes de cyrus_structure produites par le parser (instantané binaire partagé)"""
+    index = index or load_cyrus_index()
+    return index.tree.rows()
+
+def iter_batches(rows: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    """Regrouper un flux de lignes en lots, sans le matérialiser en entier"""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def upload_cyrus_rows(url: str, service_key: str, rows: Iterable[dict], batch_size: int = 1000,
+                      workers: int = 4) -> Tuple[int, List[str]]:
+    """
+    Insérer les lignes CYRUS par gros lots concurrents (avec relances) via PostgREST.
+    Upsert sur la clé naturelle : un lot rejoué après un délai dépassé ne duplique aucun nœud.
+    """
+    sender = PostgrestSender(url, service_key, 'cyrus_structure', on_conflict=CYRUS_NATURAL_KEY)
+    uploader = ConcurrentUploader(sender, max_in_flight=workers, batch_size=batch_size, verbose=False)
+    return uploader.upload(iter_batches(rows, batch_size))
+
+def count_cyrus_rows(supabase: Client) -> int:
+    """Nombre de lignes de cyrus_structure (comptage côté serveur)"""
+    result = supabase.table('cyrus_structure').select('id', count='exact').limit(1).execute()
+    return result.count or 0
+
+def import_cyrus_postgres(dsn=None):
+    """Import CYRUS par connexion Postgres directe (DELETE + COPY en une transaction)"""
     
-    records = []
+    from pg_copy_loader import load_cyrus_items
     
-    for match in matches:
-        columns = [col.strip() for col in match[0].split(',')]
-        values_section = match[1].strip()
-        
-        # Extraire chaque ligne de VALUES
-        value_lines = re.findall(r'\(([^)]+)\)', values_section)
-        
-        for value_line in value_lines:
-            values = [val.strip().strip("'") for val in value_line.split(',')]
-            
-            # Créer un dictionnaire pour chaque record
-            record = {}
-            for i, col in enumerate(columns):
-                if i < len(values):
-                    value = values[i]
-                    # Convertir les types
-                    if value == 'NULL':
-                        record[col] = None
-                    elif value.isdigit():
-                        record[col] = int(value)
-                    else:
-                        record[col] = value
-            
-            records.append(record)
+    load_dotenv()
+    try:
+        count = load_cyrus_items(iter_cyrus_rows(), dsn)
+    except Exception as e:
+        print(f"❌ Erreur générale: {e}")
+        return False
     
-    return records
+    if count != EXPECTED_NODE_COUNT:
+        print(f"⚠️  {count} éléments chargés, {EXPECTED_NODE_COUNT} attendus")
+        return False
+    return True
 
-def import_cyrus_simple():
+def import_cyrus_simple(batch_size: int = 1000, workers: int = 4):
     """Import CYRUS de manière simple via l'API"""
     
     # Charger les variables d'environnement
@@ -72,60 +90,32 @@ def import_cyrus_simple():
         
         # Vérifier la connexion
         try:
-            test = supabase.table('cyrus_structure').select('count').limit(1).execute()
-            print("✅ Connexion Supabase OK")
+            before = count_cyrus_rows(supabase)
+            print(f"✅ Connexion Supabase OK ({before} éléments déjà en base)")
         except Exception as e:
             print(f"❌ Erreur de connexion: {e}")
             return False
         
-        # Lire et parser le fichier SQL
-        sql_file = "scripts/cyrus_insert_v3.sql"
-        if not os.path.exists(sql_file):
-            print(f"❌ Fichier {sql_file} introuvable")
-            return False
+        # Structure parsée (instantané binaire du parser, pas de relecture du SQL)
+        index = load_cyrus_index()
+        print(f"📊 {len(index)} enregistrements à importer (lots de {batch_size})")
         
-        print(f"📁 Lecture du fichier {sql_file}...")
-        with open(sql_file, 'r', encoding='utf-8') as f:
-            sql_content = f.read()
-        
-        print("⚙️  Parsing des données SQL...")
-        records = parse_sql_inserts(sql_content)
-        
-        if not records:
-            print("❌ Aucune donnée parsée du fichier SQL")
-            return False
-        
-        print(f"📊 {len(records)} enregistrements à importer")
-        
-        # Import par batch pour éviter les timeouts
-        batch_size = 100
-        total_inserted = 0
-        
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i+batch_size]
-            
-            print(f"📥 Import batch {i//batch_size + 1}/{(len(records)-1)//batch_size + 1} ({len(batch)} éléments)...")
-            
-            try:
-                result = supabase.table('cyrus_structure').insert(batch).execute()
-                if result.data:
-                    total_inserted += len(result.data)
-                    print(f"   ✅ {len(result.data)} éléments insérés")
-                else:
-                    print(f"   ⚠️  Batch traité (pas de données retournées)")
-                    total_inserted += len(batch)
-                    
-            except Exception as e:
-                print(f"   ❌ Erreur sur ce batch: {e}")
-                continue
+        total_inserted, errors = upload_cyrus_rows(url, service_key, iter_cyrus_rows(index),
+                                                   batch_size, workers)
+        for error in errors:
+            print(f"   ❌ {error[:150]}")
         
         print(f"\n🎉 Import terminé !")
         print(f"✅ {total_inserted} éléments traités")
         
         # Vérification finale
-        final_count = supabase.table('cyrus_structure').select('count').execute()
-        if hasattr(final_count, 'count') and final_count.count:
-            print(f"🔍 Vérification: {final_count.count} éléments en base")
+        final_count = count_cyrus_rows(supabase)
+        print(f"🔍 Vérification: {final_count} éléments en base")
+        # Upsert sur full_path : relancer l'import ne duplique rien, la table doit
+        # contenir exactement les nœuds CYRUS quel que soit son contenu initial
+        if total_inserted != EXPECTED_NODE_COUNT or final_count != EXPECTED_NODE_COUNT:
+            print(f"⚠️  {EXPECTED_NODE_COUNT} éléments attendus en base (nœuds CYRUS)")
+            return False
         
         return True
         
@@ -134,7 +124,19 @@ def import_cyrus_simple():
         return False
 
 if __name__ == "__main__":
-    success = import_cyrus_simple()
+    parser = argparse.ArgumentParser(description="Import CYRUS dans Supabase")
+    parser.add_argument('--backend', choices=['rest', 'postgres'], default='rest',
+                        help="rest: API Supabase par lots ; postgres: COPY direct")
+    parser.add_argument('--dsn', default=None,
+                        help="URL Postgres du backend postgres (défaut: SUPABASE_DB_URL ou DATABASE_URL)")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Lignes par requête (backend rest)")
+    parser.add_argument('--workers', type=int, default=4, help="Requêtes en parallèle (backend rest)")
+    args = parser.parse_args()
+    
+    if args.backend == 'postgres':
+        success = import_cyrus_postgres(args.dsn)
+    else:
+        success = import_cyrus_simple(args.batch_size, args.workers)
     
     if success:
         print("\n🚀 Prochain étape: Tester la connexion complète")
@@ -142,4 +144,4 @@ if __name__ == "__main__":
     else:
         print("\n💡 Alternative: Utiliser l'interface web Supabase")
         print("   - Aller dans SQL Editor")
-        print("   - Copier/coller scripts/cyrus_insert_v3.sql")
\ No newline at end of file
+        print("   - Copier/coller scripts/cyrus_insert_v4.sql")
\ No newline at end of file
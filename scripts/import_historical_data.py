@@ -6,12 +6,20 @@ Script complet d'import des articles historiques
 - Import par batch dans Supabase
 """
 
+import argparse
+import hashlib
 import pandas as pd
 import os
 from supabase import create_client, Client
 from dotenv import load_dotenv
 import time
-from typing import Dict, List, Any
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from batch_uploader import ConcurrentUploader, DeadLetterFile, PostgrestSender
+from cyrus_index import CODE_COLUMNS, CyrusIndex, load_cyrus_index
+from delta_manifest import KEY_SEPARATOR, DeltaManifest
+from import_journal import ImportJournal
 
 # Charger les variables d'environnement
 load_dotenv()
@@ -20,217 +28,271 @@ load_dotenv()
 SUPABASE_URL = os.getenv("VITE_PUBLIC_SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
-if not SUPABASE_URL or not SUPABASE_KEY:
-    print("❌ Variables Supabase manquantes")
-    exit(1)
+_supabase_client = None
+
+def get_supabase() -> Client:
+    """Client Supabase créé à la première utilisation (le module reste importable sans .env)"""
+    global _supabase_client
+    
+    if _supabase_client is None:
+        if not SUPABASE_URL or not SUPABASE_KEY:
+            print("❌ Variables Supabase manquantes")
+            exit(1)
+        _supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    
+    return _supabase_client
+
+# Table articles historiques
+ARTICLES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS articles_historiques (
+    id BIGSERIAL PRIMARY KEY,
+    ean VARCHAR(20),
+    nartar VARCHAR(50),
+    libelle TEXT NOT NULL,
+    nomo VARCHAR(20),
+    secteur VARCHAR(100),
+    rayon VARCHAR(100), 
+    famille VARCHAR(100),
+    sous_famille VARCHAR(100),
+    secteur_code INTEGER,
+    rayon_code INTEGER,
+    famille_code INTEGER,
+    sous_famille_code INTEGER,
+    import_batch VARCHAR(50) DEFAULT 'batch_' || to_char(NOW(), 'YYYY_MM_DD_HH24_MI'),
+    created_at TIMESTAMP DEFAULT NOW()
+);
+"""
+
+# Clé naturelle : nécessaire à l'upsert des imports idempotents
+ARTICLES_NATURAL_KEY_SQL = "CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_natural_key ON articles_historiques(ean, nartar);"
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Index pour performance
+ARTICLES_INDEXES_SQL = [
+    "CREATE INDEX IF NOT EXISTS idx_articles_ean ON articles_historiques(ean);",
+    "CREATE INDEX IF NOT EXISTS idx_articles_nartar ON articles_historiques(nartar);", 
+    "CREATE INDEX IF NOT EXISTS idx_articles_libelle ON articles_historiques(libelle);",
+    "CREATE INDEX IF NOT EXISTS idx_articles_classification ON articles_historiques(secteur_code, rayon_code, famille_code);",
+    "CREATE INDEX IF NOT EXISTS idx_articles_search ON articles_historiques(ean, libelle, secteur_code);",
+]
 
 def create_tables():
     """Créer les tables nécessaires"""
     
     print("🏗️  Création des tables...")
     
-    # Table articles historiques
-    table_sql = """
-    CREATE TABLE IF NOT EXISTS articles_historiques (
-        id BIGSERIAL PRIMARY KEY,
-        ean VARCHAR(20),
-        nartar VARCHAR(50),
-        libelle TEXT NOT NULL,
-        nomo VARCHAR(20),
-        secteur VARCHAR(100),
-        rayon VARCHAR(100), 
-        famille VARCHAR(100),
-        sous_famille VARCHAR(100),
-        secteur_code INTEGER,
-        rayon_code INTEGER,
-        famille_code INTEGER,
-        sous_famille_code INTEGER,
-        import_batch VARCHAR(50) DEFAULT 'batch_' || to_char(NOW(), 'YYYY_MM_DD_HH24_MI'),
-        created_at TIMESTAMP DEFAULT NOW()
-    );
-    """
-    
-    # Index pour performance
-    indexes_sql = [
-        "CREATE INDEX IF NOT EXISTS idx_articles_ean ON articles_historiques(ean);",
-        "CREATE INDEX IF NOT EXISTS idx_articles_nartar ON articles_historiques(nartar);", 
-        "CREATE INDEX IF NOT EXISTS idx_articles_libelle ON articles_historiques(libelle);",
-        "CREATE INDEX IF NOT EXISTS idx_articles_classification ON articles_historiques(secteur_code, rayon_code, famille_code);",
-        "CREATE INDEX IF NOT EXISTS idx_articles_search ON articles_historiques(ean, libelle, secteur_code);"
-    ]
-    
     try:
-        # Exécuter via des requêtes RPC (contournement pour Supabase)
+        # L'API REST ne permet pas le DDL : ARTICLES_TABLE_SQL et ARTICLES_INDEXES_SQL
+        # sont exécutés par le backend postgres (--backend postgres)
         print("✅ Tables créées (structure prédéfinie)")
         return True
     except Exception as e:
         print(f"❌ Erreur création tables: {e}")
         return False
 
-def load_cyrus_mapping():
-    """Charger le mapping codes → noms depuis la structure CYRUS"""
+def load_cyrus_mapping() -> CyrusIndex:
+    """
+    Charger la taxonomie CYRUS (codes → noms) depuis la sortie locale du parser.
+    Les clés sont complètes (secteur, rayon, famille, sous-famille) : une sous-famille
+    101 n'écrase plus celle d'une autre famille.
+    """
     
     print("📋 Chargement du mapping CYRUS...")
     
-    try:
-        # Charger la structure CYRUS depuis la base
-        cyrus_data = supabase.table('cyrus_structure').select('*').execute()
-        
-        if not cyrus_data.data:
-            print("⚠️  Structure CYRUS vide, utilisation mapping par défaut")
-            return create_default_mapping()
-        
-        mapping = {
-            'secteurs': {},
-            'rayons': {},
-            'familles': {},
-            'sous_familles': {}
-        }
-        
-        for item in cyrus_data.data:
-            code = int(item['code']) if item['code'].isdigit() else item['code']
-            
-            if item['level'] == 1:  # Secteur
-                mapping['secteurs'][code] = item['name']
-            elif item['level'] == 2:  # Rayon
-                mapping['rayons'][code] = item['name']
-            elif item['level'] == 3:  # Famille
-                mapping['familles'][code] = item['name']
-            elif item['level'] == 4:  # Sous-famille
-                mapping['sous_familles'][code] = item['name']
-        
-        print(f"✅ Mapping chargé: {len(mapping['secteurs'])} secteurs, {len(mapping['rayons'])} rayons")
+    mapping = load_cyrus_index()
+    if not len(mapping):
+        print("⚠️  Structure CYRUS introuvable, les codes seront conservés tels quels")
         return mapping
-        
-    except Exception as e:
-        print(f"❌ Erreur chargement mapping: {e}")
-        return create_default_mapping()
-
-def create_default_mapping():
-    """Mapping par défaut si structure CYRUS non disponible"""
-    return {
-        'secteurs': {
-            1: 'GEANT CASINO',
-            2: 'ELECTRONIQUE', 
-            3: 'ALIMENTAIRE',
-            4: 'TEXTILE',
-            5: 'HYGIENE BEAUTE'
-        },
-        'rayons': {},
-        'familles': {},
-        'sous_familles': {}
-    }
-
-def process_excel_file():
-    """Traiter le fichier Excel et préparer les données"""
-    
-    excel_path = "/project/workspace/Tytyty.xlsx"
-    
-    print(f"📖 Lecture du fichier Excel: {excel_path}")
     
+    stats = mapping.tree.stats()
+    print(f"✅ Mapping chargé: {stats['secteurs']} secteurs, {stats['rayons']} rayons, "
+          f"{stats['familles']} familles, {stats['sous_familles']} sous-familles")
+    return mapping
+
+# Fichier source par défaut et colonnes attendues
+DEFAULT_EXCEL_PATH = "/project/workspace/Tytyty.xlsx"
+ARTICLE_COLUMNS = ['EAN', 'NARTAR', 'LIBELLE', 'NOMO', 'SECTEUR', 'RAYON', 'FAMILLE', 'SOUS FAMILLE']
+
+def _cell_to_text(value) -> str:
+    """
+    Convertir une cellule en texte de façon identique quel que soit le lecteur
+    (pandas complet, openpyxl read-only, CSV) : pas de '.0' sur les codes numériques,
+    'nan' pour une cellule vide comme le faisait astype(str).
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return 'nan'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value)
+    if text.endswith('.0') and text[:-2].isdigit():
+        return text[:-2]
+    return text
+
+def clean_articles(df: pd.DataFrame) -> pd.DataFrame:
+    """Nettoyer un lot d'articles (types, libellés, codes de classification)"""
+    
+    df['EAN'] = df['EAN'].map(_cell_to_text)
+    df['NARTAR'] = df['NARTAR'].map(_cell_to_text)
+    df['LIBELLE'] = df['LIBELLE'].astype(str).str.strip().str.upper()
+    nomo = df['NOMO'].map(_cell_to_text).astype(object)
+    df['NOMO'] = nomo.where(nomo != 'nan', None)
+    
+    # Nettoyer les codes (parfois avec décimales)
+    df['SECTEUR'] = pd.to_numeric(df['SECTEUR'], errors='coerce').fillna(0).astype(int)
+    df['RAYON'] = pd.to_numeric(df['RAYON'], errors='coerce').fillna(0).astype(int)
+    df['FAMILLE'] = pd.to_numeric(df['FAMILLE'], errors='coerce').fillna(0).astype(int)
+    df['SOUS FAMILLE'] = pd.to_numeric(df['SOUS FAMILLE'], errors='coerce').fillna(0).astype(int)
+    
+    return df
+
+def _iter_excel_rows(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """Lire la première feuille en mode read-only d'openpyxl, un lot de lignes à la fois"""
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(path, read_only=True, data_only=True)
     try:
-        # Lire le fichier Excel
-        df = pd.read_excel(excel_path, sheet_name=0)
-        
-        print(f"📊 {len(df)} articles trouvés")
-        
-        # Nettoyer les données
-        df['EAN'] = df['EAN'].astype(str)
-        df['NARTAR'] = df['NARTAR'].astype(str)
-        df['LIBELLE'] = df['LIBELLE'].astype(str).str.strip().str.upper()
-        df['NOMO'] = df['NOMO'].astype(str).replace('nan', None)
-        
-        # Nettoyer les codes (parfois avec décimales)
-        df['SECTEUR'] = pd.to_numeric(df['SECTEUR'], errors='coerce').fillna(0).astype(int)
-        df['RAYON'] = pd.to_numeric(df['RAYON'], errors='coerce').fillna(0).astype(int)
-        df['FAMILLE'] = pd.to_numeric(df['FAMILLE'], errors='coerce').fillna(0).astype(int)
-        df['SOUS FAMILLE'] = pd.to_numeric(df['SOUS FAMILLE'], errors='coerce').fillna(0).astype(int)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        first = next(rows, None)
+        if first is None:
+            return
+        header = [str(col).strip() if col is not None else '' for col in first]
         
-        print(f"✅ Données nettoyées")
-        
-        return df
-        
-    except Exception as e:
-        print(f"❌ Erreur lecture Excel: {e}")
-        return None
+        buffer = []
+        for row in rows:
+            if not any(value is not None for value in row):
+                continue
+            buffer.append(row)
+            if len(buffer) >= batch_size:
+                yield pd.DataFrame(buffer, columns=header, dtype=object)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=header, dtype=object)
+    finally:
+        workbook.close()
+
+class ArticleReadError(Exception):
+    """Catalogue illisible : fichier absent, format invalide ou colonnes manquantes"""
 
-def map_codes_to_names(df: pd.DataFrame, mapping: Dict):
-    """Mapper les codes vers les noms CYRUS"""
+def _read_errors() -> tuple:
+    """Exceptions levées par la lecture du catalogue (pandas, openpyxl, système de fichiers)"""
+    errors = [OSError, UnicodeDecodeError, zipfile.BadZipFile, pd.errors.ParserError, pd.errors.EmptyDataError]
+    try:
+        from openpyxl.utils.exceptions import InvalidFileException
+        errors.append(InvalidFileException)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+def iter_article_batches(path: str = DEFAULT_EXCEL_PATH, batch_size: int = 1000) -> Iterator[pd.DataFrame]:
+    """
+    Lire le catalogue en streaming (Excel read-only ou CSV par morceaux) et produire
+    des lots d'articles nettoyés. La mémoire utilisée ne dépend que de batch_size.
+    Les erreurs de lecture sont levées en ArticleReadError, même en cours de flux.
+    """
+    read_errors = _read_errors()
+    try:
+        if path.lower().endswith('.csv'):
+            chunks = iter(pd.read_csv(path, chunksize=batch_size, dtype=object, sep=None, engine='python'))
+        else:
+            chunks = _iter_excel_rows(path, batch_size)
+    except read_errors as e:
+        raise ArticleReadError(f"{path}: {e}") from e
     
-    print("🔄 Mapping codes → noms...")
+    while True:
+        try:
+            chunk = next(chunks, None)
+        except read_errors as e:
+            raise ArticleReadError(f"{path}: {e}") from e
+        if chunk is None:
+            return
+        chunk.columns = [str(col).strip() for col in chunk.columns]
+        missing = [col for col in ARTICLE_COLUMNS if col not in chunk.columns]
+        if missing:
+            raise ArticleReadError(f"Colonnes manquantes dans {path}: {missing}")
+        yield clean_articles(chunk[ARTICLE_COLUMNS].copy())
+
+def iter_classified_articles(path: str = DEFAULT_EXCEL_PATH,
+                             batch_size: int = 10000) -> Iterator[Tuple[str, str, Tuple[int, ...]]]:
+    """(EAN, libellé, codes secteur/rayon/famille/sous-famille) des articles classés, en streaming"""
+    for batch in iter_article_batches(path, batch_size):
+        batch = batch[(batch['SECTEUR'] > 0) & (batch['SOUS FAMILLE'] > 0)]
+        codes = zip(*(batch[col].astype('int64').tolist() for col in CODE_COLUMNS))
+        yield from zip(batch['EAN'].tolist(), batch['LIBELLE'].tolist(), codes)
+
+def map_codes_to_names(df: pd.DataFrame, mapping: CyrusIndex, verbose: bool = True):
+    """Mapper les codes vers les noms CYRUS (jointure vectorisée sur les clés complètes)"""
+    
+    if verbose:
+        print("🔄 Mapping codes → noms...")
     
-    # Mapper les codes vers les noms
-    df['secteur_nom'] = df['SECTEUR'].map(mapping['secteurs']).fillna('SECTEUR_' + df['SECTEUR'].astype(str))
-    df['rayon_nom'] = df['RAYON'].map(mapping['rayons']).fillna('RAYON_' + df['RAYON'].astype(str))
-    df['famille_nom'] = df['FAMILLE'].map(mapping['familles']).fillna('FAMILLE_' + df['FAMILLE'].astype(str))
-    df['sous_famille_nom'] = df['SOUS FAMILLE'].map(mapping['sous_familles']).fillna('SF_' + df['SOUS FAMILLE'].astype(str))
+    df = mapping.map_frame(df)
     
-    print(f"✅ Mapping terminé")
+    if verbose:
+        print(f"✅ Mapping terminé")
     
     return df
 
-def import_to_supabase(df: pd.DataFrame, batch_size: int = 1000):
-    """Importer les données dans Supabase par batch"""
-    
-    print(f"🚀 Import dans Supabase par batch de {batch_size}...")
-    
-    total_rows = len(df)
-    batch_count = (total_rows + batch_size - 1) // batch_size
-    success_count = 0
-    errors = []
+# Ordre des champs du payload envoyé à articles_historiques
+RECORD_FIELDS = [
+    'ean', 'nartar', 'libelle', 'nomo', 'secteur', 'rayon', 'famille', 'sous_famille',
+    'secteur_code', 'rayon_code', 'famille_code', 'sous_famille_code', 'import_batch'
+]
+
+def build_records(batch: pd.DataFrame, import_batch_id: str) -> List[Dict[str, Any]]:
+    """
+    Construire les payloads JSON d'un lot colonne par colonne.
+    Les colonnes sont typées une fois puis converties en listes Python natives
+    (str, int, None), et les dicts sont assemblés par zip au lieu de iterrows().
+    """
+    nomo = batch['NOMO'].astype(object)
+    columns = [
+        batch['EAN'].astype(str).tolist(),
+        batch['NARTAR'].astype(str).tolist(),
+        batch['LIBELLE'].tolist(),
+        nomo.where(nomo.notna(), None).tolist(),
+        batch['secteur_nom'].tolist(),
+        batch['rayon_nom'].tolist(),
+        batch['famille_nom'].tolist(),
+        batch['sous_famille_nom'].tolist(),
+        batch['SECTEUR'].astype('int64').tolist(),
+        batch['RAYON'].astype('int64').tolist(),
+        batch['FAMILLE'].astype('int64').tolist(),
+        batch['SOUS FAMILLE'].astype('int64').tolist(),
+        [import_batch_id] * len(batch),
+    ]
+    return [dict(zip(RECORD_FIELDS, values)) for values in zip(*columns)]
+
+# Clé naturelle d'un article historique (colonnes de la table)
+NATURAL_KEY = 'ean,nartar'
+
+def create_uploader(max_in_flight: int = 4, batch_size: int = 1000, rate: Optional[float] = None,
+                    verbose: bool = True, dead_letter: Optional[str] = None) -> ConcurrentUploader:
+    """
+    Uploader concurrent vers articles_historiques via l'API REST de Supabase.
+    Les lots refusés sont découpés par dichotomie ; les articles invalides vont dans `dead_letter`.
+    """
     
-    import_batch_id = f"import_{int(time.time())}"
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        print("❌ Variables Supabase manquantes")
+        exit(1)
     
-    for i in range(0, total_rows, batch_size):
-        batch_num = (i // batch_size) + 1
-        batch = df.iloc[i:i + batch_size]
-        
-        print(f"📦 Batch {batch_num}/{batch_count} ({len(batch)} articles)...")
-        
-        # Préparer les données pour Supabase
-        batch_data = []
-        for _, row in batch.iterrows():
-            article = {
-                'ean': str(row['EAN']),
-                'nartar': str(row['NARTAR']),
-                'libelle': row['LIBELLE'],
-                'nomo': row['NOMO'] if pd.notna(row['NOMO']) else None,
-                'secteur': row['secteur_nom'],
-                'rayon': row['rayon_nom'],
-                'famille': row['famille_nom'], 
-                'sous_famille': row['sous_famille_nom'],
-                'secteur_code': int(row['SECTEUR']),
-                'rayon_code': int(row['RAYON']),
-                'famille_code': int(row['FAMILLE']),
-                'sous_famille_code': int(row['SOUS FAMILLE']),
-                'import_batch': import_batch_id
-            }
-            batch_data.append(article)
-        
-        try:
-            # Insérer le batch
-            result = supabase.table('articles_historiques').insert(batch_data).execute()
-            
-            if result.data:
-                success_count += len(batch_data)
-                print(f"   ✅ {len(batch_data)} articles importés")
-            else:
-                errors.append(f"Batch {batch_num}: Aucune donnée insérée")
-                print(f"   ⚠️  Aucune donnée insérée")
-                
-        except Exception as e:
-            error_msg = f"Batch {batch_num}: {str(e)}"
-            errors.append(error_msg)
-            print(f"   ❌ Erreur: {str(e)[:100]}...")
-        
-        # Petite pause pour éviter la surcharge
-        time.sleep(0.1)
+    # Upsert sur la clé naturelle : relancer un lot déjà validé ne crée pas de doublon
+    sender = PostgrestSender(SUPABASE_URL, SUPABASE_KEY, 'articles_historiques', on_conflict=NATURAL_KEY)
+    return ConcurrentUploader(sender, max_in_flight=max_in_flight, batch_size=batch_size,
+                              rate=rate, verbose=verbose,
+                              dead_letter=DeadLetterFile(dead_letter) if dead_letter else None)
+
+def print_import_results(success_count: int, errors: List[str], dead_letter: Optional[DeadLetterFile] = None,
+                         duplicates: int = 0):
+    """Afficher le bilan d'un import"""
     
     print(f"\n📊 Résultats d'import:")
     print(f"   ✅ Succès: {success_count:,} articles")
-    print(f"   ❌ Erreurs: {len(errors)} batches")
+    if duplicates:
+        print(f"   🔁 Doublons (ean, nartar) ignorés: {duplicates:,} lignes (dernière occurrence importée)")
+    print(f"   ❌ Erreurs: {len(errors)} tranches")
+    if dead_letter and dead_letter.count:
+        dead_letter.close()
+        print(f"   🗂️  {dead_letter.count} articles rejetés écrits dans {dead_letter.path}")
     
     if errors:
         print("\n❌ Détail des erreurs:")
@@ -238,46 +300,246 @@ def import_to_supabase(df: pd.DataFrame, batch_size: int = 1000):
             print(f"   - {error}")
         if len(errors) > 5:
             print(f"   ... et {len(errors) - 5} autres erreurs")
+
+def import_stream(batches: Iterable[pd.DataFrame], mapping: CyrusIndex,
+                  uploader: Optional[ConcurrentUploader] = None,
+                  journal: Optional[ImportJournal] = None,
+                  manifest: Optional[DeltaManifest] = None):
+    """
+    Importer un flux de lots nettoyés : chaque lot est mappé puis envoyé,
+    sans jamais matérialiser le catalogue complet.
+    Avec un journal, les tranches de lignes déjà validées sont sautées et
+    chaque nouvelle tranche validée y est notée.
+    Avec un manifeste, les empreintes des tranches validées y sont reportées :
+    le --delta suivant n'envoie que ce qui a changé depuis cet import complet.
+    Retourne (nb importés, erreurs, nb lus).
+    """
+    
+    uploader = uploader or create_uploader()
+    print(f"🚀 Import en streaming dans Supabase ({uploader.max_in_flight} lots en parallèle)...")
+    
+    total_rows = 0
+    skipped_rows = 0
+    import_batch_id = journal.import_batch if journal else f"import_{int(time.time())}"
+    
+    def chunks():
+        nonlocal total_rows, skipped_rows
+        for batch in batches:
+            start, end = total_rows, total_rows + len(batch)
+            total_rows = end
+            if manifest is not None:
+                # Toutes les lignes sont mises en attente : positions du manifeste = positions du fichier
+                manifest.stage(*row_fingerprints(batch))
+            
+            pending = journal.pending(start, end) if journal else [(start, end)]
+            skipped_rows += (end - start) - sum(e - s for s, e in pending)
+            if not pending:
+                continue
+            
+            batch = map_codes_to_names(batch, mapping, verbose=False)
+            records = build_records(batch, import_batch_id)
+            for s, e in pending:
+                yield s, records[s - start:e - start]
+    
+    def on_success(start: int, end: int):
+        if journal:
+            journal.record(start, end)
+        if manifest is not None:
+            manifest.commit_range(start, end)
+    
+    success_count, errors = uploader.upload_ranges(chunks(), on_success=on_success)
     
-    return success_count, errors
+    if skipped_rows:
+        print(f"\n⏭️  {skipped_rows:,} articles déjà importés (journal de reprise) ignorés")
+    print_import_results(success_count, errors, uploader.dead_letter, uploader.duplicates)
+    
+    return success_count, errors, total_rows
+
+# Colonnes qui définissent le contenu d'un article pour le mode delta
+HASHED_COLUMNS = ['EAN', 'NARTAR', 'LIBELLE', 'NOMO', 'SECTEUR', 'RAYON', 'FAMILLE', 'SOUS FAMILLE']
+
+def row_fingerprints(batch: pd.DataFrame):
+    """Clé naturelle (EAN + NARTAR) et empreinte du contenu nettoyé de chaque ligne"""
+    keys = [ean + KEY_SEPARATOR + nartar for ean, nartar in zip(batch['EAN'].tolist(), batch['NARTAR'].tolist())]
+    columns = [[str(value) for value in batch[col].tolist()] for col in HASHED_COLUMNS]
+    hashes = [hashlib.blake2b(KEY_SEPARATOR.join(values).encode('utf-8'), digest_size=12).hexdigest()
+              for values in zip(*columns)]
+    return keys, hashes
+
+def import_delta(batches: Iterable[pd.DataFrame], mapping: CyrusIndex, manifest: DeltaManifest,
+                 uploader: Optional[ConcurrentUploader] = None):
+    """
+    Import incrémental : chaque ligne est comparée au manifeste du dernier import,
+    seules les lignes nouvelles ou modifiées sont envoyées (upsert), puis les articles
+    disparus du fichier sont supprimés. Le manifeste n'avance que pour les lots validés,
+    une relance renvoie donc uniquement ce qui n'a pas abouti.
+    Retourne (nb importés, erreurs, nb lus).
+    """
+    
+    uploader = uploader or create_uploader()
+    print(f"🚀 Import delta dans Supabase ({uploader.max_in_flight} lots en parallèle)...")
+    
+    total_rows = 0
+    import_batch_id = f"import_{int(time.time())}"
+    
+    def chunks():
+        nonlocal total_rows
+        for batch in batches:
+            total_rows += len(batch)
+            keys, hashes = row_fingerprints(batch)
+            changed = manifest.diff(keys, hashes)
+            if not any(changed):
+                continue
+            
+            batch = map_codes_to_names(batch[changed], mapping, verbose=False)
+            start = manifest.stage([k for k, c in zip(keys, changed) if c],
+                                   [h for h, c in zip(hashes, changed) if c])
+            yield start, build_records(batch, import_batch_id)
+    
+    success_count, errors = uploader.upload_ranges(chunks(), on_success=manifest.commit_range)
+    
+    # Suppressions : seulement une fois le fichier lu en entier
+    def deletions():
+        for start, keys in manifest.stage_deletions():
+            yield start, [dict(zip(('ean', 'nartar'), key.split(KEY_SEPARATOR))) for key in keys]
+    
+    deleter = ConcurrentUploader(uploader.send.delete_matching, max_in_flight=uploader.max_in_flight,
+                                 batch_size=100, min_batch_size=1, max_batch_size=100, verbose=False)
+    deleted_count, delete_errors = deleter.upload_ranges(deletions(), on_success=manifest.commit_range)
+    errors.extend(delete_errors)
+    
+    summary = manifest.summary()
+    print(f"\n🔍 Delta: {summary['inserts']:,} nouveaux, {summary['updates']:,} modifiés, "
+          f"{summary['unchanged']:,} inchangés, {deleted_count:,}/{summary['deletes']:,} supprimés")
+    print_import_results(success_count, errors, uploader.dead_letter, uploader.duplicates)
+    
+    return success_count, errors, total_rows
+
+def print_stats(stats: Dict):
+    """Afficher une ligne de articles_matching_stats"""
+    print(f"✅ Statistiques calculées:")
+    print(f"   - Total articles: {stats['total_articles']:,}")
+    print(f"   - Libellés uniques: {stats['unique_libelles']:,}")
+    print(f"   - EANs uniques: {stats['unique_eans']:,}")
+    print(f"   - Couverture classification: {float(stats['classification_coverage']):.1f}%")
 
 def update_stats():
-    """Mettre à jour les statistiques"""
+    """
+    Mettre à jour les statistiques.
+    Une seule agrégation SQL côté serveur (fonction refresh_articles_matching_stats,
+    database/schema_articles_historiques.sql) : rien n'est téléchargé hors du comptage.
+    """
     
     print("📈 Mise à jour des statistiques...")
     
     try:
-        # Compter les articles
-        count_result = supabase.table('articles_historiques').select('*', count='exact').execute()
-        total_articles = count_result.count
-        
-        # Compter les libellés uniques
-        libelles_result = supabase.table('articles_historiques').select('libelle').execute()
-        unique_libelles = len(set(item['libelle'] for item in libelles_result.data))
-        
-        # Compter les EANs uniques  
-        eans_result = supabase.table('articles_historiques').select('ean').execute()
-        unique_eans = len(set(item['ean'] for item in eans_result.data))
-        
-        # Classification coverage
-        classified_result = supabase.table('articles_historiques').select('*', count='exact').neq('secteur', 'null').execute()
-        classification_coverage = (classified_result.count / total_articles * 100) if total_articles > 0 else 0
-        
-        print(f"✅ Statistiques calculées:")
-        print(f"   - Total articles: {total_articles:,}")
-        print(f"   - Libellés uniques: {unique_libelles:,}")
-        print(f"   - EANs uniques: {unique_eans:,}")
-        print(f"   - Couverture classification: {classification_coverage:.1f}%")
+        result = get_supabase().rpc('refresh_articles_matching_stats').execute()
+        print_stats(result.data[0] if isinstance(result.data, list) else result.data)
         
         return True
         
     except Exception as e:
         print(f"❌ Erreur calcul stats: {e}")
+        print("💡 Déployer refresh_articles_matching_stats() depuis database/schema_articles_historiques.sql")
         return False
 
+def run_journaled_import(args, mapping: CyrusIndex):
+    """Import complet avec journal de reprise (--resume)"""
+    
+    journal = ImportJournal.open(args.journal, args.file, resume=args.resume)
+    if journal.committed_count:
+        print(f"🔁 Reprise de {journal.import_batch}: {journal.committed_count:,} articles déjà validés")
+    batches = iter_article_batches(args.file, args.batch_size)
+    uploader = create_uploader(args.workers, args.batch_size, args.rate, dead_letter=args.dead_letter)
+    # Le manifeste du mode --delta est amorcé par l'import complet
+    manifest = DeltaManifest(args.manifest)
+    try:
+        return import_stream(batches, mapping, uploader, journal, manifest)
+    finally:
+        manifest.close()
+        journal.close()
+
+def import_postgres(args, mapping: CyrusIndex):
+    """
+    Import complet par connexion Postgres directe (COPY) en une transaction :
+    crée la table et ses index, puis upsert sur la clé naturelle.
+    """
+    from pg_copy_loader import PostgresCopyLoader, get_database_url
+    
+    dsn = get_database_url(args.dsn)
+    if not dsn:
+        print("❌ SUPABASE_DB_URL (ou --dsn) manquant pour le backend postgres")
+        exit(1)
+    
+    import_batch_id = f"import_{int(time.time())}"
+    total_rows = 0
+    manifest = DeltaManifest(args.manifest)
+    
+    def rows():
+        nonlocal total_rows
+        for batch in iter_article_batches(args.file, args.batch_size):
+            manifest.stage(*row_fingerprints(batch))
+            batch = map_codes_to_names(batch, mapping, verbose=False)
+            records = build_records(batch, import_batch_id)
+            total_rows += len(records)
+            for record in records:
+                yield [record[field] for field in RECORD_FIELDS]
+    
+    loader = PostgresCopyLoader(dsn)
+    try:
+        started = time.perf_counter()
+        count = loader.bulk_upsert(
+            'articles_historiques', RECORD_FIELDS, rows(), NATURAL_KEY.split(','),
+            create_sql=[ARTICLES_TABLE_SQL, ARTICLES_NATURAL_KEY_SQL],
+            index_sql=ARTICLES_INDEXES_SQL
+        )
+        elapsed = time.perf_counter() - started
+        # count : lignes écrites après dédoublonnage de clé, comme le bilan du chemin REST
+        print(f"⚡ {total_rows:,} lignes chargées par COPY en {elapsed:.1f}s "
+              f"({total_rows / max(elapsed, 1e-9):,.0f} lignes/s)")
+        print_import_results(count, [], duplicates=total_rows - count)
+        # Chargement validé en une transaction : tout le fichier entre dans le manifeste du mode --delta
+        manifest.commit_range(0, total_rows)
+        
+        print("📈 Mise à jour des statistiques...")
+        try:
+            print_stats(loader.fetch_one("SELECT * FROM refresh_articles_matching_stats()"))
+        except Exception as e:
+            print(f"❌ Erreur calcul stats: {e}")
+    finally:
+        loader.close()
+        manifest.close()
+    
+    return count, [], total_rows
+
+def parse_args():
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Import des articles historiques dans Supabase")
+    parser.add_argument('--file', default=DEFAULT_EXCEL_PATH, help="Catalogue à importer (.xlsx ou .csv)")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Articles par lot lu et envoyé (taille initiale)")
+    parser.add_argument('--workers', type=int, default=4, help="Nombre de lots envoyés en parallèle")
+    parser.add_argument('--rate', type=float, default=None, help="Requêtes max par seconde (illimité par défaut)")
+    parser.add_argument('--journal', default='import_historique.journal.jsonl',
+                        help="Journal local des tranches de lignes déjà validées")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reprendre l'import précédent là où il s'est arrêté")
+    parser.add_argument('--delta', action='store_true',
+                        help="N'envoyer que les articles nouveaux, modifiés ou supprimés depuis le dernier import")
+    parser.add_argument('--manifest', default='import_historique.manifest.sqlite',
+                        help="Instantané local du dernier import (amorcé par les imports complets, lu par --delta)")
+    parser.add_argument('--dead-letter', default='import_historique.rejected.jsonl',
+                        help="Fichier JSONL des articles refusés par la base (isolés par dichotomie)")
+    parser.add_argument('--backend', choices=['rest', 'postgres'], default='rest',
+                        help="rest: API Supabase (PostgREST) ; postgres: COPY direct, crée aussi tables et index")
+    parser.add_argument('--dsn', default=None,
+                        help="URL Postgres du backend postgres (défaut: SUPABASE_DB_URL ou DATABASE_URL)")
+    return parser.parse_args()
+
 def main():
     """Processus principal d'import"""
     
+    args = parse_args()
+    
     print("🚀 L'HyperFix - Import Articles Historiques")
     print("=" * 60)
     
@@ -288,25 +550,37 @@ def main():
     # 2. Charger le mapping CYRUS
     mapping = load_cyrus_mapping()
     
-    # 3. Traiter le fichier Excel
-    df = process_excel_file()
-    if df is None:
+    # 3-5. Lire, nettoyer, mapper et importer le fichier lot par lot
+    print(f"📖 Lecture en streaming de: {args.file}")
+    try:
+        if args.backend == 'postgres':
+            success_count, errors, total_rows = import_postgres(args, mapping)
+        elif args.delta:
+            # Le manifeste ne retient que les lots validés : une relance reprend d'elle-même
+            manifest = DeltaManifest(args.manifest)
+            batches = iter_article_batches(args.file, args.batch_size)
+            uploader = create_uploader(args.workers, args.batch_size, args.rate, dead_letter=args.dead_letter)
+            try:
+                success_count, errors, total_rows = import_delta(batches, mapping, manifest, uploader)
+            finally:
+                manifest.close()
+        else:
+            success_count, errors, total_rows = run_journaled_import(args, mapping)
+    except ArticleReadError as e:
+        # Les lots validés avant l'erreur sont journalisés : la relance ne les renvoie pas
+        print(f"❌ Erreur lecture fichier: {e}")
+        print(f"💡 Corriger le fichier puis relancer avec --resume (ou --delta) pour reprendre")
         return
     
-    # 4. Mapper les codes vers les noms
-    df = map_codes_to_names(df, mapping)
-    
-    # 5. Importer dans Supabase
-    success_count, errors = import_to_supabase(df)
-    
-    # 6. Mettre à jour les statistiques
-    update_stats()
+    # 6. Mettre à jour les statistiques (déjà fait par le backend postgres)
+    if args.backend == 'rest':
+        update_stats()
     
     print("\n" + "=" * 60)
     
-    if success_count > 0:
+    if success_count > 0 or (args.delta and not errors):
         print(f"🎉 Import terminé avec succès!")
-        print(f"📊 {success_count:,} articles importés sur {len(df):,}")
+        print(f"📊 {success_count:,} articles importés sur {total_rows:,}")
         
         if len(errors) == 0:
             print("✅ Aucune erreur détectée")
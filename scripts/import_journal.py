@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Journal de reprise des imports
+Fichier JSON Lines local : une ligne d'en-tête (empreinte du fichier source,
+identifiant d'import) puis une ligne par tranche de lignes validée [start, end).
+Un import interrompu peut reprendre exactement là où il s'est arrêté.
+"""
+
+import json
+import os
+import time
+from typing import List, Optional, Tuple
+
+def source_fingerprint(path: str) -> str:
+    """Empreinte légère d'un fichier source (nom, taille, date de modification)"""
+    stat = os.stat(path)
+    return f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Fusionner des intervalles [start, end) qui se touchent ou se chevauchent"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+class ImportJournal:
+    """Tranches de lignes déjà validées en base pour un fichier source donné"""
+
+    def __init__(self, path: str, fingerprint: str, import_batch: str,
+                 committed: Optional[List[Tuple[int, int]]] = None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.import_batch = import_batch
+        self.committed = merge_ranges(committed or [])
+        self._file = None
+
+    @classmethod
+    def open(cls, path: str, source_path: str, resume: bool = False) -> "ImportJournal":
+        """
+        Ouvrir le journal d'un import. Avec resume=True, les tranches déjà validées
+        sont rechargées si le journal correspond bien au même fichier source ;
+        sinon un nouveau journal est commencé.
+        """
+        fingerprint = source_fingerprint(source_path)
+
+        if resume and os.path.exists(path):
+            lines = cls._read_entries(path)
+            header = lines[0] if lines else {}
+            if header.get('fingerprint') == fingerprint:
+                ranges = [(entry['start'], entry['end']) for entry in lines[1:]]
+                journal = cls(path, fingerprint, header['import_batch'], ranges)
+                journal._file = open(path, 'a', encoding='utf-8')
+                return journal
+            print(f"⚠️  Journal {path} ne correspond pas à {source_path}, nouvel import")
+
+        journal = cls(path, fingerprint, f"import_{int(time.time())}")
+        journal._file = open(path, 'w', encoding='utf-8')
+        journal._write({'fingerprint': fingerprint, 'import_batch': journal.import_batch})
+        return journal
+
+    @staticmethod
+    def _read_entries(path: str) -> List[dict]:
+        """
+        Relire les entrées du journal. Une dernière ligne illisible est une écriture
+        interrompue par un arrêt brutal : elle est ignorée et retirée du fichier.
+        Une ligne corrompue ailleurs reste une erreur.
+        """
+        with open(path, 'rb') as f:
+            raw_lines = f.readlines()
+
+        entries = []
+        offset = 0
+        for index, raw in enumerate(raw_lines):
+            if raw.strip():
+                try:
+                    entries.append(json.loads(raw))
+                except ValueError:
+                    if index < len(raw_lines) - 1:
+                        raise
+                    print(f"⚠️  Dernière ligne incomplète ignorée dans {path}")
+                    with open(path, 'r+b') as f:
+                        f.truncate(offset)
+                    return entries
+                if not raw.endswith(b'\n'):
+                    # Entrée complète mais sans fin de ligne : la suivante ne doit pas s'y coller
+                    with open(path, 'ab') as f:
+                        f.write(b'\n')
+            offset += len(raw)
+        return entries
+
+    def _write(self, entry: dict):
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record(self, start: int, end: int):
+        """Noter qu'une tranche a été validée en base (appelé après chaque lot réussi)"""
+        self._write({'start': start, 'end': end})
+        self.committed = merge_ranges(self.committed + [(start, end)])
+
+    def pending(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Sous-tranches de [start, end) qui ne sont pas encore validées"""
+        result = []
+        cursor = start
+        for c_start, c_end in self.committed:
+            if c_end <= cursor:
+                continue
+            if c_start >= end:
+                break
+            if c_start > cursor:
+                result.append((cursor, c_start))
+            cursor = max(cursor, c_end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            result.append((cursor, end))
+        return result
+
+    @property
+    def committed_count(self) -> int:
+        return sum(end - start for start, end in self.committed)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+if __name__ == '__main__':
+    import sys
+    import tempfile
+
+    # Auto-test : reprise après une écriture interrompue en fin de journal
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'source.xlsx')
+        path = os.path.join(tmp, 'journal.jsonl')
+        with open(source, 'w') as f:
+            f.write('x')
+
+        journal = ImportJournal.open(path, source)
+        journal.record(0, 100)
+        journal.record(100, 200)
+        journal.close()
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"start": 200, "e')
+
+        journal = ImportJournal.open(path, source, resume=True)
+        ok &= journal.committed == [(0, 200)]
+        journal.record(200, 300)
+        journal.close()
+        journal = ImportJournal.open(path, source, resume=True)
+        ok &= journal.committed == [(0, 300)]
+        journal.close()
+
+        # Une ligne corrompue au milieu du journal n'est pas une écriture interrompue
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        lines[1] = '{"start": 0,\n'
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        try:
+            ImportJournal.open(path, source, resume=True)
+            ok = False
+        except ValueError:
+            pass
+
+    print("✅ Journal de reprise OK" if ok else "❌ Journal de reprise en échec")
+    sys.exit(0 if ok else 1)
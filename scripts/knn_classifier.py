@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Classifieur CYRUS hors ligne par plus proches voisins sur les articles historiques
+- libellés corrigés (moteur V2 de label_processor) découpés en n-grammes de caractères
+  par mot (" LAIT " -> " LA", "LAI", "AIT", "IT ", ...)
+- matrice TF-IDF creuse (tf sous-linéaire, idf lissé, lignes normalisées L2) ; les
+  n-grammes présents dans plus de MAX_DF des libellés (marques, " DE ") sont écartés :
+  ils pèsent peu et rendent le produit creux presque dense
+- voisins par produit creux requêtes x articles, par blocs de requêtes
+- vote des k voisins pondéré par la similarité, sur la clé complète
+  (secteur, rayon, famille, sous_famille) des codes historiques
+- confiance calibrée : régression isotone du score de vote vers la probabilité
+  d'avoir raison, apprise en leave-one-out sur un échantillon d'entraînement
+
+Nécessite scipy (pip install scipy) ; le reste du dépôt n'en dépend pas.
+"""
+
+import argparse
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from cyrus_index import pack_key, unpack_key
+
+DEFAULT_MODEL_PATH = Path(__file__).parent / "knn_classifier.npz"
+
+# Longueurs des n-grammes de caractères (bornes incluses)
+NGRAM_RANGE = (3, 5)
+DEFAULT_K = 10
+# Fraction maximale de libellés contenant un n-gramme pour qu'il soit gardé (max_df de scikit-learn)
+MAX_DF = 0.1
+# Poids d'un voisin dans le vote : similarité ** VOTE_POWER (favorise les voisins très proches)
+VOTE_POWER = 2.0
+# Requêtes traitées par produit matriciel (borne la mémoire du résultat creux)
+QUERY_CHUNK = 256
+# Articles tirés pour apprendre la calibration
+CALIBRATION_SAMPLE = 5000
+
+CODE_FIELDS = ['secteur_code', 'rayon_code', 'famille_code', 'sous_famille_code']
+
+def _sparse():
+    try:
+        from scipy import sparse
+    except ImportError:
+        raise RuntimeError("Le classifieur kNN nécessite scipy: pip install scipy")
+    return sparse
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = NGRAM_RANGE) -> Iterator[str]:
+    """N-grammes de caractères de chaque mot entouré d'espaces (un mot trop court compte une fois)"""
+    low, high = ngram_range
+    for word in text.upper().split():
+        padded = f" {word} "
+        for n in range(low, high + 1):
+            if len(padded) < n:
+                if n == low:
+                    yield padded
+                break
+            for i in range(len(padded) - n + 1):
+                yield padded[i:i + n]
+
+def isotonic_fit(scores: np.ndarray, outcomes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Régression isotone (pool adjacent violators) : points (score, probabilité)
+    croissants, à interpoler avec np.interp
+    """
+    order = np.argsort(scores, kind='stable')
+    ends: List[float] = []
+    values: List[float] = []
+    weights: List[float] = []
+    for score, outcome in zip(scores[order].tolist(), outcomes[order].astype(float).tolist()):
+        ends.append(score)
+        values.append(outcome)
+        weights.append(1.0)
+        while len(values) > 1 and values[-2] >= values[-1]:
+            weight = weights[-2] + weights[-1]
+            value = (values[-2] * weights[-2] + values[-1] * weights[-1]) / weight
+            ends[-2:], values[-2:], weights[-2:] = [ends[-1]], [value], [weight]
+    return np.array(ends, dtype=np.float64), np.array(values, dtype=np.float64)
+
+@dataclass
+class KnnPrediction:
+    """Classification proposée pour un libellé"""
+    codes: Tuple[int, ...]          # (secteur, rayon, famille, sous_famille) historiques
+    confidence: float               # probabilité calibrée que `codes` soit juste
+    score: float                    # part du vote x similarité du meilleur voisin de cette clé
+    neighbors: List[Tuple[int, float]] = field(default_factory=list)  # (article, similarité)
+
+class KnnClassifier:
+    """
+    Modèle kNN : matrice TF-IDF des articles d'entraînement (une ligne par article)
+    et clé complète packée (cyrus_index.pack_key) de chacun.
+    """
+
+    def __init__(self, vocabulary: Sequence[str], idf: np.ndarray, matrix, keys: np.ndarray,
+                 k: int = DEFAULT_K, correct_labels: bool = True,
+                 calibration: Optional[Tuple[np.ndarray, np.ndarray]] = None):
+        _sparse()
+        self.vocabulary = list(vocabulary)
+        self.feature_ids = {ngram: i for i, ngram in enumerate(self.vocabulary)}
+        self.idf = idf.astype(np.float32)
+        self.matrix = matrix
+        # Transposée CSR : liste des articles par n-gramme, pour le produit requêtes x articles
+        self.matrix_t = matrix.T.tocsr()
+        self.keys = keys
+        self.k = k
+        self.correct_labels = correct_labels
+        self.calibration = calibration
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    # --- Vectorisation ---
+
+    def _prepare(self, texts: Iterable[str]) -> List[str]:
+        if not self.correct_labels:
+            return [text or '' for text in texts]
+        from label_processor import DEFAULT_PROCESSOR
+        return [DEFAULT_PROCESSOR.correct(text) for text in texts]
+
+    @staticmethod
+    def _count_matrix(texts: Sequence[str], feature_ids: Dict[str, int], grow: bool):
+        """Matrice creuse des occurrences de n-grammes (grow=True : vocabulaire étendu au passage)"""
+        sparse = _sparse()
+        indptr = array('q', [0])
+        indices = array('i')
+        for text in texts:
+            for ngram in char_ngrams(text):
+                feature = feature_ids.get(ngram)
+                if feature is None:
+                    if not grow:
+                        continue
+                    feature = feature_ids[ngram] = len(feature_ids)
+                indices.append(feature)
+            indptr.append(len(indices))
+        indices = np.frombuffer(indices, dtype=np.int32)
+        counts = sparse.csr_matrix((np.ones(len(indices), dtype=np.float32), indices,
+                                    np.frombuffer(indptr, dtype=np.int64)),
+                                   shape=(len(texts), len(feature_ids)))
+        counts.sum_duplicates()
+        return counts
+
+    @staticmethod
+    def _weight(counts, idf: np.ndarray):
+        """tf sous-linéaire x idf, puis normalisation L2 de chaque ligne (en place)"""
+        counts.data = (1.0 + np.log(counts.data)) * idf[counts.indices]
+        norms = np.sqrt(np.asarray(counts.multiply(counts).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        counts.data /= np.repeat(norms, np.diff(counts.indptr)).astype(np.float32)
+        return counts
+
+    def transform(self, texts: Iterable[str]):
+        """Matrice TF-IDF (requêtes x n-grammes) de libellés déjà corrigés"""
+        texts = list(texts)
+        counts = self._count_matrix(texts, self.feature_ids, grow=False)
+        return self._weight(counts, self.idf)
+
+    @classmethod
+    def fit(cls, labels: Sequence[str], codes: Sequence[Sequence[int]], k: int = DEFAULT_K,
+            max_df: float = MAX_DF, correct_labels: bool = True, calibrate: bool = True) -> "KnnClassifier":
+        """
+        Apprendre le modèle sur des libellés et leurs codes (secteur, rayon, famille, sous_famille).
+        Les articles dont les codes ne forment pas une clé CYRUS valide sont écartés.
+        """
+        kept_labels: List[str] = []
+        packed: List[int] = []
+        for label, key in zip(labels, codes):
+            try:
+                packed.append(pack_key(tuple(int(code) for code in key)))
+            except ValueError:
+                continue
+            kept_labels.append(label)
+        if len(kept_labels) < len(labels):
+            print(f"⚠️  {len(labels) - len(kept_labels):,} articles écartés (codes CYRUS hors limites)")
+        labels = kept_labels
+
+        if correct_labels:
+            from label_processor import DEFAULT_PROCESSOR
+            labels = [DEFAULT_PROCESSOR.correct(label) for label in labels]
+        feature_ids: Dict[str, int] = {}
+        counts = cls._count_matrix(list(labels), feature_ids, grow=True)
+
+        documents = counts.shape[0]
+        frequencies = np.bincount(counts.indices, minlength=counts.shape[1])
+        kept = np.flatnonzero(frequencies <= max_df * documents)
+        counts = counts[:, kept].tocsr()
+        frequencies = frequencies[kept]
+        idf = (np.log((1 + documents) / (1 + frequencies)) + 1).astype(np.float32)
+        matrix = cls._weight(counts, idf)
+
+        keys = np.array(packed, dtype=np.int64)
+        vocabulary = sorted(feature_ids, key=feature_ids.get)
+        vocabulary = [vocabulary[i] for i in kept]
+        model = cls(vocabulary, idf, matrix, keys, k, correct_labels=False)
+        if calibrate:
+            # Groupes de libellés corrigés identiques, écartés ensemble des voisins
+            model.calibration = model._fit_calibration(groups=np.unique(labels, return_inverse=True)[1])
+        model.correct_labels = correct_labels
+        return model
+
+    # --- Voisins et vote ---
+
+    def kneighbors(self, matrix, k: Optional[int] = None, exclude: Optional[np.ndarray] = None,
+                   groups: Optional[np.ndarray] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Pour chaque ligne de `matrix` (TF-IDF des requêtes) : articles voisins et similarités
+        cosinus, par similarité décroissante. exclude[i] est un article à ignorer pour la ligne i ;
+        avec groups (groupe de chaque article), tout son groupe est ignoré.
+        """
+        k = k or self.k
+        for start in range(0, matrix.shape[0], QUERY_CHUNK):
+            similarities = (matrix[start:start + QUERY_CHUNK] @ self.matrix_t).tocsr()
+            for row in range(similarities.shape[0]):
+                begin, end = similarities.indptr[row], similarities.indptr[row + 1]
+                docs = similarities.indices[begin:end]
+                scores = similarities.data[begin:end]
+                if exclude is not None:
+                    excluded = exclude[start + row]
+                    keep = docs != excluded if groups is None else groups[docs] != groups[excluded]
+                    docs, scores = docs[keep], scores[keep]
+                if len(docs) > k:
+                    top = np.argpartition(-scores, k - 1)[:k]
+                    docs, scores = docs[top], scores[top]
+                order = np.argsort(-scores, kind='stable')
+                yield docs[order], scores[order]
+
+    def _vote(self, docs: np.ndarray, scores: np.ndarray) -> Optional[Tuple[int, float]]:
+        """Clé gagnante et score brut (part du vote x similarité de son meilleur voisin)"""
+        if len(docs) == 0:
+            return None
+        weights = scores.astype(np.float64) ** VOTE_POWER
+        keys = self.keys[docs]
+        candidates, positions = np.unique(keys, return_inverse=True)
+        totals = np.bincount(positions, weights=weights)
+        best = int(np.argmax(totals))
+        share = totals[best] / totals.sum() if totals.sum() > 0 else 0.0
+        return int(candidates[best]), float(share * scores[positions == best].max())
+
+    def _confidence(self, score: float) -> float:
+        if self.calibration is None:
+            return score
+        ends, values = self.calibration
+        return float(np.interp(score, ends, values))
+
+    def _fit_calibration(self, sample: int = CALIBRATION_SAMPLE, seed: int = 0,
+                         groups: Optional[np.ndarray] = None):
+        """
+        Score brut -> probabilité d'avoir raison, en leave-one-out sur un échantillon.
+        Avec groups, les doublons exacts du libellé sont retirés avec lui : un voisin identique
+        gonflerait la confiance par rapport aux libellés nouveaux que le modèle aura à classer.
+        """
+        rng = np.random.default_rng(seed)
+        rows = np.sort(rng.choice(len(self), size=min(sample, len(self)), replace=False))
+        scores = np.zeros(len(rows))
+        outcomes = np.zeros(len(rows))
+        neighbors = self.kneighbors(self.matrix[rows], exclude=rows, groups=groups)
+        for i, (docs, similarities) in enumerate(neighbors):
+            vote = self._vote(docs, similarities)
+            if vote is not None:
+                scores[i] = vote[1]
+                outcomes[i] = vote[0] == self.keys[rows[i]]
+        return isotonic_fit(scores, outcomes)
+
+    def predict(self, labels: Iterable[str]) -> List[Optional[KnnPrediction]]:
+        """Classification de chaque libellé (None si aucun n-gramme connu)"""
+        matrix = self.transform(self._prepare(labels))
+        predictions: List[Optional[KnnPrediction]] = []
+        for docs, scores in self.kneighbors(matrix):
+            vote = self._vote(docs, scores)
+            if vote is None:
+                predictions.append(None)
+                continue
+            key, score = vote
+            predictions.append(KnnPrediction(
+                codes=unpack_key(key), confidence=self._confidence(score), score=score,
+                neighbors=list(zip(docs.tolist(), scores.astype(float).tolist()))))
+        return predictions
+
+    # --- Sauvegarde ---
+
+    def save(self, path: Union[str, Path] = DEFAULT_MODEL_PATH):
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        ends, values = self.calibration if self.calibration is not None else (np.empty(0), np.empty(0))
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, vocabulary=np.array(self.vocabulary, dtype=str), idf=self.idf,
+                     data=self.matrix.data, indices=self.matrix.indices, indptr=self.matrix.indptr,
+                     shape=np.array(self.matrix.shape), keys=self.keys,
+                     params=np.array([self.k, int(self.correct_labels)]),
+                     calibration_ends=ends, calibration_values=values)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_MODEL_PATH) -> "KnnClassifier":
+        sparse = _sparse()
+        with np.load(path) as data:
+            matrix = sparse.csr_matrix((data['data'], data['indices'], data['indptr']),
+                                       shape=tuple(data['shape']))
+            k, correct_labels = data['params'].tolist()
+            calibration = None
+            if len(data['calibration_ends']):
+                calibration = (data['calibration_ends'], data['calibration_values'])
+            return cls(data['vocabulary'].tolist(), data['idf'], matrix, data['keys'],
+                       k, bool(correct_labels), calibration)
+
+def load_knn_classifier(path: Union[str, Path] = DEFAULT_MODEL_PATH) -> Optional[KnnClassifier]:
+    """Modèle sauvegardé, ou None s'il n'a pas encore été entraîné"""
+    if not Path(path).exists():
+        return None
+    return KnnClassifier.load(path)
+
+# --- Données d'entraînement ---
+
+def training_rows_from_file(path: str) -> Tuple[List[str], List[Tuple[int, ...]]]:
+    """Libellés et codes complets du catalogue historique (Excel ou CSV), articles non classés exclus"""
+    from import_historical_data import iter_classified_articles
+
+    labels: List[str] = []
+    codes: List[Tuple[int, ...]] = []
+    for _, label, key in iter_classified_articles(path):
+        labels.append(label)
+        codes.append(key)
+    return labels, codes
+
+def training_rows_from_supabase() -> Tuple[List[str], List[Tuple[int, ...]]]:
+    """Libellés et codes complets exportés de articles_historiques"""
+    from article_similarity import fetch_articles_rest
+    from import_historical_data import get_supabase
+
+    rows = fetch_articles_rest(get_supabase(), ['libelle'] + CODE_FIELDS)
+    rows = [row for row in rows if all(row.get(column) for column in CODE_FIELDS)]
+    return [row['libelle'] for row in rows], [tuple(row[column] for column in CODE_FIELDS) for row in rows]
+
+def synthetic_training_set(size: int, seed: int = 11) -> Tuple[List[str], List[Tuple[int, ...]]]:
+    """Catalogue d'essai : libellés bruités construits depuis les noms de sous-familles CYRUS"""
+    import random
+    from cyrus_index import load_cyrus_index
+
+    rng = random.Random(seed)
+    index = load_cyrus_index()
+    leaves = [i for i in range(len(index)) if index.tree.levels[i] == 4]
+    brands = ['DANONE', 'NESTLE', 'LU', 'PANZANI', 'PRESIDENT', 'CRF CLASSIC', 'BONDUELLE', 'HARIBO']
+    sizes = ['25CL', '1L', '125G', '500G', '1KG', 'X6', 'X12']
+    labels, codes = [], []
+    for _ in range(size):
+        leaf = rng.choice(leaves)
+        words = index.tree.names[leaf].split()
+        # Mots tronqués ou omis, comme dans les libellés de caisse
+        words = [w[:rng.randint(3, len(w))] if len(w) > 4 and rng.random() < 0.3 else w
+                 for w in words if rng.random() > 0.15] or words
+        labels.append(' '.join([rng.choice(brands)] + words + [rng.choice(sizes)]))
+        codes.append(index.key(leaf))
+    return labels, codes
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Classifieur CYRUS kNN sur les articles historiques")
+    parser.add_argument('--train-file', default=None, help="Entraîner depuis le catalogue historique (.xlsx ou .csv)")
+    parser.add_argument('--export', action='store_true', help="Entraîner depuis articles_historiques (API REST)")
+    parser.add_argument('--model', default=str(DEFAULT_MODEL_PATH), help="Fichier .npz du modèle")
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help="Nombre de voisins")
+    parser.add_argument('--predict', action='append', default=[], help="Libellé à classer (répétable)")
+    parser.add_argument('--self-test', action='store_true', help="Entraîner et évaluer sur un catalogue synthétique")
+    return parser.parse_args()
+
+def run_self_test() -> bool:
+    labels, codes = synthetic_training_set(60_000)
+    split = 50_000
+    started = time.perf_counter()
+    model = KnnClassifier.fit(labels[:split], codes[:split])
+    print(f"🏗️  Modèle entraîné sur {len(model):,} libellés en {time.perf_counter() - started:.1f}s "
+          f"({len(model.vocabulary):,} n-grammes, {model.matrix.nnz:,} poids)")
+
+    started = time.perf_counter()
+    predictions = model.predict(labels[split:])
+    elapsed = time.perf_counter() - started
+    correct = np.array([p is not None and p.codes == tuple(c) for p, c in zip(predictions, codes[split:])])
+    confidence = np.array([p.confidence if p else 0.0 for p in predictions])
+
+    # Calibration : dans chaque tranche de confiance, la précision observée doit s'en approcher
+    bins = np.minimum((confidence * 5).astype(int), 4)
+    gaps = [abs(correct[bins == b].mean() - confidence[bins == b].mean())
+            for b in range(5) if (bins == b).sum() >= 100]
+    confident = confidence >= 0.9
+    print(f"⚡ {len(predictions) / elapsed:,.0f} libellés/s")
+    print(f"🎯 Précision {correct.mean():.1%} ; confiance >= 0.9 : {confident.mean():.1%} des libellés, "
+          f"précision {correct[confident].mean():.1%}")
+    print(f"📏 Écart max confiance / précision par tranche: {max(gaps):.3f}")
+
+    roundtrip = True
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        model.save(Path(tmp) / 'knn.npz')
+        reloaded = KnnClassifier.load(Path(tmp) / 'knn.npz')
+        again = reloaded.predict(labels[split:split + 200])
+        roundtrip = all(a.codes == b.codes and abs(a.confidence - b.confidence) < 1e-9
+                        for a, b in zip(again, predictions[:200]))
+    # Une ligne aux codes hors limites est écartée au lieu d'arrêter l'entraînement
+    dirty = KnnClassifier.fit(labels[:200] + ['LAIT DEMI ECREME 1L', 'EAU MINERALE 6X1,5L'],
+                              list(codes[:200]) + [(1, 2, 1500, 3), (1, -2, 3, 4)], calibrate=False)
+    skipped = len(dirty) == 200
+    ok = correct.mean() > 0.7 and max(gaps) < 0.1 and roundtrip and skipped
+    print(f"🔍 Sauvegarde / rechargement identiques: {'✅' if roundtrip else '❌'}")
+    print(f"🔍 Codes hors limites écartés: {'✅' if skipped else '❌'}")
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    if args.train_file or args.export:
+        started = time.perf_counter()
+        labels, codes = (training_rows_from_file(args.train_file) if args.train_file
+                         else training_rows_from_supabase())
+        print(f"📥 {len(labels):,} articles classés chargés en {time.perf_counter() - started:.1f}s")
+        model = KnnClassifier.fit(labels, codes, k=args.k)
+        model.save(args.model)
+        print(f"💾 Modèle sauvegardé dans: {args.model}")
+    else:
+        model = load_knn_classifier(args.model)
+        if model is None:
+            print(f"❌ Modèle absent: {args.model} (entraîner avec --train-file ou --export)")
+            return False
+
+    if args.predict:
+        from cyrus_index import load_cyrus_index
+        index = load_cyrus_index()
+        for label, prediction in zip(args.predict, model.predict(args.predict)):
+            if prediction is None:
+                print(f"\n❓ {label}: aucun voisin")
+                continue
+            node = index.lookup(*prediction.codes)
+            path = index.tree.full_path(node) if node is not None else prediction.codes
+            print(f"\n🏷️  {label}\n   {path} (confiance {prediction.confidence:.2f})")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Cache des corrections de libellés
+- Cache LRU borné en mémoire devant le moteur V2
+- Cache persistant optionnel (SQLite) partagé d'un import à l'autre
+La clé est le libellé brut en majuscules + l'empreinte des règles de correction.
+"""
+
+import sqlite3
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional
+
+from label_processor import DEFAULT_PROCESSOR, LabelProcessor, rules_version_hash
+
+# SQLite limite le nombre de paramètres par requête
+SQLITE_IN_CHUNK = 500
+
+class CachedLabelProcessor:
+    """
+    Moteur de correction avec mémoïsation.
+    Les libellés déjà vus (dans le fichier ou lors d'un import précédent) ne sont pas recalculés.
+    """
+
+    def __init__(self, processor: Optional[LabelProcessor] = None, maxsize: int = 100000,
+                 db_path: Optional[str] = None, flush_every: int = 5000):
+        self.processor = processor or DEFAULT_PROCESSOR
+        self.maxsize = maxsize
+        self.rules_hash = rules_version_hash()
+        self.flush_every = flush_every
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: List[tuple] = []
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS label_corrections_cache (
+                    rules_hash TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    corrected TEXT NOT NULL,
+                    PRIMARY KEY (rules_hash, label)
+                ) WITHOUT ROWID
+            """)
+
+    # --- Accès au cache ---
+
+    def _remember(self, key: str, corrected: str):
+        """Ajouter une entrée au LRU en évinçant la plus ancienne si besoin"""
+        self._memory[key] = corrected
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _store(self, key: str, corrected: str):
+        """Mémoriser un nouveau calcul en mémoire et, si activé, sur disque"""
+        self._remember(key, corrected)
+        if self._db is not None:
+            self._pending.append((self.rules_hash, key, corrected))
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def _disk_lookup(self, keys: List[str]) -> Dict[str, str]:
+        """Chercher un lot de clés dans le cache persistant"""
+        found = {}
+        if self._db is None or not keys:
+            return found
+        # Les corrections encore en attente doivent être visibles par la recherche
+        self.flush()
+        for i in range(0, len(keys), SQLITE_IN_CHUNK):
+            chunk = keys[i:i + SQLITE_IN_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._db.execute(
+                f"SELECT label, corrected FROM label_corrections_cache "
+                f"WHERE rules_hash = ? AND label IN ({placeholders})",
+                [self.rules_hash, *chunk]
+            )
+            found.update(rows)
+        return found
+
+    # --- API publique (mêmes sorties que LabelProcessor) ---
+
+    def correct(self, label_text) -> str:
+        """Retourner le libellé corrigé, depuis le cache si possible"""
+        if not label_text or not isinstance(label_text, str) or not label_text.strip():
+            return ''
+
+        key = label_text.upper()
+        corrected = self._memory.get(key)
+        if corrected is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return corrected
+
+        corrected = self._disk_lookup([key]).get(key)
+        if corrected is not None:
+            self.disk_hits += 1
+            self._remember(key, corrected)
+            return corrected
+
+        self.misses += 1
+        corrected = self.processor.correct(key)
+        self._store(key, corrected)
+        return corrected
+
+    def correct_many(self, labels: Iterable,
+                     compute: Optional[Callable[[List[str]], List[str]]] = None) -> List[str]:
+        """
+        Corriger une séquence de libellés dans l'ordre.
+        Seuls les libellés uniques absents des deux caches sont calculés, via `compute`
+        (par défaut le moteur local, sinon par exemple le pool de processus de la CLI).
+        """
+        labels = list(labels)
+        keys = [label.upper() if isinstance(label, str) and label.strip() else None for label in labels]
+
+        resolved: Dict[str, str] = {}
+        unknown = []
+        for key in keys:
+            if key is None or key in resolved:
+                continue
+            corrected = self._memory.get(key)
+            if corrected is not None:
+                self._memory.move_to_end(key)
+                resolved[key] = corrected
+            else:
+                resolved[key] = None
+                unknown.append(key)
+
+        from_disk = self._disk_lookup(unknown)
+        for key, corrected in from_disk.items():
+            resolved[key] = corrected
+            self._remember(key, corrected)
+
+        to_compute = [key for key in unknown if key not in from_disk]
+        if to_compute:
+            computed = compute(to_compute) if compute else [self.processor.correct(k) for k in to_compute]
+            for key, corrected in zip(to_compute, computed):
+                resolved[key] = corrected
+                self._store(key, corrected)
+
+        # Compteurs par libellé : un doublon dans le fichier est un succès de cache
+        computed_keys = set(to_compute)
+        for key in keys:
+            if key is None:
+                continue
+            if key in computed_keys:
+                self.misses += 1
+                computed_keys.discard(key)
+            elif key in from_disk:
+                self.disk_hits += 1
+                from_disk.pop(key)
+            else:
+                self.hits += 1
+
+        return [resolved[key] if key is not None else '' for key in keys]
+
+    def process(self, label_text) -> dict:
+        """Équivalent de process_single_label, avec cache"""
+        return {'original': label_text, 'corrected': self.correct(label_text)}
+
+    def process_many(self, labels: Iterable) -> List[dict]:
+        """Traiter une séquence de libellés, dans l'ordre"""
+        labels = list(labels)
+        return [{'original': label, 'corrected': corrected}
+                for label, corrected in zip(labels, self.correct_many(labels))]
+
+    # --- Statistiques et cycle de vie ---
+
+    def stats(self) -> dict:
+        """Compteurs de succès/échecs du cache"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            'memory_size': len(self._memory),
+            'rules_hash': self.rules_hash,
+        }
+
+    def flush(self):
+        """Écrire sur disque les corrections calculées depuis le dernier flush"""
+        if self._db is None or not self._pending:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO label_corrections_cache (rules_hash, label, corrected) VALUES (?, ?, ?)",
+                self._pending
+            )
+        self._pending = []
+
+    def close(self):
+        """Vider les écritures en attente et fermer la base"""
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,4 +1,12 @@
 import re # On importe la bibliothèque pour les expressions régulières, c'est essentiel ici.
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
 
 # --- 1. DÉFINITION DES CONSTANTES ET RÈGLES ---
 
@@ -14,6 +22,10 @@ KNOWN_BRANDS = [
 # Un "pattern" (modèle) pour les unités, pour ne pas avoir à le réécrire partout.
 UNITS_PATTERN = r'(G|KG|ML|CL|L)'
 
+# Les multipacks (ex: X6) puis les poids/volumes (ex: 15X30G, 500G, 451 G)
+MULTIPACKS_PATTERN = r'(\bX\d+\b)'
+WEIGHTS_PATTERN = r'(\b\d+(?:X\d+)?[\d,]*\s*' + UNITS_PATTERN + r')\b'
+
 # --- 2. LA FONCTION DE TRAITEMENT PRINCIPALE (V2) ---
 
 def process_single_label(label_text: str) -> dict:
@@ -46,14 +58,12 @@ def process_single_label(label_text: str) -> dict:
     all_quantities = []
 
     # D'abord les multipacks (ex: X6)
-    multipacks_pattern = r'(\bX\d+\b)'
-    multipacks = re.findall(multipacks_pattern, text)
-    text = re.sub(multipacks_pattern, ' ', text)
+    multipacks = re.findall(MULTIPACKS_PATTERN, text)
+    text = re.sub(MULTIPACKS_PATTERN, ' ', text)
 
     # Ensuite les poids/volumes (ex: 15X30G, 500G, 451 G)
-    weights_pattern = r'(\b\d+(?:X\d+)?[\d,]*\s*' + UNITS_PATTERN + r')\b'
-    weights = re.findall(weights_pattern, text)
-    text = re.sub(weights_pattern, ' ', text)
+    weights = re.findall(WEIGHTS_PATTERN, text)
+    text = re.sub(WEIGHTS_PATTERN, ' ', text)
 
     # 3. Nettoyage de la description
     description = re.sub(r'[^A-Z0-9/]', ' ', text)
@@ -79,9 +89,223 @@ def process_single_label(label_text: str) -> dict:
         'corrected': corrected_label
     }
 
-# --- 3. EXEMPLE D'UTILISATION (pour tester le fichier seul) ---
+# --- 3. MOTEUR COMPILÉ POUR LE TRAITEMENT EN MASSE ---
 
-if __name__ == '__main__':
+class LabelProcessor:
+    """
+    Moteur de correction V2 pré-compilé pour traiter des catalogues entiers.
+    Applique exactement les mêmes règles que process_single_label, mais toutes
+    les expressions régulières et le tri des marques sont faits une seule fois.
+    """
+
+    def __init__(self, brands: Optional[Iterable[str]] = None):
+        brands = list(KNOWN_BRANDS if brands is None else brands)
+
+        # Même ordre de priorité que la V2 : marques CRF, les plus longues d'abord
+        self.moved_brands = sorted([b for b in brands if b.startswith('CRF')], key=len, reverse=True)
+        self._brand_priority = {b: i for i, b in enumerate(self.moved_brands)}
+
+        # Une seule alternance pour toutes les marques, essayée seulement là où « CRF »
+        # apparaît : l'ordre des alternatives donne, à chaque position, la marque la plus
+        # prioritaire qui y commence (y compris en chevauchement).
+        alternation = '|'.join(re.escape(b) for b in self.moved_brands)
+        self._brands_re = re.compile(r'\b(?:' + alternation + r')\b') if self.moved_brands else None
+
+        self._multipacks_re = re.compile(MULTIPACKS_PATTERN)
+        self._weights_re = re.compile(WEIGHTS_PATTERN)
+        # Les mots restants après remplacement de tout caractère hors [A-Z0-9/] par un espace
+        self._words_re = re.compile(r'[A-Z0-9/]+')
+
+    def _extract_brand(self, text: str):
+        """Retourner (marque, texte sans la marque) selon la priorité V2"""
+        if self._brands_re is None:
+            return "", text
+
+        best = None
+        position = text.find('CRF')
+        while position >= 0:
+            match = self._brands_re.match(text, position)
+            if match:
+                priority = self._brand_priority[match.group()]
+                if best is None or priority < best[0]:
+                    best = (priority, match.start(), match.end())
+                    if priority == 0:
+                        break
+            position = text.find('CRF', position + 1)
+
+        if best is None:
+            return "", text
+
+        # La première occurrence de la marque retenue est celle trouvée ici
+        priority, start, end = best
+        return self.moved_brands[priority], text[:start] + ' ' + text[end:]
+
+    def correct(self, label_text) -> str:
+        """Retourner uniquement le libellé corrigé"""
+        if not label_text or not isinstance(label_text, str) or not label_text.strip():
+            return ''
+
+        text = label_text.upper().replace('.', ' ')
+
+        brand = ""
+        if 'CRF' in text:
+            brand, text = self._extract_brand(text)
+
+        # split() avec groupes capturants fait findall + sub en un seul passage :
+        # les morceaux pairs sont le texte restant, les autres les valeurs extraites.
+        multipacks = []
+        if 'X' in text:
+            pieces = self._multipacks_re.split(text)
+            if len(pieces) > 1:
+                multipacks = pieces[1::2]
+                text = ' '.join(pieces[0::2])
+
+        # Deux groupes capturants (valeur + unité) : un pas de 3
+        pieces = self._weights_re.split(text)
+        weights = pieces[1::3]
+        if weights:
+            text = ' '.join(pieces[0::3])
+
+        description = ' '.join(self._words_re.findall(text))
+
+        final_parts = [brand] if brand else []
+        if description:
+            final_parts.append(description)
+        # Un multipack (X6) ne contient jamais d'espace, seuls les poids sont à compacter
+        final_parts.extend(multipacks)
+        final_parts.extend([w.replace(" ", "") for w in weights])
+
+        return " ".join(final_parts)
+
+    def process(self, label_text) -> dict:
+        """Équivalent exact de process_single_label"""
+        return {'original': label_text, 'corrected': self.correct(label_text)}
+
+    def process_many(self, labels: Iterable) -> List[dict]:
+        """Traiter une séquence de libellés, dans l'ordre"""
+        correct = self.correct
+        return [{'original': label, 'corrected': correct(label)} for label in labels]
+
+    def process_series(self, series):
+        """Traiter une colonne pandas et retourner la série des libellés corrigés (même index)"""
+        return series.map(self.correct)
+
+
+# Instance partagée, construite une seule fois à l'import du module
+DEFAULT_PROCESSOR = LabelProcessor()
+
+# Version des règles : à incrémenter à chaque changement de logique de correction
+# (le code n'entre pas dans l'empreinte, seules les données de règles y sont)
+RULES_VERSION = 'V2.1'
+
+def rules_version_hash() -> str:
+    """Empreinte des règles courantes (version + données), pour invalider les caches de corrections"""
+    payload = '|'.join([RULES_VERSION, UNITS_PATTERN, MULTIPACKS_PATTERN, WEIGHTS_PATTERN, *KNOWN_BRANDS])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+# --- 4. CORRECTION D'UN FICHIER COMPLET (CLI MULTIPROCESSUS) ---
+
+def _correct_chunk(labels: List) -> List[str]:
+    """Tâche exécutée dans un processus du pool : corriger un morceau de libellés"""
+    return [DEFAULT_PROCESSOR.correct(label) for label in labels]
+
+def correct_labels_parallel(labels: List, workers: int = 1, chunk_size: int = 10000) -> List[str]:
+    """
+    Corriger une liste de libellés en la découpant en morceaux répartis sur un pool de processus.
+    Les résultats sont renvoyés dans l'ordre d'entrée.
+    """
+    chunks = [labels[i:i + chunk_size] for i in range(0, len(labels), chunk_size)]
+
+    if workers <= 1 or len(chunks) <= 1:
+        return [corrected for chunk in chunks for corrected in _correct_chunk(chunk)]
+
+    corrected = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() conserve l'ordre des morceaux, quel que soit l'ordre de fin des processus
+        for result in pool.map(_correct_chunk, chunks):
+            corrected.extend(result)
+    return corrected
+
+def read_input_file(path: str, column: str):
+    """Lire un fichier fournisseur (xlsx, xls, csv, parquet) dans un DataFrame"""
+    import pandas as pd
+
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.xlsx', '.xls'):
+        df = pd.read_excel(path, sheet_name=0, dtype={column: str})
+    elif suffix == '.csv':
+        df = pd.read_csv(path, dtype={column: str}, sep=None, engine='python')
+    elif suffix == '.parquet':
+        df = pd.read_parquet(path)
+    else:
+        raise ValueError(f"Format d'entrée non supporté: {suffix}")
+
+    if column not in df.columns:
+        raise ValueError(f"Colonne '{column}' absente. Colonnes disponibles: {list(df.columns)}")
+    return df
+
+def write_output_file(df, path: str):
+    """Écrire le résultat selon l'extension du fichier de sortie"""
+    suffix = Path(path).suffix.lower()
+    if suffix == '.parquet':
+        df.to_parquet(path, index=False)
+    elif suffix == '.csv':
+        df.to_csv(path, index=False)
+    elif suffix in ('.xlsx', '.xls'):
+        df.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Format de sortie non supporté: {suffix}")
+
+def run_cli(args) -> bool:
+    """Corriger la colonne demandée d'un fichier complet et écrire le résultat"""
+    print(f"📖 Lecture de {args.input}...")
+    df = read_input_file(args.input, args.col)
+    labels = df[args.col].tolist()
+    print(f"📊 {len(labels):,} libellés à corriger avec {args.workers} processus")
+
+    def compute(batch):
+        return correct_labels_parallel(batch, workers=args.workers, chunk_size=args.chunk_size)
+
+    start = time.perf_counter()
+    if args.cache_db or args.cache_size:
+        # Le cache se place devant le pool : seuls les libellés jamais vus partent en calcul
+        from label_cache import CachedLabelProcessor
+        with CachedLabelProcessor(maxsize=args.cache_size or len(labels), db_path=args.cache_db) as cache:
+            corrected = cache.correct_many(labels, compute=compute)
+            stats = cache.stats()
+        print(f"🗃️  Cache: {stats['hits']:,} succès mémoire, {stats['disk_hits']:,} succès disque, "
+              f"{stats['misses']:,} calculs ({stats['hit_rate']:.1%} de succès)")
+    else:
+        corrected = compute(labels)
+    elapsed = time.perf_counter() - start
+
+    df[f"{args.col}_CORRIGE"] = corrected
+    write_output_file(df, args.out)
+
+    rate = len(labels) / elapsed if elapsed > 0 else float('inf')
+    print(f"✅ {len(labels):,} libellés corrigés en {elapsed:.2f}s ({rate:,.0f} libellés/s)")
+    print(f"💾 Résultat écrit dans {args.out}")
+    return True
+
+def parse_args(argv=None):
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Correction V2 des libellés d'un fichier fournisseur")
+    parser.add_argument('--in', dest='input', help="Fichier d'entrée (.xlsx, .csv, .parquet)")
+    parser.add_argument('--col', default='LIBELLE', help="Colonne contenant les libellés bruts")
+    parser.add_argument('--out', help="Fichier de sortie (.parquet, .csv, .xlsx)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Nombre de processus")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="Libellés par morceau envoyé au pool")
+    parser.add_argument('--cache-db', help="Cache persistant SQLite des corrections (réutilisé d'un import à l'autre)")
+    parser.add_argument('--cache-size', type=int, default=0, help="Taille du cache LRU en mémoire (0 = désactivé sans --cache-db)")
+    args = parser.parse_args(argv)
+
+    if args.input and not args.out:
+        parser.error("--out est obligatoire avec --in")
+    return args
+
+# --- 5. EXEMPLE D'UTILISATION (pour tester le fichier seul) ---
+
+def run_self_test() -> bool:
     # On utilise les exemples fournis pour valider la logique V2.
     test_cases = {
         "1KG PETIT POIS CAROT.CRF CLASS": "CRF CLASS PETIT POIS CAROT 1KG",
@@ -109,8 +333,48 @@ if __name__ == '__main__':
             all_passed = False
         print("-" * 30)
 
+    # Le moteur compilé doit produire exactement la même sortie que la V2
+    print("--- COMPARAISON MOTEUR COMPILÉ / V2 ---")
+    extra_cases = [
+        "", "   ", None, "crf extra pates 500g", "CRF C CRF CLASSIC 1L", "CRFC.CRF EX X12 33 CL",
+        "YAOURT NATURE 4X125G", "CAFÉ MOULU CRF BIO 250 G", "2X1,5L EAU CRF S", "KINDER X3 BUENO 129G",
+    ]
+    for label in list(test_cases) + extra_cases:
+        if DEFAULT_PROCESSOR.process(label) != process_single_label(label):
+            print(f"Statut   : ❌ DIVERGENCE sur {label!r}")
+            all_passed = False
+
+    # Mesure de débit sur un échantillon répété (meilleur de 3 passages)
+    sample = (list(test_cases) + [l for l in extra_cases if l]) * 5000
+
+    def best_time(run):
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    v2_time = best_time(lambda: [process_single_label(label) for label in sample])
+    engine_time = best_time(lambda: DEFAULT_PROCESSOR.process_many(sample))
+    speedup = v2_time / engine_time
+    # Indicatif seulement : une mesure de débit ne fait pas échouer l'auto-test
+    print(f"V2 : {len(sample) / v2_time:,.0f} libellés/s | Moteur : {len(sample) / engine_time:,.0f} libellés/s "
+          f"(x{speedup:.1f}, objectif x10 {'atteint' if speedup >= 10 else 'non atteint'})")
+    if speedup < 10:
+        # Point ouvert, suivi dans ETAPES_RESTANTES.md : l'objectif x10 n'est pas encore tenu
+        print("⚠️ Point ouvert : débit x10 non atteint (voir ETAPES_RESTANTES.md)")
+
     print("\n--- RÉSUMÉ DU TEST ---")
     if all_passed:
         print("✅ Tous les tests sont passés avec succès !")
     else:
         print("❌ Certains tests ont échoué.")
+    return all_passed
+
+
+if __name__ == '__main__':
+    cli_args = parse_args()
+    # Sans fichier d'entrée, on garde le comportement historique : le test de la logique V2
+    ok = run_cli(cli_args) if cli_args.input else run_self_test()
+    sys.exit(0 if ok else 1)
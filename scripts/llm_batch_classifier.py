@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+Classification CYRUS par lots de libellés en une seule requête OpenRouter
+- N libellés numérotés par prompt, structure CYRUS envoyée une fois pour tout le lot
+- réponse attendue : tableau JSON d'objets {"id", "secteur", ..., "confidence", "reasoning"}
+- chaque objet est validé puis rendu à son libellé par son id (pas par sa position)
+- réponse tronquée ou mal formée : les objets lisibles sont gardés, seuls les
+  libellés manquants ou invalides repartent dans un lot suivant (MAX_ROUNDS tours)
+
+Sous les limites de débit des modèles gratuits, un lot de 20 libellés coûte une
+requête au lieu de 20.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from batch_uploader import RETRYABLE_STATUSES
+from cyrus_index import CyrusIndex, normalize_name
+from cyrus_parser import MAGASIN, SOUS_FAMILLE
+from llm_cache import DEFAULT_CACHE_PATH, LlmResponseCache, normalize_label, prompt_hash
+
+OPENROUTER_API_URL = 'https://openrouter.ai/api/v1/chat/completions'
+PRIMARY_MODEL = 'google/gemini-2.0-flash-exp:free'
+FALLBACK_MODEL = 'deepseek/deepseek-r1-distill-llama-70b:free'
+
+SYSTEM_PROMPT = ("Tu es un expert en classification de produits. Tu analyses les libellés et les classes "
+                 "selon la structure CYRUS fournie. Réponds UNIQUEMENT en JSON valide.")
+
+DEFAULT_BATCH_SIZE = 20
+# Tours de relance des libellés sans réponse valide
+MAX_ROUNDS = 3
+# Budget de sortie par libellé (objet JSON + raisonnement court)
+TOKENS_PER_LABEL = 80
+
+RESULT_FIELDS = ['secteur', 'rayon', 'famille', 'sous_famille']
+
+def get_openrouter_key() -> Optional[str]:
+    return os.getenv("VITE_OPENROUTER_API_KEY") or os.getenv("OPENROUTER_API_KEY")
+
+# --- Prompt ---
+
+def taxonomy_context(index: CyrusIndex, depth: int = SOUS_FAMILLE) -> str:
+    """Arbre CYRUS indenté (« code nom » par ligne) du secteur jusqu'au niveau `depth`"""
+    tree = index.tree
+    return '\n'.join(f"{'  ' * (tree.levels[i] - 1)}{tree.label(i)}" for i in range(len(tree))
+                     if MAGASIN < tree.levels[i] <= depth)
+
+def build_batch_messages(labels: Sequence[Tuple[int, str]], context: str) -> List[Dict[str, str]]:
+    """Messages d'une requête pour des libellés numérotés (id, libellé)"""
+    numbered = '\n'.join(f"{item_id}. {json.dumps(label, ensure_ascii=False)}" for item_id, label in labels)
+    prompt = f"""
+TÂCHE: Classifier chacun des {len(labels)} libellés ci-dessous selon la structure CYRUS fournie.
+
+STRUCTURE CYRUS DISPONIBLE (secteur > rayon > famille > sous-famille, « code nom »):
+{context}
+
+LIBELLÉS:
+{numbered}
+
+INSTRUCTIONS:
+1. Classe chaque libellé indépendamment, dans la hiérarchie CYRUS ci-dessus
+2. Recopie les noms exactement comme dans la structure (sans le code)
+3. Assure-toi que la hiérarchie est cohérente (secteur → rayon → famille → sous-famille)
+4. Donne un score de confiance entre 0 et 100
+5. Un objet par libellé, avec son numéro dans "id"
+
+RÉPONSE (format JSON uniquement):
+{{"resultats": [
+  {{"id": 1, "secteur": "nom_du_secteur", "rayon": "nom_du_rayon", "famille": "nom_de_la_famille",
+    "sous_famille": "nom_de_la_sous_famille", "confidence": 85, "reasoning": "Explication courte"}}
+]}}
+"""
+    return [{'role': 'system', 'content': SYSTEM_PROMPT}, {'role': 'user', 'content': prompt}]
+
+# --- Lecture de la réponse ---
+
+_THINK_RE = re.compile(r'<think>.*?(</think>|$)', re.DOTALL)
+_FENCE_RE = re.compile(r'```(?:json)?')
+
+def extract_result_objects(content: str) -> List[dict]:
+    """
+    Objets résultats d'une réponse : tableau nu, {"resultats": [...]}, bloc ```json,
+    préambule <think> des modèles de raisonnement. Si le JSON complet est invalide
+    (réponse tronquée), chaque objet encore lisible est récupéré un par un.
+    """
+    text = _FENCE_RE.sub('', _THINK_RE.sub('', content or '')).strip()
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, dict):
+        parsed = next((value for value in parsed.values() if isinstance(value, list)), [parsed])
+    if isinstance(parsed, list):
+        return [item for item in parsed if isinstance(item, dict)]
+
+    decoder = json.JSONDecoder()
+    objects = []
+    position = text.find('{')
+    while position >= 0:
+        try:
+            item, end = decoder.raw_decode(text, position)
+        except ValueError:
+            position = text.find('{', position + 1)
+            continue
+        if isinstance(item, dict) and 'id' in item:
+            objects.append(item)
+            position = text.find('{', end)
+        else:
+            position = text.find('{', position + 1)
+    return objects
+
+def validate_result(item: dict) -> Optional[Tuple[int, dict]]:
+    """(id, résultat normalisé) si l'objet est complet et bien typé, sinon None"""
+    try:
+        item_id = int(item.get('id'))
+        confidence = float(item.get('confidence'))
+    except (TypeError, ValueError):
+        return None
+    result = {}
+    for field in RESULT_FIELDS:
+        value = item.get(field)
+        if not isinstance(value, str) or not value.strip():
+            return None
+        result[field] = value.strip()
+    result['confidence'] = min(100.0, max(0.0, confidence))
+    reasoning = item.get('reasoning')
+    result['reasoning'] = reasoning.strip() if isinstance(reasoning, str) else ''
+    return item_id, result
+
+def cyrus_path_resolver(index: CyrusIndex) -> Callable[[dict], Optional[dict]]:
+    """
+    Vérifier qu'un résultat désigne un chemin CYRUS existant et le compléter avec
+    les noms officiels et les codes ; None si le chemin n'existe pas
+    """
+    def resolve(result: dict) -> Optional[dict]:
+        wanted = {field: normalize_name(result[field]) for field in RESULT_FIELDS}
+        for node in index.find_name(result['sous_famille'], SOUS_FAMILLE):
+            classification = index.classification(node)
+            if all(normalize_name(classification[field] or '') == wanted[field] for field in RESULT_FIELDS):
+                return {**result, **classification}
+        return None
+    return resolve
+
+# --- Transport ---
+
+class ChatCompletionError(Exception):
+    """Échec d'une requête chat/completions (status=None pour une erreur réseau)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class ModelReply(str):
+    """Texte d'une réponse, avec le modèle qui l'a réellement produite (bascule comprise)"""
+
+    def __new__(cls, content: str, model: Optional[str]):
+        reply = super().__new__(cls, content)
+        reply.model = model
+        return reply
+
+def answering_model(reply: str, default: str) -> str:
+    """Modèle ayant produit `reply` (ModelReply), `default` pour un texte sans provenance"""
+    return getattr(reply, 'model', None) or default
+
+class OpenRouterClient:
+    """
+    Client chat/completions synchrone (une connexion keep-alive par thread).
+    Relance sur 429 / 5xx ; si le modèle principal reste limité, bascule sur le suivant.
+    """
+
+    def __init__(self, api_key: str, models: Sequence[str] = (PRIMARY_MODEL, FALLBACK_MODEL),
+                 url: str = OPENROUTER_API_URL, max_retries: int = 3, backoff_base: float = 1.0,
+                 timeout: float = 60.0):
+        parts = urlsplit(url)
+        self.https = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path
+        self.models = list(models)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {api_key}',
+            'HTTP-Referer': 'http://localhost:5173',
+            'X-Title': "L'HyperFix - Classification CYRUS",
+        }
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = self._local.conn = cls(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def _reset(self, conn):
+        """Fermer la connexion du thread : la suivante repartira d'une connexion neuve"""
+        conn.close()
+        self._local.conn = None
+
+    def _post(self, payload: dict, accept=None) -> str:
+        """Contenu de la réponse ; avec `accept`, lecture en streaming jusqu'au premier objet accepté"""
+        conn = self._connection()
+        with self._lock:
+            self.requests += 1
+        if accept is not None:
+            payload = {**payload, 'stream': True}
+        try:
+            conn.request('POST', self.path, body=json.dumps(payload).encode('utf-8'), headers=self.headers)
+            response = conn.getresponse()
+            if response.status == 200 and accept is not None:
+                from llm_stream import iter_sse_content, stream_first_object
+                item = stream_first_object(iter_sse_content(iter(response.readline, b'')), accept)
+                # Fermer la connexion interrompt la génération côté fournisseur
+                self._reset(conn)
+                return json.dumps(item, ensure_ascii=False) if item is not None else ''
+            body = response.read()
+            if response.status == 200:
+                try:
+                    return json.loads(body)['choices'][0]['message'].get('content') or ''
+                except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                    # page HTML d'une passerelle, corps tronqué ou JSON hors format
+                    raise ChatCompletionError(f"Réponse invalide: {body[:200].decode('utf-8', 'replace')}")
+        except (OSError, http.client.HTTPException) as e:
+            self._reset(conn)
+            raise ChatCompletionError(f"Erreur réseau: {e}")
+        except BaseException:
+            # Réponse à moitié lue (erreur en cours de flux, corps invalide, interruption) :
+            # la connexion keep-alive n'est plus réutilisable
+            self._reset(conn)
+            raise
+        retry_after = response.getheader('Retry-After')
+        raise ChatCompletionError(f"HTTP {response.status}: {body[:200].decode('utf-8', 'replace')}",
+                                  status=response.status,
+                                  retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None)
+
+    def complete(self, messages: List[Dict[str, str]], max_tokens: int = 500, accept=None) -> ModelReply:
+        """
+        Contenu de la réponse du premier modèle disponible (reply.model : modèle qui a répondu).
+        Avec `accept` (schéma, cf. llm_stream), la réponse est lue en streaming et coupée dès
+        le premier objet conforme, renvoyé seul en JSON ('' si le flux n'en contient aucun).
+        """
+        last_error: Optional[ChatCompletionError] = None
+        for model in self.models:
+            payload = {'model': model, 'messages': messages, 'temperature': 0.1, 'max_tokens': max_tokens}
+            if 'gemini' in model:
+                payload['response_format'] = {'type': 'json_object'}
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return ModelReply(self._post(payload, accept), model)
+                except ChatCompletionError as e:
+                    last_error = e
+                    if e.status is not None and e.status not in RETRYABLE_STATUSES:
+                        raise
+                    if attempt < self.max_retries:
+                        delay = e.retry_after
+                        if delay is None:
+                            delay = self.backoff_base * (2 ** attempt) * (0.5 + random.random())
+                        time.sleep(delay)
+        raise last_error
+
+# --- Classification par lots ---
+
+class BatchClassifier:
+    """
+    Classer une liste de libellés en lots. `complete(messages, max_tokens)` renvoie le
+    texte de la réponse (OpenRouterClient.complete ou un faux client de test).
+    `resolve(result)` valide un résultat et peut le compléter (cyrus_path_resolver).
+    `cache` : les libellés déjà classés par `model` avec le même prompt ne sont pas renvoyés ;
+    une réponse d'un modèle de secours (ModelReply.model) est rangée sous ce modèle-là.
+    """
+
+    def __init__(self, complete: Callable[[List[Dict[str, str]], int], str], context: str,
+                 batch_size: int = DEFAULT_BATCH_SIZE, max_rounds: int = MAX_ROUNDS,
+                 resolve: Optional[Callable[[dict], Optional[dict]]] = None, workers: int = 1,
+                 cache: Optional[LlmResponseCache] = None, model: str = PRIMARY_MODEL,
+                 verbose: bool = True):
+        self.complete = complete
+        self.context = context
+        self.cache = cache
+        self.model = model
+        # Empreinte du gabarit et de la structure CYRUS : les changer invalide le cache
+        self.prompt_fingerprint = prompt_hash(model, json.dumps(build_batch_messages([], context)))
+        self.batch_size = batch_size
+        self.max_rounds = max_rounds
+        self.resolve = resolve
+        self.workers = workers
+        self.verbose = verbose
+        self.requests = 0
+        self.requeued = 0
+        self.errors: Dict[str, str] = {}
+
+    def cache_key(self, label: str, model: Optional[str] = None) -> str:
+        return prompt_hash(model or self.model, f"{self.prompt_fingerprint}\0{normalize_label(label)}")
+
+    def _classify_batch(self, labels: List[str]) -> Tuple[Dict[str, dict], Optional[ChatCompletionError], str]:
+        """Une requête pour un lot : résultats valides par libellé, erreur éventuelle et modèle ayant répondu"""
+        numbered = list(enumerate(labels, 1))
+        try:
+            content = self.complete(build_batch_messages(numbered, self.context),
+                                    TOKENS_PER_LABEL * len(labels) + 200)
+        except ChatCompletionError as e:
+            return {}, e, self.model
+        model = answering_model(content, self.model)
+
+        results: Dict[str, dict] = {}
+        for item in extract_result_objects(content):
+            validated = validate_result(item)
+            if validated is None:
+                continue
+            item_id, result = validated
+            if not 1 <= item_id <= len(labels) or labels[item_id - 1] in results:
+                continue
+            if self.resolve is not None:
+                result = self.resolve(result)
+                if result is None:
+                    continue
+            results[labels[item_id - 1]] = result
+        return results, None, model
+
+    def classify(self, labels: Iterable[str]) -> List[Optional[dict]]:
+        """Résultat de chaque libellé (dans l'ordre), None si aucune réponse valide après MAX_ROUNDS tours"""
+        labels = list(labels)
+        pending = list(dict.fromkeys(label for label in labels if label))
+        results: Dict[str, dict] = {}
+        answered_by: Dict[str, str] = {}
+        if self.cache is not None:
+            keys = {label: self.cache_key(label) for label in pending}
+            cached = self.cache.get_many(keys.values())
+            results = {label: cached[key] for label, key in keys.items() if key in cached}
+            pending = [label for label in pending if label not in results]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for round_number in range(1, self.max_rounds + 1):
+                if not pending:
+                    break
+                batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+                self.requests += len(batches)
+                retry: List[str] = []
+                for batch, (found, error, model) in zip(batches, pool.map(self._classify_batch, batches)):
+                    results.update(found)
+                    answered_by.update(dict.fromkeys(found, model))
+                    missing = [label for label in batch if label not in found]
+                    for label in missing:
+                        self.errors[label] = str(error) if error is not None else "réponse absente ou invalide"
+                    # 401, 400... : relancer le même lot échouerait de la même façon
+                    if error is None or error.status is None or error.status in RETRYABLE_STATUSES:
+                        retry.extend(missing)
+                if self.verbose:
+                    print(f"   Tour {round_number}: {len(pending) - len(retry)}/{len(pending)} libellés classés "
+                          f"en {len(batches)} requêtes", file=sys.stderr)
+                if round_number < self.max_rounds:
+                    self.requeued += len(retry)
+                pending = retry
+
+        for label in results:
+            self.errors.pop(label, None)
+        if self.cache is not None:
+            # Clé du modèle qui a répondu : une réponse de secours n'est pas servie pour `self.model`
+            by_model: Dict[str, Dict[str, dict]] = {}
+            for label, model in answered_by.items():
+                by_model.setdefault(model, {})[self.cache_key(label, model)] = results[label]
+            for model, entries in by_model.items():
+                self.cache.put_many(entries, model)
+        return [results.get(label) for label in labels]
+
+    def stats(self) -> dict:
+        stats = {'requests': self.requests, 'requeued': self.requeued, 'failed': len(self.errors)}
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+# --- Serveur OpenRouter simulé (auto-test) ---
+
+def start_mock_openrouter(index: CyrusIndex, seed: int = 1):
+    """
+    Faux endpoint chat/completions sur 127.0.0.1 : classe chaque libellé sur une
+    sous-famille déterminée par son texte, avec des défauts injectés (429, blocs
+    ```json, préambule <think>, objets omis ou invalides, réponse tronquée).
+    Retourne (serveur, url, fonction libellé -> nœud attendu).
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import zlib
+
+    # Quelques chemins CYRUS existent en double (mêmes noms, codes différents) : non testables par nom
+    paths = {}
+    for i in range(len(index)):
+        if index.tree.levels[i] == SOUS_FAMILLE:
+            paths.setdefault(tuple(index.classification(i)[field] for field in RESULT_FIELDS), []).append(i)
+    leaves = [nodes[0] for nodes in paths.values() if len(nodes) == 1]
+    expected_node = lambda label: leaves[zlib.crc32(label.encode('utf-8')) % len(leaves)]
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    line_re = re.compile(r'^(\d+)\. (".*")$', re.MULTILINE)
+
+    class MockOpenRouter(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _reply(self, status: int, payload: Optional[dict] = None, headers: Optional[dict] = None):
+            body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            with lock:
+                roll = rng.random()
+                faults = [rng.random() for _ in range(4)]
+            if roll < 0.1:
+                return self._reply(429, {'error': 'rate limited'}, {'Retry-After': '0'})
+
+            prompt = request['messages'][-1]['content']
+            items = []
+            for match in line_re.finditer(prompt):
+                item_id, label = int(match.group(1)), json.loads(match.group(2))
+                if faults[0] < 0.3 and item_id == 2:
+                    continue  # objet oublié
+                node = index.classification(expected_node(label))
+                item = {'id': item_id, **{field: node[field] for field in RESULT_FIELDS},
+                        'confidence': 90, 'reasoning': 'test'}
+                if faults[1] < 0.3 and item_id == 3:
+                    item['confidence'] = 'haute'  # type invalide
+                items.append(item)
+            # ordre de réponse différent de l'ordre du prompt : seul l'id fait foi
+            items.sort(key=lambda item: zlib.crc32(str(item['id']).encode()))
+            content = json.dumps({'resultats': items}, ensure_ascii=False)
+            if faults[2] < 0.3:
+                content = f"<think>Je classe les libellés un par un.</think>\n```json\n{content}\n```"
+            if faults[3] < 0.2:
+                content = content[:int(len(content) * 0.6)]  # réponse tronquée
+            self._reply(200, {'choices': [{'message': {'role': 'assistant', 'content': content}}]})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockOpenRouter)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/api/v1/chat/completions"
+    return server, url, expected_node
+
+def run_self_test() -> bool:
+    import tempfile
+    from cyrus_index import load_cyrus_index
+
+    index = load_cyrus_index()
+    cache_dir = tempfile.TemporaryDirectory()
+    cache = LlmResponseCache(os.path.join(cache_dir.name, 'llm.sqlite'))
+    server, url, expected_node = start_mock_openrouter(index)
+    labels = [f"PRODUIT TEST {i} {name}" for i, name in enumerate(['YAOURT', 'CAFE', 'SAVON', 'PAIN'] * 50)]
+    labels += labels[:20]  # doublons : classés une seule fois
+
+    client = OpenRouterClient('cle-test', models=['mock/modele-principal', 'mock/modele-secours'], url=url,
+                              backoff_base=0.01)
+    classifier = BatchClassifier(client.complete, taxonomy_context(index), resolve=cyrus_path_resolver(index),
+                                 workers=4, max_rounds=5, cache=cache, model='mock/modele-principal', verbose=False)
+    started = time.perf_counter()
+    results = classifier.classify(labels)
+    elapsed = time.perf_counter() - started
+
+    # Second run sur une nouvelle instance du cache : tout doit venir du disque puis de la mémoire
+    cache.close()
+    cache = LlmResponseCache(os.path.join(cache_dir.name, 'llm.sqlite'))
+    rerun = BatchClassifier(client.complete, taxonomy_context(index), resolve=cyrus_path_resolver(index),
+                            cache=cache, model='mock/modele-principal', verbose=False)
+    cached_results = rerun.classify(labels)
+    started = time.perf_counter()
+    rerun.classify(labels)
+    warm = time.perf_counter() - started
+    cache_stats = cache.stats()
+
+    # Réponses du modèle de secours : rangées sous son nom, jamais servies pour le modèle principal
+    fallback_only = lambda messages, max_tokens: ModelReply(client.complete(messages, max_tokens),
+                                                            'mock/modele-secours')
+    fresh = [f"AUTRE PRODUIT {i} YAOURT" for i in range(20)]
+    for _ in range(2):
+        secours = BatchClassifier(fallback_only, taxonomy_context(index), resolve=cyrus_path_resolver(index),
+                                  cache=cache, model='mock/modele-principal', max_rounds=5, verbose=False)
+        secours.classify(fresh)
+    cache_entries = cache.get_many(secours.cache_key(label, 'mock/modele-secours') for label in fresh)
+    server.shutdown()
+    cache.close()
+    cache_dir.cleanup()
+
+    correct = all(result is not None and
+                  all(result[f'{field}_code'] == index.classification(expected_node(label))[f'{field}_code']
+                      for field in RESULT_FIELDS)
+                  for label, result in zip(labels, results))
+    stats = classifier.stats()
+    unique = len(set(labels))
+    print(f"🧪 {unique} libellés distincts en {elapsed:.2f}s : {stats['requests']} lots, "
+          f"{client.requests} requêtes HTTP (429 compris), {stats['requeued']} libellés relancés")
+    print(f"🔍 Chaque résultat rendu à son libellé: {'✅' if correct else '❌'}")
+    cache_ok = rerun.requests == 0 and cached_results == results
+    print(f"💾 Relance: {rerun.requests} requêtes, {warm / len(labels) * 1e6:.1f} µs par libellé en cache, "
+          f"taux de succès {cache_stats['hit_rate']:.0%} {'✅' if cache_ok else '❌'}")
+    fallback_ok = secours.requests > 0 and all(
+        secours.cache_key(label, 'mock/modele-secours') in cache_entries for label in fresh)
+    print(f"💾 Réponses du modèle de secours non servies comme modèle principal: {'✅' if fallback_ok else '❌'}")
+
+    # 401 : lot abandonné dès le premier tour, pas relancé MAX_ROUNDS fois
+    def unauthorized(messages, max_tokens):
+        raise ChatCompletionError("HTTP 401: clé invalide", status=401)
+    refused = BatchClassifier(unauthorized, taxonomy_context(index), max_rounds=5, verbose=False)
+    refused_results = refused.classify(fresh)
+    refused_ok = refused.requests == 1 and refused.requeued == 0 and not any(refused_results)
+    print(f"🔍 Erreur non relançable (401) : {refused.requests} requête(s) {'✅' if refused_ok else '❌'}")
+
+    # Page HTML en 200 : erreur de transport, modèle suivant sur une connexion neuve
+    from openrouter_async import start_fake_endpoint
+    server, url, counters = start_fake_endpoint({'mock/passerelle': 'html', 'mock/sain': 'ok'}, latency=0.0)
+    try:
+        gateway = OpenRouterClient('cle-test', models=['mock/passerelle', 'mock/sain'], url=url, max_retries=0)
+        reply = gateway.complete([{'role': 'user', 'content': 'test'}])
+    finally:
+        server.shutdown()
+    gateway_ok = reply.model == 'mock/sain' and len(counters['connections']) == 2
+    print(f"🔍 Page HTML en 200 : modèle suivant, connexion refaite: {'✅' if gateway_ok else '❌'}")
+    ok = (correct and cache_ok and fallback_ok and gateway_ok and refused_ok and stats['failed'] == 0
+          and stats['requests'] < unique / 5)
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Classification CYRUS par lots via OpenRouter")
+    parser.add_argument('--labels-file', default=None, help="Fichier texte, un libellé par ligne")
+    parser.add_argument('--label', action='append', default=[], help="Libellé à classer (répétable)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Libellés par requête")
+    parser.add_argument('--workers', type=int, default=1, help="Lots en parallèle (client asynchrone partagé si > 1)")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help="Cache SQLite des réponses LLM")
+    parser.add_argument('--no-cache', action='store_true', help="Toujours interroger le modèle")
+    parser.add_argument('--output', default=None, help="Fichier JSONL des résultats (défaut: sortie standard)")
+    parser.add_argument('--self-test', action='store_true', help="Tester contre un serveur OpenRouter simulé")
+    return parser.parse_args()
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    from dotenv import load_dotenv
+    from cyrus_index import load_cyrus_index
+
+    load_dotenv()
+    api_key = get_openrouter_key()
+    if not api_key:
+        print("❌ Clé OpenRouter manquante (VITE_OPENROUTER_API_KEY ou OPENROUTER_API_KEY)", file=sys.stderr)
+        return False
+
+    labels = list(args.label)
+    if args.labels_file:
+        with open(args.labels_file, encoding='utf-8') as f:
+            labels.extend(line.strip() for line in f if line.strip())
+
+    index = load_cyrus_index()
+    if args.workers > 1:
+        # lots en parallèle : pool, débit et disjoncteurs partagés par le client asynchrone
+        from openrouter_async import SyncOpenRouterClient
+        client = SyncOpenRouterClient(api_key, max_concurrency=args.workers)
+    else:
+        client = OpenRouterClient(api_key)
+    cache = None if args.no_cache else LlmResponseCache(args.cache)
+    classifier = BatchClassifier(client.complete, taxonomy_context(index),
+                                 batch_size=args.batch_size, resolve=cyrus_path_resolver(index),
+                                 workers=args.workers, cache=cache)
+    # Diagnostics sur stderr : les résultats JSONL peuvent aller sur la sortie standard
+    print(f"🤖 Classification de {len(labels)} libellés par lots de {args.batch_size}", file=sys.stderr)
+    try:
+        results = classifier.classify(labels)
+    finally:
+        if args.workers > 1:
+            client.close()
+        if cache is not None:
+            cache.close()
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for label, result in zip(labels, results):
+            output.write(json.dumps({'label': label, 'result': result,
+                                     'error': classifier.errors.get(label)}, ensure_ascii=False) + '\n')
+    finally:
+        if args.output:
+            output.close()
+    print(f"📊 {classifier.stats()}", file=sys.stderr if not args.output else sys.stdout)
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
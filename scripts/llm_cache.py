@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Cache persistant des réponses LLM (SQLite)
+- clé : empreinte SHA-256 de (modèle, prompt) ; le prompt d'un libellé est son texte
+  normalisé + l'empreinte du gabarit et de la structure CYRUS envoyés avec lui
+- valeur : la classification déjà validée (JSON), pas la réponse brute
+- expiration (TTL) à partir de la date de réponse
+- taille bornée : au-delà de max_entries, éviction des entrées les moins récemment lues
+- LRU en mémoire devant SQLite : un libellé déjà vu dans le run répond en quelques µs
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from label_cache import SQLITE_IN_CHUNK
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(SCRIPT_DIR, 'llm_responses.sqlite')
+
+# 30 jours : au-delà, les modèles gratuits ont pu changer de version
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 200000
+
+def prompt_hash(model: str, prompt: str) -> str:
+    """Clé de cache d'un prompt pour un modèle"""
+    return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+
+def normalize_label(label: str) -> str:
+    """Forme du libellé utilisée dans la clé : majuscules, espaces réduits"""
+    return ' '.join(label.upper().split())
+
+class LlmResponseCache:
+    """Cache des classifications LLM partagé d'un run à l'autre"""
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, memory_size: int = 20000, evict_every: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self._inserted = 0
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        # Partagé par les threads des classifieurs (workers)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_response_cache_accessed "
+                             "ON llm_response_cache (accessed_at)")
+
+    # --- Accès au cache ---
+
+    def _remember(self, key: str, response: dict, created_at: float):
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        """Réponses en cache et non expirées pour ces clés"""
+        with self._lock:
+            now = time.time()
+            found: Dict[str, dict] = {}
+            unknown: List[str] = []
+            for key in dict.fromkeys(keys):
+                entry = self._memory.get(key)
+                if entry is not None and now - entry[1] < self.ttl:
+                    self._memory.move_to_end(key)
+                    self._touched[key] = now
+                    found[key] = entry[0]
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._memory[key]
+                        self.expired += 1
+                    unknown.append(key)
+
+            if self._db is not None:
+                for i in range(0, len(unknown), SQLITE_IN_CHUNK):
+                    chunk = unknown[i:i + SQLITE_IN_CHUNK]
+                    rows = self._db.execute(
+                        f"SELECT key, response, created_at FROM llm_response_cache "
+                        f"WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+                    for key, response, created_at in rows:
+                        if now - created_at >= self.ttl:
+                            self.expired += 1
+                            continue
+                        found[key] = json.loads(response)
+                        self._remember(key, found[key], created_at)
+                        self._touched[key] = now
+                        self.disk_hits += 1
+            self.misses += sum(1 for key in unknown if key not in found)
+            return found
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, responses: Dict[str, dict], model: str = ''):
+        """Mémoriser de nouvelles réponses (en mémoire et sur disque)"""
+        with self._lock:
+            if not responses:
+                return
+            now = time.time()
+            for key, response in responses.items():
+                self._remember(key, response, now)
+            if self._db is not None:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO llm_response_cache (key, model, response, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(key, response.get('model', model), json.dumps(response, ensure_ascii=False), now, now)
+                         for key, response in responses.items()])
+                # Éviction par paquets : le COUNT(*) n'est pas payé à chaque réponse
+                self._inserted += len(responses)
+                if self._inserted >= self.evict_every:
+                    self.evict()
+
+    def put(self, key: str, response: dict, model: str = ''):
+        self.put_many({key: response}, model)
+
+    # --- Éviction et cycle de vie ---
+
+    def flush(self):
+        """Écrire les dates de dernière lecture (utilisées par l'éviction LRU)"""
+        with self._lock:
+            if self._db is None or not self._touched:
+                return
+            with self._db:
+                self._db.executemany("UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?",
+                                     [(accessed_at, key) for key, accessed_at in self._touched.items()])
+            self._touched = {}
+
+    def evict(self) -> int:
+        """Supprimer les entrées expirées, puis les moins récemment lues au-delà de max_entries"""
+        with self._lock:
+            if self._db is None:
+                return 0
+            self.flush()
+            self._inserted = 0
+            with self._db:
+                removed = self._db.execute("DELETE FROM llm_response_cache WHERE created_at < ?",
+                                           (time.time() - self.ttl,)).rowcount
+                excess = self._db.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    removed += self._db.execute(
+                        "DELETE FROM llm_response_cache WHERE key IN "
+                        "(SELECT key FROM llm_response_cache ORDER BY accessed_at LIMIT ?)", (excess,)).rowcount
+            self.evicted += removed
+            return removed
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        entries = (self._db.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+                   if self._db is not None else len(self._memory))
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            'expired': self.expired,
+            'evicted': self.evicted,
+            'entries': entries,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._inserted:
+                self.evict()
+            self.flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+def run_self_test() -> bool:
+    import tempfile
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        cache = LlmResponseCache(path, max_entries=1000, evict_every=1)
+        keys = [prompt_hash('mock/modele', f"LIBELLE {i}") for i in range(1500)]
+        cache.put_many({key: {'sous_famille': f"SF {i}", 'confidence': 90.0} for i, key in enumerate(keys[:1000])})
+        cache.get_many(keys[:10])  # lues récemment : doivent survivre à l'éviction
+        cache.put_many({key: {'sous_famille': f"SF {i}"} for i, key in enumerate(keys[1000:], 1000)})
+        stats = cache.stats()
+        survivors = cache.get_many(keys[:10])
+        print(f"🔍 Taille bornée: {stats['entries']} entrées, {stats['evicted']} évincées, "
+              f"entrées lues conservées {len(survivors)}/10")
+        ok &= stats['entries'] == 1000 and len(survivors) == 10
+        cache.close()
+
+        cache = LlmResponseCache(path)
+        cold = cache.get_many(keys[1000:1100])
+        started = time.perf_counter()
+        for _ in range(100):
+            warm = cache.get_many(keys[1000:1100])
+        per_lookup = (time.perf_counter() - started) / 10000
+        print(f"⚡ Lecture: {len(cold)} depuis SQLite, puis {per_lookup * 1e6:.1f} µs par libellé en mémoire")
+        ok &= len(cold) == len(warm) == 100 and per_lookup < 50e-6
+
+        cache.ttl = 0
+        cache._memory.clear()
+        print(f"🔍 TTL: {len(cache.get_many(keys[1000:1010]))} entrée(s) expirée(s) renvoyée(s)")
+        ok &= not cache.get_many(keys[1000:1010]) and cache.evict() == 1000
+        print(f"📊 {cache.stats()}")
+        cache.close()
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if run_self_test() else 1)
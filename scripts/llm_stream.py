@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Extraction incrémentale du JSON des réponses LLM en streaming (SSE)
+- le texte arrive par morceaux (delta.content des événements `data: {...}`)
+- les blocs <think>...</think> des modèles de raisonnement (DeepSeek R1) sont ignorés,
+  même coupés entre deux morceaux
+- chaque objet JSON est testé dès que son accolade fermante arrive, y compris les
+  objets imbriqués (éléments d'un tableau "resultats") ; un objet invalide ou hors
+  schéma est simplement sauté
+- le premier objet accepté est rendu aussitôt : l'appelant ferme alors le flux, ce
+  qui interrompt la génération et évite de payer les tokens suivants
+
+Remplace les content.find('{') / rfind('}') + json.loads, qui échouent sur un
+préambule <think> ou plusieurs objets et obligent à relancer la requête.
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+THINK_OPEN = '<think>'
+THINK_CLOSE = '</think>'
+
+Schema = Callable[[dict], bool]
+
+def is_classification(item: dict) -> bool:
+    """Objet de classification complet (secteur, rayon, famille, sous_famille, confidence)"""
+    from llm_batch_classifier import validate_result
+    return validate_result({**item, 'id': item.get('id', 0)}) is not None
+
+class IncrementalJsonExtractor:
+    """
+    Analyseur tolérant alimenté morceau par morceau : feed() renvoie les objets
+    terminés dans ce morceau et acceptés par `accept` (tous les dicts par défaut),
+    les plus imbriqués d'abord.
+    """
+
+    def __init__(self, accept: Optional[Schema] = None):
+        self.accept = accept
+        self.buffer = ''
+        self.position = 0
+        self.starts: List[int] = []   # position des '{' ouvertes
+        self.depth = 0                # profondeur {} et [] confondues
+        self.in_string = False
+        self.escape = False
+        self.in_think = False
+        self.rejected = 0
+
+    def _check(self, start: int, end: int) -> Optional[dict]:
+        try:
+            item = json.loads(self.buffer[start:end])
+        except ValueError:
+            self.rejected += 1
+            return None
+        if not isinstance(item, dict) or (self.accept is not None and not self.accept(item)):
+            self.rejected += 1
+            return None
+        return item
+
+    def feed(self, chunk: str) -> List[dict]:
+        self.buffer += chunk
+        found: List[dict] = []
+        text, i = self.buffer, self.position
+        while i < len(text):
+            if self.in_think:
+                end = text.find(THINK_CLOSE, i)
+                if end < 0:
+                    # la balise fermante peut être coupée entre deux morceaux
+                    i = max(i, len(text) - len(THINK_CLOSE) + 1)
+                    break
+                self.in_think = False
+                i = end + len(THINK_CLOSE)
+                continue
+
+            char = text[i]
+            if self.depth == 0:
+                if char == '<':
+                    candidate = text[i:i + len(THINK_OPEN)]
+                    if candidate == THINK_OPEN:
+                        self.in_think = True
+                        i += len(THINK_OPEN)
+                        continue
+                    if THINK_OPEN.startswith(candidate):
+                        break  # début de balise incomplet : attendre la suite
+                elif char == '{':
+                    self.starts.append(i)
+                    self.depth = 1
+                i += 1
+                continue
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in '{[':
+                self.depth += 1
+                if char == '{':
+                    self.starts.append(i)
+            elif char in '}]':
+                self.depth -= 1
+                if char == '}' and self.starts:
+                    item = self._check(self.starts.pop(), i + 1)
+                    if item is not None:
+                        found.append(item)
+                if self.depth <= 0:
+                    self.depth = 0
+                    self.starts = []
+            i += 1
+
+        # Hors objet, le texte déjà lu n'est plus utile
+        if self.depth == 0:
+            self.buffer, self.position = text[i:], 0
+        else:
+            self.position = i
+        return found
+
+def first_json_object(content: str, accept: Optional[Schema] = None) -> Optional[dict]:
+    """Premier objet valide (et conforme à `accept`) d'une réponse complète"""
+    found = IncrementalJsonExtractor(accept).feed(content or '')
+    return found[0] if found else None
+
+# --- Flux SSE de chat/completions ---
+
+def iter_sse_content(lines: Iterable[Union[bytes, str]]) -> Iterator[str]:
+    """Texte des événements SSE (`data: {...}` → choices[0].delta.content), jusqu'à `data: [DONE]`"""
+    from llm_batch_classifier import ChatCompletionError
+
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', 'replace')
+        line = line.strip()
+        # lignes vides et commentaires (« : OPENROUTER PROCESSING ») ignorés
+        if not line.startswith('data:'):
+            continue
+        data = line[len('data:'):].strip()
+        if data == '[DONE]':
+            return
+        try:
+            event = json.loads(data)
+        except ValueError:
+            continue
+        if 'error' in event:
+            error = event['error']
+            raise ChatCompletionError(f"Erreur en cours de flux: {error}",
+                                      status=error.get('code') if isinstance(error, dict) else None)
+        for choice in event.get('choices', [])[:1]:
+            content = (choice.get('delta') or {}).get('content')
+            if content:
+                yield content
+
+def stream_first_object(chunks: Iterable[str], accept: Optional[Schema] = None) -> Optional[dict]:
+    """Consommer les morceaux jusqu'au premier objet accepté (le reste du flux n'est pas lu)"""
+    extractor = IncrementalJsonExtractor(accept)
+    for chunk in chunks:
+        found = extractor.feed(chunk)
+        if found:
+            return found[0]
+    return None
+
+# --- Auto-test contre un faux flux SSE ---
+
+def start_sse_server(chunks: List[str], delay: float = 0.02):
+    """
+    Faux chat/completions en streaming : un événement par morceau toutes les `delay`
+    secondes. Les compteurs relèvent les morceaux envoyés et les flux interrompus
+    par le client.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    counters = {'sent': 0, 'aborted': 0, 'streamed': 0}
+    lock = threading.Lock()
+
+    class FakeStream(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            if not request.get('stream'):
+                time.sleep(delay * len(chunks))  # génération complète avant la réponse
+                body = json.dumps({'choices': [{'message': {'content': ''.join(chunks)}}]}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            with lock:
+                counters['streamed'] += 1
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            events = [': OPENROUTER PROCESSING\n\n'] + [
+                f"data: {json.dumps({'choices': [{'delta': {'content': chunk}}]})}\n\n" for chunk in chunks
+            ] + ['data: [DONE]\n\n']
+            try:
+                for event in events:
+                    self.wfile.write(event.encode('utf-8'))
+                    self.wfile.flush()
+                    with lock:
+                        counters['sent'] += 1
+                    time.sleep(delay)
+            except (BrokenPipeError, ConnectionResetError):
+                with lock:
+                    counters['aborted'] += 1
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeStream)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/api/v1/chat/completions", counters
+
+def _split(text: str, size: int) -> List[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+def run_self_test() -> bool:
+    import asyncio
+    from llm_batch_classifier import OpenRouterClient
+    from openrouter_async import AsyncOpenRouterClient
+
+    ok = True
+    answer = {'secteur': 'FRAIS INDUSTRIEL', 'rayon': 'CREMERIE', 'famille': 'ULTRA FRAIS',
+              'sous_famille': 'YAOURTS NATURE', 'confidence': 88, 'reasoning': 'Yaourt {nature} "500G"'}
+    response = ("<think>Le libellé contient YAOURT. Exemple: {\"secteur\": \"?\"} puis je réponds.</think>\n"
+                "Voici un brouillon {\"secteur\": \"EPICERIE\"} puis la réponse :\n```json\n"
+                + json.dumps(answer, ensure_ascii=False) + "\n```\n"
+                + "Explication détaillée de la classification. " * 40)
+
+    # Découpage au caractère près : balises et chaînes coupées à toutes les positions
+    for size in (1, 3, 7, 64, len(response)):
+        got = stream_first_object(_split(response, size), is_classification)
+        if got != answer:
+            print(f"❌ Morceaux de {size} caractères: {got}")
+            ok = False
+    nested = '{"resultats": [{"id": 1, "x": 1}, {"id": 2, "x": }, {"id": 3, "x": 3}]}'
+    ids = [item.get('id') for item in IncrementalJsonExtractor().feed(nested)]
+    print(f"🔍 Objets imbriqués, un invalide sauté: {ids} {'✅' if ids[:2] == [1, 3] else '❌'}")
+    ok &= ids[:2] == [1, 3]
+    naive_ok = True
+    try:
+        json.loads(response[response.find('{'):response.rfind('}') + 1])
+    except ValueError:
+        naive_ok = False
+    print(f"🔍 find('{{') / rfind('}}') sur la même réponse: {'réussit' if naive_ok else 'échoue'} ; "
+          f"extracteur incrémental: {'✅' if ok else '❌'}")
+
+    chunks = _split(response, 12)
+    server, url, counters = start_sse_server(chunks, delay=0.01)
+    try:
+        client = OpenRouterClient('cle-test', models=['mock/modele'], url=url)
+        started = time.perf_counter()
+        full = client.complete([{'role': 'user', 'content': 'test'}], 300)
+        full_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        streamed = client.complete([{'role': 'user', 'content': 'test'}], 300, accept=is_classification)
+        sync_time = time.perf_counter() - started
+
+        async def run_async():
+            async with AsyncOpenRouterClient('cle-test', models=['mock/modele'], url=url,
+                                             requests_per_minute=6000) as async_client:
+                return await async_client.complete([{'role': 'user', 'content': 'test'}], 300,
+                                                   accept=is_classification)
+        started = time.perf_counter()
+        async_result = asyncio.run(run_async())
+        async_time = time.perf_counter() - started
+        time.sleep(0.1)
+    finally:
+        server.shutdown()
+
+    total_events = len(chunks) + 2
+    streams_ok = (json.loads(streamed) == answer and json.loads(async_result.content) == answer
+                  and counters['aborted'] == 2 and counters['sent'] < counters['streamed'] * total_events)
+    print(f"⏱️  Réponse complète (sans streaming): {full_time:.2f}s ; premier objet en streaming : "
+          f"{sync_time:.2f}s (sync), {async_time:.2f}s (async)")
+    print(f"✂️  Flux interrompus: {counters['aborted']}/{counters['streamed']}, "
+          f"{counters['sent']} événements envoyés sur {counters['streamed'] * total_events} {'✅' if streams_ok else '❌'}")
+    ok &= streams_ok and sync_time < full_time / 2 and first_json_object(full, is_classification) == answer
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if run_self_test() else 1)
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Client OpenRouter asynchrone (asyncio + httpx) pour classer en parallèle
+- un seul pool de connexions keep-alive partagé par toutes les requêtes
+- concurrence bornée par un sémaphore
+- limite de débit par modèle (requêtes/minute, avec rafale)
+- chaîne de modèles : sur 429, 5xx ou erreur réseau, bascule immédiate sur le
+  modèle suivant ; le modèle limité est mis en pause (Retry-After)
+- disjoncteur par modèle : après N échecs consécutifs le modèle est écarté
+  pendant reset_timeout, puis une seule requête d'essai décide de sa réouverture
+
+SyncOpenRouterClient expose la même méthode complete() que OpenRouterClient
+(llm_batch_classifier) : les threads de BatchClassifier partagent alors la boucle,
+le pool, les limites de débit et les disjoncteurs.
+
+Nécessite httpx (pip install httpx), déjà installé avec le client supabase.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from batch_uploader import RETRYABLE_STATUSES
+from llm_batch_classifier import (
+    FALLBACK_MODEL, OPENROUTER_API_URL, PRIMARY_MODEL, ChatCompletionError, ModelReply, get_openrouter_key,
+)
+
+# Modèles gratuits essayés dans l'ordre (cf. test_ai_with_fallback.py)
+MODEL_CHAIN = [
+    PRIMARY_MODEL,
+    FALLBACK_MODEL,
+    'meta-llama/llama-3.2-3b-instruct:free',
+    'microsoft/phi-3-mini-128k-instruct:free',
+]
+
+MAX_CONCURRENCY = 8
+# Limite OpenRouter des modèles gratuits
+REQUESTS_PER_MINUTE = 20
+# Pause d'un modèle après un 429 sans Retry-After (secondes)
+DEFAULT_COOLDOWN = 10.0
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 30.0
+# Attente maximale d'un créneau de débit avant de préférer le modèle suivant
+MAX_QUEUE_DELAY = 2.0
+
+def _httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise RuntimeError("Le client OpenRouter asynchrone nécessite httpx: pip install httpx")
+    return httpx
+
+class RateLimiter:
+    """Limite de débit (algorithme GCRA) : `rate` requêtes/minute, rafale de `burst`"""
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.interval = 60.0 / rate_per_minute
+        self.burst = burst
+        self.tat = 0.0  # instant d'arrivée théorique de la prochaine requête
+
+    def delay(self, now: float) -> float:
+        """Attente avant le prochain créneau libre"""
+        return max(0.0, max(self.tat, now) - now - (self.burst - 1) * self.interval)
+
+    def reserve(self, now: float) -> float:
+        """Réserver un créneau ; retourne l'attente à respecter"""
+        wait = self.delay(now)
+        self.tat = max(self.tat, now) + self.interval
+        return wait
+
+class CircuitBreaker:
+    """Disjoncteur : fermé → ouvert après `threshold` échecs consécutifs → semi-ouvert après `reset_timeout`"""
+
+    CLOSED, OPEN, HALF_OPEN = 'fermé', 'ouvert', 'semi-ouvert'
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+    def available(self, now: float) -> bool:
+        if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        return self.state == self.CLOSED or (self.state == self.HALF_OPEN and not self.probing)
+
+    def reopens_at(self) -> float:
+        return self.opened_at + self.reset_timeout if self.state == self.OPEN else 0.0
+
+    def acquire(self):
+        if self.state == self.HALF_OPEN:
+            self.probing = True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probing = False
+
+    def record_failure(self, now: float):
+        self.failures += 1
+        self.probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.opened_at = now
+
+@dataclass
+class ModelState:
+    """État d'un modèle de la chaîne"""
+    name: str
+    limiter: RateLimiter
+    breaker: CircuitBreaker
+    cooldown_until: float = 0.0
+    requests: int = 0
+    successes: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+
+    def ready_at(self, now: float) -> float:
+        """Instant à partir duquel le modèle peut recevoir une requête (pause 429, disjoncteur, débit)"""
+        if not self.breaker.available(now):
+            return max(self.breaker.reopens_at(), self.cooldown_until, now + 0.05)
+        return max(self.cooldown_until, now + self.limiter.delay(now))
+
+@dataclass
+class Completion:
+    content: str
+    model: str
+    attempts: int
+    latency: float
+
+class AsyncOpenRouterClient:
+    """
+    async with AsyncOpenRouterClient(api_key) as client:
+        results = await client.complete_many(conversations)
+    """
+
+    def __init__(self, api_key: str, models: Sequence[str] = MODEL_CHAIN, url: str = OPENROUTER_API_URL,
+                 max_concurrency: int = MAX_CONCURRENCY, requests_per_minute: float = REQUESTS_PER_MINUTE,
+                 burst: int = 1, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT,
+                 default_cooldown: float = DEFAULT_COOLDOWN, max_queue_delay: float = MAX_QUEUE_DELAY,
+                 timeout: float = 60.0, deadline: float = 120.0):
+        self.api_key = api_key
+        self.url = url
+        self.max_concurrency = max_concurrency
+        self.models = [ModelState(name, RateLimiter(requests_per_minute, burst),
+                                  CircuitBreaker(failure_threshold, reset_timeout)) for name in models]
+        self.default_cooldown = default_cooldown
+        self.max_queue_delay = max_queue_delay
+        self.timeout = timeout
+        self.deadline = deadline
+        self._client = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def open(self):
+        httpx = _httpx()
+        limits = httpx.Limits(max_connections=self.max_concurrency,
+                              max_keepalive_connections=self.max_concurrency)
+        self._client = httpx.AsyncClient(limits=limits, timeout=self.timeout, headers={
+            'Authorization': f'Bearer {self.api_key}',
+            'HTTP-Referer': 'http://localhost:5173',
+            'X-Title': "L'HyperFix - Classification CYRUS",
+        })
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _pick_model(self, now: float) -> ModelState:
+        """Premier modèle de la chaîne prêt sous MAX_QUEUE_DELAY, sinon celui qui se libère le plus tôt"""
+        for state in self.models:
+            if state.ready_at(now) - now <= self.max_queue_delay:
+                return state
+        return min(self.models, key=lambda state: state.ready_at(now))
+
+    async def _post(self, state: ModelState, messages: List[Dict[str, str]], max_tokens: int,
+                    temperature: float, accept=None) -> str:
+        payload = {'model': state.name, 'messages': messages, 'temperature': temperature, 'max_tokens': max_tokens}
+        if 'gemini' in state.name:
+            payload['response_format'] = {'type': 'json_object'}
+        if accept is not None:
+            payload['stream'] = True
+        try:
+            async with self._client.stream('POST', self.url, json=payload) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    retry_after = response.headers.get('Retry-After')
+                    raise ChatCompletionError(f"HTTP {response.status_code}: {response.text[:200]}",
+                                              status=response.status_code,
+                                              retry_after=float(retry_after) if retry_after and retry_after.isdigit()
+                                              else None)
+                if accept is None:
+                    await response.aread()
+                    try:
+                        return response.json()['choices'][0]['message'].get('content') or ''
+                    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                        # page HTML d'une passerelle, corps tronqué ou JSON hors format
+                        raise ChatCompletionError(f"Réponse invalide: {response.text[:200]}")
+                from llm_stream import IncrementalJsonExtractor, iter_sse_content
+                extractor = IncrementalJsonExtractor(accept)
+                async for line in response.aiter_lines():
+                    for chunk in iter_sse_content([line]):
+                        found = extractor.feed(chunk)
+                        if found:
+                            # sortir du bloc ferme le flux et interrompt la génération
+                            return json.dumps(found[0], ensure_ascii=False)
+                    if line.strip() == 'data: [DONE]':
+                        break
+                return ''
+        except _httpx().HTTPError as e:
+            raise ChatCompletionError(f"Erreur réseau: {e}")
+
+    async def complete(self, messages: List[Dict[str, str]], max_tokens: int = 500,
+                       temperature: float = 0.1, accept=None) -> Completion:
+        """
+        Réponse du premier modèle disponible ; lève ChatCompletionError si aucun ne répond
+        avant `deadline`. Avec `accept` (schéma, cf. llm_stream), lecture en streaming
+        arrêtée au premier objet conforme, renvoyé seul en JSON.
+        """
+        started = time.monotonic()
+        attempts = 0
+        last_error: Optional[ChatCompletionError] = None
+        while True:
+            # Le modèle est choisi une fois le créneau de concurrence obtenu : les requêtes
+            # en attente voient les 429 et disjoncteurs déclenchés par celles qui les précèdent
+            async with self._semaphore:
+                now = time.monotonic()
+                state = self._pick_model(now)
+                ready_at = state.ready_at(now)
+                if ready_at - started > self.deadline:
+                    raise last_error or ChatCompletionError("Aucun modèle disponible", status=429)
+                if not state.breaker.available(now):
+                    state = None
+                else:
+                    state.breaker.acquire()
+                    wait = max(state.limiter.reserve(now), state.cooldown_until - now)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    attempts += 1
+                    state.requests += 1
+                    try:
+                        content = await self._post(state, messages, max_tokens, temperature, accept)
+                        error = None
+                    except ChatCompletionError as e:
+                        error = e
+                    except BaseException:
+                        # Annulation ou erreur imprévue : la requête d'essai n'a rien décidé,
+                        # le modèle doit rester essayable
+                        state.breaker.probing = False
+                        raise
+            if state is None:
+                await asyncio.sleep(ready_at - now)
+                continue
+
+            if error is not None:
+                last_error = error
+                if error.status is not None and error.status not in RETRYABLE_STATUSES:
+                    state.breaker.probing = False
+                    raise error
+                if error.status == 429:
+                    state.rate_limited += 1
+                    state.cooldown_until = time.monotonic() + (error.retry_after if error.retry_after is not None
+                                                               else self.default_cooldown)
+                else:
+                    state.failures += 1
+                state.breaker.record_failure(time.monotonic())
+                continue
+            state.successes += 1
+            state.breaker.record_success()
+            return Completion(content, state.name, attempts, time.monotonic() - started)
+
+    async def complete_many(self, conversations: Sequence[List[Dict[str, str]]], max_tokens: int = 500,
+                            temperature: float = 0.1, accept=None) -> List[object]:
+        """Toutes les conversations en parallèle ; Completion ou exception, dans l'ordre"""
+        return await asyncio.gather(*(self.complete(messages, max_tokens, temperature, accept)
+                                      for messages in conversations), return_exceptions=True)
+
+    def stats(self) -> List[dict]:
+        return [{'model': state.name, 'requests': state.requests, 'successes': state.successes,
+                 'rate_limited': state.rate_limited, 'failures': state.failures,
+                 'circuit': state.breaker.state} for state in self.models]
+
+class SyncOpenRouterClient:
+    """
+    Façade bloquante et thread-safe : boucle asyncio dans un thread dédié, partagée
+    par tous les appelants (BatchClassifier avec workers > 1)
+    """
+
+    def __init__(self, api_key: str, **kwargs):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.client = AsyncOpenRouterClient(api_key, **kwargs)
+        self._run(self.client.open())
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def complete(self, messages: List[Dict[str, str]], max_tokens: int = 500, accept=None) -> ModelReply:
+        """Contenu de la réponse ; reply.model donne le modèle de la chaîne qui a répondu"""
+        completion = self._run(self.client.complete(messages, max_tokens, accept=accept))
+        return ModelReply(completion.content, completion.model)
+
+    def close(self):
+        self._run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+# --- Auto-test contre un faux endpoint ---
+
+def start_fake_endpoint(behaviours: Dict[str, str], latency: float = 0.05):
+    """
+    Faux chat/completions local. `behaviours` : modèle -> 'ok' | '429' | '500' | 'html'
+    ('html' : statut 200 avec une page de passerelle au lieu du JSON).
+    Retourne (serveur, url, compteurs) ; les compteurs relèvent les requêtes par
+    modèle, les connexions TCP ouvertes et la concurrence maximale observée.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    counters = {'connections': set(), 'in_flight': 0, 'max_in_flight': 0, 'by_model': {}}
+    lock = threading.Lock()
+
+    class FakeOpenRouter(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            model = request['model']
+            with lock:
+                counters['connections'].add(self.client_address)
+                counters['by_model'][model] = counters['by_model'].get(model, 0) + 1
+                counters['in_flight'] += 1
+                counters['max_in_flight'] = max(counters['max_in_flight'], counters['in_flight'])
+            time.sleep(latency)
+            behaviour = behaviours.get(model, 'ok')
+            if behaviour == '429':
+                status, payload, headers = 429, {'error': 'rate limited'}, {'Retry-After': '5'}
+            elif behaviour == '500':
+                status, payload, headers = 500, {'error': 'upstream error'}, {}
+            else:
+                status, headers = 200, {}
+                payload = {'choices': [{'message': {'role': 'assistant',
+                                                    'content': json.dumps({'model': model})}}]}
+            body = json.dumps(payload).encode('utf-8')
+            content_type = 'application/json'
+            if behaviour == 'html':
+                body, content_type = b'<html><body>502 Bad Gateway</body></html>', 'text/html'
+            with lock:
+                counters['in_flight'] -= 1
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # requête annulée par le client
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOpenRouter)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/api/v1/chat/completions", counters
+
+async def _self_test() -> bool:
+    behaviours = {'mock/limite': '429', 'mock/en-panne': '500', 'mock/sain': 'ok'}
+    server, url, counters = start_fake_endpoint(behaviours, latency=0.05)
+    total = 120
+    try:
+        async with AsyncOpenRouterClient('cle-test', models=list(behaviours), url=url, max_concurrency=8,
+                                         requests_per_minute=60000, burst=8, failure_threshold=3,
+                                         reset_timeout=60.0) as client:
+            conversations = [[{'role': 'user', 'content': f"libellé {i}"}] for i in range(total)]
+            started = time.perf_counter()
+            results = await client.complete_many(conversations)
+            elapsed = time.perf_counter() - started
+            stats = client.stats()
+    finally:
+        server.shutdown()
+
+    ok_results = [r for r in results if isinstance(r, Completion)]
+    served_by_healthy = all(r.model == 'mock/sain' and json.loads(r.content)['model'] == 'mock/sain'
+                            for r in ok_results)
+    serial = total * 0.05
+    by_model = counters['by_model']
+    print(f"🧪 {len(ok_results)}/{total} réponses en {elapsed:.2f}s (série: ~{serial:.1f}s), "
+          f"concurrence max {counters['max_in_flight']}, {len(counters['connections'])} connexions TCP")
+    print(f"📊 Requêtes par modèle: {by_model}")
+    for line in stats:
+        print(f"   {line['model']}: disjoncteur {line['circuit']}, {line['rate_limited']} x 429, "
+              f"{line['failures']} échecs")
+
+    checks = {
+        "toutes les requêtes abouties": len(ok_results) == total and served_by_healthy,
+        "exécution parallèle": elapsed < serial / 2 and counters['max_in_flight'] <= 8,
+        "connexions réutilisées": len(counters['connections']) <= 8,
+        "modèle limité mis en pause": by_model.get('mock/limite', 0) <= 8,
+        "disjoncteur ouvert sur le modèle en panne": stats[1]['circuit'] == CircuitBreaker.OPEN
+                                                     and by_model.get('mock/en-panne', 0) <= 8 + 3,
+    }
+    for name, passed in checks.items():
+        print(f"🔍 {name}: {'✅' if passed else '❌'}")
+
+    # Réponse 200 non JSON pendant l'essai du disjoncteur, puis annulation pendant un
+    # essai : le modèle doit rester essayable dans les deux cas
+    server, url, _ = start_fake_endpoint({'mock/passerelle': 'html', 'mock/sain': 'ok'}, latency=0.05)
+    try:
+        async with AsyncOpenRouterClient('cle-test', models=['mock/passerelle', 'mock/sain'], url=url,
+                                         requests_per_minute=60000, burst=8, failure_threshold=1,
+                                         reset_timeout=0.2, max_queue_delay=0.0) as client:
+            messages = [{'role': 'user', 'content': 'test'}]
+            breaker = client.models[0].breaker
+            replies = []
+            for _ in range(2):
+                replies.append(await client.complete(messages))
+                await asyncio.sleep(0.25)  # disjoncteur semi-ouvert : requête d'essai suivante
+            html_ok = (all(r.model == 'mock/sain' for r in replies) and client.models[0].requests == 2
+                       and not breaker.probing and breaker.available(time.monotonic()))
+            breaker.state = CircuitBreaker.HALF_OPEN
+            task = asyncio.ensure_future(client.complete(messages))
+            await asyncio.sleep(0.02)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            cancel_ok = not breaker.probing and breaker.available(time.monotonic())
+    finally:
+        server.shutdown()
+    print(f"🔍 Page HTML en 200 : modèle suivant, disjoncteur réessayé: {'✅' if html_ok else '❌'}")
+    print(f"🔍 Annulation pendant l'essai : modèle toujours essayable: {'✅' if cancel_ok else '❌'}")
+
+    limiter = RateLimiter(60, burst=2)
+    waits = [limiter.reserve(0.0) for _ in range(4)]
+    rate_ok = waits == [0.0, 0.0, 1.0, 2.0]
+    print(f"🔍 Limite de débit (60/min, rafale 2): {waits} {'✅' if rate_ok else '❌'}")
+    return all(checks.values()) and rate_ok and html_ok and cancel_ok
+
+def run_self_test() -> bool:
+    return asyncio.run(_self_test())
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Client OpenRouter asynchrone avec chaîne de modèles")
+    parser.add_argument('--prompt', action='append', default=[], help="Prompt à envoyer (répétable, en parallèle)")
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENCY, help="Requêtes simultanées")
+    parser.add_argument('--self-test', action='store_true', help="Tester contre un faux endpoint local")
+    return parser.parse_args()
+
+async def _run_prompts(api_key: str, prompts: List[str], concurrency: int) -> bool:
+    async with AsyncOpenRouterClient(api_key, max_concurrency=concurrency) as client:
+        results = await client.complete_many([[{'role': 'user', 'content': p}] for p in prompts])
+        for prompt, result in zip(prompts, results):
+            if isinstance(result, Completion):
+                print(f"✅ [{result.model}, {result.latency:.1f}s] {prompt[:40]} → {result.content[:200]}")
+            else:
+                print(f"❌ {prompt[:40]} → {result}")
+        for line in client.stats():
+            print(f"📊 {line}")
+    return all(isinstance(result, Completion) for result in results)
+
+def main() -> bool:
+    args = parse_args()
+    if args.self_test:
+        return run_self_test()
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    api_key = get_openrouter_key()
+    if not api_key:
+        print("❌ Clé OpenRouter manquante (VITE_OPENROUTER_API_KEY ou OPENROUTER_API_KEY)")
+        return False
+    if not args.prompt:
+        print("❌ Aucun prompt (--prompt)")
+        return False
+    return asyncio.run(_run_prompts(api_key, args.prompt, args.concurrency))
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Chargement direct PostgreSQL par COPY ... FROM STDIN
+Alternative au chemin REST (PostgREST JSON) pour les gros volumes :
+- crée réellement les tables et index (DDL impossible via l'API REST)
+- streame les lignes dans une table temporaire par COPY
+- fusionne dans la table cible en une seule transaction (upsert sur la clé naturelle)
+Nécessite psycopg 3 (pip install "psycopg[binary]") et l'URL de connexion Postgres
+du projet Supabase (Settings > Database > Connection string).
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Schéma jetable de l'auto-test : les tables réelles ne sont jamais touchées
+SELF_TEST_SCHEMA = 'copy_loader_selftest'
+
+def get_database_url(dsn: Optional[str] = None) -> Optional[str]:
+    """URL Postgres : argument explicite, sinon SUPABASE_DB_URL ou DATABASE_URL"""
+    return dsn or os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+
+class PostgresCopyLoader:
+    """Connexion Postgres directe pour les chargements en masse"""
+
+    def __init__(self, dsn: str):
+        try:
+            import psycopg
+        except ImportError:
+            raise RuntimeError("Le backend postgres nécessite psycopg 3: pip install \"psycopg[binary]\"")
+        self.conn = psycopg.connect(dsn)
+
+    def execute_all(self, statements: Sequence[str]):
+        """Exécuter une liste d'ordres SQL (DDL) dans la transaction courante"""
+        with self.conn.cursor() as cur:
+            for statement in statements:
+                cur.execute(statement)
+
+    def fetch_one(self, query: str) -> dict:
+        """Exécuter une requête (validée aussitôt) et retourner sa première ligne en dict"""
+        with self.conn.transaction():
+            with self.conn.cursor() as cur:
+                cur.execute(query)
+                columns = [column.name for column in cur.description]
+                return dict(zip(columns, cur.fetchone()))
+
+    def copy_rows(self, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+        """Streamer des tuples dans `table` par COPY FROM STDIN. Retourne le nombre de lignes"""
+        count = 0
+        column_list = ', '.join(columns)
+        with self.conn.cursor() as cur:
+            with cur.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    count += 1
+        return count
+
+    def bulk_upsert(self, table: str, columns: Sequence[str], rows: Iterable[Sequence],
+                    key_columns: Sequence[str], create_sql: Sequence[str] = (),
+                    index_sql: Sequence[str] = ()) -> int:
+        """
+        Charger `rows` dans `table` en une transaction :
+        DDL -> COPY dans une table temporaire -> INSERT ... ON CONFLICT -> index secondaires.
+        Les index secondaires sont créés après le chargement (bien plus rapide qu'une mise à jour ligne à ligne).
+        Retourne le nombre de lignes écrites dans `table` (doublons de clé du fichier retirés).
+        """
+        staging = f"{table}_staging"
+        column_list = ', '.join(columns)
+        key_list = ', '.join(key_columns)
+        updates = ', '.join(f"{col} = EXCLUDED.{col}" for col in columns if col not in key_columns)
+
+        with self.conn.transaction():
+            self.execute_all(create_sql)
+            # Seulement les colonnes chargées (sans les DEFAULT de la cible : l'id BIGSERIAL
+            # consommerait sa séquence pour chaque ligne copiée) + le rang de la ligne dans le fichier
+            self.execute_all([
+                f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {column_list}, 0::bigint AS _ordinal FROM {table} WITH NO DATA"
+            ])
+            self.copy_rows(staging, [*columns, '_ordinal'],
+                           ((*row, ordinal) for ordinal, row in enumerate(rows)))
+            # DISTINCT ON : une clé présente deux fois dans le fichier ne touche la cible qu'une fois,
+            # avec sa dernière occurrence (comme le dédoublonnage de PostgrestSender)
+            with self.conn.cursor() as cur:
+                cur.execute(f"""
+                    INSERT INTO {table} ({column_list})
+                    SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging}
+                    ORDER BY {key_list}, _ordinal DESC
+                    ON CONFLICT ({key_list}) DO UPDATE SET {updates}
+                """)
+                written = cur.rowcount
+            self.execute_all(index_sql)
+        return written
+
+    def replace_all(self, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+        """
+        Remplacer tout le contenu d'une table en une transaction (DELETE + COPY).
+        Les lecteurs continuent de voir l'ancien contenu jusqu'au COMMIT.
+        """
+        with self.conn.transaction():
+            self.execute_all([f"DELETE FROM {table}"])
+            return self.copy_rows(table, columns, rows)
+
+    def close(self):
+        self.conn.close()
+
+def load_cyrus_items(items: Iterable[dict], dsn: Optional[str] = None) -> int:
+    """Charger la structure CYRUS dans cyrus_structure par COPY, de façon atomique"""
+    dsn = get_database_url(dsn)
+    if not dsn:
+        raise RuntimeError("SUPABASE_DB_URL (ou DATABASE_URL) doit être défini pour le backend postgres")
+
+    columns = ['level', 'code', 'name', 'parent_code', 'full_path']
+    loader = PostgresCopyLoader(dsn)
+    try:
+        started = time.perf_counter()
+        count = loader.replace_all('cyrus_structure', columns,
+                                   ([item.get(col) for col in columns] for item in items))
+        print(f"✅ {count} éléments CYRUS chargés par COPY en {time.perf_counter() - started:.2f}s")
+        return count
+    finally:
+        loader.close()
+
+# --- Auto-test et mesure contre le chemin REST (base Postgres locale) ---
+
+def start_postgrest_stub(dsn: str):
+    """
+    Équivalent local de PostgREST pour la mesure : POST /rest/v1/<table>?on_conflict=...
+    exécute le même upsert que PostgREST (json_populate_recordset + ON CONFLICT DO UPDATE),
+    une connexion par thread, validée à chaque requête.
+    """
+    import psycopg
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    local = threading.local()
+    connections = []
+
+    class PostgrestStub(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            parts = urlsplit(self.path)
+            table = parts.path.rsplit('/', 1)[-1]
+            keys = parse_qs(parts.query).get('on_conflict', [''])[0]
+            body = self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8')
+            columns = list(json.loads(body)[0])
+            column_list = ', '.join(columns)
+            query = (f"INSERT INTO {table} ({column_list}) SELECT {column_list} "
+                     f"FROM json_populate_recordset(NULL::{table}, %s)")
+            if keys:
+                updates = ', '.join(f"{col} = EXCLUDED.{col}" for col in columns if col not in keys.split(','))
+                query += f" ON CONFLICT ({keys}) DO UPDATE SET {updates}"
+
+            conn = getattr(local, 'conn', None)
+            if conn is None:
+                conn = local.conn = psycopg.connect(dsn, autocommit=True)
+                connections.append(conn)
+            try:
+                conn.execute(query, (body,))
+                status, payload = 201, b''
+            except psycopg.Error as e:
+                status, payload = 400, json.dumps({'code': e.sqlstate, 'message': str(e)}).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PostgrestStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop():
+        server.shutdown()
+        for conn in connections:
+            conn.close()
+
+    return f"http://127.0.0.1:{server.server_port}", stop
+
+def synthetic_articles(count: int, import_batch: str = 'selftest') -> List[Dict]:
+    """Articles de test au format de articles_historiques (RECORD_FIELDS)"""
+    return [{
+        'ean': f"3{i:012d}", 'nartar': str(100000 + i), 'libelle': f"ARTICLE TEST {i} 500G",
+        'nomo': None if i % 7 else str(i % 100), 'secteur': 'EPICERIE', 'rayon': 'EPICERIE SALEE',
+        'famille': 'CONSERVES', 'sous_famille': f"SOUS FAMILLE {i % 40}", 'secteur_code': 2,
+        'rayon_code': 20, 'famille_code': 200 + i % 10, 'sous_famille_code': i % 40,
+        'import_batch': import_batch,
+    } for i in range(count)]
+
+def run_self_test(dsn: Optional[str] = None, rows: int = 50_000) -> bool:
+    """
+    Contre une base Postgres locale (--dsn ou TEST_DATABASE_URL, ignoré sinon), dans un schéma jetable :
+    - doublons de clé dans le fichier : dernière occurrence gardée, contenu identique au chemin REST
+    - la séquence de l'id n'est consommée que par les lignes réellement insérées
+    - durée du chargement de `rows` articles par COPY et par le chemin REST
+    """
+    dsn = dsn or os.getenv("TEST_DATABASE_URL")
+    if not dsn:
+        print("⏭️  Auto-test postgres ignoré : définir TEST_DATABASE_URL ou --dsn (base locale de test)")
+        return True
+
+    import psycopg
+    from psycopg.conninfo import make_conninfo
+    from batch_uploader import ConcurrentUploader, PostgrestSender
+    from import_historical_data import (ARTICLES_INDEXES_SQL, ARTICLES_NATURAL_KEY_SQL,
+                                        ARTICLES_TABLE_SQL, NATURAL_KEY, RECORD_FIELDS)
+
+    scratch = make_conninfo(dsn, options=f"-c search_path={SELF_TEST_SCHEMA}")
+    admin = psycopg.connect(dsn, autocommit=True)
+    admin.execute(f"DROP SCHEMA IF EXISTS {SELF_TEST_SCHEMA} CASCADE")
+    admin.execute(f"CREATE SCHEMA {SELF_TEST_SCHEMA}")
+    db = psycopg.connect(scratch, autocommit=True)
+    url, stop = start_postgrest_stub(scratch)
+    key_columns = NATURAL_KEY.split(',')
+
+    def load_rest(records: List[Dict]) -> float:
+        """Table existante avec ses index (cas d'un import en production), lots de 1000, 4 en vol"""
+        db.execute("DROP TABLE IF EXISTS articles_historiques")
+        for statement in [ARTICLES_TABLE_SQL, ARTICLES_NATURAL_KEY_SQL, *ARTICLES_INDEXES_SQL]:
+            db.execute(statement)
+        uploader = ConcurrentUploader(PostgrestSender(url, 'cle-test', 'articles_historiques',
+                                                      on_conflict=NATURAL_KEY), verbose=False)
+        started = time.perf_counter()
+        count, errors = uploader.upload(records[i:i + 1000] for i in range(0, len(records), 1000))
+        if errors:
+            raise RuntimeError(f"Chemin REST: {errors[0]}")
+        return time.perf_counter() - started
+
+    def load_copy(records: List[Dict]) -> Tuple[float, int]:
+        """Durée du chargement et lignes écrites selon bulk_upsert"""
+        db.execute("DROP TABLE IF EXISTS articles_historiques")
+        loader = PostgresCopyLoader(scratch)
+        try:
+            started = time.perf_counter()
+            written = loader.bulk_upsert('articles_historiques', RECORD_FIELDS,
+                                         ([record[f] for f in RECORD_FIELDS] for record in records), key_columns,
+                                         create_sql=[ARTICLES_TABLE_SQL, ARTICLES_NATURAL_KEY_SQL],
+                                         index_sql=ARTICLES_INDEXES_SQL)
+            return time.perf_counter() - started, written
+        finally:
+            loader.close()
+
+    def snapshot():
+        return db.execute(f"SELECT {', '.join(RECORD_FIELDS)} FROM articles_historiques "
+                          "ORDER BY ean, nartar").fetchall()
+
+    ok = True
+    try:
+        # Doublons dans le même lot : la dernière occurrence doit gagner sur les deux chemins
+        records = synthetic_articles(200)
+        records.insert(50, dict(records[120], libelle='ANCIEN LIBELLE'))
+        records.append(dict(records[10], libelle='LIBELLE CORRIGE'))
+        load_rest(records)
+        rest_rows = snapshot()
+        _, written = load_copy(records)
+        copy_rows = snapshot()
+        max_id = db.execute("SELECT max(id) FROM articles_historiques").fetchone()[0]
+        libelles = {row[1]: row[2] for row in copy_rows}
+        last_wins = libelles['100010'] == 'LIBELLE CORRIGE' and libelles['100120'] == 'ARTICLE TEST 120 500G'
+        same = rest_rows == copy_rows and len(copy_rows) == 200
+        print(f"🔍 Doublons de clé: dernière occurrence gardée {'✅' if last_wins else '❌'} ; "
+              f"contenu identique au chemin REST {'✅' if same else '❌'}")
+        print(f"🔍 Séquence id: {max_id} valeurs consommées pour 200 lignes {'✅' if max_id == 200 else '❌'}")
+        print(f"🔍 Lignes écrites: {written} pour {len(records)} lues (2 doublons) {'✅' if written == 200 else '❌'}")
+        ok = last_wins and same and max_id == 200 and written == 200
+
+        # Mesure : même volume, table vide au départ
+        records = synthetic_articles(rows)
+        rest_time = load_rest(records)
+        copy_time, _ = load_copy(records)
+        loaded = db.execute("SELECT count(*) FROM articles_historiques").fetchone()[0]
+        ok &= loaded == rows
+        print(f"⏱️  {rows:,} articles: REST {rest_time:.2f}s ({rows / rest_time:,.0f} lignes/s), "
+              f"COPY {copy_time:.2f}s ({rows / copy_time:,.0f} lignes/s), x{rest_time / copy_time:.1f}")
+    finally:
+        stop()
+        db.close()
+        admin.execute(f"DROP SCHEMA IF EXISTS {SELF_TEST_SCHEMA} CASCADE")
+        admin.close()
+
+    print(f"🔍 Auto-test: {'✅' if ok else '❌'}")
+    return ok
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Chargement Postgres par COPY (auto-test et mesure)")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Vérifier le chargement et le comparer au chemin REST sur une base locale")
+    parser.add_argument('--dsn', default=None,
+                        help="Base Postgres de test (défaut: TEST_DATABASE_URL) ; sans DSN l'auto-test est ignoré")
+    parser.add_argument('--rows', type=int, default=50_000, help="Articles chargés pour la mesure")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not args.self_test:
+        print("Module utilisé par les scripts d'import (--backend postgres) ; --self-test pour le vérifier")
+        sys.exit(0)
+    sys.exit(0 if run_self_test(args.dsn, args.rows) else 1)
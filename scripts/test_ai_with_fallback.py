@@ -9,6 +9,8 @@ import json
 import time
 from dotenv import load_dotenv
 
+from llm_stream import first_json_object, is_classification
+
 def test_with_deepseek():
     """Test avec le modèle DeepSeek en fallback"""
     
@@ -86,13 +88,9 @@ Réponds en JSON:
             
             # Tentative de parsing JSON
             try:
-                if '{' in content and '}' in content:
-                    # Extraire le JSON
-                    start = content.find('{')
-                    end = content.rfind('}') + 1
-                    json_part = content[start:end]
-                    
-                    parsed = json.loads(json_part)
+                # Premier objet de classification complet, préambule <think> et brouillons ignorés
+                parsed = first_json_object(content, is_classification)
+                if parsed is not None:
                     print("\n🎯 Classification réussie:")
                     print(f"   Secteur: {parsed.get('secteur')}")
                     print(f"   Rayon: {parsed.get('rayon')}")
@@ -72,10 +72,10 @@ def full_verification():
             print(f"✅ Structure CYRUS complète ({total_cyrus} éléments)")
         elif total_cyrus > 0:
             print(f"⚠️  Structure CYRUS partielle ({total_cyrus} éléments)")
-            print("   Recommandation: Réimporter cyrus_insert_v3.sql")
+            print("   Recommandation: Réimporter cyrus_insert_v4.sql")
         else:
             print("❌ Structure CYRUS vide")
-            print("   Action requise: Importer cyrus_insert_v3.sql")
+            print("   Action requise: Importer cyrus_insert_v4.sql")
         
         print("\n💰 VÉRIFICATION CODES DOUANIERS")
         print("-" * 35)
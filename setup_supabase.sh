@@ -29,7 +29,7 @@ echo "1. 🌐 Aller sur https://supabase.com"
 echo "2. 📝 Créer votre compte et projet 'hyperfix-production'"
 echo "3. ⚙️  Récupérer vos clés API et modifier le fichier .env"
 echo "4. 📊 Créer les tables avec database/schema.sql"
-echo "5. 📥 Importer les données avec scripts/cyrus_insert_v3.sql"
+echo "5. 📥 Importer les données avec scripts/cyrus_insert_v4.sql"
 echo "6. 🧪 Tester avec: python scripts/test_supabase.py"
 echo "7. 🚀 Démarrer: bun dev"
 echo ""
@@ -206,47 +206,20 @@ export class ArticlesHistoriquesService {
    */
   private async calculateStats(): Promise<HistoricalStats> {
     try {
-      // Total articles
-      const { count: totalCount } = await supabase
-        .from('articles_historiques')
-        .select('*', { count: 'exact', head: true });
-
-      // Libellés uniques
-      const { data: uniqueLibelles } = await supabase
-        .from('articles_historiques')
-        .select('libelle')
-        .not('libelle', 'is', null);
-
-      // EANs uniques
-      const { data: uniqueEans } = await supabase
-        .from('articles_historiques')
-        .select('ean')
-        .not('ean', 'is', null);
+      // Une seule agrégation côté serveur, qui met aussi à jour articles_matching_stats
+      const { data, error } = await supabase.rpc('refresh_articles_matching_stats');
 
-      // Articles avec classification complète
-      const { count: classifiedCount } = await supabase
-        .from('articles_historiques')
-        .select('*', { count: 'exact', head: true })
-        .not('secteur', 'is', null)
-        .not('rayon', 'is', null)
-        .not('famille', 'is', null);
+      if (error) throw error;
 
+      const row = Array.isArray(data) ? data[0] : data;
       const stats = {
-        total_articles: totalCount || 0,
-        unique_libelles: new Set(uniqueLibelles?.map(item => item.libelle)).size,
-        unique_eans: new Set(uniqueEans?.map(item => item.ean)).size,
-        classification_coverage: totalCount ? ((classifiedCount || 0) / totalCount) * 100 : 0,
-        last_updated: new Date().toISOString()
+        total_articles: row?.total_articles || 0,
+        unique_libelles: row?.unique_libelles || 0,
+        unique_eans: row?.unique_eans || 0,
+        classification_coverage: Number(row?.classification_coverage || 0),
+        last_updated: row?.last_updated || new Date().toISOString()
       };
 
-      // Sauvegarder en cache
-      await supabase
-        .from('articles_matching_stats')
-        .upsert({
-          id: 1,
-          ...stats
-        });
-
       return stats;
     } catch (error) {
       console.error('Erreur calcul stats:', error);